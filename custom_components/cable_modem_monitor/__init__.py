@@ -11,23 +11,38 @@ import homeassistant.helpers.config_validation as cv
 import voluptuous as vol
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .const import (
+    CONF_ADAPTIVE_POLLING,
     CONF_HOST,
     CONF_MODEM_CHOICE,
     CONF_PARSER_NAME,
     CONF_PASSWORD,
+    CONF_PASSWORD_ENCODING,
     CONF_SCAN_INTERVAL,
     CONF_USERNAME,
     CONF_WORKING_URL,
+    DATA_HEALTH_COORDINATORS,
+    DATA_POLL_SCHEDULER,
+    DEFAULT_ADAPTIVE_POLLING,
+    DEFAULT_PROBE_CONCURRENCY,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
+    HEALTH_CHECK_INTERVAL,
+    HEALTH_HISTORY_SIZE,
+    MAX_CONCURRENT_POLLS,
+    MAX_SCAN_INTERVAL,
+    MIN_SCAN_INTERVAL,
+    POLL_PHASE_SPACING,
     VERIFY_SSL,
     VERSION,
 )
 from .core.modem_scraper import ModemScraper
+from .core.poll_scheduler import PollScheduler
+from .parsers.base_parser import SECTION_DOWNSTREAM, SECTION_SYSTEM_INFO, SECTION_UPSTREAM
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -63,8 +78,17 @@ def _select_parser(parsers: list, modem_choice: str):
     return parsers
 
 
+def _get_poll_scheduler(hass: HomeAssistant) -> PollScheduler:
+    """Return the scheduler shared by all config entries, creating it on first use."""
+    scheduler: PollScheduler | None = hass.data.get(DATA_POLL_SCHEDULER)
+    if scheduler is None:
+        scheduler = PollScheduler(max_concurrent_polls=MAX_CONCURRENT_POLLS, phase_spacing=POLL_PHASE_SPACING)
+        hass.data[DATA_POLL_SCHEDULER] = scheduler
+    return scheduler
+
+
 async def _create_health_monitor(hass: HomeAssistant):
-    """Create health monitor with SSL context."""
+    """Create health monitor with the SSL context shared by all entries."""
     import ssl
 
     from .core.health_monitor import ModemHealthMonitor
@@ -76,29 +100,77 @@ async def _create_health_monitor(hass: HomeAssistant):
         context.verify_mode = ssl.CERT_NONE
         return context
 
-    ssl_context = await hass.async_add_executor_job(create_ssl_context)
-    return ModemHealthMonitor(max_history=100, verify_ssl=VERIFY_SSL, ssl_context=ssl_context)
+    scheduler = _get_poll_scheduler(hass)
+    if scheduler.ssl_context is None:
+        scheduler.ssl_context = await hass.async_add_executor_job(create_ssl_context)
+    return ModemHealthMonitor(max_history=HEALTH_HISTORY_SIZE, verify_ssl=VERIFY_SSL, ssl_context=scheduler.ssl_context)
+
+
+def _health_data(health_result, health_monitor) -> dict[str, Any]:
+    """Return the health coordinator data keys describing a health check."""
+    return {
+        "health_status": health_result.status,
+        "health_diagnosis": health_result.diagnosis,
+        "ping_success": health_result.ping_success,
+        "ping_latency_ms": health_result.ping_latency_ms,
+        "ping_min_ms": health_result.ping_min_ms,
+        "ping_max_ms": health_result.ping_max_ms,
+        "ping_jitter_ms": health_result.ping_jitter_ms,
+        "ping_packet_loss": health_result.ping_packet_loss,
+        "http_success": health_result.http_success,
+        "http_latency_ms": health_result.http_latency_ms,
+        "consecutive_failures": health_monitor.consecutive_failures,
+    }
+
+
+def _create_health_update_function(health_monitor, host: str):
+    """Create the update function of the health coordinator (probes only, no scrape)."""
+
+    async def async_update_health() -> dict[str, Any]:
+        """Probe the modem."""
+        health_result = await health_monitor.check_health(f"http://{host}")
+        return _health_data(health_result, health_monitor)
+
+    return async_update_health
+
+
+def _requested_sections(hass: HomeAssistant, entry: ConfigEntry) -> frozenset[str] | None:
+    """Return the parse result sections the entry needs from this poll.
+
+    Returns None (everything) while the entry has no registered entities yet,
+    i.e. on the poll that decides which sensors to create.
+    """
+    from homeassistant.helpers import entity_registry as er
+
+    entity_entries = er.async_entries_for_config_entry(er.async_get(hass), entry.entry_id)
+    if not entity_entries:
+        return None
+
+    # Connection status and adaptive polling are derived from the downstream channels.
+    # System info is always read: its uptime drives reboot detection and diagnostics.
+    sections = {SECTION_DOWNSTREAM, SECTION_SYSTEM_INFO}
+    prefix = f"{entry.entry_id}_cable_modem_"
+    for entity_entry in entity_entries:
+        if not entity_entry.disabled and entity_entry.unique_id.removeprefix(prefix).startswith("upstream"):
+            sections.add(SECTION_UPSTREAM)
+    return frozenset(sections)
 
 
-def _create_update_function(hass: HomeAssistant, scraper, health_monitor, host: str):
-    """Create the async update function for the coordinator."""
+def _create_update_function(hass: HomeAssistant, scraper, health_coordinator, entry: ConfigEntry | None = None):
+    """Create the async update function for the coordinator.
+
+    The modem is not probed here; when the scrape fails, the latest result of
+    the health coordinator tells whether the modem is still responding.
+    """
 
     async def async_update_data() -> dict[str, Any]:
         """Fetch data from the modem."""
-        base_url = f"http://{host}"
-        health_result = await health_monitor.check_health(base_url)
-
         try:
-            data: dict[str, Any] = await hass.async_add_executor_job(scraper.get_modem_data)
-
-            # Add health monitoring data
-            data["health_status"] = health_result.status
-            data["health_diagnosis"] = health_result.diagnosis
-            data["ping_success"] = health_result.ping_success
-            data["ping_latency_ms"] = health_result.ping_latency_ms
-            data["http_success"] = health_result.http_success
-            data["http_latency_ms"] = health_result.http_latency_ms
-            data["consecutive_failures"] = health_monitor.consecutive_failures
+            if entry is not None:
+                scraper.requested_sections = _requested_sections(hass, entry)
+            # Fetch on the event loop; only login/parse are handed to the executor
+            session = async_get_clientsession(hass, verify_ssl=VERIFY_SSL)
+            data: dict[str, Any] = await scraper.async_get_modem_data(session, hass.async_add_executor_job)
 
             # Create indexed lookups for O(1) channel access (performance optimization)
             # This prevents O(n) linear searches in each sensor's native_value property
@@ -115,24 +187,59 @@ def _create_update_function(hass: HomeAssistant, scraper, health_monitor, host:
 
             return data
         except Exception as err:
-            # If scraper fails but health check succeeded, return partial data
-            if health_result.ping_success or health_result.http_success:
+            # If scraper fails but the last health check succeeded, return partial data
+            health_result = health_coordinator.data or {}
+            if health_result.get("ping_success") or health_result.get("http_success"):
                 _LOGGER.warning("Scraper failed but modem is responding to health checks: %s", err)
-                return {
-                    "cable_modem_connection_status": "offline",
-                    "health_status": health_result.status,
-                    "health_diagnosis": health_result.diagnosis,
-                    "ping_success": health_result.ping_success,
-                    "ping_latency_ms": health_result.ping_latency_ms,
-                    "http_success": health_result.http_success,
-                    "http_latency_ms": health_result.http_latency_ms,
-                    "consecutive_failures": health_monitor.consecutive_failures,
-                }
+                return {"cable_modem_connection_status": "offline"}
             raise UpdateFailed(f"Error communicating with modem: {err}") from err
 
     return async_update_data
 
 
+def _setup_adaptive_polling(entry: ConfigEntry, coordinator: DataUpdateCoordinator) -> None:
+    """Feed every successful poll into a SignalQualityAnalyzer and follow its recommended interval.
+
+    Only recommendations with medium or high confidence are applied, and the
+    interval always stays within MIN_SCAN_INTERVAL and MAX_SCAN_INTERVAL.
+    """
+    from .core.signal_analyzer import SignalQualityAnalyzer
+
+    analyzer = SignalQualityAnalyzer()
+
+    @callback
+    def _async_adapt_interval() -> None:
+        data = coordinator.data
+        if not coordinator.last_update_success or not data or coordinator.update_interval is None:
+            return
+        if data.get("cable_modem_connection_status") != "online":
+            return
+
+        analyzer.add_sample(
+            {
+                "downstream_channels": data.get("cable_modem_downstream", []),
+                "total_uncorrected_errors": data.get("cable_modem_total_uncorrected", 0),
+            }
+        )
+
+        current = int(coordinator.update_interval.total_seconds())
+        recommendation = analyzer.get_recommended_interval(current)
+        if recommendation["confidence"] == "low":
+            return
+
+        new_interval = max(MIN_SCAN_INTERVAL, min(MAX_SCAN_INTERVAL, recommendation["recommended_seconds"]))
+        if new_interval != current:
+            _LOGGER.info(
+                "Adaptive polling: %s signal, changing interval from %ss to %ss",
+                recommendation["signal_status"],
+                current,
+                new_interval,
+            )
+            coordinator.update_interval = timedelta(seconds=new_interval)
+
+    entry.async_on_unload(coordinator.async_add_listener(_async_adapt_interval))
+
+
 async def _perform_initial_refresh(coordinator, entry: ConfigEntry) -> None:
     """Perform initial data refresh based on entry state."""
     from homeassistant.config_entries import ConfigEntryState
@@ -342,17 +449,16 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         else:
             # Fallback to auto if parser not found
             _LOGGER.warning("Parser '%s' not found, falling back to auto discovery", modem_choice)
-            from .parsers import get_parsers
+            from .parsers import get_lazy_parsers
 
-            parsers = await hass.async_add_executor_job(get_parsers)
-            selected_parser = parsers
+            selected_parser = get_lazy_parsers()
             parser_name_hint = entry.data.get(CONF_PARSER_NAME)
     else:
-        # Auto mode - need all parsers for discovery
-        from .parsers import get_parsers
+        # Auto mode - all parsers are candidates, but only those detection
+        # actually tries (usually just the cached one) get imported
+        from .parsers import get_lazy_parsers
 
-        parsers = await hass.async_add_executor_job(get_parsers)
-        selected_parser = parsers
+        selected_parser = get_lazy_parsers()
         parser_name_hint = entry.data.get(CONF_PARSER_NAME)
 
     # Create scraper
@@ -362,15 +468,34 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         password,
         parser=selected_parser,
         cached_url=entry.data.get(CONF_WORKING_URL),
+        password_encoding=entry.data.get(CONF_PASSWORD_ENCODING),
         parser_name=parser_name_hint,
         verify_ssl=VERIFY_SSL,
+        probe_concurrency=DEFAULT_PROBE_CONCURRENCY,
     )
 
     # Create health monitor
     health_monitor = await _create_health_monitor(hass)
+    entry.async_on_unload(health_monitor.async_close)
+
+    # Probe health on a short interval of its own, so outages shorter than a scrape are caught.
+    # It is refreshed first so a failing first scrape can already tell offline from unreachable.
+    health_coordinator = DataUpdateCoordinator(
+        hass,
+        _LOGGER,
+        name=f"Cable Modem {host} health",
+        update_method=_create_health_update_function(health_monitor, host),
+        update_interval=timedelta(seconds=HEALTH_CHECK_INTERVAL),
+        config_entry=entry,
+        always_update=False,
+    )
+    await _perform_initial_refresh(health_coordinator, entry)
 
-    # Create coordinator
-    async_update_data = _create_update_function(hass, scraper, health_monitor, host)
+    # Create coordinator; polls of all entries share one scheduler
+    scheduler = _get_poll_scheduler(hass)
+    async_update_data = scheduler.wrap(
+        entry.entry_id, _create_update_function(hass, scraper, health_coordinator, entry)
+    )
     coordinator = DataUpdateCoordinator(
         hass,
         _LOGGER,
@@ -380,12 +505,17 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         config_entry=entry,
     )
 
-    # Perform initial data fetch
+    if entry.data.get(CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING):
+        _setup_adaptive_polling(entry, coordinator)
+
+    # Perform initial data fetch, then phase-shift the following polls
     await _perform_initial_refresh(coordinator, entry)
+    scheduler.register(entry.entry_id, scan_interval)
 
-    # Store coordinator
+    # Store coordinators
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
+    hass.data.setdefault(DATA_HEALTH_COORDINATORS, {})[entry.entry_id] = health_coordinator
 
     # Setup platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
@@ -429,11 +559,18 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if unload_ok:
         # Clean up coordinator data
         hass.data[DOMAIN].pop(entry.entry_id, None)
+        hass.data.get(DATA_HEALTH_COORDINATORS, {}).pop(entry.entry_id, None)
+
+        scheduler: PollScheduler | None = hass.data.get(DATA_POLL_SCHEDULER)
+        if scheduler is not None:
+            scheduler.unregister(entry.entry_id)
 
-        # Unregister services if this is the last entry
+        # Unregister services (and drop the shared scheduler) if this is the last entry
         if not hass.data[DOMAIN]:
             hass.services.async_remove(DOMAIN, SERVICE_CLEAR_HISTORY)
             hass.services.async_remove(DOMAIN, SERVICE_CLEANUP_ENTITIES)
+            hass.data.pop(DATA_POLL_SCHEDULER, None)
+            hass.data.pop(DATA_HEALTH_COORDINATORS, None)
 
     return bool(unload_ok)
 
@@ -67,7 +67,7 @@ async def async_setup_entry(
 
 
 async def _check_restart_support(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    """Check if modem supports restart (run in executor to avoid blocking)."""
+    """Check if modem supports restart."""
     parser_name = entry.data.get("parser_name", "")
     detected_modem = entry.data.get("detected_modem", "")
 
@@ -75,19 +75,13 @@ async def _check_restart_support(hass: HomeAssistant, entry: ConfigEntry) -> boo
     if "Fallback Mode" in parser_name or "Unknown" in detected_modem:
         return False
 
-    # Check if parser has restart method
+    # Check if parser has restart method (manifest metadata, no parser import needed)
     modem_choice = entry.data.get("modem_choice", "")
     if modem_choice and modem_choice != "auto":
-        from .parsers import get_parser_by_name
+        from .parsers import get_lazy_parser
 
-        def check_parser() -> bool:
-            try:
-                parser_class = get_parser_by_name(modem_choice)
-                return bool(parser_class and hasattr(parser_class, "restart"))
-            except Exception:
-                return False
-
-        return bool(await hass.async_add_executor_job(check_parser))
+        parser = get_lazy_parser(modem_choice)
+        return bool(parser and parser.supports_restart)
 
     # Default to unavailable for safety
     return False
@@ -135,7 +129,7 @@ class ModemRestartButton(ModemButtonBase):
             VERIFY_SSL,
         )
         from .core.modem_scraper import ModemScraper
-        from .parsers import get_parsers
+        from .parsers import get_lazy_parsers
 
         host = self._entry.data[HOST_KEY]
         username = self._entry.data.get(CONF_USERNAME)
@@ -155,11 +149,11 @@ class ModemRestartButton(ModemButtonBase):
                 scraper = ModemScraper(host, username, password, parser, cached_url, verify_ssl=verify_ssl)
             else:
                 # Fallback to all parsers
-                parsers = await self.hass.async_add_executor_job(get_parsers)
+                parsers = get_lazy_parsers()
                 scraper = ModemScraper(host, username, password, parsers, cached_url, verify_ssl=verify_ssl)
         else:
-            # Auto mode - get all parsers (but use cache for speed)
-            parsers = await self.hass.async_add_executor_job(get_parsers)
+            # Auto mode - lazy proxies, only the parsers detection tries get imported
+            parsers = get_lazy_parsers()
             scraper = ModemScraper(host, username, password, parsers, cached_url, verify_ssl=verify_ssl)
 
         # Run the restart in an executor since it uses requests (blocking I/O)
@@ -621,7 +615,7 @@ class CaptureHtmlButton(ModemButtonBase):
             VERIFY_SSL,
         )
         from .core.modem_scraper import ModemScraper
-        from .parsers import get_parsers
+        from .parsers import get_lazy_parsers
 
         host = self._entry.data[HOST_KEY]
         username = self._entry.data.get(CONF_USERNAME)
@@ -639,10 +633,10 @@ class CaptureHtmlButton(ModemButtonBase):
                 parser = parser_class()
                 scraper = ModemScraper(host, username, password, parser, cached_url, verify_ssl=verify_ssl)
             else:
-                parsers = await self.hass.async_add_executor_job(get_parsers)
+                parsers = get_lazy_parsers()
                 scraper = ModemScraper(host, username, password, parsers, cached_url, verify_ssl=verify_ssl)
         else:
-            parsers = await self.hass.async_add_executor_job(get_parsers)
+            parsers = get_lazy_parsers()
             scraper = ModemScraper(host, username, password, parsers, cached_url, verify_ssl=verify_ssl)
 
         # Fetch data with HTML capture enabled
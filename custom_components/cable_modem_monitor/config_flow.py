@@ -11,6 +11,7 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 
 from .const import (
+    CONF_ADAPTIVE_POLLING,
     CONF_DETECTED_MANUFACTURER,
     CONF_DETECTED_MODEM,
     CONF_HOST,
@@ -18,9 +19,12 @@ from .const import (
     CONF_MODEM_CHOICE,
     CONF_PARSER_NAME,
     CONF_PASSWORD,
+    CONF_PASSWORD_ENCODING,
     CONF_SCAN_INTERVAL,
     CONF_USERNAME,
     CONF_WORKING_URL,
+    DEFAULT_ADAPTIVE_POLLING,
+    DEFAULT_PROBE_CONCURRENCY,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
     MAX_SCAN_INTERVAL,
@@ -29,7 +33,7 @@ from .const import (
 )
 from .core.discovery_helpers import ParserNotFoundError
 from .core.modem_scraper import ModemScraper
-from .parsers import get_parsers
+from .parsers import get_lazy_parsers, get_parser_names
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -297,8 +301,8 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
         raise CannotConnectError(error_msg)
     _LOGGER.warning("Quick connectivity check PASSED for %s", host)
 
-    # Get parsers and select appropriate one(s)
-    all_parsers = await hass.async_add_executor_job(get_parsers)
+    # Lazy parser proxies: only the parsers validation actually tries get imported
+    all_parsers = get_lazy_parsers()
     selected_parser, parser_name_hint = _select_parser_for_validation(
         all_parsers, data.get(CONF_MODEM_CHOICE), data.get(CONF_PARSER_NAME)
     )
@@ -311,8 +315,10 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
         data.get(CONF_PASSWORD),
         parser=selected_parser if selected_parser else all_parsers,
         cached_url=data.get(CONF_WORKING_URL),
+        password_encoding=data.get(CONF_PASSWORD_ENCODING),
         parser_name=parser_name_hint,
         verify_ssl=VERIFY_SSL,
+        probe_concurrency=DEFAULT_PROBE_CONCURRENCY,
     )
 
     # Connect and validate
@@ -357,24 +363,9 @@ class CableModemMonitorConfigFlow(config_entries.ConfigFlow):
         if user_input is None and self._user_input:
             user_input = self._user_input
 
-        # Get parsers for the dropdown
-        parsers = await self.hass.async_add_executor_job(get_parsers)
-
-        # Sort by manufacturer (alphabetical), then by name (alphabetical)
-        # Generic parsers appear last within their manufacturer group
-        # Unknown/Fallback parsers appear at the very end
-        def sort_key(p):
-            # Unknown manufacturer goes last
-            if p.manufacturer == "Unknown":
-                return ("ZZZZ", "ZZZZ")  # Sort to end
-            # Within each manufacturer, Generic parsers go last
-            if "Generic" in p.name:
-                return (p.manufacturer, "ZZZZ")  # Generic last in manufacturer
-            # Regular parsers sort by manufacturer then name
-            return (p.manufacturer, p.name)
-
-        sorted_parsers = sorted(parsers, key=sort_key)
-        modem_choices = ["auto"] + [p.name for p in sorted_parsers]
+        # Dropdown choices come from the parser manifest (already in display order),
+        # so rendering the form does not import any parser module
+        modem_choices = ["auto"] + get_parser_names()
 
         if user_input is not None:
             # Store user input and start validation with progress
@@ -485,6 +476,7 @@ class CableModemMonitorConfigFlow(config_entries.ConfigFlow):
 
         # Add default values for fields not in initial setup
         user_input.setdefault(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+        user_input.setdefault(CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING)
         # Note: VERIFY_SSL is now a hardcoded constant (see const.py)
 
         # Store detection info from validation
@@ -495,6 +487,7 @@ class CableModemMonitorConfigFlow(config_entries.ConfigFlow):
             user_input[CONF_DETECTED_MODEM] = detection_info.get("modem_name", "Unknown")
             user_input[CONF_DETECTED_MANUFACTURER] = detection_info.get("manufacturer", "Unknown")
             user_input[CONF_WORKING_URL] = detection_info.get("successful_url")
+            user_input[CONF_PASSWORD_ENCODING] = detection_info.get("password_encoding")
             from datetime import datetime
 
             user_input[CONF_LAST_DETECTION] = datetime.now().isoformat()
@@ -512,18 +505,9 @@ class CableModemMonitorConfigFlow(config_entries.ConfigFlow):
         self, user_input: dict[str, Any] | None = None
     ) -> config_entries.ConfigFlowResult:
         """Show form again with errors after validation failure."""
-        # Get parsers for the dropdown
-        parsers = await self.hass.async_add_executor_job(get_parsers)
-
-        def sort_key(p):
-            if p.manufacturer == "Unknown":
-                return ("ZZZZ", "ZZZZ")
-            if "Generic" in p.name:
-                return (p.manufacturer, "ZZZZ")
-            return (p.manufacturer, p.name)
-
-        sorted_parsers = sorted(parsers, key=sort_key)
-        modem_choices = ["auto"] + [p.name for p in sorted_parsers]
+        # Dropdown choices come from the parser manifest (already in display order),
+        # so rendering the form does not import any parser module
+        modem_choices = ["auto"] + get_parser_names()
 
         from homeassistant.helpers import selector
 
@@ -594,6 +578,7 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
             user_input[CONF_DETECTED_MODEM] = detection_info.get("modem_name", "Unknown")
             user_input[CONF_DETECTED_MANUFACTURER] = detection_info.get("manufacturer", "Unknown")
             user_input[CONF_WORKING_URL] = detection_info.get("successful_url")
+            user_input[CONF_PASSWORD_ENCODING] = detection_info.get("password_encoding")
             from datetime import datetime
 
             user_input[CONF_LAST_DETECTION] = datetime.now().isoformat()
@@ -611,6 +596,7 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
             user_input[CONF_DETECTED_MODEM] = self.config_entry.data.get(CONF_DETECTED_MODEM, "Unknown")
             user_input[CONF_DETECTED_MANUFACTURER] = self.config_entry.data.get(CONF_DETECTED_MANUFACTURER, "Unknown")
             user_input[CONF_WORKING_URL] = self.config_entry.data.get(CONF_WORKING_URL)
+            user_input[CONF_PASSWORD_ENCODING] = self.config_entry.data.get(CONF_PASSWORD_ENCODING)
             user_input[CONF_LAST_DETECTION] = self.config_entry.data.get(CONF_LAST_DETECTION)
 
     def _create_config_message(self, user_input: dict[str, Any]) -> str:
@@ -634,24 +620,9 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         """Manage the options."""
         errors = {}
 
-        # Get parsers for the dropdown
-        parsers = await self.hass.async_add_executor_job(get_parsers)
-
-        # Sort by manufacturer (alphabetical), then by name (alphabetical)
-        # Generic parsers appear last within their manufacturer group
-        # Unknown/Fallback parsers appear at the very end
-        def sort_key(p):
-            # Unknown manufacturer goes last
-            if p.manufacturer == "Unknown":
-                return ("ZZZZ", "ZZZZ")  # Sort to end
-            # Within each manufacturer, Generic parsers go last
-            if "Generic" in p.name:
-                return (p.manufacturer, "ZZZZ")  # Generic last in manufacturer
-            # Regular parsers sort by manufacturer then name
-            return (p.manufacturer, p.name)
-
-        sorted_parsers = sorted(parsers, key=sort_key)
-        modem_choices = ["auto"] + [p.name for p in sorted_parsers]
+        # Dropdown choices come from the parser manifest (already in display order),
+        # so rendering the form does not import any parser module
+        modem_choices = ["auto"] + get_parser_names()
 
         if user_input is not None:
             # Preserve existing credentials if not provided
@@ -696,6 +667,7 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         current_username = self.config_entry.data.get(CONF_USERNAME, "")
         current_modem_choice = self.config_entry.data.get(CONF_MODEM_CHOICE, "auto")
         current_scan_interval = self.config_entry.data.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+        current_adaptive_polling = self.config_entry.data.get(CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING)
 
         # Get detection info for display
         detected_modem = self.config_entry.data.get(CONF_DETECTED_MODEM, "Not detected")
@@ -730,6 +702,7 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                     vol.Coerce(int),
                     vol.Range(min=MIN_SCAN_INTERVAL, max=MAX_SCAN_INTERVAL),
                 ),
+                vol.Optional(CONF_ADAPTIVE_POLLING, default=current_adaptive_polling): bool,
             }
         )
 
@@ -25,11 +25,26 @@ CONF_MODEM_CHOICE = "modem_choice"
 # The self-signed certificate still provides encryption in transit on the LAN.
 VERIFY_SSL = False
 
+# Number of candidate URLs probed in parallel during URL/protocol discovery.
+# Kept small so weak modem web servers are not flooded with connections.
+DEFAULT_PROBE_CONCURRENCY = 4
+
+# Polling of multiple modems from one Home Assistant instance
+DATA_POLL_SCHEDULER = f"{DOMAIN}_poll_scheduler"  # hass.data key of the shared PollScheduler
+MAX_CONCURRENT_POLLS = 4  # Polls in flight across all modems
+POLL_PHASE_SPACING = 5  # Seconds between the phase offsets of consecutive modems
+
+# Health probing, which runs on its own short interval alongside the scrape
+DATA_HEALTH_COORDINATORS = f"{DOMAIN}_health_coordinators"  # hass.data key: entry_id -> health coordinator
+HEALTH_CHECK_INTERVAL = 10  # Seconds between health probes
+HEALTH_HISTORY_SIZE = 8640  # Health checks retained per modem (one day at HEALTH_CHECK_INTERVAL)
+
 # Modem detection cache fields
 CONF_PARSER_NAME = "parser_name"  # Cached parser class name for quick lookup
 CONF_DETECTED_MODEM = "detected_modem"  # Display name for UI
 CONF_DETECTED_MANUFACTURER = "detected_manufacturer"  # Display manufacturer for UI
 CONF_WORKING_URL = "working_url"  # Last successful URL
+CONF_PASSWORD_ENCODING = "password_encoding"  # Password encoding that last logged in ("plain"/"base64")
 CONF_LAST_DETECTION = "last_detection"  # Timestamp of last detection
 
 # Polling interval defaults based on industry best practices
@@ -43,3 +58,7 @@ CONF_LAST_DETECTION = "last_detection"  # Timestamp of last detection
 DEFAULT_SCAN_INTERVAL = 600  # 10 minutes - balanced default for network monitoring
 MIN_SCAN_INTERVAL = 60  # 1 minute - minimum to avoid device strain
 MAX_SCAN_INTERVAL = 1800  # 30 minutes - maximum useful interval
+
+# Adaptive polling: let signal stability move the interval between MIN and MAX (opt-in)
+CONF_ADAPTIVE_POLLING = "adaptive_polling"
+DEFAULT_ADAPTIVE_POLLING = False
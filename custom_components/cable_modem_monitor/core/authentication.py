@@ -15,10 +15,38 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+# Password encodings tried by form logins that fall back from plain to Base64
+PASSWORD_ENCODING_PLAIN = "plain"
+PASSWORD_ENCODING_BASE64 = "base64"
+
+
+def get_password_candidates(password: str, preferred_encoding: str | None = None) -> list[tuple[str, str]]:
+    """Return (encoding, encoded_password) pairs in the order they should be tried.
+
+    Plain comes first unless a previously successful encoding is given.
+
+    Args:
+        password: Plain-text password
+        preferred_encoding: Encoding that worked last time, if known
+
+    Returns:
+        List of (encoding, encoded_password) tuples
+    """
+    candidates = [
+        (PASSWORD_ENCODING_PLAIN, password),
+        (PASSWORD_ENCODING_BASE64, base64.b64encode(password.encode("utf-8")).decode("utf-8")),
+    ]
+    if preferred_encoding == PASSWORD_ENCODING_BASE64:
+        candidates.reverse()
+    return candidates
+
 
 class AuthStrategy:
     """Abstract base class for authentication strategies."""
 
+    # Password encoding the last login succeeded with, for strategies that try more than one
+    successful_encoding: str | None = None
+
     def login(
         self, session: requests.Session, base_url: str, username: str | None, password: str | None, config: AuthConfig
     ) -> tuple[bool, str | None]:
@@ -171,10 +199,20 @@ class FormBase64AuthStrategy(AuthStrategy):
 class FormPlainAndBase64AuthStrategy(AuthStrategy):
     """Form-based authentication with fallback from plain to Base64."""
 
+    def __init__(self, preferred_encoding: str | None = None):
+        """Initialize the strategy.
+
+        Args:
+            preferred_encoding: Encoding that worked last time ("plain" or "base64");
+                                it is tried first
+        """
+        self.preferred_encoding = preferred_encoding
+        self.successful_encoding: str | None = None
+
     def login(
         self, session: requests.Session, base_url: str, username: str | None, password: str | None, config: AuthConfig
     ) -> tuple[bool, str | None]:
-        """Try plain password first, then Base64-encoded."""
+        """Try the preferred encoding first (plain by default), then the other one."""
         if not username or not password:
             _LOGGER.debug("No credentials provided, skipping login")
             return (True, None)
@@ -187,19 +225,12 @@ class FormPlainAndBase64AuthStrategy(AuthStrategy):
 
         login_url = f"{base_url}{config.login_url}"
 
-        # Try plain password first
-        passwords_to_try = [
-            password,  # Plain password
-            base64.b64encode(password.encode("utf-8")).decode("utf-8"),  # Base64-encoded
-        ]
-
-        for attempt, pwd in enumerate(passwords_to_try, 1):
+        for encoding, pwd in get_password_candidates(password, self.preferred_encoding):
             login_data = {
                 config.username_field: username,
                 config.password_field: pwd,
             }
-            pwd_type = "plain" if attempt == 1 else "Base64-encoded"
-            _LOGGER.debug("Attempting login with %s password", pwd_type)
+            _LOGGER.debug("Attempting login with %s password", encoding)
 
             response = session.post(login_url, data=login_data, timeout=10, allow_redirects=True, verify=session.verify)
 
@@ -215,7 +246,8 @@ class FormPlainAndBase64AuthStrategy(AuthStrategy):
                 success = response.status_code == 200
 
             if success:
-                _LOGGER.debug("Form login successful with %s password", pwd_type)
+                _LOGGER.debug("Form login successful with %s password", encoding)
+                self.successful_encoding = encoding
                 return (True, response.text)
 
         _LOGGER.warning("Form login failed with both plain and Base64 passwords")
@@ -461,11 +493,13 @@ class AuthFactory:
     }
 
     @classmethod
-    def get_strategy(cls, strategy_type: AuthStrategyType) -> AuthStrategy:
+    def get_strategy(cls, strategy_type: AuthStrategyType, password_encoding: str | None = None) -> AuthStrategy:
         """Get authentication strategy instance by type.
 
         Args:
             strategy_type: AuthStrategyType enum value
+            password_encoding: Encoding that worked last time, tried first by
+                               strategies that fall back between encodings
 
         Returns:
             AuthStrategy instance
@@ -477,6 +511,8 @@ class AuthFactory:
             raise ValueError(f"Unsupported authentication strategy: {strategy_type}")
 
         strategy_class = cls._strategies[strategy_type]
+        if strategy_class is FormPlainAndBase64AuthStrategy:
+            return FormPlainAndBase64AuthStrategy(preferred_encoding=password_encoding)
         return strategy_class()
 
     @classmethod
@@ -5,12 +5,16 @@ from __future__ import annotations
 import logging
 import time
 from collections.abc import Sequence
+from typing import TYPE_CHECKING
 
 import requests
-from bs4 import BeautifulSoup
 
+from ..lib.html_backend import make_soup
 from ..parsers.base_parser import ModemParser
 
+if TYPE_CHECKING:
+    from .document_cache import DocumentCache
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -23,6 +27,7 @@ class ParserHeuristics:
         parsers: Sequence[type[ModemParser]],
         session: requests.Session,
         verify_ssl: bool = False,
+        documents: DocumentCache | None = None,
     ) -> list[type[ModemParser]]:
         """
         Return parsers likely to match based on quick heuristic checks.
@@ -32,6 +37,7 @@ class ParserHeuristics:
             parsers: List of all available parser classes
             session: requests.Session object
             verify_ssl: SSL verification setting
+            documents: Per-poll document cache; reuses an already fetched root page and its parse tree
 
         Returns:
             List of parser classes, sorted by likelihood (most likely first)
@@ -43,10 +49,16 @@ class ParserHeuristics:
 
         # Try to fetch root page quickly (no auth) for heuristics
         try:
-            response = session.get(f"{base_url}/", timeout=3, verify=verify_ssl)
-            if response.status_code == 200:
-                html = response.text.lower()
-                soup = BeautifulSoup(response.text, "html.parser")
+            if documents is not None:
+                document = documents.fetch(session, f"{base_url}/", timeout=3, verify_ssl=verify_ssl)
+                root_html = document.html if document else None
+            else:
+                response = session.get(f"{base_url}/", timeout=3, verify=verify_ssl)
+                root_html = response.text if response.status_code == 200 else None
+
+            if root_html is not None:
+                html = root_html.lower()
+                soup = documents.soup(root_html) if documents is not None else make_soup(root_html)
                 title = soup.title.string.lower() if soup.title and soup.title.string else ""
 
                 _LOGGER.debug("Heuristics: Got root page (%s bytes, title: '%s')", len(html), title)
@@ -71,7 +83,7 @@ class ParserHeuristics:
                         unlikely_parsers.append(parser_class)
 
             else:
-                _LOGGER.debug("Heuristics: Root page returned status %s, skipping heuristics", response.status_code)
+                _LOGGER.debug("Heuristics: Root page unavailable, skipping heuristics")
                 return list(parsers)  # Return all parsers if heuristics fail
 
         except (requests.RequestException, Exception) as e:
@@ -94,7 +106,11 @@ class ParserHeuristics:
 
     @staticmethod
     def check_anonymous_access(
-        base_url: str, parser_class: type[ModemParser], session: requests.Session, verify_ssl: bool = False
+        base_url: str,
+        parser_class: type[ModemParser],
+        session: requests.Session,
+        verify_ssl: bool = False,
+        documents: DocumentCache | None = None,
     ) -> tuple[str, str] | None:
         """
         Check if parser has public (non-authenticated) URLs that can be accessed.
@@ -104,6 +120,7 @@ class ParserHeuristics:
             parser_class: Parser class to check
             session: requests.Session object
             verify_ssl: SSL verification setting
+            documents: Per-poll document cache; a public page shared by several parsers is fetched once
 
         Returns:
             Tuple of (html, url) if successful, None otherwise
@@ -116,6 +133,13 @@ class ParserHeuristics:
             # Look for patterns explicitly marked as not requiring auth
             if not pattern.get("auth_required", True):
                 url = f"{base_url}{pattern['path']}"
+                if documents is not None:
+                    _LOGGER.debug("Trying anonymous access to %s for parser %s", url, parser_class.name)
+                    document = documents.fetch(session, url, timeout=5, verify_ssl=verify_ssl)
+                    if document is not None:
+                        _LOGGER.info("Anonymous access successful to %s (%s bytes)", url, len(document.html))
+                        return (document.html, url)
+                    continue
                 try:
                     _LOGGER.debug("Trying anonymous access to %s for parser %s", url, parser_class.name)
                     response = session.get(url, timeout=5, verify=verify_ssl)
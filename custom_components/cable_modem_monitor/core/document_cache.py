@@ -0,0 +1,129 @@
+"""Per-poll cache of fetched and parsed modem pages."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+from dataclasses import dataclass, field
+
+import requests
+from bs4 import BeautifulSoup
+
+from ..lib.html_backend import make_soup
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def content_digest(html: str) -> str:
+    """Return a stable digest of page content."""
+    return hashlib.sha256(html.encode("utf-8", errors="replace")).hexdigest()
+
+
+@dataclass
+class CachedDocument:
+    """A fetched page with its lazily built parse tree."""
+
+    url: str
+    html: str
+    digest: str
+    _soup: BeautifulSoup | None = field(default=None, repr=False)
+
+
+class DocumentCache:
+    """Share fetched pages and parse trees between detection, heuristics and parsing.
+
+    Pages are keyed by URL, parse trees by content digest, so the same HTML is
+    parsed at most once no matter how many callers ask for it. Failed fetches are
+    remembered as well so a URL is requested at most once per poll.
+
+    The cache is meant to live for a single poll; call clear() before the next one.
+    """
+
+    def __init__(self, backend: str | None = None):
+        """Initialize the cache.
+
+        Args:
+            backend: HTML parse backend passed to make_soup
+        """
+        self.backend = backend
+        self._by_url: dict[str, CachedDocument | None] = {}
+        self._by_digest: dict[str, CachedDocument] = {}
+
+    def clear(self) -> None:
+        """Forget all pages (start of a new poll)."""
+        self._by_url.clear()
+        self._by_digest.clear()
+
+    def add(self, url: str, html: str) -> CachedDocument:
+        """Record a page fetched by the caller.
+
+        Args:
+            url: URL the page was fetched from
+            html: Page content
+
+        Returns:
+            Cached document (shared with any earlier entry with identical content)
+        """
+        digest = content_digest(html)
+        document = self._by_digest.get(digest)
+        if document is None:
+            document = CachedDocument(url=url, html=html, digest=digest)
+            self._by_digest[digest] = document
+        self._by_url[url] = document
+        return document
+
+    def get(self, url: str) -> CachedDocument | None:
+        """Return the cached page for a URL, if it was fetched successfully."""
+        return self._by_url.get(url)
+
+    def fetch(
+        self, session: requests.Session, url: str, timeout: float = 5, verify_ssl: bool = False
+    ) -> CachedDocument | None:
+        """GET a page unless this poll already requested it.
+
+        Args:
+            session: requests.Session object
+            url: URL to fetch
+            timeout: Request timeout in seconds
+            verify_ssl: SSL verification setting
+
+        Returns:
+            Cached document on HTTP 200, None otherwise (including earlier failures)
+        """
+        if url in self._by_url:
+            _LOGGER.debug("Document cache hit for %s", url)
+            return self._by_url[url]
+
+        try:
+            response = session.get(url, timeout=timeout, verify=verify_ssl)
+        except requests.RequestException as e:
+            _LOGGER.debug("Fetch of %s failed: %s", url, type(e).__name__)
+            self._by_url[url] = None
+            return None
+
+        if response.status_code != 200:
+            _LOGGER.debug("Fetch of %s returned status %s", url, response.status_code)
+            self._by_url[url] = None
+            return None
+
+        return self.add(url, response.text)
+
+    def soup(self, html: str, url: str | None = None) -> BeautifulSoup:
+        """Return the parse tree for some HTML, parsing it only on first use.
+
+        Args:
+            html: Page content
+            url: URL the content came from, if known (recorded for later lookups)
+
+        Returns:
+            BeautifulSoup document shared by every caller with the same content
+        """
+        document = self._by_digest.get(content_digest(html))
+        if document is None:
+            document = self.add(url or "", html)
+        elif url and url not in self._by_url:
+            self._by_url[url] = document
+
+        if document._soup is None:
+            document._soup = make_soup(document.html, self.backend)
+        return document._soup
@@ -0,0 +1,135 @@
+"""Single-pass fingerprint matching to rank parser candidates before can_parse runs."""
+
+from __future__ import annotations
+
+import functools
+import logging
+import re
+from collections.abc import Sequence
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+# How much one distinct fingerprint hit of each kind counts towards a parser's score.
+# Title and URL hits are specific to a model page; body text is often shared.
+FINGERPRINT_WEIGHTS = {"title": 4, "url": 4, "meta": 3, "body": 1}
+
+# Regions of the page that fingerprints of the same name are matched against
+_REGION_PATTERN = r"(?P<title><title\b[^>]*>.*?</title>)|(?P<meta><meta\b[^>]*>)"
+
+# Fingerprints of one parser as hashable data: (parser name, ((kind, (literal, ...)), ...))
+FingerprintKey = tuple[str, tuple[tuple[str, tuple[str, ...]], ...]]
+
+
+def _fingerprint_key(parser_class: Any) -> FingerprintKey:
+    """Return a parser's fingerprints as hashable data (empty if missing or not a dict)."""
+    fingerprints = getattr(parser_class, "fingerprints", None)
+    if not isinstance(fingerprints, dict):
+        return parser_class.name, ()
+    return parser_class.name, tuple((kind, tuple(literals)) for kind, literals in fingerprints.items())
+
+
+class _CompiledFingerprints:
+    """Patterns compiled from the fingerprints of a parser list, referring to parsers by position."""
+
+    def __init__(self, keys: tuple[FingerprintKey, ...]):
+        # literal (lowercased) -> [(parser index, kind)]
+        self.owners: dict[str, list[tuple[int, str]]] = {}
+        self.url_literals: list[tuple[str, int]] = []
+
+        for index, (name, fingerprints) in enumerate(keys):
+            for kind, literals in fingerprints:
+                if kind not in FINGERPRINT_WEIGHTS:
+                    _LOGGER.warning("Ignoring unknown fingerprint kind '%s' on %s", kind, name)
+                    continue
+                for literal in literals:
+                    if kind == "url":
+                        self.url_literals.append((literal.lower(), index))
+                    else:
+                        self.owners.setdefault(literal.lower(), []).append((index, kind))
+
+        # Longest first, so a literal that contains another one wins at the same position
+        alternation = "|".join(re.escape(literal) for literal in sorted(self.owners, key=len, reverse=True))
+        self.literals = re.compile(alternation, re.IGNORECASE) if alternation else None
+        self.scanner = re.compile(
+            f"{_REGION_PATTERN}|{alternation}" if alternation else _REGION_PATTERN, re.IGNORECASE | re.DOTALL
+        )
+
+
+@functools.lru_cache(maxsize=8)
+def _compile(keys: tuple[FingerprintKey, ...]) -> _CompiledFingerprints:
+    """Compile the fingerprints of a parser list once per distinct list.
+
+    Keyed on names and literals only, so the cache keeps no parser objects alive.
+    """
+    return _CompiledFingerprints(keys)
+
+
+class FingerprintIndex:
+    """Ranks parsers by the fingerprints they declare, scanning the HTML once.
+
+    Every literal from every parser's ``fingerprints`` is compiled into one
+    case-insensitive alternation, together with patterns for the <title>
+    element and <meta> tags. A single ``finditer`` over the raw HTML then
+    yields all body hits and the title/meta regions, whose (short) contents
+    are matched again to attribute title and meta hits. Cost grows with the
+    page size, not with the number of parsers.
+    """
+
+    def __init__(self, parsers: Sequence[Any]):
+        """Index the fingerprints of the given parser classes.
+
+        The patterns are compiled once per distinct set of parser names and
+        fingerprints and shared between indexes.
+
+        Args:
+            parsers: Parser classes; those without a ``fingerprints`` dict never become candidates
+        """
+        self.parsers = list(parsers)
+        self._compiled = _compile(tuple(_fingerprint_key(parser_class) for parser_class in self.parsers))
+
+    def scores(self, html: str, url: str = "") -> dict[Any, int]:
+        """Return the fingerprint score of each parser with at least one hit."""
+        hits: set[tuple[int, str, str]] = set()
+
+        compiled = self._compiled
+        if compiled.literals is not None:
+            for match in compiled.scanner.finditer(html):
+                region = match.lastgroup
+                if region is None:
+                    self._record(match.group().lower(), "body", hits)
+                    continue
+                for inner in compiled.literals.finditer(match.group()):
+                    self._record(inner.group().lower(), region, hits)
+
+        lowered_url = url.lower()
+        for literal, index in compiled.url_literals:
+            if literal in lowered_url:
+                hits.add((index, "url", literal))
+
+        totals: dict[int, int] = {}
+        for index, kind, _literal in hits:
+            totals[index] = totals.get(index, 0) + FINGERPRINT_WEIGHTS[kind]
+        return {self.parsers[index]: totals[index] for index in sorted(totals)}
+
+    def _record(self, literal: str, region: str, hits: set[tuple[int, str, str]]) -> None:
+        """Count a literal found in a region for every parser that declared it there (or as body)."""
+        for index, kind in self._compiled.owners.get(literal, ()):
+            if kind in (region, "body"):
+                hits.add((index, kind, literal))
+
+    def rank(self, html: str, url: str = "") -> list[Any]:
+        """Return the parsers with fingerprint hits, most likely first.
+
+        Hits decide which parsers are candidates. They are ordered by parser
+        priority first, so a model-specific parser still runs before the
+        generic parser of the same family, then by score. Parsers without
+        hits are not returned; callers keep them as later candidates.
+        """
+        scores = self.scores(html, url)
+        ranked = sorted(scores, key=lambda parser: (-getattr(parser, "priority", 50), -scores[parser]))
+        if ranked:
+            _LOGGER.debug(
+                "Fingerprint candidates: %s", ", ".join(f"{parser.name} ({scores[parser]})" for parser in ranked)
+            )
+        return ranked
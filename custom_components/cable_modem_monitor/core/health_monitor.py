@@ -7,15 +7,29 @@ import logging
 import re
 import ssl
 import time
+from collections.abc import Iterator
 from dataclasses import dataclass
 from urllib.parse import urlparse
 
 import aiohttp
 
+from ..lib.quantile_sketch import QuantileSketch
+from ..lib.ring_buffer import RingBuffer
+from .network_probe import NetworkProber, ProbeResult
+
 _LOGGER = logging.getLogger(__name__)
 
+# Seconds an idle pooled connection to the modem is kept open. Modems often
+# drop idle connections sooner; a stale one only fails the HEAD, which the
+# GET fallback then retries on a fresh connection.
+HTTP_KEEPALIVE_TIMEOUT = 60
+
+# Probes sent per health check; enough for a loss and jitter estimate without
+# adding more than a fraction of a second to the check.
+PING_BURST_COUNT = 3
 
-@dataclass
+
+@dataclass(slots=True)
 class HealthCheckResult:
     """Result of a health check operation."""
 
@@ -24,6 +38,10 @@ class HealthCheckResult:
     ping_latency_ms: float | None
     http_success: bool
     http_latency_ms: float | None
+    ping_min_ms: float | None = None
+    ping_max_ms: float | None = None
+    ping_jitter_ms: float | None = None
+    ping_packet_loss: float | None = None
 
     @property
     def is_healthy(self) -> bool:
@@ -55,11 +73,138 @@ class HealthCheckResult:
             return "Network down / offline"
 
 
+class _LatencyWindow:
+    """Running mean and quantile sketch of the latencies in a sliding window."""
+
+    __slots__ = ("count", "total", "sketch")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.sketch = QuantileSketch()
+
+    def add(self, latency_ms: float) -> None:
+        self.count += 1
+        self.total += latency_ms
+        self.sketch.add(latency_ms)
+
+    def remove(self, latency_ms: float) -> None:
+        self.count -= 1
+        # Reset instead of subtracting the last value so float error cannot accumulate
+        self.total = self.total - latency_ms if self.count else 0.0
+        self.sketch.remove(latency_ms)
+
+    @property
+    def mean(self) -> float | None:
+        return self.total / self.count if self.count else None
+
+
+def _latency_percentiles(name: str, window: _LatencyWindow) -> dict[str, float | None]:
+    """Return p50/p95/p99 of a latency window keyed as ``<name>_latency_p<N>_ms``."""
+    return {f"{name}_latency_p{int(q * 100)}_ms": window.sketch.quantile(q) for q in (0.5, 0.95, 0.99)}
+
+
+class HealthHistory:
+    """Fixed-size history of health check results with rolling aggregates.
+
+    Results are kept oldest first in a ring buffer. Success counts and latency
+    windows are updated as results are added and evicted, so means, quantiles
+    and the success ratio cost O(1) to read regardless of ``max_size``.
+    The longest outage is tracked over the monitor's whole lifetime.
+    """
+
+    def __init__(self, max_size: int):
+        """Initialize the history.
+
+        Args:
+            max_size: Maximum number of results retained
+        """
+        self._results: RingBuffer[HealthCheckResult] = RingBuffer(max_size)
+        self._healthy = 0
+        self.ping = _LatencyWindow()
+        self.http = _LatencyWindow()
+        self._outage_start: float | None = None
+        self._outage_checks = 0
+        self.longest_outage_checks = 0
+        self.longest_outage_seconds = 0.0
+
+    def __len__(self) -> int:
+        """Return the number of retained results."""
+        return len(self._results)
+
+    def __getitem__(self, index: int) -> HealthCheckResult:
+        """Return a result (0 = oldest, -1 = latest)."""
+        return self._results[index]
+
+    def __iter__(self) -> Iterator[HealthCheckResult]:
+        """Iterate from oldest to latest."""
+        return iter(self._results)
+
+    def append(self, result: HealthCheckResult) -> None:
+        """Add the latest result, evicting the oldest when full."""
+        evicted = self._results.append(result)
+        self._count(result)
+        if evicted is not None:
+            self._uncount(evicted)
+        self._track_outage(result)
+
+    def clear(self) -> None:
+        """Remove all results and reset the aggregates."""
+        self._results.clear()
+        self._healthy = 0
+        self.ping = _LatencyWindow()
+        self.http = _LatencyWindow()
+        self._outage_start = None
+        self._outage_checks = 0
+        self.longest_outage_checks = 0
+        self.longest_outage_seconds = 0.0
+
+    @property
+    def success_ratio(self) -> float | None:
+        """Share of retained checks in which the modem responded."""
+        return self._healthy / len(self._results) if self._results else None
+
+    def _count(self, result: HealthCheckResult) -> None:
+        if result.is_healthy:
+            self._healthy += 1
+        if result.ping_success and result.ping_latency_ms is not None:
+            self.ping.add(result.ping_latency_ms)
+        if result.http_success and result.http_latency_ms is not None:
+            self.http.add(result.http_latency_ms)
+
+    def _uncount(self, result: HealthCheckResult) -> None:
+        if result.is_healthy:
+            self._healthy -= 1
+        if result.ping_success and result.ping_latency_ms is not None:
+            self.ping.remove(result.ping_latency_ms)
+        if result.http_success and result.http_latency_ms is not None:
+            self.http.remove(result.http_latency_ms)
+
+    def _track_outage(self, result: HealthCheckResult) -> None:
+        """Measure runs of failed checks, from the first failure to the recovering check."""
+        if result.is_healthy:
+            if self._outage_start is not None:
+                self._record_outage(self._outage_start, result.timestamp)
+            self._outage_start = None
+            self._outage_checks = 0
+            return
+        if self._outage_start is None:
+            self._outage_start = result.timestamp
+        self._outage_checks += 1
+        # An ongoing outage counts with the time observed so far
+        self._record_outage(self._outage_start, result.timestamp)
+
+    def _record_outage(self, start: float, until: float) -> None:
+        self.longest_outage_checks = max(self.longest_outage_checks, self._outage_checks)
+        self.longest_outage_seconds = max(self.longest_outage_seconds, until - start)
+
+
 class ModemHealthMonitor:
     """
     Monitor modem health using dual-layer diagnostics.
 
-    Performs both ICMP ping (Layer 3) and HTTP HEAD (Layer 7) checks
+    Performs both ICMP ping (Layer 3, or a TCP connect where unprivileged
+    ICMP sockets are not allowed) and HTTP HEAD (Layer 7) checks
     to distinguish between network issues, web server issues, and firewall blocks.
     """
 
@@ -73,10 +218,12 @@ class ModemHealthMonitor:
         """
         self.max_history = max_history
         self.verify_ssl = verify_ssl
-        self.history: list[HealthCheckResult] = []
+        self.history = HealthHistory(max_history)
         self.consecutive_failures = 0
         self.total_checks = 0
         self.successful_checks = 0
+        self._session: aiohttp.ClientSession | None = None
+        self._prober = NetworkProber(count=PING_BURST_COUNT)
 
         # Use provided SSL context or create a new one
         # NOTE: If creating here, ensure this __init__ is NOT called from async context
@@ -104,9 +251,11 @@ class ModemHealthMonitor:
         """
         # Extract host from URL using proper URL parsing
         host: str | None
+        port = 80
         try:
             parsed = urlparse(base_url)
             host = parsed.hostname or parsed.netloc.split(":")[0] if parsed.netloc else base_url
+            port = parsed.port or (443 if parsed.scheme == "https" else 80)
 
             # Validate host format (basic IP or hostname validation)
             if not host or not self._is_valid_host(host):
@@ -117,17 +266,19 @@ class ModemHealthMonitor:
             host = None
 
         # Run ping and HTTP check in parallel (skip ping if host is invalid)
+        probe: ProbeResult | None = None
         if host:
             ping_result, http_result = await asyncio.gather(
-                self._check_ping(host), self._check_http(base_url), return_exceptions=True
+                self._check_ping(host, port), self._check_http(base_url), return_exceptions=True
             )
 
             # Handle exceptions
             if isinstance(ping_result, BaseException):
                 _LOGGER.debug("Ping check exception: %s", ping_result)
-                ping_success, ping_latency = False, None
             else:
-                ping_success, ping_latency = ping_result
+                probe = ping_result
+            ping_success = probe is not None and probe.success
+            ping_latency = probe.avg_ms if probe is not None else None
 
             if isinstance(http_result, BaseException):
                 _LOGGER.debug("HTTP check exception: %s", http_result)
@@ -147,57 +298,47 @@ class ModemHealthMonitor:
             http_success=http_success,
             http_latency_ms=http_latency,
         )
+        if probe is not None:
+            result.ping_min_ms = probe.min_ms
+            result.ping_max_ms = probe.max_ms
+            result.ping_jitter_ms = probe.jitter_ms
+            result.ping_packet_loss = probe.packet_loss
 
         # Update statistics
         self._update_stats(result)
 
         # Store in history
         self.history.append(result)
-        if len(self.history) > self.max_history:
-            self.history.pop(0)
 
         _LOGGER.debug("Health check: %s (ping=%s, http=%s)", result.status, ping_success, http_success)
 
         return result
 
-    async def _check_ping(self, host: str) -> tuple[bool, float | None]:
+    async def _check_ping(self, host: str, port: int = 80) -> ProbeResult | None:
         """
-        Perform ICMP ping check with input validation.
+        Send a burst of in-process ICMP echo (or TCP connect) probes.
+
+        The burst is returned rather than stored, so checks running at the same
+        time (e.g. from two coordinators) never see each other's statistics.
 
         Args:
             host: Validated hostname or IP address
+            port: TCP port probed when unprivileged ICMP is not permitted
 
         Returns:
-            tuple: (success: bool, latency_ms: float | None)
+            ProbeResult of the burst, or None if the host is invalid or probing failed
         """
         try:
-            # Additional validation to prevent command injection
+            # Validation guards against probing arbitrary strings taken from the URL
             if not host or not self._is_valid_host(host):
                 _LOGGER.error("Invalid host for ping: %s", host)
-                return False, None
+                return None
 
-            # Use system ping command (works on Linux and Windows)
-            # -c 1 = send 1 packet (Linux)
-            # -W 2 = timeout 2 seconds (Linux)
-            start_time = time.time()
-
-            # Run ping command with validated host
-            # Using asyncio.create_subprocess_exec with separate arguments prevents shell injection
-            proc = await asyncio.create_subprocess_exec(
-                "ping", "-c", "1", "-W", "2", host, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
-            )
-
-            stdout, stderr = await proc.communicate()
-            latency_ms = (time.time() - start_time) * 1000
-
-            # Check return code (0 = success)
-            success = proc.returncode == 0
-
-            return success, latency_ms if success else None
+            return await self._prober.probe(host, port)
 
         except Exception as e:
             _LOGGER.debug("Ping exception for %s: %s", host, e)
-            return False, None
+            return None
 
     async def _check_http(self, base_url: str) -> tuple[bool, float | None]:
         """
@@ -214,39 +355,36 @@ class ModemHealthMonitor:
                 _LOGGER.error("Invalid URL for HTTP check: %s", base_url)
                 return False, None
 
-            # Use pre-configured SSL context (created during __init__ to avoid blocking I/O in event loop)
-            timeout = aiohttp.ClientTimeout(total=5)
-            connector = aiohttp.TCPConnector(ssl=self._ssl_context)
-
-            async with aiohttp.ClientSession(timeout=timeout, connector=connector) as session:
-                # Try HEAD first (lightweight)
-                try:
-                    async with session.head(base_url, allow_redirects=False) as response:
-                        # Validate redirect if present
-                        if response.status in (301, 302, 303, 307, 308):
-                            redirect_url = response.headers.get("Location", "")
-                            if not self._is_safe_redirect(base_url, redirect_url):
-                                _LOGGER.warning("Unsafe redirect detected: %s -> %s", base_url, redirect_url)
-                                return False, None
-
-                        latency_ms = (time.time() - start_time) * 1000
-                        # Accept any response (2xx, 3xx, 4xx) as "alive"
-                        success = response.status < 500
-                        return success, latency_ms if success else None
-                except (aiohttp.ClientError, TimeoutError):
-                    # HEAD failed, try GET (some modems don't support HEAD)
-                    start_time = time.time()  # Reset timer
-                    async with session.get(base_url, allow_redirects=False) as response:
-                        # Validate redirect if present
-                        if response.status in (301, 302, 303, 307, 308):
-                            redirect_url = response.headers.get("Location", "")
-                            if not self._is_safe_redirect(base_url, redirect_url):
-                                _LOGGER.warning("Unsafe redirect detected: %s -> %s", base_url, redirect_url)
-                                return False, None
-
-                        latency_ms = (time.time() - start_time) * 1000
-                        success = response.status < 500
-                        return success, latency_ms if success else None
+            session = self._get_session()
+
+            # Try HEAD first (lightweight)
+            try:
+                async with session.head(base_url, allow_redirects=False) as response:
+                    # Validate redirect if present
+                    if response.status in (301, 302, 303, 307, 308):
+                        redirect_url = response.headers.get("Location", "")
+                        if not self._is_safe_redirect(base_url, redirect_url):
+                            _LOGGER.warning("Unsafe redirect detected: %s -> %s", base_url, redirect_url)
+                            return False, None
+
+                    latency_ms = (time.time() - start_time) * 1000
+                    # Accept any response (2xx, 3xx, 4xx) as "alive"
+                    success = response.status < 500
+                    return success, latency_ms if success else None
+            except (aiohttp.ClientError, TimeoutError):
+                # HEAD failed, try GET (some modems don't support HEAD)
+                start_time = time.time()  # Reset timer
+                async with session.get(base_url, allow_redirects=False) as response:
+                    # Validate redirect if present
+                    if response.status in (301, 302, 303, 307, 308):
+                        redirect_url = response.headers.get("Location", "")
+                        if not self._is_safe_redirect(base_url, redirect_url):
+                            _LOGGER.warning("Unsafe redirect detected: %s -> %s", base_url, redirect_url)
+                            return False, None
+
+                    latency_ms = (time.time() - start_time) * 1000
+                    success = response.status < 500
+                    return success, latency_ms if success else None
 
         except TimeoutError:
             _LOGGER.debug("HTTP check timeout for %s", base_url)
@@ -258,6 +396,29 @@ class ModemHealthMonitor:
             _LOGGER.debug("HTTP check exception for %s: %s", base_url, e)
             return False, None
 
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the session used for HTTP checks, creating it on first use.
+
+        The session (and its keep-alive connection pool) lives as long as the
+        monitor, so repeated checks skip the TCP and TLS handshakes.
+        """
+        if self._session is None or self._session.closed:
+            # Use pre-configured SSL context (created during __init__ to avoid blocking I/O in event loop)
+            timeout = aiohttp.ClientTimeout(total=5)
+            connector = aiohttp.TCPConnector(
+                ssl=self._ssl_context,
+                limit_per_host=2,
+                keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT,
+            )
+            self._session = aiohttp.ClientSession(timeout=timeout, connector=connector)
+        return self._session
+
+    async def async_close(self) -> None:
+        """Close the HTTP session and its pooled connections."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
     def _update_stats(self, result: HealthCheckResult):
         """Update running statistics."""
         self.total_checks += 1
@@ -270,19 +431,13 @@ class ModemHealthMonitor:
 
     @property
     def average_ping_latency(self) -> float | None:
-        """Calculate average ping latency from recent history."""
-        latencies = [h.ping_latency_ms for h in self.history if h.ping_success and h.ping_latency_ms is not None]
-        if not latencies:
-            return None
-        return sum(latencies) / len(latencies)
+        """Average ping latency over the retained history."""
+        return self.history.ping.mean
 
     @property
     def average_http_latency(self) -> float | None:
-        """Calculate average HTTP latency from recent history."""
-        latencies = [h.http_latency_ms for h in self.history if h.http_success and h.http_latency_ms is not None]
-        if not latencies:
-            return None
-        return sum(latencies) / len(latencies)
+        """Average HTTP latency over the retained history."""
+        return self.history.http.mean
 
     def get_status_summary(self) -> dict:
         """Get current health status summary."""
@@ -301,10 +456,17 @@ class ModemHealthMonitor:
             "total_checks": self.total_checks,
             "ping_success": latest.ping_success,
             "ping_latency_ms": latest.ping_latency_ms,
+            "ping_jitter_ms": latest.ping_jitter_ms,
+            "ping_packet_loss": latest.ping_packet_loss,
             "http_success": latest.http_success,
             "http_latency_ms": latest.http_latency_ms,
             "avg_ping_latency_ms": self.average_ping_latency,
             "avg_http_latency_ms": self.average_http_latency,
+            **_latency_percentiles("ping", self.history.ping),
+            **_latency_percentiles("http", self.history.http),
+            "success_ratio": self.history.success_ratio,
+            "longest_outage_checks": self.history.longest_outage_checks,
+            "longest_outage_seconds": self.history.longest_outage_seconds,
         }
 
     def _is_valid_host(self, host: str) -> bool:
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import io
 import logging
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, cast
 
 import requests
@@ -27,6 +30,39 @@ except ImportError:
     )
 
 
+@dataclass(frozen=True)
+class HNAPResultPaths:
+    """Qualified tag names of the action results and fields to pull from an HNAP response.
+
+    Compiled once (a parser's namespace and fields are fixed), so extraction only
+    looks tag names up in dicts. Each name is matched with and without the HNAP
+    namespace, since firmware differs in whether results declare it.
+
+    Attributes:
+        responses: Element tag -> result key ("<Action>Response")
+        fields: Result key -> {element tag: field name}
+    """
+
+    responses: Mapping[str, str]
+    fields: Mapping[str, Mapping[str, str]]
+
+    @classmethod
+    def compile(cls, namespace: str, fields: Mapping[str, Iterable[str]]) -> HNAPResultPaths:
+        """Build paths for the given fields of each action's result.
+
+        Args:
+            namespace: SOAP action namespace (e.g., "http://purenetworks.com/HNAP1/")
+            fields: HNAP action name -> names of the result fields to extract
+        """
+        responses: dict[str, str] = {}
+        field_tags: dict[str, dict[str, str]] = {}
+        for action, names in fields.items():
+            key = f"{action}Response"
+            responses[key] = responses[f"{{{namespace}}}{key}"] = key
+            field_tags[key] = {tag: name for name in names for tag in (name, f"{{{namespace}}}{name}")}
+        return cls(responses, field_tags)
+
+
 class HNAPRequestBuilder:
     """Helper for building and executing HNAP/SOAP requests."""
 
@@ -161,6 +197,9 @@ class HNAPRequestBuilder:
         """
         Parse HNAP XML response and extract action result.
 
+        The envelope is parsed incrementally and parsing stops at the end of
+        the action result, so whatever follows it is never read.
+
         Args:
             xml_text: XML response text
             action: HNAP action name to extract
@@ -169,24 +208,66 @@ class HNAPRequestBuilder:
         Returns:
             XML Element containing action response, or None if not found
         """
+        # Some responses put the result in the HNAP namespace, others use no namespace
+        targets = {f"{{{namespace}}}{action}Response", f"{action}Response"}
         try:
-            root = ElementTree.fromstring(xml_text)
+            for _, element in ElementTree.iterparse(io.BytesIO(xml_text.encode("utf-8"))):
+                if element.tag in targets:
+                    return element  # type: ignore[no-any-return]
+        except ElementTree.ParseError as e:
+            _LOGGER.error("Failed to parse HNAP XML response: %s", e)
+        return None
 
-            # Define namespaces for XPath
-            namespaces = {"soap": "http://schemas.xmlsoap.org/soap/envelope/", "hnap": namespace}
+    @staticmethod
+    def extract_results(
+        xml_text: str, paths: HNAPResultPaths, actions: Iterable[str] | None = None
+    ) -> dict[str, dict[str, str]]:
+        """
+        Pull the declared fields of action results out of an HNAP XML response.
 
-            # Find the action response in the SOAP body
-            action_response = root.find(f".//hnap:{action}Response", namespaces)
+        The envelope is streamed with iterparse: field texts are copied out of
+        the requested results, every element is cleared once it has been read,
+        and parsing stops after the last requested result.
 
-            if action_response is None:
-                # Try without namespace prefix (some responses don't use it)
-                action_response = root.find(f".//{action}Response")
+        Args:
+            xml_text: XML response text
+            paths: Results and fields to extract
+            actions: Actions whose results are wanted (default: every action in paths)
 
-            return action_response  # type: ignore[no-any-return]
+        Returns:
+            Dict shaped like a JSON HNAP response, {"<Action>Response": {field: text}};
+            results missing from the response are left out
 
-        except ElementTree.ParseError as e:
-            _LOGGER.error("Failed to parse HNAP XML response: %s", e)
-            return None
+        Raises:
+            ElementTree.ParseError: If the XML is malformed before the last requested result
+        """
+        wanted = (
+            set(paths.fields) if actions is None else {f"{action}Response" for action in actions} & set(paths.fields)
+        )
+        results: dict[str, dict[str, str]] = {}
+        current: str | None = None  # Key of the result being read
+        field_tags: Mapping[str, str] = {}
+        values: dict[str, str] = {}
+
+        for event, element in ElementTree.iterparse(io.BytesIO(xml_text.encode("utf-8")), events=("start", "end")):
+            tag = element.tag
+            if event == "start":
+                if current is None and paths.responses.get(tag) in wanted:
+                    current = paths.responses[tag]
+                    field_tags = paths.fields[current]
+                    values = {}
+                continue
+
+            if current is not None and tag in field_tags:
+                values[field_tags[tag]] = (element.text or "").strip()
+            elif current is not None and paths.responses.get(tag) == current:
+                results[current] = values
+                current = None
+                if len(results) == len(wanted):
+                    break
+            element.clear()
+
+        return results
 
     @staticmethod
     def get_text_value(element: Element | None, tag: str, default: str = "") -> str:
@@ -195,7 +276,7 @@ class HNAPRequestBuilder:
 
         Args:
             element: XML element to search
-            tag: Tag name to find
+            tag: Tag name to find (in the element's own namespace, if it has one)
             default: Default value if tag not found
 
         Returns:
@@ -205,6 +286,10 @@ class HNAPRequestBuilder:
             return default
 
         child = element.find(tag)
+        if child is None and element.tag.startswith("{"):
+            # Children inherit a default namespace declared on the action result
+            namespace = element.tag[: element.tag.index("}") + 1]
+            child = element.find(f"{namespace}{tag}")
         if child is not None and child.text:
             return child.text.strip()
 
@@ -0,0 +1,85 @@
+"""Decoding of the channel tables HNAP modems return as delimited strings.
+
+Motorola HNAP firmware sends each channel table as a single string: channels
+are separated by "|+|" and the fields of a channel by "^" (with a trailing "^"):
+
+    "1^Locked^QAM256^20^543.0^ 1.4^45.1^41^0^|+|2^Locked^QAM256^1^..."
+
+decode_channels() splits the string once and converts it a column at a time,
+so a table of 32+ channels takes one map() per field instead of a conversion
+call per value. A column that fails to convert falls back to converting the
+channels one by one, which drops only the malformed channels.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Sequence
+from operator import itemgetter
+from typing import Any
+
+from ..lib.table_extract import Column
+
+_LOGGER = logging.getLogger(__name__)
+
+CHANNEL_SEPARATOR = "|+|"
+FIELD_SEPARATOR = "^"
+
+
+def split_channels(data: str, min_fields: int, label: str) -> list[list[str]]:
+    """Split a channel table string into the field lists of its channels.
+
+    Args:
+        data: Channel table string
+        min_fields: Channels with fewer fields are logged and skipped
+        label: Name of the table for log messages
+
+    Returns:
+        Field lists, in table order (blank entries are skipped)
+    """
+    channels = []
+    for entry in data.split(CHANNEL_SEPARATOR):
+        if not entry.strip():
+            continue
+        fields = entry.split(FIELD_SEPARATOR)
+        if len(fields) < min_fields:
+            _LOGGER.warning("%s: Invalid channel entry: %s", label, entry)
+            continue
+        channels.append(fields)
+    return channels
+
+
+def decode_channels(data: str, columns: Sequence[Column], label: str) -> list[dict[str, Any]]:
+    """Convert a channel table string into channel dicts.
+
+    Args:
+        data: Channel table string
+        columns: Output keys with their field index and converter, in dict order
+        label: Name of the table for log messages
+
+    Returns:
+        Channel dicts; channels with too few fields or a field that fails to
+        convert (ValueError) are logged and left out
+    """
+    min_fields = max(int(column.source) for column in columns) + 1
+    channels = split_channels(data, min_fields, label)
+    if not channels:
+        return []
+
+    keys = [column.key for column in columns]
+    try:
+        converted = [list(map(column.convert, map(itemgetter(column.source), channels))) for column in columns]
+    except ValueError:
+        return _decode_each(channels, columns, label)
+    return [dict(zip(keys, values, strict=True)) for values in zip(*converted, strict=True)]
+
+
+def _decode_each(channels: list[list[str]], columns: Sequence[Column], label: str) -> list[dict[str, Any]]:
+    """Convert channels one at a time, skipping those with a malformed field."""
+    records = []
+    for fields in channels:
+        try:
+            records.append({column.key: column.convert(fields[int(column.source)]) for column in columns})
+        except ValueError as e:
+            _LOGGER.warning("%s: Error parsing channel: %s - %s", label, FIELD_SEPARATOR.join(fields), e)
+    return records
@@ -2,25 +2,50 @@
 
 from __future__ import annotations
 
+import asyncio
+import copy
 import logging
-from collections.abc import Callable
-from typing import TYPE_CHECKING, Any, cast
-
+import re
+import time
+from collections.abc import Awaitable, Callable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from typing import TYPE_CHECKING, Any, NamedTuple, cast
+
+import aiohttp
 import requests
-from bs4 import BeautifulSoup
 
-from ..parsers.base_parser import ModemParser
+from ..lib.html_backend import resolve_backend
+from ..lib.html_stream import TargetStream, iter_response_text
+from ..lib.utils import parse_uptime_to_seconds
+from ..parsers import LazyParser
+from ..parsers.base_parser import ModemParser, ParseContext
+from .auth_config import AuthStrategyType
 from .discovery_helpers import (
     DiscoveryCircuitBreaker,
     ParserHeuristics,
     ParserNotFoundError,
 )
+from .document_cache import DocumentCache, content_digest
+from .fingerprint_index import FingerprintIndex
 
 if TYPE_CHECKING:
     from ..parsers.base_parser import ModemParser
 
 _LOGGER = logging.getLogger(__name__)
 
+# A password input means the modem served its login form instead of the requested page
+_LOGIN_FORM_PATTERN = re.compile(r"<input[^>]+type\s*=\s*[\"']?password", re.IGNORECASE)
+
+
+class _AsyncProbeResult(NamedTuple):
+    """Response of a candidate URL fetched with aiohttp, before it is recorded."""
+
+    status: int
+    html: str  # Only read for a 200
+    headers: Mapping[str, str]
+    cookies: dict[str, str]
+
 
 class CapturingSession(requests.Session):
     """Session wrapper that captures responses for diagnostics."""
@@ -67,6 +92,9 @@ class ModemScraper:
         cached_url: str | None = None,
         parser_name: str | None = None,
         verify_ssl: bool = False,
+        probe_concurrency: int = 1,
+        password_encoding: str | None = None,
+        html_backend: str | None = None,
     ):
         """
         Initialize the modem scraper.
@@ -79,6 +107,9 @@ class ModemScraper:
             cached_url: Previously successful URL (optimization)
             parser_name: Name of cached parser to use (skips auto-detection)
             verify_ssl: Enable SSL certificate verification (default: False for compatibility with self-signed certs)
+            probe_concurrency: Number of candidate URLs probed in parallel (1 = serial)
+            password_encoding: Password encoding that worked last time (optimization)
+            html_backend: BeautifulSoup tree builder ("lxml" or "html.parser"; default: fastest installed)
         """
         self.host = host
         # Support both plain IP addresses and full URLs (http:// or https://)
@@ -95,6 +126,8 @@ class ModemScraper:
         self.username = username
         self.password = password
         self.verify_ssl = verify_ssl
+        self.probe_concurrency = max(1, probe_concurrency)
+        self.html_backend = resolve_backend(html_backend)
         self.session = requests.Session()
 
         # Configure SSL verification with security warnings
@@ -113,11 +146,11 @@ class ModemScraper:
             self.session.verify = True
             _LOGGER.info("SSL certificate verification is enabled for secure connections")
 
-        # Handle parser parameter - can be instance, class, or list of classes
+        # Handle parser parameter - can be instance, class (or lazy proxy), or list of classes
         if isinstance(parser, list):
             self.parsers: list[Any] = parser
             self.parser: ModemParser | None = None
-        elif parser and isinstance(parser, type):
+        elif parser and isinstance(parser, type | LazyParser):
             # Parser class passed in
             self.parsers = [parser]
             self.parser = None
@@ -129,11 +162,25 @@ class ModemScraper:
             self.parsers = []
             self.parser = None
 
+        # Fingerprints of all candidate parsers; patterns are compiled once per parser set
+        self._fingerprints = FingerprintIndex(self.parsers)
+
         self.cached_url = cached_url
         self.parser_name = parser_name  # For Tier 2: load cached parser by name
+        self.password_encoding = password_encoding  # Winning plain/Base64 encoding from a previous login
         self.last_successful_url = ""
         self._captured_urls: list[dict[str, Any]] = []  # For HTML capture feature
         self._capture_enabled: bool = False  # Flag to enable HTML capture
+        self._authenticated: bool = False  # Session holds a login from a previous poll
+        self._documents = DocumentCache(self.html_backend)  # Pages fetched and parsed during the current poll
+        self._validators: dict[str, dict[str, str]] = {}  # URL -> ETag/Last-Modified from the last 200
+        self._last_pages: dict[str, str] = {}  # URL -> body of the last 200, served again on 304
+        self._last_parse: tuple[str, dict] | None = None  # (page digest, parsed data) for single-page parsers
+        self._static_info: dict[str, Any] = {}  # Last values of the parser's static_info_keys
+        self._static_info_read_at: float | None = None  # time.monotonic() when they were last read
+        self._last_uptime: int | None = None  # system_uptime in seconds at the previous poll
+        # Parse result sections this poll needs (None = everything); diagnostics captures get everything
+        self.requested_sections: frozenset[str] | None = None
 
     def _capture_response(self, response: requests.Response, description: str = "") -> None:
         """Capture HTTP response for diagnostics.
@@ -333,7 +380,13 @@ class ModemScraper:
             _LOGGER.error("No parser detected, cannot log in")
             return False
 
-        return self.parser.login(self.session, self.base_url, self.username, self.password)
+        # Try the remembered password encoding first, then keep whatever the parser settled on
+        if self.password_encoding and not self.parser.password_encoding:
+            self.parser.password_encoding = self.password_encoding
+        result = self.parser.login(self.session, self.base_url, self.username, self.password)
+        if self.parser.password_encoding:
+            self.password_encoding = self.parser.password_encoding
+        return result
 
     def _get_tier1_urls(self) -> list[tuple[str, str, type[ModemParser]]]:
         """Get URLs for Tier 1: User explicitly selected a parser."""
@@ -463,83 +516,430 @@ class ModemScraper:
         # Tier 3: Auto-detection mode
         return self._get_tier3_urls()
 
+    def _build_probe_candidates(
+        self, urls_to_try: list[tuple[str, str, type[ModemParser]]]
+    ) -> list[tuple[str, str, type[ModemParser], str]]:
+        """Expand URL patterns into (url, auth_method, parser_class, base_url) probe candidates.
+
+        In serial mode every URL is tried over HTTPS before any URL is tried over
+        HTTP. In concurrent mode the protocols are interleaved per URL so that
+        HTTPS and HTTP race each other instead of HTTP waiting for all HTTPS
+        attempts to time out.
+        """
+        # Try HTTPS first, then HTTP fallback for each URL
+        protocols_to_try = ["https", "http"] if self.base_url.startswith("https://") else ["http"]
+        _LOGGER.debug("Protocols to try: %s (base_url: %s)", protocols_to_try, self.base_url)
+
+        base_urls = [
+            self.base_url.replace("https://", f"{protocol}://").replace("http://", f"{protocol}://")
+            for protocol in protocols_to_try
+        ]
+
+        if self.probe_concurrency > 1:
+            return [
+                (url.replace(self.base_url, base_url), auth_method, parser_class, base_url)
+                for url, auth_method, parser_class in urls_to_try
+                for base_url in base_urls
+            ]
+        return [
+            (url.replace(self.base_url, base_url), auth_method, parser_class, base_url)
+            for base_url in base_urls
+            for url, auth_method, parser_class in urls_to_try
+        ]
+
+    def _order_probe_candidates(
+        self, candidates: list[tuple[str, str, type[ModemParser], str]]
+    ) -> list[tuple[str, str, type[ModemParser], str]]:
+        """Move the last working URL to the front so steady-state polls hit it first."""
+        if not self.last_successful_url:
+            return candidates
+        known = [c for c in candidates if c[0] == self.last_successful_url]
+        return known + [c for c in candidates if c[0] != self.last_successful_url] if known else candidates
+
+    def _probe_url(
+        self, url: str, auth_method: str, parser_class: type[ModemParser] | None
+    ) -> requests.Response | None:
+        """GET a single candidate URL, returning the response on HTTP 200 (or 304 for a remembered page)."""
+        response = self._request_candidate(url, auth_method, parser_class)
+        return self._accept_response(url, response) if response is not None else None
+
+    def _request_candidate(
+        self,
+        url: str,
+        auth_method: str,
+        parser_class: type[ModemParser] | None,
+        session: requests.Session | None = None,
+    ) -> requests.Response | None:
+        """GET a single candidate URL without touching scraper state.
+
+        Args:
+            url: Candidate URL
+            auth_method: "basic" to send the configured credentials, anything else for none
+            parser_class: Parser the URL belongs to (for logging)
+            session: Session to send the request with; defaults to the scraper's own
+
+        Returns:
+            The response whatever its status, or None if the request failed
+        """
+        try:
+            _LOGGER.debug(
+                "Attempting to fetch %s (auth: %s, parser: %s)",
+                url,
+                auth_method,
+                parser_class.name if parser_class else "unknown",
+            )
+            auth = None
+            if auth_method == "basic" and self.username and self.password:
+                auth = (self.username, self.password)
+
+            # Use configured SSL verification setting
+            headers = self._conditional_headers(url)
+            return (session or self.session).get(url, timeout=10, auth=auth, verify=self.verify_ssl, headers=headers)
+        except requests.RequestException as e:
+            _LOGGER.debug("Failed to fetch from %s: %s: %s", url, type(e).__name__, e)
+        return None
+
+    def _usable_status(self, url: str, status: int) -> bool:
+        """Check whether a candidate's HTTP status gives a page (200, or 304 for a remembered page)."""
+        return status == 200 or (status == 304 and url in self._last_pages)
+
+    def _accept_response(self, url: str, response: requests.Response) -> requests.Response | None:
+        """Record a candidate's response in the scraper state and return it if it gave a page."""
+        if response.status_code == 200:
+            self._remember_page(url, response.headers, response.text)
+            return response
+        if self._usable_status(url, response.status_code):
+            _LOGGER.debug("%s not modified since last poll", url)
+            return response
+        if response.status_code == 401:
+            self._authenticated = False
+        _LOGGER.debug("Got status %s from %s", response.status_code, url)
+        return None
+
+    def _conditional_headers(self, url: str) -> dict[str, str]:
+        """Build If-None-Match/If-Modified-Since headers for a URL fetched before.
+
+        Skipped in capture mode, which needs the full body of every page.
+        """
+        validators = self._validators.get(url)
+        if not validators or self._capture_enabled or url not in self._last_pages:
+            return {}
+        headers = {}
+        if "etag" in validators:
+            headers["If-None-Match"] = validators["etag"]
+        if "last_modified" in validators:
+            headers["If-Modified-Since"] = validators["last_modified"]
+        return headers
+
+    def _remember_page(self, url: str, headers: Mapping[str, str], html: str) -> None:
+        """Store cache validators and body of a 200 response for the next conditional request."""
+        validators = {}
+        if etag := headers.get("ETag"):
+            validators["etag"] = etag
+        if last_modified := headers.get("Last-Modified"):
+            validators["last_modified"] = last_modified
+
+        if validators:
+            self._validators[url] = validators
+            self._last_pages[url] = html
+        else:
+            # Server does not support conditional requests for this URL
+            self._validators.pop(url, None)
+            self._last_pages.pop(url, None)
+
+    def _accept_probe(self, url: str, html: str, parser_class: type[ModemParser], base_url: str) -> None:
+        """Record a successful probe and switch to its protocol."""
+        _LOGGER.info(
+            "Successfully connected to %s (HTML: %s bytes, parser: %s)",
+            url,
+            len(html),
+            parser_class.name if parser_class else "unknown",
+        )
+        self.last_successful_url = url
+        self._documents.add(url, html)
+
+        # Update base_url to the working protocol
+        _LOGGER.debug("Updating base_url from %s to %s", self.base_url, base_url)
+        self.base_url = base_url
+
+    def _probe_session(self) -> requests.Session:
+        """Create a session for one concurrent probe, seeded with the scraper session's cookies and settings.
+
+        requests.Session is not thread-safe, so concurrent probes do not share the
+        scraper's session; only the winner's cookies are copied back into it.
+        """
+        session = requests.Session()
+        session.headers.update(self.session.headers)
+        session.cookies.update(self.session.cookies)
+        session.auth = self.session.auth
+        session.verify = self.session.verify
+        return session
+
+    def _probe_concurrently(
+        self, candidates: list[tuple[str, str, type[ModemParser], str]]
+    ) -> tuple[int, requests.Response] | None:
+        """Probe candidates with bounded concurrency.
+
+        Returns the highest-priority candidate that answered 200, which is only
+        known once every candidate ahead of it has failed. Candidates that were
+        not started yet are cancelled as soon as the winner is known.
+
+        Worker threads only send requests, each with its own session from
+        _probe_session. Responses are recorded in the scraper state here, in
+        priority order, and only the winner's cookies reach the scraper session,
+        so a losing candidate that is still running (or that answered 401 after
+        the winner) cannot change either.
+
+        Returns:
+            tuple of (candidate index, response) or None if every candidate failed
+        """
+        from concurrent.futures import FIRST_COMPLETED, wait
+
+        results: dict[int, requests.Response | None] = {}
+        sessions: dict[int, requests.Session] = {}
+        pending: dict = {}
+
+        def usable(index: int) -> bool:
+            response = results[index]
+            return response is not None and self._usable_status(candidates[index][0], response.status_code)
+
+        next_index = 0
+        resolved = 0
+
+        pool = ThreadPoolExecutor(max_workers=self.probe_concurrency, thread_name_prefix="modem_probe")
+        try:
+            while resolved < len(candidates):
+                # Keep the pool full, but never start candidates behind a known success
+                while len(pending) < self.probe_concurrency and next_index < len(candidates):
+                    if any(usable(index) for index in results):
+                        break
+                    url, auth_method, parser_class, _ = candidates[next_index]
+                    session = sessions[next_index] = self._probe_session()
+                    future = pool.submit(self._request_candidate, url, auth_method, parser_class, session)
+                    # Closed once its request is done, including losers that finish after the winner
+                    future.add_done_callback(lambda _, session=session: session.close())
+                    pending[future] = next_index
+                    next_index += 1
+
+                if not pending:
+                    break
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    results[pending.pop(future)] = future.result()
+
+                # Resolve in priority order
+                while resolved in results:
+                    response = results[resolved]
+                    if response is not None:
+                        accepted = self._accept_response(candidates[resolved][0], response)
+                        if accepted is not None:
+                            self.session.cookies.update(sessions[resolved].cookies)
+                            return resolved, accepted
+                    resolved += 1
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+        return None
+
     def _fetch_data(self, capture_raw: bool = False) -> tuple[str, str, type[ModemParser]] | None:
         """
         Fetch data from the modem using parser-defined URL patterns.
         Automatically tries both HTTPS and HTTP protocols.
 
+        When probe_concurrency is greater than 1, candidate URLs are probed in
+        parallel and the first 200 in priority order wins.
+
         Args:
             capture_raw: If True, capture raw HTML responses for diagnostics
 
         Returns:
             tuple of (html, successful_url, parser_class) or None if failed
         """
+        self._documents.clear()
         urls_to_try = self._get_url_patterns_to_try()
 
         if not urls_to_try:
             _LOGGER.error("No URL patterns available to try")
             return None
 
-        # Try HTTPS first, then HTTP fallback for each URL
-        protocols_to_try = ["https", "http"] if self.base_url.startswith("https://") else ["http"]
-        _LOGGER.debug("Protocols to try: %s (base_url: %s)", protocols_to_try, self.base_url)
+        candidates = self._order_probe_candidates(self._build_probe_candidates(urls_to_try))
+        winner = self._select_candidate(candidates)
+        if winner is None:
+            return None
 
-        for protocol in protocols_to_try:
-            current_base_url = self.base_url.replace("https://", f"{protocol}://").replace("http://", f"{protocol}://")
-            _LOGGER.debug("Trying protocol: %s (current_base_url: %s)", protocol, current_base_url)
+        index, response = winner
+        url, _, parser_class, base_url = candidates[index]
+        # A 304 means the body from the last poll is still current
+        html = self._last_pages[url] if response.status_code == 304 else response.text
+        self._accept_probe(url, html, parser_class, base_url)
+
+        # Capture raw HTML if requested
+        self._capture_response(response, "Initial connection page")
+        return html, url, parser_class
+
+    def _select_candidate(
+        self, candidates: list[tuple[str, str, type[ModemParser], str]]
+    ) -> tuple[int, requests.Response] | None:
+        """Probe candidates serially or concurrently and return the winning (index, response)."""
+        if self.probe_concurrency <= 1:
+            for index, (url, auth_method, parser_class, _) in enumerate(candidates):
+                response = self._probe_url(url, auth_method, parser_class)
+                if response is not None:
+                    return index, response
+            return None
 
-            for url, auth_method, parser_class in urls_to_try:
-                # Replace protocol in URL to match current attempt
-                url = url.replace(self.base_url, current_base_url)
+        # A known-good URL is tried on its own before fanning out
+        offset = 0
+        if self.last_successful_url and candidates[0][0] == self.last_successful_url:
+            response = self._probe_url(candidates[0][0], candidates[0][1], candidates[0][2])
+            if response is not None:
+                return 0, response
+            offset = 1
+
+        winner = self._probe_concurrently(candidates[offset:])
+        return (winner[0] + offset, winner[1]) if winner else None
+
+    async def _async_probe_url(
+        self, session: aiohttp.ClientSession, url: str, auth_method: str
+    ) -> tuple[str, dict[str, str]] | None:
+        """GET a single candidate URL with aiohttp, returning (html, cookies) on HTTP 200 or 304."""
+        result = await self._async_request_candidate(session, url, auth_method)
+        return self._async_accept_result(url, result) if result is not None else None
+
+    async def _async_request_candidate(
+        self, session: aiohttp.ClientSession, url: str, auth_method: str
+    ) -> _AsyncProbeResult | None:
+        """GET a single candidate URL with aiohttp without touching scraper state.
+
+        The body is only read for a 200. Returns None if the request failed.
+        """
+        auth = None
+        if auth_method == "basic" and self.username and self.password:
+            auth = aiohttp.BasicAuth(self.username, self.password)
 
-                try:
-                    _LOGGER.debug(
-                        "Attempting to fetch %s (auth: %s, parser: %s)",
-                        url,
-                        auth_method,
-                        parser_class.name if parser_class else "unknown",
-                    )
-                    auth = None
-                    if auth_method == "basic" and self.username and self.password:
-                        auth = (self.username, self.password)
+        try:
+            timeout = aiohttp.ClientTimeout(total=10)
+            # Send the requests session cookies so a login from a previous poll is reused
+            cookies = self.session.cookies.get_dict()
+            headers = self._conditional_headers(url)
+            async with session.get(
+                url, timeout=timeout, auth=auth, cookies=cookies, headers=headers, ssl=self.verify_ssl
+            ) as response:
+                new_cookies = {name: morsel.value for name, morsel in response.cookies.items()}
+                html = await response.text(errors="replace") if response.status == 200 else ""
+                return _AsyncProbeResult(response.status, html, response.headers, new_cookies)
+        except (aiohttp.ClientError, TimeoutError) as e:
+            _LOGGER.debug("Failed to fetch from %s: %s: %s", url, type(e).__name__, e)
+            return None
 
-                    # Use configured SSL verification setting
-                    response = self.session.get(url, timeout=10, auth=auth, verify=self.verify_ssl)
+    def _async_accept_result(self, url: str, result: _AsyncProbeResult) -> tuple[str, dict[str, str]] | None:
+        """Async counterpart of _accept_response, returning (html, cookies) if the candidate gave a page."""
+        if result.status == 200:
+            self._remember_page(url, result.headers, result.html)
+            return result.html, result.cookies
+        if self._usable_status(url, result.status):
+            _LOGGER.debug("%s not modified since last poll", url)
+            return self._last_pages[url], result.cookies
+        if result.status == 401:
+            self._authenticated = False
+        _LOGGER.debug("Got status %s from %s", result.status, url)
+        return None
 
-                    if response.status_code == 200:
-                        parser_name = parser_class.name if parser_class else "unknown"
-                        _LOGGER.info(
-                            "Successfully connected to %s (HTML: %s bytes, parser: %s)",
-                            url,
-                            len(response.text),
-                            parser_name,
-                        )
-                        self.last_successful_url = url
+    async def _async_probe_concurrently(
+        self, session: aiohttp.ClientSession, candidates: list[tuple[str, str, type[ModemParser], str]]
+    ) -> tuple[int, tuple[str, dict[str, str]]] | None:
+        """Async counterpart of _probe_concurrently; losing requests are cancelled."""
+        semaphore = asyncio.Semaphore(self.probe_concurrency)
 
-                        # Capture raw HTML if requested
-                        self._capture_response(response, "Initial connection page")
+        async def probe(candidate: tuple[str, str, type[ModemParser], str]):
+            async with semaphore:
+                return await self._async_request_candidate(session, candidate[0], candidate[1])
 
-                        # Update base_url to the working protocol
-                        _LOGGER.debug("About to update base_url from %s to %s", self.base_url, current_base_url)
-                        self.base_url = current_base_url
-                        _LOGGER.debug("Updated! base_url is now: %s", self.base_url)
-                        return response.text, url, parser_class
-                    else:
-                        _LOGGER.debug("Got status %s from %s", response.status_code, url)
-                except requests.RequestException as e:
-                    _LOGGER.debug("Failed to fetch from %s: %s: %s", url, type(e).__name__, e)
+        tasks = [asyncio.create_task(probe(candidate)) for candidate in candidates]
+        try:
+            # Tasks are awaited (and their results recorded) in priority order; lower-priority ones keep running
+            for index, task in enumerate(tasks):
+                result = await task
+                if result is None:
                     continue
-
+                accepted = self._async_accept_result(candidates[index][0], result)
+                if accepted is not None:
+                    return index, accepted
+        finally:
+            for task in tasks:
+                task.cancel()
         return None
 
-    def _try_anonymous_probing(self, circuit_breaker, attempted_parsers: list) -> ModemParser | None:
+    async def _async_fetch_data(self, session: aiohttp.ClientSession) -> tuple[str, str, type[ModemParser]] | None:
+        """Async counterpart of _fetch_data using aiohttp.
+
+        Tries the same candidates in the same priority order as _fetch_data.
+        Cookies set by the modem are copied into the requests session so that a
+        later login or parse sees the same state as after a blocking fetch.
+
+        Args:
+            session: aiohttp client session
+
+        Returns:
+            tuple of (html, successful_url, parser_class) or None if failed
+        """
+        self._documents.clear()
+        urls_to_try = self._get_url_patterns_to_try()
+
+        if not urls_to_try:
+            _LOGGER.error("No URL patterns available to try")
+            return None
+
+        candidates = self._order_probe_candidates(self._build_probe_candidates(urls_to_try))
+        winner = await self._async_select_candidate(session, candidates)
+        if winner is None:
+            return None
+
+        index, (html, cookies) = winner
+        url, _, parser_class, base_url = candidates[index]
+        for name, value in cookies.items():
+            self.session.cookies.set(name, value)
+        self._accept_probe(url, html, parser_class, base_url)
+        return html, url, parser_class
+
+    async def _async_select_candidate(
+        self, session: aiohttp.ClientSession, candidates: list[tuple[str, str, type[ModemParser], str]]
+    ) -> tuple[int, tuple[str, dict[str, str]]] | None:
+        """Async counterpart of _select_candidate."""
+        if self.probe_concurrency <= 1:
+            for index, (url, auth_method, _, _) in enumerate(candidates):
+                result = await self._async_probe_url(session, url, auth_method)
+                if result is not None:
+                    return index, result
+            return None
+
+        # A known-good URL is tried on its own before fanning out
+        offset = 0
+        if self.last_successful_url and candidates[0][0] == self.last_successful_url:
+            result = await self._async_probe_url(session, candidates[0][0], candidates[0][1])
+            if result is not None:
+                return 0, result
+            offset = 1
+
+        winner = await self._async_probe_concurrently(session, candidates[offset:])
+        return (winner[0] + offset, winner[1]) if winner else None
+
+    def _try_anonymous_probing(
+        self, html: str, url: str, circuit_breaker, attempted_parsers: list
+    ) -> ModemParser | None:
         """Try anonymous probing for modems with public pages.
 
+        Each probe requests the parser's own public page, so parsers whose
+        fingerprints hit the already fetched page are probed first.
+
         Note: Excludes fallback parser - only tries real modem parsers.
         """
         _LOGGER.info("Phase 1: Attempting anonymous probing before authentication")
+        candidates = self._fingerprints.rank(html, url)
+        probe_order = candidates + [parser for parser in self.parsers if parser not in candidates]
 
-        for parser_class in self.parsers:
+        for parser_class in probe_order:
             # Skip fallback parser - it should only be used as last resort
             if parser_class.manufacturer == "Unknown":
                 continue
@@ -549,11 +949,11 @@ class ModemScraper:
 
             try:
                 anon_result = ParserHeuristics.check_anonymous_access(
-                    self.base_url, parser_class, self.session, self.verify_ssl
+                    self.base_url, parser_class, self.session, self.verify_ssl, documents=self._documents
                 )
                 if anon_result:
                     anon_html, anon_url = anon_result
-                    anon_soup = BeautifulSoup(anon_html, "html.parser")
+                    anon_soup = self._documents.soup(anon_html, anon_url)
                     circuit_breaker.record_attempt(parser_class.name)
 
                     if parser_class.can_parse(anon_soup, anon_url, anon_html):
@@ -609,10 +1009,13 @@ class ModemScraper:
 
         Note: Excludes fallback parser - only tries real modem parsers.
         """
-        _LOGGER.info("Phase 3: Using parser heuristics to prioritize likely parsers")
-        prioritized_parsers = ParserHeuristics.get_likely_parsers(
-            self.base_url, self.parsers, self.session, self.verify_ssl
+        _LOGGER.info("Phase 3: Using parser fingerprints and heuristics to prioritize likely parsers")
+        # Parsers whose fingerprints hit this page go first; the rest follow in heuristic order
+        candidates = self._fingerprints.rank(html, url)
+        heuristic_order = ParserHeuristics.get_likely_parsers(
+            self.base_url, self.parsers, self.session, self.verify_ssl, documents=self._documents
         )
+        prioritized_parsers = candidates + [parser for parser in heuristic_order if parser not in candidates]
 
         _LOGGER.debug("Attempting to detect parser from %s available parsers (prioritized)", len(prioritized_parsers))
 
@@ -663,12 +1066,12 @@ class ModemScraper:
         if self.parser:
             return self.parser
 
-        soup = BeautifulSoup(html, "html.parser")
+        soup = self._documents.soup(html, url)
         circuit_breaker = DiscoveryCircuitBreaker(max_attempts=15, timeout_seconds=90)
         attempted_parsers: list[str] = []
 
         # Try anonymous probing first
-        parser = self._try_anonymous_probing(circuit_breaker, attempted_parsers)
+        parser = self._try_anonymous_probing(html, url, circuit_breaker, attempted_parsers)
         if parser:
             return parser
 
@@ -697,15 +1100,85 @@ class ModemScraper:
 
         raise ParserNotFoundError(modem_info=modem_info, attempted_parsers=attempted_parsers)
 
-    def _parse_data(self, html: str) -> dict:
-        """Parse data from the modem."""
+    def _parse_data(self, html: str, pages: Mapping[str, str] | None = None) -> dict:
+        """Parse data from the modem.
+
+        For single-page parsers, a page identical to the one parsed on the
+        previous poll returns a copy of the previous result without parsing.
+
+        Args:
+            html: HTML of the data page
+            pages: Secondary pages prefetched for this poll, keyed by path
+        """
         if self.parser is None:
             raise RuntimeError("Cannot parse data: parser is not set")
-        soup = BeautifulSoup(html, "html.parser")
+
+        digest = content_digest(html) if self.parser.single_page else None
+        if digest is not None and self._last_parse is not None and self._last_parse[0] == digest:
+            _LOGGER.debug("Page unchanged since last poll, reusing parsed data")
+            return copy.deepcopy(self._last_parse[1])
+
+        soup = self._documents.soup(html)
+        parser = self.parser
+        parser.html_backend = self.html_backend
+        pages = pages or {}
+        for path, page_html in pages.items():
+            self._documents.add(f"{self.base_url}{path}", page_html)
+        context = self._parse_context(parser, pages)
         # Pass session and base_url to parser in case it needs to fetch additional pages
-        data = self.parser.parse(soup, session=self.session, base_url=self.base_url)
+        data = parser.parse(soup, session=self.session, base_url=self.base_url, context=context)
+        self._apply_static_info(parser, data, context.refresh_static_info)
+
+        if digest is not None and not (data.get("_auth_failure") or data.get("_login_page_detected")):
+            self._last_parse = (digest, copy.deepcopy(data))
         return data
 
+    def _parse_context(self, parser: ModemParser, pages: Mapping[str, str]) -> ParseContext:
+        """Build this poll's inputs for one parse; diagnostics captures request every section."""
+        return ParseContext(
+            pages=pages,
+            refresh_static_info=self._static_info_due(parser),
+            requested_sections=None if self._capture_enabled else self.requested_sections,
+        )
+
+    def _static_info_due(self, parser: ModemParser) -> bool:
+        """Check whether this poll should read the parser's static system info."""
+        if not parser.static_info_keys or self._static_info_read_at is None:
+            return True
+        return time.monotonic() - self._static_info_read_at >= parser.static_info_ttl
+
+    def _apply_static_info(self, parser: ModemParser, data: dict, refreshed: bool) -> None:
+        """Cache the static system info a parse read, or fill it in when the parse skipped it.
+
+        A system_uptime lower than on the previous poll means the modem rebooted,
+        possibly into new firmware, so the cached values expire right away.
+
+        Args:
+            parser: Parser that produced the data
+            data: Parse result, updated in place
+            refreshed: Whether the parse was asked to read static info
+        """
+        if not parser.static_info_keys or data.get("_auth_failure") or data.get("_login_page_detected"):
+            return
+
+        system_info = data.setdefault("system_info", {})
+        if refreshed:
+            static_info = {key: value for key, value in system_info.items() if key in parser.static_info_keys}
+            # If none was found (e.g. a page failed to load), keep the old values and try again next poll
+            if static_info:
+                self._static_info = static_info
+                self._static_info_read_at = time.monotonic()
+        for key, value in self._static_info.items():
+            system_info.setdefault(key, value)
+
+        uptime = parse_uptime_to_seconds(system_info.get("system_uptime"))
+        if uptime is None:
+            return
+        if self._last_uptime is not None and uptime < self._last_uptime and not refreshed:
+            _LOGGER.info("Modem uptime went down, reading static system info again on the next poll")
+            self._static_info_read_at = None
+        self._last_uptime = uptime
+
     def get_modem_data(self, capture_raw: bool = False) -> dict:
         """Fetch and parse modem data.
 
@@ -729,57 +1202,245 @@ class ModemScraper:
             _LOGGER.debug("Enabled HTML capture mode with CapturingSession")
 
         try:
+            if self._can_stream_poll():
+                streamed = self._stream_poll()
+                if streamed is not None:
+                    return streamed
+
             fetched_data = self._fetch_data(capture_raw=capture_raw)
             if not fetched_data:
                 return self._create_error_response("unreachable")
 
             html, successful_url, suggested_parser = fetched_data
+            return self._process_fetched_data(html, successful_url, suggested_parser, capture_raw=capture_raw)
 
-            # Detect or instantiate parser
-            if not self._ensure_parser(html, successful_url, suggested_parser):
-                return self._create_error_response("offline")
+        except Exception as e:
+            _LOGGER.error("Error fetching modem data: %s", e)
+            return self._create_error_response("unreachable")
+        finally:
+            # Restore original session if we replaced it
+            if original_session is not None:
+                self.session = original_session
+                _LOGGER.debug("Restored original session")
 
-            # Login and get authenticated HTML
-            html_or_none = self._handle_login_result(html)
-            if html_or_none is None:
-                return self._create_error_response("unreachable")
-            html = html_or_none
+    async def async_get_modem_data(
+        self,
+        session: aiohttp.ClientSession,
+        executor: Callable[..., Awaitable[Any]],
+    ) -> dict:
+        """Fetch and parse modem data without tying up an executor thread for the fetch.
 
-            # Parse data and build response
-            data = self._parse_data(html)
-            response = self._build_response(data)
+        The initial page fetch (including protocol and URL discovery) runs on the
+        event loop with aiohttp, together with the fetch of the parser's secondary
+        pages. Parser detection, login and parsing still use the requests-based
+        parser API and are handed to ``executor`` as a single job.
 
-            # Capture additional pages if in capture mode
-            if capture_raw and self._captured_urls:
-                # First, fetch all URLs defined in the parser's url_patterns
-                # This ensures we get critical pages like DocsisStatus.htm that may not be linked
-                self._fetch_parser_url_patterns()
+        Args:
+            session: aiohttp client session used for the initial fetch
+            executor: Callable that runs a blocking function off the event loop,
+                      e.g. ``hass.async_add_executor_job``
 
-                # Then crawl for additional pages by following links
-                self._crawl_additional_pages()
+        Returns:
+            Dictionary with modem data
+        """
+        self._captured_urls = []
+        self._capture_enabled = False
 
-            # Include captured HTML if requested
-            if capture_raw and self._captured_urls:
-                from datetime import datetime, timedelta
+        try:
+            if self._can_stream_poll():
+                streamed: dict | None = await executor(self._stream_poll)
+                if streamed is not None:
+                    return streamed
 
-                response["_raw_html_capture"] = {
-                    "timestamp": datetime.now().isoformat(),
-                    "trigger": "manual",
-                    "ttl_expires": (datetime.now() + timedelta(minutes=5)).isoformat(),
-                    "urls": self._captured_urls,
-                }
-                _LOGGER.info("Captured %d HTML pages for diagnostics", len(self._captured_urls))
+            fetched_data, pages = await asyncio.gather(
+                self._async_fetch_data(session), self._async_prefetch_pages(session)
+            )
+            if not fetched_data:
+                return self._create_error_response("unreachable")
 
-            return response
+            html, successful_url, suggested_parser = fetched_data
+            result: dict = await executor(
+                self._process_fetched_data, html, successful_url, suggested_parser, False, pages
+            )
+            return result
 
         except Exception as e:
             _LOGGER.error("Error fetching modem data: %s", e)
             return self._create_error_response("unreachable")
-        finally:
-            # Restore original session if we replaced it
-            if original_session is not None:
-                self.session = original_session
-                _LOGGER.debug("Restored original session")
+
+    def _can_stream_poll(self) -> bool:
+        """Check whether this poll can stream the known data page through the parser's targets.
+
+        Requires a detected parser that declares stream_targets and reads no
+        other pages, the URL it was detected on, no diagnostics capture, and
+        either a page that needs no login or a session that still holds one
+        from a previous poll.
+        """
+        parser = self.parser
+        if parser is None or not parser.stream_targets or not self.last_successful_url:
+            return False
+        if parser.secondary_pages or parser.static_pages:
+            # parse_rows() has no session to fetch them with
+            return False
+        return self._session_ready(parser)
+
+    def _session_ready(self, parser: ModemParser) -> bool:
+        """Check whether pages can be requested before this poll's login step.
+
+        True outside diagnostics capture when the modem needs no login or the
+        session still holds one from a previous poll.
+        """
+        if self._capture_enabled:
+            return False
+        if self._authenticated:
+            return True
+        auth_config = parser.auth_config
+        return auth_config is not None and auth_config.strategy is AuthStrategyType.NO_AUTH
+
+    async def _async_prefetch_pages(self, session: aiohttp.ClientSession) -> dict[str, str]:
+        """Fetch the parser's secondary (and, when due, static) pages with aiohttp.
+
+        Runs alongside the fetch of the data page, so a poll of a multi-page modem
+        waits for the slowest page rather than for every page in turn. Pages that
+        fail or come back as a login form are left out; parse() fetches those itself.
+
+        Returns:
+            Page bodies keyed by path
+        """
+        parser = self.parser
+        if parser is None or not self._session_ready(parser):
+            return {}
+
+        paths = parser.secondary_pages
+        if parser.static_pages and self._static_info_due(parser):
+            paths += parser.static_pages
+        if not paths:
+            return {}
+
+        _LOGGER.debug("Prefetching secondary pages %s", list(paths))
+        auth_method = "basic" if self.session.auth else "none"
+        results = await asyncio.gather(
+            *(self._async_request_candidate(session, f"{self.base_url}{path}", auth_method) for path in paths)
+        )
+        pages = {}
+        for path, result in zip(paths, results, strict=True):
+            if result is None or result.status != 200 or _LOGIN_FORM_PATTERN.search(result.html):
+                _LOGGER.debug("Prefetch of %s failed or returned a login form", path)
+                continue
+            pages[path] = result.html
+        return pages
+
+    def _stream_poll(self) -> dict | None:
+        """Poll by streaming the data page through the parser's declared targets (blocking).
+
+        The response is read only until every target has been captured, and the
+        parser converts rows while the rest of the page is still arriving.
+
+        Returns:
+            Response dictionary, or None to fall back to a full fetch (request
+            failed, or the page lacked a target, e.g. because a login form came back)
+        """
+        parser = self.parser
+        url = self.last_successful_url
+        if parser is None or not url:
+            return None
+
+        try:
+            response = self.session.get(url, timeout=10, verify=self.verify_ssl, stream=True)
+        except requests.RequestException as e:
+            _LOGGER.debug("Streaming fetch of %s failed: %s: %s", url, type(e).__name__, e)
+            return None
+
+        with closing(response):
+            if response.status_code != 200:
+                if response.status_code == 401:
+                    self._authenticated = False
+                _LOGGER.debug("Got status %s from %s, falling back to a full fetch", response.status_code, url)
+                return None
+            stream = TargetStream(iter_response_text(response), parser.stream_targets)
+            try:
+                context = self._parse_context(parser, {})
+                data = parser.parse_rows(stream, context=context)
+            except Exception as e:
+                _LOGGER.warning("Streaming parse of %s failed, falling back to a full fetch: %s", url, e)
+                return None
+
+        if not stream.complete:
+            _LOGGER.debug("%s lacks stream targets %s, falling back to a full fetch", url, sorted(stream.missing))
+            return None
+        _LOGGER.debug("Streamed %s: parsed after reading %d characters", url, stream.chars_read)
+        # Same post-parse step as a full parse: static info is cached or filled in, and reboots are detected
+        self._apply_static_info(parser, data, context.refresh_static_info)
+        return self._build_response(data)
+
+    def _process_fetched_data(
+        self,
+        html: str,
+        successful_url: str,
+        suggested_parser: type[ModemParser] | None,
+        capture_raw: bool = False,
+        pages: Mapping[str, str] | None = None,
+    ) -> dict:
+        """Detect parser, log in and parse an already fetched page (blocking).
+
+        Args:
+            html: HTML returned by the initial fetch
+            successful_url: URL that returned the HTML
+            suggested_parser: Parser class suggested by URL pattern match
+            capture_raw: If True, capture raw HTML responses for diagnostics
+            pages: Secondary pages prefetched alongside the initial fetch, keyed by path.
+                   Only the first parse uses them; a parse after a new login fetches its own.
+
+        Returns:
+            Dictionary with modem data
+        """
+        # Detect or instantiate parser
+        if not self._ensure_parser(html, successful_url, suggested_parser):
+            return self._create_error_response("offline")
+
+        # Login and get authenticated HTML, unless the session from a previous poll is still valid
+        session_reused = self._can_reuse_session(html)
+        if session_reused:
+            _LOGGER.debug("Reusing authenticated session, skipping login")
+        else:
+            html_or_none = self._handle_login_result(html)
+            if html_or_none is None:
+                return self._create_error_response("unreachable")
+            html = html_or_none
+
+        # Parse data and build response
+        data = self._parse_data(html, pages)
+        if session_reused and (data.get("_auth_failure") or data.get("_login_page_detected")):
+            _LOGGER.info("Authenticated session expired, logging in again")
+            self._authenticated = False
+            html_or_none = self._relogin(successful_url)
+            if html_or_none is None:
+                return self._create_error_response("unreachable")
+            data = self._parse_data(html_or_none)
+        response = self._build_response(data)
+
+        # Capture additional pages if in capture mode
+        if capture_raw and self._captured_urls:
+            # First, fetch all URLs defined in the parser's url_patterns
+            # This ensures we get critical pages like DocsisStatus.htm that may not be linked
+            self._fetch_parser_url_patterns()
+
+            # Then crawl for additional pages by following links
+            self._crawl_additional_pages()
+
+        # Include captured HTML if requested
+        if capture_raw and self._captured_urls:
+            from datetime import datetime, timedelta
+
+            response["_raw_html_capture"] = {
+                "timestamp": datetime.now().isoformat(),
+                "trigger": "manual",
+                "ttl_expires": (datetime.now() + timedelta(minutes=5)).isoformat(),
+                "urls": self._captured_urls,
+            }
+            _LOGGER.info("Captured %d HTML pages for diagnostics", len(self._captured_urls))
+
+        return response
 
     def _create_error_response(self, status: str) -> dict:
         """Create error response dictionary."""
@@ -820,21 +1481,59 @@ class ModemScraper:
 
         if isinstance(login_result, tuple):
             success, authenticated_html = login_result
-            if not success:
-                _LOGGER.error("Failed to log in to modem")
-                return None
-            # Use the authenticated HTML from login if available
-            if authenticated_html:
-                _LOGGER.debug("Using authenticated HTML from login (%s bytes)", len(authenticated_html))
-                return authenticated_html
-            return html
         else:
             # Old-style boolean return for parsers that don't return HTML
-            if not login_result:
-                _LOGGER.error("Failed to log in to modem")
-                return None
+            success, authenticated_html = bool(login_result), None
+
+        # Only a real login (credentials supplied) yields a session worth reusing
+        self._authenticated = success and bool(self.username and self.password)
+
+        if not success:
+            _LOGGER.error("Failed to log in to modem")
+            return None
+        # Use the authenticated HTML from login if available
+        if authenticated_html:
+            _LOGGER.debug("Using authenticated HTML from login (%s bytes)", len(authenticated_html))
+            return authenticated_html
+        return html
+
+    def _relogin(self, url: str) -> str | None:
+        """Log in again after a reused session turned out to be expired, and return the data page.
+
+        The page fetched at the start of the poll was not authenticated, so unless
+        the login returns the authenticated page itself, the data URL is fetched again.
+
+        Returns:
+            HTML of the data page, or None if login or the new fetch failed
+        """
+        html = self._handle_login_result("")
+        if html is None or html:
             return html
 
+        try:
+            response = self.session.get(url, timeout=10, verify=self.verify_ssl)
+        except requests.RequestException as e:
+            _LOGGER.error("Failed to fetch %s after logging in again: %s", url, e)
+            return None
+        if self._accept_response(url, response) is None:
+            _LOGGER.error("Got status %s from %s after logging in again", response.status_code, url)
+            return None
+        return response.text
+
+    def _can_reuse_session(self, html: str) -> bool:
+        """Check whether the session from a previous login can be used without logging in again.
+
+        The session is considered expired when the fetched page is a login form.
+        A 401 during fetch clears the authenticated flag as well.
+        """
+        if not self._authenticated:
+            return False
+        if _LOGIN_FORM_PATTERN.search(html):
+            _LOGGER.debug("Fetched page looks like a login form; session has expired")
+            self._authenticated = False
+            return False
+        return True
+
     def _build_response(self, data: dict) -> dict:
         """Build response dictionary from parsed data."""
         downstream = data.get("downstream", [])
@@ -893,6 +1592,7 @@ class ModemScraper:
                 "modem_name": self.parser.name,
                 "manufacturer": self.parser.manufacturer,
                 "successful_url": self.last_successful_url,
+                "password_encoding": self.password_encoding,
             }
         return {}
 
@@ -0,0 +1,237 @@
+"""In-process latency probes (ICMP echo or TCP connect) for modem health checks."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import os
+import socket
+import statistics
+import struct
+import time
+from dataclasses import dataclass, field
+
+_LOGGER = logging.getLogger(__name__)
+
+ICMP_ECHO_REQUEST = 8
+ICMP_ECHO_REPLY = 0
+ICMPV6_ECHO_REQUEST = 128
+ICMPV6_ECHO_REPLY = 129
+
+PROBE_METHOD_ICMP = "icmp"
+PROBE_METHOD_TCP = "tcp"
+
+
+@dataclass
+class ProbeResult:
+    """Outcome of a burst of probes to one host."""
+
+    method: str
+    sent: int = 0
+    rtts_ms: list[float] = field(default_factory=list)
+
+    @property
+    def received(self) -> int:
+        """Number of probes that were answered."""
+        return len(self.rtts_ms)
+
+    @property
+    def success(self) -> bool:
+        """Return True if at least one probe was answered."""
+        return bool(self.rtts_ms)
+
+    @property
+    def packet_loss(self) -> float | None:
+        """Percentage of probes that went unanswered."""
+        if not self.sent:
+            return None
+        return 100.0 * (self.sent - self.received) / self.sent
+
+    @property
+    def min_ms(self) -> float | None:
+        """Fastest round trip."""
+        return min(self.rtts_ms) if self.rtts_ms else None
+
+    @property
+    def avg_ms(self) -> float | None:
+        """Mean round trip."""
+        return statistics.fmean(self.rtts_ms) if self.rtts_ms else None
+
+    @property
+    def max_ms(self) -> float | None:
+        """Slowest round trip."""
+        return max(self.rtts_ms) if self.rtts_ms else None
+
+    @property
+    def jitter_ms(self) -> float | None:
+        """Mean absolute difference between consecutive round trips (RFC 3550 style)."""
+        if len(self.rtts_ms) < 2:
+            return None
+        return statistics.fmean(abs(b - a) for a, b in zip(self.rtts_ms, self.rtts_ms[1:], strict=False))
+
+
+def _checksum(data: bytes) -> int:
+    """Compute the Internet checksum (RFC 1071) of an ICMP message."""
+    if len(data) % 2:
+        data += b"\x00"
+    total = sum(struct.unpack(f"!{len(data) // 2}H", data))
+    total = (total >> 16) + (total & 0xFFFF)
+    total += total >> 16
+    return ~total & 0xFFFF
+
+
+def build_echo_request(identifier: int, sequence: int, payload: bytes, ipv6: bool = False) -> bytes:
+    """Build an ICMP (or ICMPv6) echo request.
+
+    For ICMPv6 the kernel fills in the checksum, since it covers a
+    pseudo-header that is not known here.
+    """
+    icmp_type = ICMPV6_ECHO_REQUEST if ipv6 else ICMP_ECHO_REQUEST
+    header = struct.pack("!BBHHH", icmp_type, 0, 0, identifier, sequence)
+    if ipv6:
+        return header + payload
+    checksum = _checksum(header + payload)
+    return struct.pack("!BBHHH", icmp_type, 0, checksum, identifier, sequence) + payload
+
+
+def parse_echo_reply(packet: bytes, ipv6: bool = False) -> int | None:
+    """Return the sequence number of an echo reply, or None for any other packet.
+
+    Linux delivers datagram ICMP sockets the bare ICMP message, while BSD and
+    macOS prepend the IPv4 header; both forms are accepted.
+    """
+    if not ipv6 and packet and packet[0] >> 4 == 4:
+        packet = packet[(packet[0] & 0x0F) * 4 :]
+    if len(packet) < 8:
+        return None
+    icmp_type, _code, _checksum_, _identifier, sequence = struct.unpack("!BBHHH", packet[:8])
+    if icmp_type != (ICMPV6_ECHO_REPLY if ipv6 else ICMP_ECHO_REPLY):
+        return None
+    return int(sequence)
+
+
+def open_icmp_socket(family: int) -> socket.socket:
+    """Open a non-blocking unprivileged ICMP datagram socket.
+
+    Raises:
+        OSError: If the kernel does not permit unprivileged ICMP sockets
+            (on Linux this is controlled by net.ipv4.ping_group_range)
+    """
+    proto = socket.IPPROTO_ICMPV6 if family == socket.AF_INET6 else socket.IPPROTO_ICMP
+    sock = socket.socket(family, socket.SOCK_DGRAM, proto)
+    sock.setblocking(False)
+    return sock
+
+
+class NetworkProber:
+    """Measure round trips to a host without spawning the ping binary.
+
+    Uses unprivileged ICMP datagram sockets when the kernel allows them and
+    otherwise times TCP connects to the given port. Once ICMP has been found
+    unavailable the prober stays on TCP, so the socket is not retried on
+    every check.
+    """
+
+    def __init__(self, count: int = 3, timeout: float = 2.0, interval: float = 0.2):
+        """Initialize the prober.
+
+        Args:
+            count: Number of probes sent per burst
+            timeout: Seconds to wait for each reply
+            interval: Seconds between probes within a burst
+        """
+        self.count = max(1, count)
+        self.timeout = timeout
+        self.interval = interval
+        self.icmp_available: bool | None = None
+        self._sequence = 0
+
+    async def probe(self, host: str, port: int = 80) -> ProbeResult:
+        """Send a burst of probes to a host.
+
+        Args:
+            host: Validated hostname or IP address
+            port: TCP port used when ICMP is unavailable
+
+        Returns:
+            ProbeResult with per-probe round trips
+        """
+        loop = asyncio.get_running_loop()
+        infos = await loop.getaddrinfo(host, None, type=socket.SOCK_DGRAM)
+        family, _, _, _, address = infos[0]
+
+        if self.icmp_available is not False:
+            try:
+                sock = open_icmp_socket(family)
+            except OSError as e:
+                _LOGGER.debug("Unprivileged ICMP unavailable (%s), falling back to TCP connect probes", e)
+                self.icmp_available = False
+            else:
+                self.icmp_available = True
+                with sock:
+                    return await self._icmp_burst(sock, address, family == socket.AF_INET6)
+
+        return await self._tcp_burst(host, port)
+
+    async def _icmp_burst(self, sock: socket.socket, address: tuple, ipv6: bool) -> ProbeResult:
+        """Send echo requests on an open ICMP socket and time the replies."""
+        loop = asyncio.get_running_loop()
+        result = ProbeResult(PROBE_METHOD_ICMP)
+        payload = os.urandom(16)
+
+        for index in range(self.count):
+            if index:
+                await asyncio.sleep(self.interval)
+            self._sequence = (self._sequence + 1) & 0xFFFF
+            sequence = self._sequence
+            # The kernel rewrites the identifier of datagram ICMP sockets, so replies are matched on sequence
+            packet = build_echo_request(0, sequence, payload, ipv6)
+            result.sent += 1
+            start = time.perf_counter()
+            try:
+                await loop.sock_sendto(sock, packet, address)
+                rtt_ms = await asyncio.wait_for(self._await_reply(sock, sequence, ipv6, start), self.timeout)
+            except (OSError, TimeoutError) as e:
+                _LOGGER.debug("ICMP probe %d to %s failed: %s", sequence, address[0], e)
+                continue
+            result.rtts_ms.append(rtt_ms)
+
+        return result
+
+    @staticmethod
+    async def _await_reply(sock: socket.socket, sequence: int, ipv6: bool, start: float) -> float:
+        """Read from the socket until the reply to ``sequence`` arrives; return its round trip in ms."""
+        loop = asyncio.get_running_loop()
+        while True:
+            packet = await loop.sock_recv(sock, 1024)
+            if parse_echo_reply(packet, ipv6) == sequence:
+                return (time.perf_counter() - start) * 1000
+
+    async def _tcp_burst(self, host: str, port: int) -> ProbeResult:
+        """Time TCP handshakes to the host.
+
+        A refused connection still proves the host answered, so it counts as
+        a reply; only timeouts and unreachable errors count as loss.
+        """
+        result = ProbeResult(PROBE_METHOD_TCP)
+
+        for index in range(self.count):
+            if index:
+                await asyncio.sleep(self.interval)
+            result.sent += 1
+            start = time.perf_counter()
+            try:
+                _reader, writer = await asyncio.wait_for(asyncio.open_connection(host, port), self.timeout)
+            except ConnectionRefusedError:
+                result.rtts_ms.append((time.perf_counter() - start) * 1000)
+                continue
+            except (OSError, TimeoutError) as e:
+                _LOGGER.debug("TCP probe to %s:%d failed: %s", host, port, e)
+                continue
+            result.rtts_ms.append((time.perf_counter() - start) * 1000)
+            writer.close()
+            with contextlib.suppress(OSError):
+                await writer.wait_closed()
+
+        return result
@@ -0,0 +1,95 @@
+"""Domain-wide scheduling of modem polls."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import ssl
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+_LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+
+class PollScheduler:
+    """Spread the polls of all configured modems over time and cap how many run at once.
+
+    Every config entry keeps its own coordinator and interval. The scheduler
+    gives each entry a phase offset that is applied once, before its first
+    scheduled poll, so entries set up together at startup do not stay in
+    lockstep. A shared semaphore limits how many polls (fetch, login and parse)
+    are in flight across all entries, which bounds the load on the executor
+    pool. Resources that are identical for every modem, such as the SSL
+    context used by health checks, are created once and shared.
+    """
+
+    def __init__(self, max_concurrent_polls: int = 4, phase_spacing: float = 5.0):
+        """Initialize the scheduler.
+
+        Args:
+            max_concurrent_polls: Maximum number of polls running at the same time
+            phase_spacing: Seconds between the phase offsets of consecutive entries
+        """
+        self.max_concurrent_polls = max(1, max_concurrent_polls)
+        self.phase_spacing = phase_spacing
+        self.ssl_context: ssl.SSLContext | None = None
+        self._semaphore = asyncio.Semaphore(self.max_concurrent_polls)
+        self._slots: dict[str, int] = {}
+        self._pending_offsets: dict[str, float] = {}
+
+    @property
+    def entry_count(self) -> int:
+        """Return the number of registered entries."""
+        return len(self._slots)
+
+    def register(self, entry_id: str, interval: float) -> float:
+        """Register an entry and assign its phase offset.
+
+        Entries take the lowest free slot, so offsets stay evenly spaced when
+        entries are removed and added again.
+
+        Args:
+            entry_id: Config entry ID
+            interval: Entry's polling interval in seconds
+
+        Returns:
+            Delay in seconds applied before the entry's next poll
+        """
+        if entry_id not in self._slots:
+            used = set(self._slots.values())
+            self._slots[entry_id] = next(slot for slot in range(len(used) + 1) if slot not in used)
+
+        offset = (self._slots[entry_id] * self.phase_spacing) % interval if interval > 0 else 0.0
+        if offset:
+            self._pending_offsets[entry_id] = offset
+        _LOGGER.debug("Scheduled entry %s in slot %s (phase offset %.1fs)", entry_id, self._slots[entry_id], offset)
+        return offset
+
+    def unregister(self, entry_id: str) -> None:
+        """Release an entry's slot."""
+        self._slots.pop(entry_id, None)
+        self._pending_offsets.pop(entry_id, None)
+
+    def wrap(self, entry_id: str, update: Callable[[], Awaitable[_T]]) -> Callable[[], Awaitable[_T]]:
+        """Wrap an entry's update function with its phase offset and the global concurrency cap.
+
+        Args:
+            entry_id: Config entry ID
+            update: Coordinator update function
+
+        Returns:
+            Update function to hand to the coordinator
+        """
+
+        async def scheduled_update() -> _T:
+            offset = self._pending_offsets.pop(entry_id, 0.0)
+            if offset:
+                _LOGGER.debug("Delaying poll of entry %s by %.1fs to spread load", entry_id, offset)
+                await asyncio.sleep(offset)
+
+            async with self._semaphore:
+                return await update()
+
+        return scheduled_update
@@ -3,20 +3,99 @@
 from __future__ import annotations
 
 import logging
-import statistics
+import math
 from datetime import datetime, timedelta
-from typing import Any
+from typing import Any, NamedTuple
+
+from ..lib.ring_buffer import RingBuffer
 
 _LOGGER = logging.getLogger(__name__)
 
+# Upper bound on retained samples: 48 hours at the minimum 60 s polling interval
+_MAX_SAMPLES = 2880
+
+
+class _Moments(NamedTuple):
+    """Count, mean and sum of squared deviations (Welford) of a set of values."""
+
+    count: int
+    mean: float
+    m2: float
+
+    @classmethod
+    def of(cls, values: list[float]) -> _Moments:
+        """Compute moments of values in one pass."""
+        count, mean, m2 = 0, 0.0, 0.0
+        for value in values:
+            count += 1
+            delta = value - mean
+            mean += delta / count
+            m2 += delta * (value - mean)
+        return cls(count, mean, m2)
+
+    def merge(self, other: _Moments) -> _Moments:
+        """Return the moments of the union of both sets."""
+        if not other.count:
+            return self
+        if not self.count:
+            return other
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        mean = self.mean + delta * other.count / count
+        m2 = self.m2 + other.m2 + delta * delta * self.count * other.count / count
+        return _Moments(count, mean, m2)
+
+    def remove(self, other: _Moments) -> _Moments:
+        """Return the moments of this set with a previously merged subset taken out."""
+        count = self.count - other.count
+        if count <= 0:
+            return _EMPTY
+        if not other.count:
+            return self
+        mean = (self.mean * self.count - other.mean * other.count) / count
+        delta = other.mean - mean
+        m2 = self.m2 - other.m2 - delta * delta * count * other.count / self.count
+        return _Moments(count, mean, max(m2, 0.0))
+
+    @property
+    def stdev(self) -> float:
+        """Sample standard deviation (0 for fewer than two values)."""
+        return math.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else 0.0
+
+
+_EMPTY = _Moments(0, 0.0, 0.0)
+
+
+class _Sample(NamedTuple):
+    """Scalars kept per poll; independent of the size of the modem payload."""
+
+    timestamp: datetime
+    snr: _Moments
+    power: _Moments
+    errors: float
+    errors_cumulative: float  # Sum of errors of all samples up to and including this one
+
 
 class SignalQualityAnalyzer:
-    """Analyze signal quality trends to recommend polling intervals."""
+    """Analyze signal quality trends to recommend polling intervals.
+
+    Each poll is reduced to a few scalars (SNR/power moments across channels
+    and the uncorrected error total) kept in a fixed-size ring buffer. The
+    24 hour analysis window keeps running totals that are updated as samples
+    enter and leave it, so adding a sample and computing a recommendation are
+    both O(1) (amortized) and memory is bounded by _MAX_SAMPLES.
+    """
 
     def __init__(self):
         """Initialize the signal analyzer."""
-        self._history: list[dict[str, Any]] = []
+        self._samples: RingBuffer[_Sample] = RingBuffer(_MAX_SAMPLES)
         self._max_history_hours = 48  # Keep 48 hours of data for analysis
+        self._analysis_hours = 24
+
+        # Running totals over the analysis window (samples _window_start.. of _samples)
+        self._window_start = 0
+        self._window_snr = _EMPTY
+        self._window_power = _EMPTY
 
     def add_sample(self, data: dict[str, Any]) -> None:
         """
@@ -25,15 +104,56 @@ class SignalQualityAnalyzer:
         Args:
             data: Modem data dict with downstream_channels, upstream_channels, etc.
         """
-        sample = {
-            "timestamp": datetime.now(),
-            "data": data,
-        }
-        self._history.append(sample)
+        now = datetime.now()
+        channels = data.get("downstream_channels", [])
+        errors = float(data.get("total_uncorrected_errors", 0) or 0)
+        previous = self._samples[-1].errors_cumulative if len(self._samples) else 0.0
+        sample = _Sample(
+            timestamp=now,
+            snr=_Moments.of([ch["snr"] for ch in channels if ch.get("snr") is not None]),
+            power=_Moments.of([ch["power"] for ch in channels if ch.get("power") is not None]),
+            errors=errors,
+            errors_cumulative=previous + errors,
+        )
+
+        if len(self._samples) == self._samples.capacity:
+            self._drop_oldest()
+        self._samples.append(sample)
+        self._window_snr = self._window_snr.merge(sample.snr)
+        self._window_power = self._window_power.merge(sample.power)
 
         # Clean old data (older than max_history_hours)
-        cutoff = datetime.now() - timedelta(hours=self._max_history_hours)
-        self._history = [s for s in self._history if s["timestamp"] > cutoff]
+        cutoff = now - timedelta(hours=self._max_history_hours)
+        while len(self._samples) and self._samples[0].timestamp <= cutoff:
+            self._drop_oldest()
+
+    def _drop_oldest(self) -> None:
+        """Remove the oldest sample, taking it out of the window totals if it is still in the window."""
+        sample = self._samples.popleft()
+        if self._window_start:
+            self._window_start -= 1
+        else:
+            self._leave_window(sample)
+
+    def _leave_window(self, sample: _Sample) -> None:
+        """Subtract a sample from the analysis window totals."""
+        self._window_snr = self._window_snr.remove(sample.snr)
+        self._window_power = self._window_power.remove(sample.power)
+
+    def _advance_window(self, now: datetime) -> int:
+        """Move samples older than the analysis window out of it.
+
+        Returns:
+            Number of samples in the window
+        """
+        cutoff = now - timedelta(hours=self._analysis_hours)
+        while self._window_start < len(self._samples) and self._samples[self._window_start].timestamp <= cutoff:
+            self._leave_window(self._samples[self._window_start])
+            self._window_start += 1
+        if self._window_start == len(self._samples):
+            # Reset exactly so floating-point residue does not accumulate
+            self._window_snr = self._window_power = _EMPTY
+        return len(self._samples) - self._window_start
 
     def get_recommended_interval(self, current_interval: int) -> dict[str, Any]:
         """
@@ -56,7 +176,7 @@ class SignalQualityAnalyzer:
         - Network monitoring best practices
         - Cable modem health indicators
         """
-        if len(self._history) < 3:
+        if len(self._samples) < 3:
             return {
                 "recommended_seconds": current_interval,
                 "confidence": "low",
@@ -64,11 +184,10 @@ class SignalQualityAnalyzer:
                 "signal_status": "unknown",
             }
 
-        # Extract recent samples (last 24 hours)
-        cutoff_24h = datetime.now() - timedelta(hours=24)
-        recent_samples = [s for s in self._history if s["timestamp"] > cutoff_24h]
+        # Restrict analysis to the last 24 hours
+        sample_count = self._advance_window(datetime.now())
 
-        if len(recent_samples) < 3:
+        if sample_count < 3:
             return {
                 "recommended_seconds": current_interval,
                 "confidence": "low",
@@ -76,67 +195,35 @@ class SignalQualityAnalyzer:
                 "signal_status": "unknown",
             }
 
-        # Analyze signal stability
-        snr_values = self._extract_snr_values(recent_samples)
-        power_values = self._extract_power_values(recent_samples)
-        error_rates = self._calculate_error_rates(recent_samples)
-
-        # Calculate stability metrics
-        snr_variance = statistics.stdev(snr_values) if len(snr_values) > 1 else 0
-        power_variance = statistics.stdev(power_values) if len(power_values) > 1 else 0
-        error_trend = self._calculate_error_trend(error_rates)
-
         # Determine signal status and recommendation
         return self._calculate_recommendation(
             current_interval=current_interval,
-            snr_variance=snr_variance,
-            power_variance=power_variance,
-            error_trend=error_trend,
-            sample_count=len(recent_samples),
+            snr_variance=self._window_snr.stdev,
+            power_variance=self._window_power.stdev,
+            error_trend=self._window_error_trend(),
+            sample_count=sample_count,
         )
 
-    def _extract_snr_values(self, samples: list[dict]) -> list[float]:
-        """Extract SNR values from downstream channels."""
-        snr_values = []
-        for sample in samples:
-            channels = sample["data"].get("downstream_channels", [])
-            for channel in channels:
-                if "snr" in channel and channel["snr"] is not None:
-                    snr_values.append(channel["snr"])
-        return snr_values
-
-    def _extract_power_values(self, samples: list[dict]) -> list[float]:
-        """Extract power level values from downstream channels."""
-        power_values = []
-        for sample in samples:
-            channels = sample["data"].get("downstream_channels", [])
-            for channel in channels:
-                if "power" in channel and channel["power"] is not None:
-                    power_values.append(channel["power"])
-        return power_values
-
-    def _calculate_error_rates(self, samples: list[dict]) -> list[int]:
-        """Calculate total error counts over time."""
-        error_rates = []
-        for sample in samples:
-            total_errors = sample["data"].get("total_uncorrected_errors", 0)
-            error_rates.append(total_errors)
-        return error_rates
-
-    def _calculate_error_trend(self, error_rates: list[int]) -> str:
+    def _window_error_trend(self) -> str:
+        """Compare the mean error count of the newer half of the window with the older half."""
+        count = len(self._samples) - self._window_start
+        if count < 2:
+            return "stable"
+
+        first = self._samples[self._window_start]
+        last = self._samples[-1]
+        mid = self._samples[self._window_start + count // 2 - 1]  # Last sample of the older half
+
+        older_sum = mid.errors_cumulative - (first.errors_cumulative - first.errors)
+        recent_sum = last.errors_cumulative - mid.errors_cumulative
+        return self._calculate_error_trend(older_sum / (count // 2), recent_sum / (count - count // 2))
+
+    def _calculate_error_trend(self, older_avg: float, recent_avg: float) -> str:
         """
         Determine if errors are increasing, stable, or decreasing.
 
         Returns: "increasing", "stable", or "decreasing"
         """
-        if len(error_rates) < 2:
-            return "stable"
-
-        # Compare recent half to older half
-        mid = len(error_rates) // 2
-        older_avg = statistics.mean(error_rates[:mid])
-        recent_avg = statistics.mean(error_rates[mid:])
-
         # If recent errors are 50% higher, consider increasing
         if recent_avg > older_avg * 1.5:
             return "increasing"
@@ -221,16 +308,18 @@ class SignalQualityAnalyzer:
 
     def get_history_summary(self) -> dict[str, Any]:
         """Get summary of collected history."""
-        if not self._history:
+        if not len(self._samples):
             return {
                 "sample_count": 0,
                 "oldest_sample": None,
                 "newest_sample": None,
             }
 
+        oldest = self._samples[0].timestamp
+        newest = self._samples[-1].timestamp
         return {
-            "sample_count": len(self._history),
-            "oldest_sample": self._history[0]["timestamp"].isoformat(),
-            "newest_sample": self._history[-1]["timestamp"].isoformat(),
-            "hours_covered": (self._history[-1]["timestamp"] - self._history[0]["timestamp"]).total_seconds() / 3600,
+            "sample_count": len(self._samples),
+            "oldest_sample": oldest.isoformat(),
+            "newest_sample": newest.isoformat(),
+            "hours_covered": (newest - oldest).total_seconds() / 3600,
         }
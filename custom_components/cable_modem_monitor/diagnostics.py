@@ -9,7 +9,7 @@ from typing import Any
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
-from .const import DOMAIN
+from .const import DATA_HEALTH_COORDINATORS, DOMAIN
 from .utils.html_helper import sanitize_html
 
 _LOGGER = logging.getLogger(__name__)
@@ -263,6 +263,9 @@ def _get_detection_method(entry: ConfigEntry) -> str:
 def _build_diagnostics_dict(hass: HomeAssistant, coordinator, entry: ConfigEntry) -> dict[str, Any]:
     """Build the main diagnostics dictionary from coordinator data."""
     data = coordinator.data if coordinator.data else {}
+    # Health probes run on their own coordinator
+    health_coordinator = hass.data.get(DATA_HEALTH_COORDINATORS, {}).get(entry.entry_id)
+    health = health_coordinator.data if health_coordinator is not None and health_coordinator.data else {}
 
     diagnostics = {
         "config_entry": {
@@ -296,13 +299,15 @@ def _build_diagnostics_dict(hass: HomeAssistant, coordinator, entry: ConfigEntry
             "total_uncorrected_errors": data.get("cable_modem_total_uncorrected", 0),
             "software_version": data.get("cable_modem_software_version", "Unknown"),
             "system_uptime": data.get("cable_modem_system_uptime", "Unknown"),
-            "health_status": data.get("health_status", "not_available"),
-            "health_diagnosis": data.get("health_diagnosis", ""),
-            "ping_success": data.get("ping_success", False),
-            "ping_latency_ms": data.get("ping_latency_ms"),
-            "http_success": data.get("http_success", False),
-            "http_latency_ms": data.get("http_latency_ms"),
-            "consecutive_failures": data.get("consecutive_failures", 0),
+            "health_status": health.get("health_status", "not_available"),
+            "health_diagnosis": health.get("health_diagnosis", ""),
+            "ping_success": health.get("ping_success", False),
+            "ping_latency_ms": health.get("ping_latency_ms"),
+            "ping_jitter_ms": health.get("ping_jitter_ms"),
+            "ping_packet_loss": health.get("ping_packet_loss"),
+            "http_success": health.get("http_success", False),
+            "http_latency_ms": health.get("http_latency_ms"),
+            "consecutive_failures": health.get("consecutive_failures", 0),
         },
         "downstream_channels": [
             {
@@ -0,0 +1,77 @@
+"""Selectable HTML tree builder for BeautifulSoup.
+
+Parsers are written against the BeautifulSoup API, so the backend choice is the
+tree builder BeautifulSoup uses underneath. lxml is a C parser and is several
+times faster than the pure-Python html.parser on large modem status pages; it
+is used when installed and html.parser is the fallback.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import logging
+from functools import cache
+
+from bs4 import BeautifulSoup
+
+_LOGGER = logging.getLogger(__name__)
+
+HTML_BACKEND_LXML = "lxml"
+HTML_BACKEND_HTML_PARSER = "html.parser"
+
+# Preferred backends, fastest first
+SUPPORTED_BACKENDS = [HTML_BACKEND_LXML, HTML_BACKEND_HTML_PARSER]
+
+_default_backend: str | None = None
+
+
+@cache
+def _is_available(backend: str) -> bool:
+    """Check whether the library behind a backend can be imported."""
+    if backend == HTML_BACKEND_HTML_PARSER:
+        return True
+    return importlib.util.find_spec(backend) is not None
+
+
+def get_default_backend() -> str:
+    """Return the fastest installed backend (detected once per process).
+
+    Returns:
+        BeautifulSoup feature name, e.g. "lxml" or "html.parser"
+    """
+    global _default_backend
+
+    if _default_backend is None:
+        _default_backend = next(b for b in SUPPORTED_BACKENDS if _is_available(b))
+        _LOGGER.debug("Using HTML parse backend: %s", _default_backend)
+    return _default_backend
+
+
+def resolve_backend(backend: str | None) -> str:
+    """Validate a requested backend, falling back to the default when unavailable.
+
+    Args:
+        backend: Requested backend name, or None for the default
+
+    Returns:
+        Backend name that is safe to pass to BeautifulSoup
+    """
+    if backend is None:
+        return get_default_backend()
+    if backend not in SUPPORTED_BACKENDS or not _is_available(backend):
+        _LOGGER.warning("HTML parse backend '%s' is not available, using %s", backend, get_default_backend())
+        return get_default_backend()
+    return backend
+
+
+def make_soup(html: str, backend: str | None = None) -> BeautifulSoup:
+    """Parse HTML with the selected backend.
+
+    Args:
+        html: Raw HTML string
+        backend: Backend name (default: fastest installed)
+
+    Returns:
+        BeautifulSoup document
+    """
+    return BeautifulSoup(html, resolve_backend(backend))
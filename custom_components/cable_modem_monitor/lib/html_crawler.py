@@ -9,7 +9,7 @@ from __future__ import annotations
 import logging
 from urllib.parse import urljoin, urlparse, urlunparse
 
-from bs4 import BeautifulSoup
+from .html_backend import make_soup
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -102,7 +102,7 @@ def extract_links_from_html(html: str, base_url: str) -> set[str]:
     base_host = urlparse(base_url).netloc
 
     try:
-        soup = BeautifulSoup(html, "html.parser")
+        soup = make_soup(html)
 
         # Find all <a> tags with href attributes
         for link_tag in soup.find_all("a", href=True):
@@ -0,0 +1,239 @@
+"""Incremental HTML extraction of declared tables and script blocks.
+
+A parser that only needs one or two tables (or one script block) from a large
+status page does not need the whole page, let alone a DOM of it. The page is
+fed chunk by chunk into the standard library's HTMLParser, which keeps only
+the rows of the targeted elements; reading stops as soon as every target has
+been captured, and rows are handed out while the rest of the page is still
+on the wire.
+"""
+
+from __future__ import annotations
+
+import codecs
+import logging
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass, field
+from html.parser import HTMLParser
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+STREAM_CHUNK_SIZE = 8192
+
+
+@dataclass(frozen=True)
+class StreamTarget:
+    """An element a parser needs from a page.
+
+    Attributes:
+        tag: "table" or "script"
+        marker: Text that identifies the element. For tables, a text node of
+            the innermost table that contains it; for scripts, a substring of
+            the script source.
+    """
+
+    tag: str
+    marker: str
+
+    def __post_init__(self) -> None:
+        """Reject tags the stream cannot capture."""
+        if self.tag not in ("table", "script"):
+            raise ValueError(f"Unsupported stream target tag: {self.tag}")
+
+
+@dataclass
+class _OpenTable:
+    """State of a <table> element that has not been closed yet."""
+
+    target: str | None = None
+    # Current text node; HTMLParser may deliver one node in several pieces at chunk boundaries
+    text: str = ""
+    rows: list[list[str]] = field(default_factory=list)
+    row: list[str] | None = None
+    cell: list[str] | None = None
+
+
+class _TargetCollector(HTMLParser):
+    """HTMLParser that records the rows of targeted tables and the source of targeted scripts.
+
+    Table targets produce one item per <tr>: the stripped text of its <td>
+    cells (an empty list for rows with header cells only). Script targets
+    produce a single item holding the script source.
+    """
+
+    def __init__(self, targets: Mapping[str, StreamTarget]):
+        super().__init__(convert_charrefs=True)
+        self._table_targets = {name: t for name, t in targets.items() if t.tag == "table"}
+        self._script_targets = {name: t for name, t in targets.items() if t.tag == "script"}
+        self._remaining = set(targets)
+        self._tables: list[_OpenTable] = []
+        self._script: list[str] | None = None
+        self._ready: list[tuple[str, list[str]]] = []
+
+    @property
+    def done(self) -> bool:
+        """Return True once every target has been captured."""
+        return not self._remaining
+
+    @property
+    def missing(self) -> set[str]:
+        """Return the names of targets not captured (yet)."""
+        return set(self._remaining)
+
+    def drain(self) -> list[tuple[str, list[str]]]:
+        """Return and forget the items completed since the last call."""
+        ready, self._ready = self._ready, []
+        return ready
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if tag == "script" and self._script_targets:
+            self._script = []
+            return
+        if not self._table_targets:
+            return
+        if tag == "table":
+            self._tables.append(_OpenTable())
+            return
+        if not self._tables:
+            return
+        table = self._tables[-1]
+        table.text = ""
+        if tag == "tr":
+            self._end_row(table)
+            table.row = []
+        elif tag in ("td", "th"):
+            self._end_cell(table)
+            if table.row is None:
+                table.row = []
+            # Header cells are read for markers but not returned as row values
+            table.cell = [] if tag == "td" else None
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "script" and self._script is not None:
+            self._end_script("".join(self._script))
+            self._script = None
+            return
+        if not self._tables:
+            return
+        table = self._tables[-1]
+        table.text = ""
+        if tag in ("td", "th"):
+            self._end_cell(table)
+        elif tag == "tr":
+            self._end_row(table)
+        elif tag == "table":
+            self._end_row(table)
+            self._tables.pop()
+            if table.target is not None:
+                self._remaining.discard(table.target)
+
+    def handle_data(self, data: str) -> None:
+        if self._script is not None:
+            self._script.append(data)
+            return
+        if not self._tables:
+            return
+        table = self._tables[-1]
+        if table.cell is not None:
+            table.cell.append(data)
+        if table.target is None:
+            table.text += data
+            self._match_table(table, table.text)
+
+    def _match_table(self, table: _OpenTable, text: str) -> None:
+        """Claim the innermost open table for the first uncaptured target whose marker is in the text."""
+        for name, target in self._table_targets.items():
+            if name in self._remaining and target.marker in text:
+                if any(other.target == name for other in self._tables):
+                    continue
+                table.target = name
+                # Rows read before the marker showed up belong to the target too
+                self._ready.extend((name, row) for row in table.rows)
+                table.rows = []
+                return
+
+    def _end_cell(self, table: _OpenTable) -> None:
+        if table.cell is not None and table.row is not None:
+            table.row.append("".join(table.cell).strip())
+        table.cell = None
+
+    def _end_row(self, table: _OpenTable) -> None:
+        self._end_cell(table)
+        if table.row is None:
+            return
+        if table.target is not None:
+            self._ready.append((table.target, table.row))
+        else:
+            table.rows.append(table.row)
+        table.row = None
+
+    def _end_script(self, source: str) -> None:
+        for name, target in self._script_targets.items():
+            if name in self._remaining and target.marker in source:
+                self._ready.append((name, [source]))
+                self._remaining.discard(name)
+
+
+class TargetStream:
+    """Iterate over the rows of declared targets while the page is being read.
+
+    Iterating yields ``(target_name, cells)`` tuples in document order. The
+    chunk source is not read any further once every target has been captured.
+
+    Example:
+        stream = TargetStream(chunks, {"downstream": StreamTarget("table", "Downstream")})
+        for name, cells in stream:
+            ...
+        if not stream.complete:
+            ...  # page did not contain every target (e.g. a login page)
+    """
+
+    def __init__(self, chunks: Iterable[str], targets: Mapping[str, StreamTarget]):
+        """Initialize the stream.
+
+        Args:
+            chunks: Page text, in pieces of any size
+            targets: Target name -> StreamTarget
+        """
+        self._chunks = chunks
+        self._collector = _TargetCollector(targets)
+        self.chars_read = 0
+
+    @property
+    def complete(self) -> bool:
+        """Return True if every target was captured."""
+        return self._collector.done
+
+    @property
+    def missing(self) -> set[str]:
+        """Return the names of targets that were not captured."""
+        return self._collector.missing
+
+    def __iter__(self) -> Iterator[tuple[str, list[str]]]:
+        collector = self._collector
+        for chunk in self._chunks:
+            self.chars_read += len(chunk)
+            collector.feed(chunk)
+            yield from collector.drain()
+            if collector.done:
+                _LOGGER.debug("All stream targets captured after %d characters", self.chars_read)
+                return
+        collector.close()
+        yield from collector.drain()
+
+
+def iter_response_text(response: Any, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[str]:
+    """Decode a streamed requests response incrementally.
+
+    The response must have been requested with ``stream=True``. Uses the
+    encoding requests derived from the headers, or UTF-8 when there is none.
+    """
+    decoder = codecs.getincrementaldecoder(response.encoding or "utf-8")(errors="replace")
+    for chunk in response.iter_content(chunk_size=chunk_size):
+        text = decoder.decode(chunk)
+        if text:
+            yield text
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        yield tail
@@ -0,0 +1,91 @@
+"""Quantile sketch with bounded relative error that also supports removal."""
+
+from __future__ import annotations
+
+import math
+
+
+class QuantileSketch:
+    """Log-bucketed histogram for estimating quantiles of positive values.
+
+    Every value is counted in the bucket ``ceil(log(value, gamma))``, so any
+    quantile is returned within ``relative_accuracy`` of a value actually
+    added (the DDSketch scheme). Because buckets only hold counts, values can
+    be removed again, which lets the sketch follow a sliding window in O(1)
+    per update. Memory grows with the logarithm of the value range, not with
+    the number of values: a 2% sketch spans 0.01 ms to 100 s in under 450
+    buckets.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.02, min_value: float = 1e-2):
+        """Initialize the sketch.
+
+        Args:
+            relative_accuracy: Maximum relative error of returned quantiles
+            min_value: Values at or below this are counted together as ``min_value``
+        """
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        self.relative_accuracy = relative_accuracy
+        self.min_value = min_value
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._buckets: dict[int, int] = {}
+        self._low_count = 0
+        self.count = 0
+
+    def _key(self, value: float) -> int | None:
+        """Return the bucket of a value, or None for the low bucket."""
+        if value <= self.min_value:
+            return None
+        return math.ceil(math.log(value) / self._log_gamma)
+
+    def add(self, value: float) -> None:
+        """Count a value."""
+        key = self._key(value)
+        if key is None:
+            self._low_count += 1
+        else:
+            self._buckets[key] = self._buckets.get(key, 0) + 1
+        self.count += 1
+
+    def remove(self, value: float) -> None:
+        """Uncount a value previously added.
+
+        Raises:
+            KeyError: If no value in that bucket is counted
+        """
+        key = self._key(value)
+        if key is None:
+            if not self._low_count:
+                raise KeyError(value)
+            self._low_count -= 1
+        else:
+            remaining = self._buckets[key] - 1
+            if remaining:
+                self._buckets[key] = remaining
+            else:
+                del self._buckets[key]
+        self.count -= 1
+
+    def clear(self) -> None:
+        """Remove all values."""
+        self._buckets.clear()
+        self._low_count = 0
+        self.count = 0
+
+    def quantile(self, q: float) -> float | None:
+        """Estimate the q-quantile (0 <= q <= 1), or None if the sketch is empty."""
+        if not self.count:
+            return None
+        # Nearest-rank definition: the smallest value with at least q of all values at or below it
+        rank = max(1, math.ceil(q * self.count))
+        seen = self._low_count
+        if seen >= rank:
+            return self.min_value
+        for key in sorted(self._buckets):
+            seen += self._buckets[key]
+            if seen >= rank:
+                # Midpoint of the bucket (gamma^(key-1), gamma^key] in relative terms
+                return 2 * self._gamma**key / (self._gamma + 1)
+        return 2 * self._gamma ** max(self._buckets) / (self._gamma + 1)
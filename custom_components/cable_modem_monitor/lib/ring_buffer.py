@@ -0,0 +1,73 @@
+"""Fixed-capacity ring buffer with O(1) append, popleft and indexing."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+
+class RingBuffer[T]:
+    """Preallocated FIFO of at most ``capacity`` items.
+
+    Appending to a full buffer overwrites (and returns) the oldest item, so
+    memory use is fixed no matter how long the buffer is fed. Unlike
+    collections.deque, indexing anywhere in the buffer is O(1).
+    """
+
+    def __init__(self, capacity: int):
+        """Initialize the buffer.
+
+        Args:
+            capacity: Maximum number of items kept
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self._slots: list[T | None] = [None] * capacity
+        self._start = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        """Return the number of items in the buffer."""
+        return self._size
+
+    def __getitem__(self, index: int) -> T:
+        """Return the item at a position (0 = oldest, -1 = newest)."""
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("ring buffer index out of range")
+        return self._slots[(self._start + index) % self.capacity]  # type: ignore[return-value]
+
+    def __iter__(self) -> Iterator[T]:
+        """Iterate from oldest to newest."""
+        for index in range(self._size):
+            yield self[index]
+
+    def append(self, item: T) -> T | None:
+        """Add an item as the newest.
+
+        Returns:
+            The oldest item if it was overwritten because the buffer was full, else None
+        """
+        evicted = None
+        if self._size == self.capacity:
+            evicted = self.popleft()
+        self._slots[(self._start + self._size) % self.capacity] = item
+        self._size += 1
+        return evicted
+
+    def popleft(self) -> T:
+        """Remove and return the oldest item."""
+        if not self._size:
+            raise IndexError("pop from an empty ring buffer")
+        item = self._slots[self._start]
+        self._slots[self._start] = None
+        self._start = (self._start + 1) % self.capacity
+        self._size -= 1
+        return item  # type: ignore[return-value]
+
+    def clear(self) -> None:
+        """Remove all items."""
+        self._slots = [None] * self.capacity
+        self._start = 0
+        self._size = 0
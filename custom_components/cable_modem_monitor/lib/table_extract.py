@@ -0,0 +1,173 @@
+"""Declarative extraction of channel records from HTML tables.
+
+Most status pages present channels as a table, either one channel per row or
+transposed (one field per row, one channel per column). Instead of walking the
+table with nested find_all loops, a parser declares a TableSpec - which cell or
+row label feeds which output key, and how to convert it - and the spec turns
+the table's cell texts into channel records in one pass.
+
+A spec works on plain lists of cell texts, so the same declaration serves a
+BeautifulSoup table (via table_rows) and rows streamed by lib.html_stream.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from .utils import extract_number
+
+if TYPE_CHECKING:
+    from bs4 import Tag
+
+_LOGGER = logging.getLogger(__name__)
+
+ROWS = "rows"
+TRANSPOSED = "transposed"
+
+
+def text(value: str) -> str:
+    """Keep the cell text as is (already stripped)."""
+    return value
+
+
+def id_text(value: str) -> str | None:
+    """Return the number in a channel ID cell as a string, or None if there is none."""
+    number = extract_number(value)
+    return str(number) if number is not None else None
+
+
+@dataclass(frozen=True)
+class Column:
+    """Where one output key comes from.
+
+    Attributes:
+        key: Key in the channel record
+        source: Cell index for ROWS tables, or the start of the row label for
+            TRANSPOSED tables
+        convert: Function applied to the stripped cell text
+    """
+
+    key: str
+    source: int | str
+    convert: Callable[[str], Any] = text
+
+
+@dataclass(frozen=True)
+class TableSpec:
+    """How to turn a table into channel records.
+
+    Attributes:
+        name: Label used in debug logging
+        columns: Output keys and their sources, in record order
+        orientation: ROWS (one channel per row) or TRANSPOSED (one channel per column)
+        header_rows: Leading rows to skip (ROWS only)
+        min_cells: Rows with fewer cells are not channels (ROWS only; at least
+            enough cells for every column)
+        key: Records whose value for this key converts to None are dropped
+        defaults: Extra keys added to every record
+    """
+
+    name: str
+    columns: tuple[Column, ...]
+    orientation: str = ROWS
+    header_rows: int = 0
+    min_cells: int = 0
+    key: str | None = None
+    defaults: Mapping[str, Any] = field(default_factory=dict)
+    _getters: tuple[tuple[str, Any, Callable[[str], Any]], ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Validate the declaration once, when the parser class is defined."""
+        if self.orientation == ROWS:
+            if not all(isinstance(column.source, int) for column in self.columns):
+                raise ValueError(f"{self.name}: ROWS columns need cell indexes")
+            needed = max((column.source for column in self.columns), default=-1) + 1  # type: ignore[type-var]
+            object.__setattr__(self, "min_cells", max(self.min_cells, needed))
+        elif self.orientation == TRANSPOSED:
+            if not all(isinstance(column.source, str) for column in self.columns):
+                raise ValueError(f"{self.name}: TRANSPOSED columns need row labels")
+        else:
+            raise ValueError(f"{self.name}: unknown orientation {self.orientation!r}")
+        object.__setattr__(self, "_getters", tuple((c.key, c.source, c.convert) for c in self.columns))
+
+    def record(self, cells: Sequence[str]) -> dict[str, Any] | None:
+        """Convert the cell texts of one row of a ROWS table, or None if the row is not a channel."""
+        if len(cells) < self.min_cells:
+            return None
+        record = {key: convert(cells[index]) for key, index, convert in self._getters}
+        return self._finish(record)
+
+    def iter_records(self, rows: Iterable[Sequence[str]]) -> Iterator[dict[str, Any]]:
+        """Yield channel records from the cell texts of each table row."""
+        if self.orientation == TRANSPOSED:
+            yield from self._transposed_records(rows)
+            return
+        for index, cells in enumerate(rows):
+            if index < self.header_rows:
+                continue
+            record = self.record(cells)
+            if record is not None:
+                yield record
+
+    def extract(self, rows: Iterable[Sequence[str]]) -> list[dict[str, Any]]:
+        """Return the channel records of a table."""
+        start = time.perf_counter()
+        records = list(self.iter_records(rows))
+        _LOGGER.debug(
+            "%s: extracted %d records in %.2f ms", self.name, len(records), (time.perf_counter() - start) * 1000
+        )
+        return records
+
+    def _transposed_records(self, rows: Iterable[Sequence[str]]) -> Iterator[dict[str, Any]]:
+        """Yield one record per column of a table whose rows are fields."""
+        values: dict[str, Sequence[str]] = {}
+        channel_count = 0
+        for cells in rows:
+            if len(cells) < 2:
+                continue
+            label = cells[0]
+            channel_count = max(channel_count, len(cells) - 1)
+            for key, prefix, _ in self._getters:
+                if label.startswith(prefix):
+                    values[key] = cells[1:]
+
+        for index in range(channel_count):
+            record = {
+                key: convert(values[key][index])
+                for key, _, convert in self._getters
+                if key in values and index < len(values[key])
+            }
+            finished = self._finish(record)
+            if finished is not None:
+                yield finished
+
+    def _finish(self, record: dict[str, Any]) -> dict[str, Any] | None:
+        if self.key is not None and record.get(self.key) is None:
+            return None
+        if self.defaults:
+            record.update(self.defaults)
+        return record
+
+
+def table_rows(table: Tag) -> list[list[str]]:
+    """Return the stripped cell texts of every row of a table.
+
+    Header cells (<th>) are not included. A <td> that sits inside another cell
+    of the same row (a nested layout table) is part of that cell's text, not a
+    cell of its own.
+    """
+    rows = []
+    for tr in table.find_all("tr"):
+        cells: list[str] = []
+        outer = None
+        for td in tr.find_all("td"):
+            if outer is not None and any(parent is outer for parent in td.parents):
+                continue
+            outer = td
+            cells.append(td.get_text().strip())
+        rows.append(cells)
+    return rows
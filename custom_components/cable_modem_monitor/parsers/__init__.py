@@ -1,38 +1,157 @@
-"""Parser plugin discovery and registration system."""
+"""Parser plugin registry backed by the generated parser manifest."""
 
 from __future__ import annotations
 
 import importlib
 import logging
-import os
-import pkgutil
+import threading
+from dataclasses import dataclass, field
+from typing import Any
 
 from .base_parser import ModemParser
+from .manifest import PARSER_MANIFEST
 
 _LOGGER = logging.getLogger(__name__)
 
-# Global cache for discovered parsers to avoid repeated filesystem scans
+# Global cache for loaded parsers to avoid importing every parser module again
 _PARSER_CACHE: list[type[ModemParser]] | None = None
 
-# Mapping of parser names to their module paths for direct loading
-_PARSER_MODULE_MAP = {
-    "ARRIS SB6141": ("arris", "sb6141", "ARRISSb6141Parser"),
-    "ARRIS SB6190": ("arris", "sb6190", "ArrisSB6190Parser"),
-    "Motorola MB Series (Generic)": ("motorola", "generic", "MotorolaGenericParser"),
-    "Motorola MB7621": ("motorola", "mb7621", "MotorolaMB7621Parser"),
-    "Motorola MB8611 (HNAP)": ("motorola", "mb8611_hnap", "MotorolaMB8611HnapParser"),
-    "Motorola MB8611 (Static)": ("motorola", "mb8611_static", "MotorolaMB8611StaticParser"),
-    "Netgear C3700": ("netgear", "c3700", "NetgearC3700Parser"),
-    "Netgear CM600": ("netgear", "cm600", "NetgearCM600Parser"),
-    "Technicolor TC4400": ("technicolor", "tc4400", "TechnicolorTC4400Parser"),
-    "Technicolor XB7": ("technicolor", "xb7", "TechnicolorXB7Parser"),
-    "Unknown Modem (Fallback Mode)": ("universal", "fallback", "UniversalFallbackParser"),
-}
+
+@dataclass(frozen=True, eq=False)
+class ParserInfo:
+    """Metadata of one parser, read from the manifest without importing its module."""
+
+    name: str
+    manufacturer: str
+    module: str  # Relative to this package, e.g. "motorola.mb7621"
+    class_name: str
+    models: list[str] = field(default_factory=list)
+    priority: int = 50
+    auth_strategy: str | None = None
+    supports_restart: bool = False
+    url_patterns: list[dict[str, Any]] = field(default_factory=list)
+    fingerprints: dict[str, list[str]] = field(default_factory=dict)
+
+
+# Manifest entries in dropdown order (alphabetical by manufacturer, then name;
+# Generic parsers last within their manufacturer, Unknown at the very end)
+_PARSER_INFO: tuple[ParserInfo, ...] = tuple(ParserInfo(**entry) for entry in PARSER_MANIFEST)
+_PARSER_INFO_BY_NAME: dict[str, ParserInfo] = {info.name: info for info in _PARSER_INFO}
+
+
+class LazyParser:
+    """Stand-in for a parser class that imports the parser module on first real use.
+
+    Manifest metadata (name, manufacturer, models, priority, url_patterns,
+    fingerprints, auth_strategy, supports_restart) is available without any
+    import, so detection can rank and skip parsers cheaply. Instantiating the
+    proxy before login/parse, or reading any other class attribute such as
+    ``can_parse``, imports the module once and delegates to the real class.
+    """
+
+    def __init__(self, info: ParserInfo):
+        """Wrap a manifest entry."""
+        self.info = info
+        self.name = info.name
+        self.manufacturer = info.manufacturer
+        self.models = info.models
+        self.priority = info.priority
+        self.url_patterns = info.url_patterns
+        self.fingerprints = info.fingerprints
+        self.auth_strategy = info.auth_strategy
+        self.supports_restart = info.supports_restart
+        self._parser_class: type[ModemParser] | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        """Return True once the parser module has been imported."""
+        return self._parser_class is not None
+
+    def load(self) -> type[ModemParser]:
+        """Import the parser module (once) and return the real parser class.
+
+        Raises:
+            ImportError: If the module or class listed in the manifest cannot be loaded
+        """
+        if self._parser_class is None:
+            with self._lock:
+                if self._parser_class is None:
+                    parser_class = load_parser(self.info)
+                    if parser_class is None:
+                        raise ImportError(f"Parser '{self.name}' could not be loaded from .{self.info.module}")
+                    self._parser_class = parser_class
+        return self._parser_class
+
+    def __call__(self, *args: Any, **kwargs: Any) -> ModemParser:
+        """Create a parser instance, loading the real class first."""
+        return self.load()(*args, **kwargs)
+
+    def __getattr__(self, attr: str) -> Any:
+        """Delegate everything that is not manifest metadata to the real class."""
+        # Private and dunder lookups (copy, pickle, half-initialized proxies) must not trigger an import
+        if attr.startswith("_"):
+            raise AttributeError(attr)
+        return getattr(self.load(), attr)
+
+    def __repr__(self) -> str:
+        """Return a representation that shows whether the module is loaded."""
+        return f"<LazyParser {self.name!r}{'' if self.loaded else ' (not loaded)'}>"
+
+
+def get_parser_info() -> tuple[ParserInfo, ...]:
+    """Return the metadata of all parsers, in dropdown order, without importing any parser module."""
+    return _PARSER_INFO
+
+
+def get_parser_names() -> list[str]:
+    """Return the names of all parsers, in dropdown order."""
+    return [info.name for info in _PARSER_INFO]
+
+
+def load_parser(info: ParserInfo) -> type[ModemParser] | None:
+    """Import the module of a manifest entry and return its parser class.
+
+    Returns:
+        Parser class, or None if the module or class cannot be loaded
+    """
+    full_module_name = f".{info.module}"
+    try:
+        module = importlib.import_module(full_module_name, package=__name__)
+    except Exception as e:
+        _LOGGER.error("Failed to load parser module %s: %s", full_module_name, e, exc_info=True)
+        return None
+
+    parser_class = getattr(module, info.class_name, None)
+    if parser_class is None:
+        _LOGGER.error("Parser class %s not found in module %s", info.class_name, full_module_name)
+        return None
+    if not (isinstance(parser_class, type) and issubclass(parser_class, ModemParser)):
+        _LOGGER.error(
+            "Class '%s' found in module '%s' is not a subclass of ModemParser", info.class_name, full_module_name
+        )
+        return None
+    return parser_class
+
+
+# One proxy per parser for the lifetime of the process, so the classes they load
+# (and indexes keyed on the proxies) are shared by every config entry
+_LAZY_PARSERS: dict[str, LazyParser] = {info.name: LazyParser(info) for info in _PARSER_INFO}
+
+
+def get_lazy_parsers() -> list[LazyParser]:
+    """Return a lazy proxy for every parser, in dropdown order, without importing any parser module."""
+    return list(_LAZY_PARSERS.values())
+
+
+def get_lazy_parser(parser_name: str) -> LazyParser | None:
+    """Return the lazy proxy of a parser by name, or None if the manifest has no such parser."""
+    return _LAZY_PARSERS.get(parser_name)
 
 
 def get_parser_by_name(parser_name: str) -> type[ModemParser] | None:
     """
-    Load a specific parser by name without scanning all parsers.
+    Load a specific parser by name, importing only its module.
 
     This is much faster than get_parsers() when you know which parser you need.
 
@@ -43,129 +162,43 @@ def get_parser_by_name(parser_name: str) -> type[ModemParser] | None:
         Parser class if found, None otherwise
     """
     _LOGGER.debug("Attempting to get parser by name: %s", parser_name)
-    if parser_name not in _PARSER_MODULE_MAP:
-        _LOGGER.warning("Parser '%s' not found in known parsers map", parser_name)
+    info = _PARSER_INFO_BY_NAME.get(parser_name)
+    if info is None:
+        _LOGGER.warning("Parser '%s' not found in parser manifest", parser_name)
         return None
 
-    manufacturer, module_name, class_name = _PARSER_MODULE_MAP[parser_name]
-    _LOGGER.debug(
-        "Found parser details in map: manufacturer=%s, module=%s, class=%s",
-        manufacturer,
-        module_name,
-        class_name,
-    )
+    parser_class = load_parser(info)
+    if parser_class is not None:
+        _LOGGER.info("Loaded parser: %s (skipped discovery - direct load)", parser_name)
+    return parser_class
 
-    try:
-        # Import only the specific parser module
-        full_module_name = f".{manufacturer}.{module_name}"
-        _LOGGER.debug("Loading specific parser module: %s", full_module_name)
-        module = importlib.import_module(full_module_name, package=__name__)
-        _LOGGER.debug("Successfully imported module: %s", full_module_name)
-
-        # Get the parser class
-        parser_class = getattr(module, class_name, None)
-        if parser_class:
-            _LOGGER.debug("Found class '%s' in module '%s'", class_name, full_module_name)
-            if issubclass(parser_class, ModemParser):
-                _LOGGER.info("Loaded parser: %s (skipped discovery - direct load)", parser_name)
-                return parser_class  # type: ignore[no-any-return]
-            else:
-                _LOGGER.error(
-                    "Class '%s' found in module '%s' is not a subclass of ModemParser",
-                    class_name,
-                    full_module_name,
-                )
-        else:
-            _LOGGER.error("Parser class %s not found in module %s", class_name, full_module_name)
-        return None
-
-    except Exception as e:
-        _LOGGER.error("Failed to load parser %s: %s", parser_name, e, exc_info=True)
-        return None
 
-
-def get_parsers(use_cache: bool = True) -> list[type[ModemParser]]:  # noqa: C901
+def get_parsers(use_cache: bool = True) -> list[type[ModemParser]]:
     """
-    Auto-discover and return all parser modules in this package.
+    Return all parser classes listed in the manifest, in dropdown order.
 
     Args:
         use_cache: If True, return cached parsers if available (faster).
-                   Set to False to force re-discovery (useful for testing).
+                   Set to False to force re-loading (useful for testing).
 
     Returns:
-        List of all discovered parser classes
+        List of all parser classes
     """
     global _PARSER_CACHE
 
     # Return cached parsers if available
     if use_cache and _PARSER_CACHE is not None:
-        _LOGGER.debug("Returning %d cached parsers (skipped discovery)", len(_PARSER_CACHE))
+        _LOGGER.debug("Returning %d cached parsers (skipped loading)", len(_PARSER_CACHE))
         return _PARSER_CACHE
 
     parsers = []
-    package_dir = os.path.dirname(__file__)
-
-    _LOGGER.debug("Starting parser discovery in %s", package_dir)
-
-    # Iterate through manufacturer subdirectories (e.g., 'arris', 'motorola', 'technicolor')
-    for manufacturer_dir_name in os.listdir(package_dir):
-        manufacturer_dir_path = os.path.join(package_dir, manufacturer_dir_name)
-        if not os.path.isdir(manufacturer_dir_path) or manufacturer_dir_name.startswith("__"):
-            continue
-
-        _LOGGER.debug("Searching in manufacturer directory: %s", manufacturer_dir_name)
-
-        # Recursively find modules within each manufacturer directory
-        for _, module_name, _ in pkgutil.iter_modules([manufacturer_dir_path]):
-            _LOGGER.debug("Found module candidate: %s in %s", module_name, manufacturer_dir_name)
-            if module_name in ("base_parser", "__init__", "parser_template"):
-                _LOGGER.debug("Skipping module: %s", module_name)
-                continue
-
-            try:
-                # Construct the full module path relative to the 'parsers' package
-                full_module_name = f".{manufacturer_dir_name}.{module_name}"
-                _LOGGER.debug("Attempting to import module: %s", full_module_name)
-                module = importlib.import_module(full_module_name, package=__name__)
-                _LOGGER.debug("Successfully imported module: %s", full_module_name)
-
-                found_parser_in_module = False
-                for attr_name in dir(module):
-                    attr = getattr(module, attr_name)
-                    # Only register parsers defined in this module (not imported ones)
-                    if (
-                        isinstance(attr, type)
-                        and issubclass(attr, ModemParser)
-                        and attr is not ModemParser
-                        and attr.__module__ == module.__name__
-                    ):
-                        parsers.append(attr)
-                        _LOGGER.info(
-                            "Registered parser: %s (%s, models: %s)", attr.name, attr.manufacturer, attr.models
-                        )
-                        found_parser_in_module = True
-                if not found_parser_in_module:
-                    _LOGGER.debug("No ModemParser subclass found in module: %s", full_module_name)
-            except Exception as e:
-                _LOGGER.error("Failed to load parser module %s: %s", full_module_name, e, exc_info=True)
-
-    # Sort parsers to match dropdown order (alphabetical by manufacturer, then name)
-    # Generic parsers go last within their manufacturer group
-    # Unknown manufacturer (fallback) goes to the very end
-    def sort_key(parser):
-        # Unknown manufacturer goes last
-        if parser.manufacturer == "Unknown":
-            return ("ZZZZ", "ZZZZ")
-        # Within each manufacturer, Generic parsers go last
-        if "Generic" in parser.name:
-            return (parser.manufacturer, "ZZZZ")
-        # Regular parsers sort by manufacturer then name
-        return (parser.manufacturer, parser.name)
-
-    parsers.sort(key=sort_key)
-
-    _LOGGER.debug("Finished parser discovery. Found %d parsers.", len(parsers))
-    _LOGGER.debug("Parser order (alphabetical): %s", [p.name for p in parsers])
+    for info in _PARSER_INFO:
+        parser_class = load_parser(info)
+        if parser_class is not None:
+            parsers.append(parser_class)
+            _LOGGER.info("Registered parser: %s (%s, models: %s)", info.name, info.manufacturer, info.models)
+
+    _LOGGER.debug("Loaded %d parsers from manifest: %s", len(parsers), [p.name for p in parsers])
 
     # Cache the results
     _PARSER_CACHE = parsers
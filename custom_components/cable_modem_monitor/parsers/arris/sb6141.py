@@ -8,9 +8,10 @@ from bs4 import BeautifulSoup
 
 from custom_components.cable_modem_monitor.core.auth_config import NoAuthConfig
 from custom_components.cable_modem_monitor.core.authentication import AuthStrategyType
+from custom_components.cable_modem_monitor.lib.table_extract import TRANSPOSED, Column, TableSpec, id_text, table_rows
 from custom_components.cable_modem_monitor.lib.utils import extract_float, extract_number
 
-from ..base_parser import ModemParser
+from ..base_parser import ModemParser, ParseContext
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -28,15 +29,50 @@ class ArrisSB6141Parser(ModemParser):
     url_patterns = [
         {"path": "/cmSignalData.htm", "auth_method": "none", "auth_required": False},
     ]
+    fingerprints = {"body": ["SB6141", "Startup Procedure"]}
+    single_page = True
+
+    # Transposed tables: one row per field, one column per channel.
+    # Frequencies are already in Hz.
+    _DOWNSTREAM = TableSpec(
+        name="SB6141 downstream",
+        orientation=TRANSPOSED,
+        columns=(
+            Column("channel_id", "Channel ID", id_text),
+            Column("frequency", "Frequency", extract_number),
+            Column("power", "Power Level", extract_float),
+            Column("snr", "Signal to Noise Ratio", extract_float),
+        ),
+        key="channel_id",
+        # Filled in from the signal stats table
+        defaults={"corrected": None, "uncorrected": None},
+    )
+    _UPSTREAM = TableSpec(
+        name="SB6141 upstream",
+        orientation=TRANSPOSED,
+        columns=(
+            Column("channel_id", "Channel ID", id_text),
+            Column("frequency", "Frequency", extract_number),
+            Column("power", "Power Level", extract_float),
+        ),
+        key="channel_id",
+    )
+    _STATS = TableSpec(
+        name="SB6141 signal stats",
+        orientation=TRANSPOSED,
+        columns=(
+            Column("corrected", "Total Correctable Codewords", extract_number),
+            Column("uncorrected", "Total Uncorrectable Codewords", extract_number),
+        ),
+    )
 
     def login(self, session, base_url, username, password) -> bool:
         """ARRIS modems do not have a login page."""
         return True
 
-    def parse(self, soup: BeautifulSoup, session=None, base_url=None) -> dict:
+    def parse(self, soup: BeautifulSoup, session=None, base_url=None, context: ParseContext | None = None) -> dict:
         """Parse all data from the modem."""
-        downstream_channels = self._parse_downstream(soup)
-        upstream_channels = self._parse_upstream(soup)
+        downstream_channels, upstream_channels = self._parse_tables(soup)
 
         return {
             "downstream": downstream_channels,
@@ -74,208 +110,43 @@ class ArrisSB6141Parser(ModemParser):
 
         return False
 
-    def _parse_downstream(self, soup: BeautifulSoup) -> list[dict]:
-        """Parse downstream channel data from ARRIS SB6141."""
-        downstream_channels = []
+    def _parse_tables(self, soup: BeautifulSoup) -> tuple[list[dict], list[dict]]:
+        """Parse downstream and upstream channels in one pass over the page's tables.
+
+        Tables are recognized by their row labels: the downstream table has an
+        SNR or downstream modulation row, the upstream table a symbol rate or
+        upstream modulation row, and the signal stats table holds the codeword
+        counters of the downstream channels (matched by column).
+        """
+        downstream_channels: list[dict] = []
+        upstream_channels: list[dict] = []
 
         try:
             tables = soup.find_all("table")
             _LOGGER.debug("Parsing ARRIS SB6141 format from %s tables", len(tables))
 
-            # Find tables by looking for "Channel ID" row
             for table in tables:
-                rows = table.find_all("tr")
-                if not rows:
-                    continue
-
-                # Check if this table has channel data
-                row_labels = []
-                for row in rows:
-                    cells = row.find_all("td")
-                    if cells and len(cells) > 0:
-                        label = cells[0].text.strip()
-                        row_labels.append(label)
-
-                # Detect downstream table
-                has_channel_id = "Channel ID" in row_labels
-                has_power_level = any("Power Level" in label for label in row_labels)
-                has_snr = "Signal to Noise Ratio" in row_labels
-                has_downstream_mod = "Downstream Modulation" in row_labels
-
-                if has_channel_id and has_power_level and (has_snr or has_downstream_mod):
-                    # Downstream table
-                    _LOGGER.debug("Found ARRIS downstream table")
-                    downstream_channels = self._parse_transposed_table(
-                        rows, ["Channel ID", "Frequency", "Signal to Noise Ratio", "Power Level"]
-                    )
-                elif "Total Correctable Codewords" in row_labels:
-                    # Signal stats table - merge with downstream channels
+                rows = table_rows(table)
+                labels = {cells[0] for cells in rows if cells}
+                if "Channel ID" in labels and any("Power Level" in label for label in labels):
+                    if labels & {"Signal to Noise Ratio", "Downstream Modulation"}:
+                        _LOGGER.debug("Found ARRIS downstream table")
+                        downstream_channels = self._DOWNSTREAM.extract(rows)
+                    elif labels & {"Symbol Rate", "Upstream Modulation"}:
+                        _LOGGER.debug("Found ARRIS upstream table")
+                        upstream_channels = self._UPSTREAM.extract(rows)
+                elif "Total Correctable Codewords" in labels:
                     _LOGGER.debug("Found ARRIS signal stats table")
-                    self._merge_error_stats(downstream_channels, rows)
+                    for channel, stats in zip(downstream_channels, self._STATS.extract(rows), strict=False):
+                        channel.update(stats)
 
-            _LOGGER.debug("ARRIS parsing found %s downstream channels", len(downstream_channels))
+            _LOGGER.debug(
+                "ARRIS parsing found %s downstream and %s upstream channels",
+                len(downstream_channels),
+                len(upstream_channels),
+            )
 
         except Exception as e:
-            _LOGGER.error("Error parsing ARRIS SB6141 downstream: %s", e)
-
-        return downstream_channels
-
-    def _parse_upstream(self, soup: BeautifulSoup) -> list[dict]:
-        """Parse upstream channel data from ARRIS SB6141."""
-        upstream_channels = []
-
-        try:
-            tables = soup.find_all("table")
-
-            for table in tables:
-                rows = table.find_all("tr")
-                if not rows:
-                    continue
-
-                # Check if this is upstream table
-                row_labels = []
-                for row in rows:
-                    cells = row.find_all("td")
-                    if cells and len(cells) > 0:
-                        label = cells[0].text.strip()
-                        row_labels.append(label)
-
-                # Detect upstream table
-                has_channel_id = "Channel ID" in row_labels
-                has_power_level = any("Power Level" in label for label in row_labels)
-                has_symbol_rate = "Symbol Rate" in row_labels
-                has_upstream_mod = "Upstream Modulation" in row_labels
-
-                if has_channel_id and has_power_level and (has_symbol_rate or has_upstream_mod):
-                    # Upstream table
-                    _LOGGER.debug("Found ARRIS upstream table")
-                    upstream_channels = self._parse_transposed_table(
-                        rows, ["Channel ID", "Frequency", "Power Level"], is_upstream=True
-                    )
-
-            _LOGGER.debug("ARRIS parsing found %s upstream channels", len(upstream_channels))
-
-        except Exception as e:
-            _LOGGER.error("Error parsing ARRIS SB6141 upstream: %s", e)
-
-        return upstream_channels
-
-    def _build_transposed_data_map(self, rows: list) -> tuple[dict, int]:
-        """Build data map from transposed table rows.
-
-        Returns:
-            Tuple of (data_map, channel_count)
-        """
-        data_map = {}
-        channel_count = 0
-
-        for row in rows:
-            cells = row.find_all("td")
-            if not cells or len(cells) < 2:
-                continue
-
-            label = cells[0].text.strip()
-            values = [cell.text.strip() for cell in cells[1:]]  # Skip first cell (label)
-
-            # Normalize label and handle nested tables in Power Level row
-            if "Power Level" in label:
-                label = "Power Level"
-                # ARRIS SB6141 has nested table in Power Level row - skip first value
-                if values and "Downstream Power Level reading" in values[0]:
-                    values = values[1:]  # Skip nested table text
-
-            # Update channel count from longest row
-            if len(values) > channel_count:
-                channel_count = len(values)
-
-            data_map[label] = values
+            _LOGGER.error("Error parsing ARRIS SB6141 channels: %s", e)
 
-        return data_map, channel_count
-
-    def _extract_channel_data_at_index(self, data_map: dict, index: int, is_upstream: bool) -> dict | None:
-        """Extract channel data from data_map at given column index.
-
-        Returns:
-            Channel data dict or None if channel_id is missing
-        """
-        channel_data: dict[str, str | int | float | None] = {}
-
-        # Extract channel ID
-        if "Channel ID" in data_map and index < len(data_map["Channel ID"]):
-            channel_id = extract_number(data_map["Channel ID"][index])
-            if channel_id is None:
-                return None
-            channel_data["channel_id"] = str(channel_id)
-        else:
-            return None
-
-        # Extract frequency (already in Hz for ARRIS)
-        if "Frequency" in data_map and index < len(data_map["Frequency"]):
-            freq_text = data_map["Frequency"][index]
-            freq_hz = extract_number(freq_text)
-            channel_data["frequency"] = freq_hz
-
-        # Extract power level
-        if "Power Level" in data_map and index < len(data_map["Power Level"]):
-            power_text = data_map["Power Level"][index]
-            channel_data["power"] = extract_float(power_text)
-
-        if not is_upstream:
-            # Downstream-specific fields
-            if "Signal to Noise Ratio" in data_map and index < len(data_map["Signal to Noise Ratio"]):
-                snr_text = data_map["Signal to Noise Ratio"][index]
-                channel_data["snr"] = extract_float(snr_text)
-
-            # Initialize error counters (will be filled from stats table)
-            channel_data["corrected"] = None
-            channel_data["uncorrected"] = None
-
-        return channel_data
-
-    def _parse_transposed_table(self, rows: list, required_fields: list, is_upstream: bool = False) -> list[dict]:
-        """Parse ARRIS transposed table where columns are channels."""
-        channels = []
-
-        try:
-            # Build a map of row_label -> [values for each channel]
-            data_map, channel_count = self._build_transposed_data_map(rows)
-
-            _LOGGER.debug(f"Transposed table has {channel_count} channels with labels: {list(data_map.keys())}")
-
-            # Now transpose: create one channel dict per column
-            for i in range(channel_count):
-                channel_data = self._extract_channel_data_at_index(data_map, i, is_upstream)
-
-                if channel_data is not None:
-                    channels.append(channel_data)
-                    _LOGGER.debug("Parsed ARRIS channel %s: %s", channel_data.get("channel_id"), channel_data)
-
-        except Exception as e:
-            _LOGGER.error("Error parsing ARRIS transposed table: %s", e)
-
-        return channels
-
-    def _merge_error_stats(self, downstream_channels: list[dict], stats_rows: list) -> None:
-        """Merge error statistics from signal stats table into downstream channels."""
-        try:
-            # Parse stats table (also transposed)
-            data_map = {}
-            for row in stats_rows:
-                cells = row.find_all("td")
-                if not cells or len(cells) < 2:
-                    continue
-
-                label = cells[0].text.strip()
-                values = [cell.text.strip() for cell in cells[1:]]
-                data_map[label] = values
-
-            # Match channels by index
-            for i, channel in enumerate(downstream_channels):
-                if "Total Correctable Codewords" in data_map and i < len(data_map["Total Correctable Codewords"]):
-                    channel["corrected"] = extract_number(data_map["Total Correctable Codewords"][i])
-
-                if "Total Uncorrectable Codewords" in data_map and i < len(data_map["Total Uncorrectable Codewords"]):
-                    channel["uncorrected"] = extract_number(data_map["Total Uncorrectable Codewords"][i])
-
-        except Exception as e:
-            _LOGGER.error("Error merging ARRIS error stats: %s", e)
+        return downstream_channels, upstream_channels
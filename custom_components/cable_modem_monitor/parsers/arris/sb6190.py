@@ -3,19 +3,37 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterable, Iterator
 from typing import Any
 
 from bs4 import BeautifulSoup
 
 from custom_components.cable_modem_monitor.core.auth_config import NoAuthConfig
 from custom_components.cable_modem_monitor.core.authentication import AuthStrategyType
+from custom_components.cable_modem_monitor.lib.html_stream import StreamTarget
+from custom_components.cable_modem_monitor.lib.table_extract import Column, TableSpec, table_rows
 from custom_components.cable_modem_monitor.lib.utils import extract_float, extract_number
 
-from ..base_parser import ModemParser
+from ..base_parser import ModemParser, ParseContext
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def _mhz_to_hz(text: str) -> int | None:
+    """Convert a "669.00 MHz" cell to Hz."""
+    if "MHz" not in text:
+        return None
+    try:
+        return int(float(text.replace("MHz", "").strip()) * 1_000_000)
+    except ValueError:
+        return None
+
+
+def _channel_id(text: str) -> str | None:
+    """Return the channel ID, or None for an unused channel ("----")."""
+    return text if text and text != "----" else None
+
+
 class ArrisSB6190Parser(ModemParser):
     """Parser for ARRIS SB6190 cable modem."""
 
@@ -29,12 +47,43 @@ class ArrisSB6190Parser(ModemParser):
     url_patterns = [
         {"path": "/cgi-bin/status", "auth_method": "none", "auth_required": False},
     ]
+    fingerprints = {"body": ["SB6190", "Downstream Bonded Channels"]}
+    single_page = True
+    stream_targets = {
+        "downstream": StreamTarget("table", "Downstream Bonded Channels"),
+        "upstream": StreamTarget("table", "Upstream Bonded Channels"),
+    }
+
+    # Both tables start with a title row and a column header row
+    _DOWNSTREAM = TableSpec(
+        name="SB6190 downstream",
+        columns=(
+            Column("channel_id", 3, _channel_id),
+            Column("frequency", 4, _mhz_to_hz),
+            Column("power", 5, extract_float),
+            Column("snr", 6, extract_float),
+            Column("corrected", 7, extract_number),
+            Column("uncorrected", 8, extract_number),
+        ),
+        header_rows=2,
+        key="channel_id",
+    )
+    _UPSTREAM = TableSpec(
+        name="SB6190 upstream",
+        columns=(
+            Column("channel_id", 3, _channel_id),
+            Column("frequency", 5, _mhz_to_hz),
+            Column("power", 6, extract_float),
+        ),
+        header_rows=2,
+        key="channel_id",
+    )
 
     def login(self, session, base_url, username, password) -> bool:
         """ARRIS modems do not have a login page."""
         return True
 
-    def parse(self, soup: BeautifulSoup, session=None, base_url=None) -> dict:
+    def parse(self, soup: BeautifulSoup, session=None, base_url=None, context: ParseContext | None = None) -> dict:
         """Parse all data from the modem."""
         downstream_channels = self._parse_downstream(soup)
         upstream_channels = self._parse_upstream(soup)
@@ -45,6 +94,27 @@ class ArrisSB6190Parser(ModemParser):
             "system_info": {},
         }
 
+    def parse_rows(self, rows: Iterable[tuple[str, list[str]]], context: ParseContext | None = None) -> dict:
+        """Parse channel data from the streamed downstream and upstream tables."""
+        data: dict[str, Any] = {"downstream": [], "upstream": [], "system_info": {}}
+        for direction, channel in self.iter_channels(rows):
+            data[direction].append(channel)
+        return data
+
+    def iter_channels(self, rows: Iterable[tuple[str, list[str]]]) -> Iterator[tuple[str, dict]]:
+        """Yield ("downstream" | "upstream", channel) as each streamed table row arrives."""
+        specs = {"downstream": self._DOWNSTREAM, "upstream": self._UPSTREAM}
+        seen: dict[str, int] = {}
+        for direction, cells in rows:
+            index = seen.get(direction, 0)
+            seen[direction] = index + 1
+            spec = specs[direction]
+            if index < spec.header_rows:
+                continue
+            channel = spec.record(cells)
+            if channel is not None:
+                yield direction, channel
+
     @classmethod
     def can_parse(cls, soup: BeautifulSoup, url: str, html: str) -> bool:
         """Detect if this is an ARRIS SB6190 modem."""
@@ -56,7 +126,7 @@ class ArrisSB6190Parser(ModemParser):
         tables = soup.find_all("table")
         for table in tables:
             if table.find(string="Downstream Bonded Channels"):
-                return self._parse_downstream_table(table)
+                return self._DOWNSTREAM.extract(table_rows(table))
         return []
 
     def _parse_upstream(self, soup: BeautifulSoup) -> list[dict]:
@@ -64,148 +134,5 @@ class ArrisSB6190Parser(ModemParser):
         tables = soup.find_all("table")
         for table in tables:
             if table.find(string="Upstream Bonded Channels"):
-                return self._parse_upstream_table(table)
+                return self._UPSTREAM.extract(table_rows(table))
         return []
-
-    def _parse_transposed_table(self, rows: list, required_fields: list, is_upstream: bool = False) -> list[dict]:
-        """Parse ARRIS transposed table where columns are channels."""
-        try:
-            data_map, channel_count = self._build_data_map(rows)
-            return [
-                self._build_channel_data(i, data_map, is_upstream)
-                for i in range(channel_count)
-                if self._build_channel_data(i, data_map, is_upstream) is not None
-            ]
-        except Exception as e:
-            _LOGGER.error("Error parsing ARRIS SB6190 transposed table: %s", e)
-            return []
-
-    def _build_data_map(self, rows):
-        data_map = {}
-        channel_count = 0
-        for row in rows:
-            cells = row.find_all("td")
-            if not cells or len(cells) < 2:
-                continue
-            label = cells[0].text.strip()
-            values = [cell.text.strip() for cell in cells[1:]]
-            if "Power Level" in label:
-                label = "Power Level"
-                if values and "Downstream Power Level reading" in values[0]:
-                    values = values[1:]
-            if len(values) > channel_count:
-                channel_count = len(values)
-            data_map[label] = values
-        _LOGGER.debug(f"Transposed table has {channel_count} channels with labels: {list(data_map.keys())}")
-        return data_map, channel_count
-
-    def _build_channel_data(self, i, data_map, is_upstream):
-        channel_data: dict[str, Any] = {}
-        if "Channel ID" in data_map and i < len(data_map["Channel ID"]):
-            channel_id = extract_number(data_map["Channel ID"][i])
-            if channel_id is None:
-                return None
-            channel_data["channel_id"] = str(channel_id)
-        else:
-            return None
-        if "Frequency" in data_map and i < len(data_map["Frequency"]):
-            freq_text = data_map["Frequency"][i]
-            freq_hz = extract_number(freq_text)
-            channel_data["frequency"] = freq_hz
-        if "Power Level" in data_map and i < len(data_map["Power Level"]):
-            power_text = data_map["Power Level"][i]
-            channel_data["power"] = extract_float(power_text)
-        if not is_upstream:
-            if "Signal to Noise Ratio" in data_map and i < len(data_map["Signal to Noise Ratio"]):
-                snr_text = data_map["Signal to Noise Ratio"][i]
-                channel_data["snr"] = extract_float(snr_text)
-            channel_data["corrected"] = None
-            channel_data["uncorrected"] = None
-        _LOGGER.debug("Parsed ARRIS SB6190 channel %s: %s", channel_data.get("channel_id"), channel_data)
-        return channel_data
-
-    def _merge_error_stats(self, downstream_channels: list[dict], stats_rows: list) -> None:
-        """Merge error statistics from signal stats table into downstream channels."""
-        try:
-            # Parse stats table (also transposed)
-            data_map = {}
-            for row in stats_rows:
-                cells = row.find_all("td")
-                if not cells or len(cells) < 2:
-                    continue
-
-                label = cells[0].text.strip()
-                values = [cell.text.strip() for cell in cells[1:]]
-                data_map[label] = values
-
-            # Match channels by index
-            for i, channel in enumerate(downstream_channels):
-                if "Total Correctable Codewords" in data_map and i < len(data_map["Total Correctable Codewords"]):
-                    channel["corrected"] = extract_number(data_map["Total Correctable Codewords"][i])
-
-                if "Total Uncorrectable Codewords" in data_map and i < len(data_map["Total Uncorrectable Codewords"]):
-                    channel["uncorrected"] = extract_number(data_map["Total Uncorrectable Codewords"][i])
-
-        except Exception as e:
-            _LOGGER.error("Error merging ARRIS SB6190 error stats: %s", e)
-
-    def _parse_downstream_table(self, table) -> list[dict]:
-        """Parse non-transposed downstream table."""
-        channels: list[dict[str, Any]] = []
-        rows = table.find_all("tr")
-        if not rows or len(rows) < 2:
-            return channels
-
-        for row in rows[2:]:
-            cells = row.find_all("td")
-            if len(cells) < 9:
-                continue
-            freq_text = cells[4].text.strip()
-            freq_hz = None
-            if "MHz" in freq_text:
-                try:
-                    freq_hz = int(float(freq_text.replace("MHz", "").strip()) * 1_000_000)
-                except Exception:
-                    freq_hz = None
-            channel = {
-                "channel_id": cells[3].text.strip(),
-                "frequency": freq_hz,
-                "power": extract_float(cells[5].text),
-                "snr": extract_float(cells[6].text),
-                "corrected": extract_number(cells[7].text),
-                "uncorrected": extract_number(cells[8].text),
-            }
-            if not channel["channel_id"] or channel["channel_id"] == "----":
-                continue
-            channels.append(channel)
-        return channels
-
-    def _parse_upstream_table(self, table) -> list[dict]:
-        """Parse non-transposed upstream table."""
-        channels: list[dict[str, Any]] = []
-        rows = table.find_all("tr")
-        if not rows or len(rows) < 2:
-            return channels
-
-        for row in rows[2:]:
-            cells = row.find_all("td")
-            if len(cells) < 7:
-                continue
-            # Frequency is in MHz, convert to Hz
-            freq_text = cells[5].text.strip()
-            freq_hz = None
-            if "MHz" in freq_text:
-                try:
-                    freq_hz = int(float(freq_text.replace("MHz", "").strip()) * 1_000_000)
-                except Exception:
-                    freq_hz = None
-            channel = {
-                "channel_id": cells[3].text.strip(),
-                "frequency": freq_hz,
-                "power": extract_float(cells[6].text),
-                # Add more fields as needed
-            }
-            if not channel["channel_id"] or channel["channel_id"] == "----":
-                continue
-            channels.append(channel)
-        return channels
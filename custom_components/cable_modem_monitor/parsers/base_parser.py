@@ -3,12 +3,42 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
-from bs4 import BeautifulSoup
-
 if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
+
     from custom_components.cable_modem_monitor.core.auth_config import AuthConfig
+    from custom_components.cable_modem_monitor.lib.html_stream import StreamTarget
+
+# Parts of a parse result that can be requested separately (see ParseContext.requested_sections)
+SECTION_DOWNSTREAM = "downstream"
+SECTION_UPSTREAM = "upstream"
+SECTION_SYSTEM_INFO = "system_info"
+
+
+@dataclass(frozen=True)
+class ParseContext:
+    """Inputs of a single parse that change from poll to poll (built by the scraper)."""
+
+    # Prefetched bodies of secondary_pages (and static_pages), keyed by path. A page
+    # can be missing, in which case parse() fetches it itself.
+    pages: Mapping[str, str] = field(default_factory=dict)
+
+    # Whether this parse should read static_info_keys. When False, parse() may skip
+    # the pages or requests that only serve them.
+    refresh_static_info: bool = True
+
+    # Sections (SECTION_* above) the integration needs from this parse, or None for
+    # everything. Parsers that fetch sections with separate requests may leave out
+    # the others; the rest can ignore this.
+    requested_sections: frozenset[str] | None = None
+
+    def wants(self, section: str) -> bool:
+        """Check whether a section was requested."""
+        return self.requested_sections is None or section in self.requested_sections
 
 
 class ModemParser(ABC):
@@ -30,6 +60,13 @@ class ModemParser(ABC):
     # The scraper will try URLs in the order specified
     url_patterns: list[dict[str, str | bool]] = []
 
+    # Detection fingerprints: literal strings (matched case-insensitively) whose
+    # presence suggests this parser, keyed by where they are looked for:
+    # "title" (<title> element), "meta" (a <meta> tag), "url" (the page URL) or
+    # "body" (anywhere in the HTML). They only rank candidates before can_parse
+    # runs, so they need not be exhaustive, e.g. {"title": ["Motorola Cable Modem"]}
+    fingerprints: dict[str, list[str]] = {}
+
     # Legacy field for backward compatibility (deprecated - use url_patterns)
     auth_type: str = "form"
 
@@ -37,6 +74,40 @@ class ModemParser(ABC):
     # Parsers should define this as a class attribute
     auth_config: AuthConfig | None = None
 
+    # Password encoding ("plain" or "base64") that last logged in successfully.
+    # Only used by parsers whose login falls back between encodings; the scraper
+    # seeds it from the config entry and reads it back after login.
+    password_encoding: str | None = None
+
+    # BeautifulSoup tree builder for pages the parser fetches itself.
+    # None means the fastest installed backend; the scraper sets it to its own choice.
+    html_backend: str | None = None
+
+    # True if parse() reads nothing but the page it is given (no extra requests).
+    # The scraper then reuses the previous result when that page is unchanged.
+    single_page: bool = False
+
+    # Elements of the data page this parser needs, for streaming polls (see parse_rows).
+    # When set, a poll of an already detected modem reads the page incrementally
+    # and stops once these are captured, instead of downloading and parsing it whole.
+    # Not used for parsers that also declare secondary_pages or static_pages.
+    stream_targets: dict[str, StreamTarget] = {}
+
+    # Paths of further pages parse() reads, e.g. ("/DocsisStatus.htm",). Once the
+    # modem is detected, the scraper fetches them concurrently with the data page
+    # and hands their bodies to parse() in ``context.pages``.
+    secondary_pages: tuple[str, ...] = ()
+
+    # system_info keys that rarely change (versions, startup results). The scraper
+    # keeps their last values for static_info_ttl seconds, or until system_uptime
+    # goes down (a reboot), and fills them into polls that skip reading them.
+    static_info_keys: frozenset[str] = frozenset()
+    static_info_ttl: float = 24 * 60 * 60
+
+    # Pages read only for static_info_keys. They are prefetched like secondary_pages,
+    # but only on polls that refresh static info.
+    static_pages: tuple[str, ...] = ()
+
     @classmethod
     @abstractmethod
     def can_parse(cls, soup: BeautifulSoup, url: str, html: str) -> bool:
@@ -68,8 +139,28 @@ class ModemParser(ABC):
         """
         raise NotImplementedError
 
+    def login_with_auth_config(self, session, base_url, username, password) -> tuple[bool, str | None]:
+        """
+        Log in with the strategy declared in ``auth_config``.
+
+        The strategy tries ``password_encoding`` first, and the encoding it
+        succeeded with is stored back for the scraper to remember.
+
+        Returns:
+            tuple[bool, str | None]: (success, html) as returned by the strategy
+        """
+        from custom_components.cable_modem_monitor.core.authentication import AuthFactory
+
+        if self.auth_config is None:
+            raise RuntimeError(f"{self.name} declares no auth_config")
+        auth_strategy = AuthFactory.get_strategy(self.auth_config.strategy, password_encoding=self.password_encoding)
+        result = auth_strategy.login(session, base_url, username, password, self.auth_config)
+        if auth_strategy.successful_encoding:
+            self.password_encoding = auth_strategy.successful_encoding
+        return result
+
     @abstractmethod
-    def parse(self, soup: BeautifulSoup, session=None, base_url=None) -> dict:
+    def parse(self, soup: BeautifulSoup, session=None, base_url=None, context: ParseContext | None = None) -> dict:
         """
         Parse all data from the modem.
 
@@ -77,6 +168,8 @@ class ModemParser(ABC):
             soup: BeautifulSoup object of the main page
             session: Optional requests.Session for fetching additional pages
             base_url: Optional base URL of the modem (e.g., "http://192.168.100.1")
+            context: Optional per-poll inputs (prefetched pages, static info and
+                     section requests); None means no pages and everything wanted
 
         Returns:
             Dict with all parsed data:
@@ -87,3 +180,20 @@ class ModemParser(ABC):
             }
         """
         raise NotImplementedError
+
+    def parse_rows(self, rows: Iterable[tuple[str, list[str]]], context: ParseContext | None = None) -> dict:
+        """
+        Parse data from the streamed rows of ``stream_targets``.
+
+        Only called for parsers that declare ``stream_targets``. Consume the
+        iterable completely; it ends once every target has been read.
+
+        Args:
+            rows: (target name, cell texts) for each table row, or
+                  (target name, [script source]) for script targets, in page order
+            context: Optional per-poll inputs, as for parse()
+
+        Returns:
+            Dict in the same format as parse()
+        """
+        raise NotImplementedError
@@ -0,0 +1,186 @@
+"""Parser manifest.
+
+Generated by scripts/maintenance/generate_parser_manifest.py - do not edit by hand.
+Regenerate it whenever a parser is added, renamed or changes its metadata.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+PARSER_MANIFEST: list[dict[str, Any]] = [
+    {
+        "name": "ARRIS SB6141",
+        "manufacturer": "ARRIS",
+        "models": ["SB6141"],
+        "priority": 50,
+        "module": "arris.sb6141",
+        "class_name": "ArrisSB6141Parser",
+        "auth_strategy": "no_auth",
+        "supports_restart": False,
+        "url_patterns": [{"path": "/cmSignalData.htm", "auth_method": "none", "auth_required": False}],
+        "fingerprints": {"body": ["SB6141", "Startup Procedure"]},
+    },
+    {
+        "name": "ARRIS SB6190",
+        "manufacturer": "ARRIS",
+        "models": ["SB6190"],
+        "priority": 50,
+        "module": "arris.sb6190",
+        "class_name": "ArrisSB6190Parser",
+        "auth_strategy": "no_auth",
+        "supports_restart": False,
+        "url_patterns": [{"path": "/cgi-bin/status", "auth_method": "none", "auth_required": False}],
+        "fingerprints": {"body": ["SB6190", "Downstream Bonded Channels"]},
+    },
+    {
+        "name": "Motorola MB7621",
+        "manufacturer": "Motorola",
+        "models": ["MB7621"],
+        "priority": 100,
+        "module": "motorola.mb7621",
+        "class_name": "MotorolaMB7621Parser",
+        "auth_strategy": "form_plain_and_base64",
+        "supports_restart": True,
+        "url_patterns": [
+            {"path": "/MotoSwInfo.asp", "auth_method": "form"},
+            {"path": "/MotoConnection.asp", "auth_method": "form"},
+            {"path": "/MotoHome.asp", "auth_method": "form"},
+        ],
+        "fingerprints": {"body": ["MB7621", "MB 7621"]},
+    },
+    {
+        "name": "Motorola MB8611 (HNAP)",
+        "manufacturer": "Motorola",
+        "models": ["MB8611", "MB8612"],
+        "priority": 101,
+        "module": "motorola.mb8611_hnap",
+        "class_name": "MotorolaMB8611HnapParser",
+        "auth_strategy": "hnap_session",
+        "supports_restart": False,
+        "url_patterns": [
+            {"path": "/HNAP1/", "auth_method": "hnap", "auth_required": True},
+            {"path": "/MotoStatusConnection.html", "auth_method": "hnap", "auth_required": True},
+        ],
+        "fingerprints": {"body": ["MB8611", "MB 8611", "HNAP"]},
+    },
+    {
+        "name": "Motorola MB8611 (Static)",
+        "manufacturer": "Motorola",
+        "models": ["MB8611", "MB8612"],
+        "priority": 100,
+        "module": "motorola.mb8611_static",
+        "class_name": "MotorolaMB8611StaticParser",
+        "auth_strategy": None,
+        "supports_restart": False,
+        "url_patterns": [
+            {"path": "/MotoStatusConnection.html", "auth_method": "none", "auth_required": False},
+            {"path": "/MotoConnection.asp", "auth_method": "form", "auth_required": True},
+        ],
+        "fingerprints": {"body": ["MB8611", "MB 8611", "HNAP"]},
+    },
+    {
+        "name": "Motorola MB Series (Generic)",
+        "manufacturer": "Motorola",
+        "models": ["MB7420", "MB8600", "MB8611"],
+        "priority": 50,
+        "module": "motorola.generic",
+        "class_name": "MotorolaGenericParser",
+        "auth_strategy": "form_plain_and_base64",
+        "supports_restart": True,
+        "url_patterns": [
+            {"path": "/MotoConnection.asp", "auth_method": "form", "auth_required": True},
+            {"path": "/MotoHome.asp", "auth_method": "form", "auth_required": True},
+        ],
+        "fingerprints": {"title": ["Motorola Cable Modem"]},
+    },
+    {
+        "name": "Netgear C3700",
+        "manufacturer": "Netgear",
+        "models": ["C3700", "C3700-100NAS"],
+        "priority": 50,
+        "module": "netgear.c3700",
+        "class_name": "NetgearC3700Parser",
+        "auth_strategy": "basic_http",
+        "supports_restart": False,
+        "url_patterns": [
+            {"path": "/", "auth_method": "basic", "auth_required": False},
+            {"path": "/index.htm", "auth_method": "basic", "auth_required": False},
+            {"path": "/DocsisStatus.htm", "auth_method": "basic", "auth_required": True},
+            {"path": "/DashBoard.htm", "auth_method": "basic", "auth_required": True},
+            {"path": "/RouterStatus.htm", "auth_method": "basic", "auth_required": True},
+        ],
+        "fingerprints": {"title": ["NETGEAR Gateway C3700"], "meta": ["C3700"], "body": ["C3700"]},
+    },
+    {
+        "name": "Netgear CM600",
+        "manufacturer": "Netgear",
+        "models": ["CM600"],
+        "priority": 50,
+        "module": "netgear.cm600",
+        "class_name": "NetgearCM600Parser",
+        "auth_strategy": "basic_http",
+        "supports_restart": False,
+        "url_patterns": [
+            {"path": "/", "auth_method": "basic", "auth_required": False},
+            {"path": "/index.html", "auth_method": "basic", "auth_required": False},
+            {"path": "/DocsisStatus.asp", "auth_method": "basic", "auth_required": True},
+            {"path": "/DashBoard.asp", "auth_method": "basic", "auth_required": True},
+            {"path": "/RouterStatus.asp", "auth_method": "basic", "auth_required": True},
+        ],
+        "fingerprints": {"title": ["NETGEAR Gateway CM600"], "meta": ["CM600"], "body": ["CM600"]},
+    },
+    {
+        "name": "Technicolor TC4400",
+        "manufacturer": "Technicolor",
+        "models": ["TC4400"],
+        "priority": 50,
+        "module": "technicolor.tc4400",
+        "class_name": "TechnicolorTC4400Parser",
+        "auth_strategy": "basic_http",
+        "supports_restart": False,
+        "url_patterns": [{"path": "/cmconnectionstatus.html", "auth_method": "basic", "auth_required": True}],
+        "fingerprints": {
+            "url": ["cmconnectionstatus.html", "cmswinfo.html"],
+            "body": ["Board ID:", "Build Timestamp:"],
+        },
+    },
+    {
+        "name": "Technicolor XB7",
+        "manufacturer": "Technicolor",
+        "models": ["XB7", "CGM4331COM"],
+        "priority": 50,
+        "module": "technicolor.xb7",
+        "class_name": "TechnicolorXB7Parser",
+        "auth_strategy": "redirect_form",
+        "supports_restart": False,
+        "url_patterns": [{"path": "/network_setup.jst", "auth_method": "form", "auth_required": True}],
+        "fingerprints": {"url": ["network_setup.jst"], "body": ["Channel Bonding Value"]},
+    },
+    {
+        "name": "Unknown Modem (Fallback Mode)",
+        "manufacturer": "Unknown",
+        "models": ["Unknown"],
+        "priority": 1,
+        "module": "universal.fallback",
+        "class_name": "UniversalFallbackParser",
+        "auth_strategy": "basic_http",
+        "supports_restart": False,
+        "url_patterns": [
+            {"path": "/", "auth_method": "basic", "auth_required": False},
+            {"path": "/index", "auth_method": "basic", "auth_required": False},
+            {"path": "/index.html", "auth_method": "basic", "auth_required": False},
+            {"path": "/index.htm", "auth_method": "basic", "auth_required": False},
+            {"path": "/index.asp", "auth_method": "basic", "auth_required": False},
+            {"path": "/status", "auth_method": "basic", "auth_required": False},
+            {"path": "/status.html", "auth_method": "basic", "auth_required": False},
+            {"path": "/status.htm", "auth_method": "basic", "auth_required": False},
+            {"path": "/status.asp", "auth_method": "basic", "auth_required": False},
+            {"path": "/connection", "auth_method": "basic", "auth_required": False},
+            {"path": "/connection.html", "auth_method": "basic", "auth_required": False},
+            {"path": "/connection.htm", "auth_method": "basic", "auth_required": False},
+            {"path": "/connection.asp", "auth_method": "basic", "auth_required": False},
+        ],
+        "fingerprints": {},
+    },
+]
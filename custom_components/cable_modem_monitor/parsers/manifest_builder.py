@@ -0,0 +1,123 @@
+"""Build the parser manifest from the parser modules on disk.
+
+This is the only place that scans the parsers package. It runs at development
+time through ``scripts/maintenance/generate_parser_manifest.py``; at runtime the
+integration reads the generated ``manifest.py`` instead.
+"""
+
+from __future__ import annotations
+
+import importlib
+import json
+import os
+import pkgutil
+from typing import Any
+
+from .base_parser import ModemParser
+
+MANIFEST_FILE = os.path.join(os.path.dirname(__file__), "manifest.py")
+
+_SKIPPED_MODULES = ("base_parser", "__init__", "parser_template", "manifest", "manifest_builder")
+
+_HEADER = '''"""Parser manifest.
+
+Generated by scripts/maintenance/generate_parser_manifest.py - do not edit by hand.
+Regenerate it whenever a parser is added, renamed or changes its metadata.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+'''
+
+
+def discover_parser_classes() -> list[type[ModemParser]]:
+    """Import every parser module and return the parser classes, in dropdown order."""
+    package_dir = os.path.dirname(__file__)
+    package = __name__.rsplit(".", 1)[0]
+    parsers: list[type[ModemParser]] = []
+
+    for manufacturer_dir_name in sorted(os.listdir(package_dir)):
+        manufacturer_dir_path = os.path.join(package_dir, manufacturer_dir_name)
+        if not os.path.isdir(manufacturer_dir_path) or manufacturer_dir_name.startswith("__"):
+            continue
+
+        for _, module_name, _ in pkgutil.iter_modules([manufacturer_dir_path]):
+            if module_name in _SKIPPED_MODULES:
+                continue
+            module = importlib.import_module(f".{manufacturer_dir_name}.{module_name}", package=package)
+            for attr_name in dir(module):
+                attr = getattr(module, attr_name)
+                # Only register parsers defined in this module (not imported ones)
+                if (
+                    isinstance(attr, type)
+                    and issubclass(attr, ModemParser)
+                    and attr is not ModemParser
+                    and attr.__module__ == module.__name__
+                ):
+                    parsers.append(attr)
+
+    parsers.sort(key=sort_key)
+    return parsers
+
+
+def sort_key(parser: Any) -> tuple[str, str]:
+    """Sort alphabetically by manufacturer then name, Generic parsers last, Unknown at the very end."""
+    # Unknown manufacturer goes last
+    if parser.manufacturer == "Unknown":
+        return ("ZZZZ", "ZZZZ")
+    # Within each manufacturer, Generic parsers go last
+    if "Generic" in parser.name:
+        return (parser.manufacturer, "ZZZZ")
+    # Regular parsers sort by manufacturer then name
+    return (parser.manufacturer, parser.name)
+
+
+def manifest_entry(parser_class: type[ModemParser]) -> dict[str, Any]:
+    """Return the manifest record of a parser class."""
+    auth_config = parser_class.auth_config
+    package = __name__.rsplit(".", 1)[0]
+    return {
+        "name": parser_class.name,
+        "manufacturer": parser_class.manufacturer,
+        "models": list(parser_class.models),
+        "priority": parser_class.priority,
+        "module": parser_class.__module__.removeprefix(f"{package}."),
+        "class_name": parser_class.__name__,
+        "auth_strategy": auth_config.strategy.value if auth_config is not None else None,
+        "supports_restart": callable(getattr(parser_class, "restart", None)),
+        "url_patterns": [dict(pattern) for pattern in parser_class.url_patterns],
+        "fingerprints": {kind: list(literals) for kind, literals in parser_class.fingerprints.items()},
+    }
+
+
+def build_manifest() -> list[dict[str, Any]]:
+    """Return the manifest records of all parsers, in dropdown order."""
+    return [manifest_entry(parser_class) for parser_class in discover_parser_classes()]
+
+
+def _render(value: Any, indent: int) -> str:
+    """Render a literal in black's style, keeping short collections on one line."""
+    if isinstance(value, str):
+        return json.dumps(value)
+    if not isinstance(value, dict | list):
+        return repr(value)
+
+    if isinstance(value, dict):
+        items = [f"{json.dumps(key)}: {_render(item, indent + 4)}" for key, item in value.items()]
+        opening, closing = "{", "}"
+    else:
+        items = [_render(item, indent + 4) for item in value]
+        opening, closing = "[", "]"
+
+    inline = f"{opening}{', '.join(items)}{closing}"
+    if "\n" not in inline and indent + len(inline) <= 100:
+        return inline
+    inner = " " * (indent + 4)
+    return f"{opening}\n" + "".join(f"{inner}{item},\n" for item in items) + " " * indent + closing
+
+
+def render_manifest(entries: list[dict[str, Any]]) -> str:
+    """Render manifest records as the source of manifest.py."""
+    return f"{_HEADER}PARSER_MANIFEST: list[dict[str, Any]] = {_render(entries, 0)}\n"
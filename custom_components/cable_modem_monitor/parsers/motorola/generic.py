@@ -2,16 +2,17 @@
 
 from __future__ import annotations
 
-import base64
 import logging
 
 from bs4 import BeautifulSoup
 
 from custom_components.cable_modem_monitor.core.auth_config import FormAuthConfig
-from custom_components.cable_modem_monitor.core.authentication import AuthStrategyType
+from custom_components.cable_modem_monitor.core.authentication import AuthStrategyType, get_password_candidates
+from custom_components.cable_modem_monitor.lib.table_extract import Column, TableSpec, id_text, table_rows
 from custom_components.cable_modem_monitor.lib.utils import extract_float, extract_number
 
-from ..base_parser import ModemParser
+from ...lib.html_backend import make_soup
+from ..base_parser import ModemParser, ParseContext
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -20,6 +21,12 @@ _LOGGER = logging.getLogger(__name__)
 RESTART_WINDOW_SECONDS = 300
 
 
+def _mhz_to_hz(text: str) -> float | None:
+    """Convert a frequency cell in MHz to Hz."""
+    freq_mhz = extract_float(text)
+    return freq_mhz * 1_000_000 if freq_mhz is not None else None
+
+
 class MotorolaGenericParser(ModemParser):
     """Parser for Motorola MB series cable modems (MB7420, MB8600, etc.)."""
 
@@ -42,6 +49,41 @@ class MotorolaGenericParser(ModemParser):
         {"path": "/MotoConnection.asp", "auth_method": "form", "auth_required": True},
         {"path": "/MotoHome.asp", "auth_method": "form", "auth_required": True},
     ]
+    fingerprints = {"title": ["Motorola Cable Modem"]}
+
+    # The software version only changes with a firmware update (which reboots the modem)
+    static_info_keys = frozenset({"software_version"})
+    # Some firmware keeps the version off the connection page and only shows it on MotoHome.asp.
+    # parse() ignores the page when the connection page already carries the version.
+    static_pages = ("/MotoHome.asp",)
+
+    # Channel tables (class "moto-table-content") start with one header row
+    _DOWNSTREAM = TableSpec(
+        name="Motorola downstream",
+        columns=(
+            Column("channel_id", 0, id_text),
+            Column("modulation", 2),
+            Column("frequency", 4, _mhz_to_hz),
+            Column("power", 5, extract_float),
+            Column("snr", 6, extract_float),
+            Column("corrected", 7, extract_number),
+            Column("uncorrected", 8, extract_number),
+        ),
+        header_rows=1,
+        key="channel_id",
+    )
+    _UPSTREAM = TableSpec(
+        name="Motorola upstream",
+        columns=(
+            Column("channel_id", 0, id_text),
+            Column("lock_status", 1),
+            Column("modulation", 2),
+            Column("frequency", 5, _mhz_to_hz),
+            Column("power", 6, extract_float),
+        ),
+        header_rows=1,
+        key="channel_id",
+    )
 
     @classmethod
     def can_parse(cls, soup: BeautifulSoup, url: str, html: str) -> bool:
@@ -67,20 +109,15 @@ class MotorolaGenericParser(ModemParser):
 
         login_url = f"{base_url}/goform/login"
 
-        # Try plain password first, then Base64-encoded (MB7621 requires Base64)
+        # Try plain password first, then Base64-encoded (MB7621 requires Base64).
+        # The encoding that worked last time is tried first.
         # SECURITY WARNING: Base64 is NOT encryption! It's just encoding.
         # The password is still transmitted in an easily reversible format.
-        passwords_to_try = [
-            password,  # Plain password
-            base64.b64encode(password.encode("utf-8")).decode("utf-8"),  # Base64-encoded (not secure)
-        ]
-
-        for attempt, pwd in enumerate(passwords_to_try, 1):
+        for pwd_type, pwd in get_password_candidates(password, self.password_encoding):
             login_data = {
                 "loginUsername": username,
                 "loginPassword": pwd,
             }
-            pwd_type = "plain" if attempt == 1 else "Base64-encoded"
             # Security: Do not log usernames or any credential information
             _LOGGER.info("Attempting login to %s (password encoding: %s)", login_url, pwd_type)
 
@@ -145,28 +182,33 @@ class MotorolaGenericParser(ModemParser):
             # Check for successful authentication - look for actual content, not login page
             if test_response.status_code == 200 and len(test_response.text) > 10000:
                 _LOGGER.info("Login successful using %s password (got %s bytes)", pwd_type, len(test_response.text))
+                self.password_encoding = pwd_type
                 return True, test_response.text
 
         _LOGGER.error("Login failed with both plain and Base64-encoded passwords")
         return False, None
 
-    def parse(self, soup: BeautifulSoup, session=None, base_url=None) -> dict:
+    def parse(self, soup: BeautifulSoup, session=None, base_url=None, context: ParseContext | None = None) -> dict:
         """Parse all data from the modem."""
         # Parse system info first to get uptime
         system_info = self._parse_system_info(soup)
 
-        # If software version not found and we have session/base_url, fetch MotoHome.asp
-        if not system_info.get("software_version") and session and base_url:
-            try:
-                _LOGGER.debug("Software version not found on connection page, fetching MotoHome.asp")
-                home_response = session.get(f"{base_url}/MotoHome.asp", timeout=10)
-                if home_response.status_code == 200:
-                    home_soup = BeautifulSoup(home_response.text, "html.parser")
-                    home_info = self._parse_system_info(home_soup)
-                    system_info.update(home_info)
-                    _LOGGER.debug("Fetched system info from MotoHome.asp: %s", home_info)
-            except Exception as e:
-                _LOGGER.error("Failed to fetch system info from MotoHome.asp: %s", e)
+        # If software version not found, read it from MotoHome.asp (unless the scraper still has it)
+        context = context or ParseContext()
+        if not system_info.get("software_version") and context.refresh_static_info:
+            home_html = context.pages.get("/MotoHome.asp")
+            if home_html is None and session and base_url:
+                try:
+                    _LOGGER.debug("Software version not found on connection page, fetching MotoHome.asp")
+                    home_response = session.get(f"{base_url}/MotoHome.asp", timeout=10)
+                    if home_response.status_code == 200:
+                        home_html = home_response.text
+                except Exception as e:
+                    _LOGGER.error("Failed to fetch system info from MotoHome.asp: %s", e)
+            if home_html is not None:
+                home_info = self._parse_system_info(make_soup(home_html, self.html_backend))
+                system_info.update(home_info)
+                _LOGGER.debug("Fetched system info from MotoHome.asp: %s", home_info)
 
         downstream_channels = self._parse_downstream(soup, system_info)
         upstream_channels = self._parse_upstream(soup, system_info)
@@ -193,45 +235,6 @@ class MotorolaGenericParser(ModemParser):
                 snr = None
         return power, snr
 
-    def _parse_downstream_row(self, cols: list, is_restarting: bool) -> dict | None:
-        """Parse a single downstream channel row.
-
-        Returns:
-            Channel data dict or None if parsing fails
-        """
-        if len(cols) < 9:
-            return None
-
-        try:
-            channel_id = extract_number(cols[0].text)
-            if channel_id is None:
-                _LOGGER.debug("Skipping row - could not extract channel_id from: %s", cols[0].text)
-                return None
-
-            freq_mhz = extract_float(cols[4].text)
-            freq_hz = freq_mhz * 1_000_000 if freq_mhz is not None else None
-
-            power = extract_float(cols[5].text)
-            snr = extract_float(cols[6].text)
-            _LOGGER.debug("Ch %s: Raw Power=%s, Raw SNR=%s", channel_id, power, snr)
-
-            power, snr = self._filter_restart_values(power, snr, is_restarting)
-
-            channel_data = {
-                "channel_id": str(channel_id),
-                "frequency": freq_hz,
-                "power": power,
-                "snr": snr,
-                "corrected": extract_number(cols[7].text),
-                "uncorrected": extract_number(cols[8].text),
-                "modulation": cols[2].text.strip(),
-            }
-            _LOGGER.debug("Parsed downstream channel: %s", channel_data)
-            return channel_data
-        except Exception as e:
-            _LOGGER.error("Error parsing downstream channel row: %s", e)
-            return None
-
     def _parse_downstream(self, soup: BeautifulSoup, system_info: dict) -> list[dict]:
         """Parse downstream channel data from Motorola MB modem."""
         from custom_components.cable_modem_monitor.lib.utils import parse_uptime_to_seconds
@@ -255,14 +258,12 @@ class MotorolaGenericParser(ModemParser):
                 _LOGGER.debug("Table headers found: %s", headers)
 
                 if self._is_downstream_table(headers):
-                    rows = table.find_all("tr")[1:]
-                    _LOGGER.debug("Found downstream table with %s rows", len(rows))
-
-                    for row in rows:
-                        cols = row.find_all("td")
-                        channel_data = self._parse_downstream_row(cols, is_restarting)
-                        if channel_data:
-                            channels.append(channel_data)
+                    _LOGGER.debug("Found downstream table")
+                    for channel in self._DOWNSTREAM.extract(table_rows(table)):
+                        channel["power"], channel["snr"] = self._filter_restart_values(
+                            channel["power"], channel["snr"], is_restarting
+                        )
+                        channels.append(channel)
                     break
         except Exception as e:
             _LOGGER.error("Error parsing downstream channels: %s", e)
@@ -287,45 +288,18 @@ class MotorolaGenericParser(ModemParser):
                     for th in table.find_all(["th", "td"], class_=["moto-param-header-s", "moto-param-header"])
                 ]
                 if any("Symb. Rate" in h for h in headers):
-                    rows = table.find_all("tr")[1:]
-                    _LOGGER.debug("Found upstream table with %s rows", len(rows))
-                    for row in rows:
-                        cols = row.find_all("td")
-                        if len(cols) >= 7:
-                            try:
-                                channel_id = extract_number(cols[0].text)
-                                if channel_id is None:
-                                    _LOGGER.debug("Skipping row - could not extract channel_id from: %s", cols[0].text)
-                                    continue
-
-                                lock_status = cols[1].text.strip()
-                                if "not locked" in lock_status.lower():
-                                    _LOGGER.debug(
-                                        "Skipping channel %s - not locked (status: %s)", channel_id, lock_status
-                                    )
-                                    continue
-
-                                freq_mhz = extract_float(cols[5].text)
-                                freq_hz = freq_mhz * 1_000_000 if freq_mhz is not None else None
-
-                                power = extract_float(cols[6].text)
-                                _LOGGER.debug("Ch %s: Raw Power=%s", channel_id, power)
-
-                                # During restart window, filter out zero power which is typically invalid
-                                if is_restarting and power == 0:
-                                    power = None
-
-                                channel_data = {
-                                    "channel_id": str(channel_id),
-                                    "frequency": freq_hz,
-                                    "power": power,
-                                    "modulation": cols[2].text.strip(),
-                                }
-                                _LOGGER.debug("Parsed upstream channel: %s", channel_data)
-                                channels.append(channel_data)
-                            except Exception as e:
-                                _LOGGER.error("Error parsing upstream channel row: %s", e)
-                                continue
+                    _LOGGER.debug("Found upstream table")
+                    for channel in self._UPSTREAM.extract(table_rows(table)):
+                        lock_status = channel.pop("lock_status")
+                        if "not locked" in lock_status.lower():
+                            _LOGGER.debug(
+                                "Skipping channel %s - not locked (status: %s)", channel["channel_id"], lock_status
+                            )
+                            continue
+                        # During restart window, filter out zero power which is typically invalid
+                        if is_restarting and channel["power"] == 0:
+                            channel["power"] = None
+                        channels.append(channel)
                     break
         except Exception as e:
             _LOGGER.error("Error parsing upstream channels: %s", e)
@@ -24,6 +24,7 @@ class MotorolaMB7621Parser(MotorolaGenericParser):
         {"path": "/MotoConnection.asp", "auth_method": "form"},
         {"path": "/MotoHome.asp", "auth_method": "form"},
     ]
+    fingerprints = {"body": ["MB7621", "MB 7621"]}
 
     # Override specific methods or add MB7621-specific logic here if needed
     # For now, it inherits all logic from MotorolaGenericParser
@@ -9,14 +9,52 @@ from bs4 import BeautifulSoup
 
 from custom_components.cable_modem_monitor.core.auth_config import HNAPAuthConfig
 from custom_components.cable_modem_monitor.core.authentication import AuthStrategyType
-from custom_components.cable_modem_monitor.core.hnap_builder import HNAPRequestBuilder
+from custom_components.cable_modem_monitor.core.hnap_builder import HNAPRequestBuilder, HNAPResultPaths
 from custom_components.cable_modem_monitor.core.hnap_json_builder import HNAPJsonRequestBuilder
+from custom_components.cable_modem_monitor.core.hnap_records import decode_channels
+from custom_components.cable_modem_monitor.lib.table_extract import Column
 
-from ..base_parser import ModemParser
+from ..base_parser import (
+    SECTION_DOWNSTREAM,
+    SECTION_SYSTEM_INFO,
+    SECTION_UPSTREAM,
+    ModemParser,
+    ParseContext,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def _mhz_to_hz(value: str) -> int:
+    """Convert a frequency field in MHz to Hz."""
+    return int(round(float(value.strip()) * 1_000_000))
+
+
+# Fields of "ID^Status^Mod^ChID^Freq^Power^SNR^Corr^Uncorr^"
+_DOWNSTREAM_COLUMNS = (
+    Column("channel_id", 0, int),
+    Column("lock_status", 1, str.strip),
+    Column("modulation", 2, str.strip),
+    Column("ch_id", 3, int),
+    Column("frequency", 4, _mhz_to_hz),
+    Column("power", 5, float),
+    Column("snr", 6, float),
+    Column("corrected", 7, int),
+    Column("uncorrected", 8, int),
+)
+
+# Fields of "ID^Status^Mod^ChID^SymbolRate^Freq^Power^"
+_UPSTREAM_COLUMNS = (
+    Column("channel_id", 0, int),
+    Column("lock_status", 1, str.strip),
+    Column("modulation", 2, str.strip),
+    Column("ch_id", 3, int),
+    Column("symbol_rate", 4, int),
+    Column("frequency", 5, _mhz_to_hz),
+    Column("power", 6, float),
+)
+
+
 class MotorolaMB8611HnapParser(ModemParser):
     """Parser for Motorola MB8611 cable modem using HNAP/SOAP protocol."""
 
@@ -38,6 +76,40 @@ class MotorolaMB8611HnapParser(ModemParser):
         {"path": "/HNAP1/", "auth_method": "hnap", "auth_required": True},
         {"path": "/MotoStatusConnection.html", "auth_method": "hnap", "auth_required": True},
     ]
+    fingerprints = {"body": ["MB8611", "MB 8611", "HNAP"]}
+
+    # Startup sequence results only change when the modem reboots, so the
+    # GetMotoStatusStartupSequence action is left out of polls that reuse them
+    static_info_keys = frozenset(
+        {"downstream_frequency", "connectivity_status", "boot_status", "security_status", "security_comment"}
+    )
+
+    # GetMultipleHNAPs actions in batch order, with the section of the parse result
+    # each one feeds; only actions for requested sections are sent.
+    _HNAP_ACTIONS = {
+        "GetMotoStatusStartupSequence": SECTION_SYSTEM_INFO,
+        "GetMotoStatusConnectionInfo": SECTION_SYSTEM_INFO,
+        "GetMotoStatusDownstreamChannelInfo": SECTION_DOWNSTREAM,
+        "GetMotoStatusUpstreamChannelInfo": SECTION_UPSTREAM,
+    }
+    _STATIC_HNAP_ACTIONS = frozenset({"GetMotoStatusStartupSequence"})
+
+    # Result fields read from SOAP XML responses, compiled once for iterparse extraction
+    _RESULT_PATHS = HNAPResultPaths.compile(
+        auth_config.soap_action_namespace,
+        {
+            "GetMotoStatusStartupSequence": (
+                "MotoConnDSFreq",
+                "MotoConnConnectivityStatus",
+                "MotoConnBootStatus",
+                "MotoConnSecurityStatus",
+                "MotoConnSecurityComment",
+            ),
+            "GetMotoStatusConnectionInfo": ("MotoConnSystemUpTime", "MotoConnNetworkAccess"),
+            "GetMotoStatusDownstreamChannelInfo": ("MotoConnDownstreamChannel",),
+            "GetMotoStatusUpstreamChannelInfo": ("MotoConnUpstreamChannel",),
+        },
+    )
 
     @classmethod
     def can_parse(cls, soup: BeautifulSoup, url: str, html: str) -> bool:
@@ -116,7 +188,7 @@ class MotorolaMB8611HnapParser(ModemParser):
 
         return any(indicator in error_str for indicator in auth_indicators)
 
-    def parse(self, soup: BeautifulSoup, session=None, base_url=None) -> dict:
+    def parse(self, soup: BeautifulSoup, session=None, base_url=None, context: ParseContext | None = None) -> dict:
         """
         Parse data using HNAP calls (JSON or XML/SOAP).
 
@@ -127,22 +199,25 @@ class MotorolaMB8611HnapParser(ModemParser):
             soup: BeautifulSoup object (may not be used for HNAP modems)
             session: requests.Session with authenticated session
             base_url: Modem base URL
+            context: Per-poll inputs; the batch leaves out sections that were not
+                     requested and static info the scraper still has cached
 
         Returns:
             Dict with downstream, upstream, and system_info
         """
         if not session or not base_url:
             raise ValueError("MB8611 requires session and base_url for HNAP calls")
+        context = context or ParseContext()
 
         # Try JSON-based HNAP first (newer firmware)
         try:
-            return self._parse_with_json_hnap(session, base_url)
+            return self._parse_with_json_hnap(session, base_url, context)
         except Exception as json_error:
             _LOGGER.debug("MB8611: JSON HNAP failed (%s), trying XML/SOAP HNAP...", str(json_error))
 
             # Fall back to XML/SOAP-based HNAP (older firmware)
             try:
-                return self._parse_with_xml_hnap(session, base_url)
+                return self._parse_with_xml_hnap(session, base_url, context)
             except Exception as xml_error:
                 _LOGGER.error(
                     "MB8611: Both JSON and XML/SOAP HNAP methods failed. " "JSON error: %s, XML error: %s",
@@ -170,7 +245,21 @@ class MotorolaMB8611HnapParser(ModemParser):
 
                 return result
 
-    def _parse_with_json_hnap(self, session, base_url: str) -> dict:
+    def _batch_actions(self, context: ParseContext) -> list[str]:
+        """Return the actions of this poll's GetMultipleHNAPs batch.
+
+        Actions are left out when their section was not requested, or when
+        they only carry static info that the scraper still has cached.
+        """
+        actions = [
+            action
+            for action, section in self._HNAP_ACTIONS.items()
+            if context.wants(section) and (context.refresh_static_info or action not in self._STATIC_HNAP_ACTIONS)
+        ]
+        # Downstream channels decide whether the modem counts as online, so a batch is never empty
+        return actions or ["GetMotoStatusDownstreamChannelInfo"]
+
+    def _parse_with_json_hnap(self, session, base_url: str, context: ParseContext) -> dict:
         """Parse modem data using JSON-based HNAP requests."""
         _LOGGER.debug("MB8611: Attempting JSON-based HNAP communication")
 
@@ -180,13 +269,7 @@ class MotorolaMB8611HnapParser(ModemParser):
         )
 
         # Make batched HNAP request for all data
-        hnap_actions = [
-            "GetMotoStatusStartupSequence",
-            "GetMotoStatusConnectionInfo",
-            "GetMotoStatusDownstreamChannelInfo",
-            "GetMotoStatusUpstreamChannelInfo",
-            "GetMotoLagStatus",
-        ]
+        hnap_actions = self._batch_actions(context)
 
         _LOGGER.debug("MB8611: Fetching modem data via JSON HNAP GetMultipleHNAPs")
         json_response = builder.call_multiple(session, base_url, hnap_actions)
@@ -204,9 +287,9 @@ class MotorolaMB8611HnapParser(ModemParser):
             len(json_response),
         )
 
-        # Parse channels and system info
-        downstream = self._parse_downstream_from_hnap(hnap_data)
-        upstream = self._parse_upstream_from_hnap(hnap_data)
+        # Parse channels and system info (sections that were not requested stay empty)
+        downstream = self._parse_downstream_from_hnap(hnap_data) if context.wants(SECTION_DOWNSTREAM) else []
+        upstream = self._parse_upstream_from_hnap(hnap_data) if context.wants(SECTION_UPSTREAM) else []
         system_info = self._parse_system_info_from_hnap(hnap_data)
 
         _LOGGER.info(
@@ -221,7 +304,7 @@ class MotorolaMB8611HnapParser(ModemParser):
             "system_info": system_info,
         }
 
-    def _parse_with_xml_hnap(self, session, base_url: str) -> dict:
+    def _parse_with_xml_hnap(self, session, base_url: str, context: ParseContext) -> dict:
         """Parse modem data using XML/SOAP-based HNAP requests."""
         _LOGGER.debug("MB8611: Attempting XML/SOAP-based HNAP communication")
 
@@ -231,33 +314,29 @@ class MotorolaMB8611HnapParser(ModemParser):
         )
 
         # Make batched HNAP request for all data
-        soap_actions = [
-            "GetMotoStatusStartupSequence",
-            "GetMotoStatusConnectionInfo",
-            "GetMotoStatusDownstreamChannelInfo",
-            "GetMotoStatusUpstreamChannelInfo",
-            "GetMotoLagStatus",
-        ]
+        soap_actions = self._batch_actions(context)
 
         _LOGGER.debug("MB8611: Fetching modem data via XML/SOAP HNAP GetMultipleHNAPs")
-        json_response = builder.call_multiple(session, base_url, soap_actions)
+        response_text = builder.call_multiple(session, base_url, soap_actions)
 
-        # Parse JSON response (MB8611 uses JSON, not XML)
-        response_data = json.loads(json_response)
-
-        # Extract nested response
-        hnap_data = response_data.get("GetMultipleHNAPsResponse", response_data)
+        if response_text.lstrip().startswith("<"):
+            # SOAP envelope: stream out just the result fields the parser reads
+            hnap_data = HNAPRequestBuilder.extract_results(response_text, self._RESULT_PATHS, soap_actions)
+        else:
+            # Most MB8611 firmware answers SOAP requests with JSON
+            response_data = json.loads(response_text)
+            hnap_data = response_data.get("GetMultipleHNAPsResponse", response_data)
 
         # Enhanced logging to help diagnose response structure
         _LOGGER.debug(
             "MB8611: XML/SOAP HNAP response received. Top-level keys: %s, response size: %d bytes",
             list(hnap_data.keys()),
-            len(json_response),
+            len(response_text),
         )
 
-        # Parse channels and system info
-        downstream = self._parse_downstream_from_hnap(hnap_data)
-        upstream = self._parse_upstream_from_hnap(hnap_data)
+        # Parse channels and system info (sections that were not requested stay empty)
+        downstream = self._parse_downstream_from_hnap(hnap_data) if context.wants(SECTION_DOWNSTREAM) else []
+        upstream = self._parse_upstream_from_hnap(hnap_data) if context.wants(SECTION_UPSTREAM) else []
         system_info = self._parse_system_info_from_hnap(hnap_data)
 
         _LOGGER.info(
@@ -296,49 +375,7 @@ class MotorolaMB8611HnapParser(ModemParser):
                 )
                 return channels
 
-            # Split by |+| delimiter
-            channel_entries = channel_data.split("|+|")
-
-            for entry in channel_entries:
-                if not entry.strip():
-                    continue
-
-                # Split by ^ delimiter
-                fields = entry.split("^")
-
-                if len(fields) < 9:
-                    _LOGGER.warning("MB8611: Invalid downstream channel entry: %s", entry)
-                    continue
-
-                try:
-                    # Parse channel fields
-                    channel_id = int(fields[0])
-                    lock_status = fields[1].strip()
-                    modulation = fields[2].strip()
-                    ch_id = int(fields[3])
-                    frequency = int(round(float(fields[4].strip()) * 1_000_000))  # MHz to Hz
-                    power = float(fields[5].strip())
-                    snr = float(fields[6].strip())
-                    corrected = int(fields[7])
-                    uncorrected = int(fields[8])
-
-                    channel_info = {
-                        "channel_id": channel_id,
-                        "lock_status": lock_status,
-                        "modulation": modulation,
-                        "ch_id": ch_id,
-                        "frequency": int(frequency),
-                        "power": power,
-                        "snr": snr,
-                        "corrected": corrected,
-                        "uncorrected": uncorrected,
-                    }
-
-                    channels.append(channel_info)
-
-                except (ValueError, IndexError) as e:
-                    _LOGGER.warning("MB8611: Error parsing downstream channel: %s - %s", entry, e)
-                    continue
+            channels = decode_channels(channel_data, _DOWNSTREAM_COLUMNS, "MB8611 downstream")
 
         except Exception as e:
             _LOGGER.error("MB8611: Error parsing downstream channels: %s", e)
@@ -369,45 +406,7 @@ class MotorolaMB8611HnapParser(ModemParser):
                 )
                 return channels
 
-            # Split by |+| delimiter
-            channel_entries = channel_data.split("|+|")
-
-            for entry in channel_entries:
-                if not entry.strip():
-                    continue
-
-                # Split by ^ delimiter
-                fields = entry.split("^")
-
-                if len(fields) < 7:
-                    _LOGGER.warning("MB8611: Invalid upstream channel entry: %s", entry)
-                    continue
-
-                try:
-                    # Parse channel fields
-                    channel_id = int(fields[0])
-                    lock_status = fields[1].strip()
-                    modulation = fields[2].strip()
-                    ch_id = int(fields[3])
-                    symbol_rate = int(fields[4])
-                    frequency = int(round(float(fields[5].strip()) * 1_000_000))  # MHz to Hz
-                    power = float(fields[6].strip())
-
-                    channel_info = {
-                        "channel_id": channel_id,
-                        "lock_status": lock_status,
-                        "modulation": modulation,
-                        "ch_id": ch_id,
-                        "symbol_rate": symbol_rate,
-                        "frequency": int(frequency),
-                        "power": power,
-                    }
-
-                    channels.append(channel_info)
-
-                except (ValueError, IndexError) as e:
-                    _LOGGER.warning("MB8611: Error parsing upstream channel: %s - %s", entry, e)
-                    continue
+            channels = decode_channels(channel_data, _UPSTREAM_COLUMNS, "MB8611 upstream")
 
         except Exception as e:
             _LOGGER.error("MB8611: Error parsing upstream channels: %s", e)
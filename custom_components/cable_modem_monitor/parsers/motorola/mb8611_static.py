@@ -6,7 +6,7 @@ import logging
 
 from bs4 import BeautifulSoup
 
-from ..base_parser import ModemParser
+from ..base_parser import ModemParser, ParseContext
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -24,6 +24,8 @@ class MotorolaMB8611StaticParser(ModemParser):
         # MB8600 compatibility: Some MB8611 firmware may use older MB8600-style URLs
         {"path": "/MotoConnection.asp", "auth_method": "form", "auth_required": True},
     ]
+    fingerprints = {"body": ["MB8611", "MB 8611", "HNAP"]}
+    single_page = True
 
     @classmethod
     def can_parse(cls, soup: BeautifulSoup, url: str, html: str) -> bool:
@@ -40,7 +42,7 @@ class MotorolaMB8611StaticParser(ModemParser):
         """Static parser does not require login."""
         return True, None
 
-    def parse(self, soup: BeautifulSoup, session=None, base_url=None) -> dict:
+    def parse(self, soup: BeautifulSoup, session=None, base_url=None, context: ParseContext | None = None) -> dict:
         """
         Parse data from a static HTML page.
 
@@ -0,0 +1,211 @@
+"""Single-pass extraction of the data Netgear pages embed in JavaScript.
+
+Netgear firmware (C3700, CM600) does not put status values in the HTML; each
+page fills its tables from JavaScript functions that hold a pipe-delimited
+``var tagValueList = '...'`` string:
+
+- InitDsTableTagValue(): 'count|ch1_data|ch2_data|...', 9 fields per channel:
+  num|lock|modulation|id|frequency|power|snr|corrected|uncorrected
+- InitUsTableTagValue(): 'count|ch1_data|ch2_data|...', 7 fields per channel:
+  num|lock|channel_type|id|symbol_rate|frequency|power
+- The first tagValueList of RouterStatus/DashBoard/index pages starts with
+  hardware version|firmware version|serial number
+
+scan_scripts() reads all three from one pass over a page's script sources with
+precompiled patterns, so neither channel data nor system info needs a
+BeautifulSoup tree.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
+
+_LOGGER = logging.getLogger(__name__)
+
+_SCRIPT = re.compile(r"<script\b[^>]*>(.*?)</script\s*>", re.DOTALL | re.IGNORECASE)
+_CHANNEL_FUNCTION = re.compile(r"function (InitDsTableTagValue|InitUsTableTagValue)\(\)[^{]*\{(.*?)\n\}", re.DOTALL)
+_BLOCK_COMMENT = re.compile(r"/\*.*?\*/", re.DOTALL)
+# Inside the channel functions only indented declarations count, which skips lines commented out with //
+_FUNCTION_TAG_VALUE_LIST = re.compile(r"^\s+var tagValueList = [\"']([^\"']+)[\"']", re.MULTILINE)
+_TAG_VALUE_LIST = re.compile(r"var tagValueList = [\"']([^\"']+)[\"']")
+
+
+def _hz(value: str) -> int:
+    """Convert a "507000000 Hz" field to an int."""
+    return int(value.replace(" Hz", "").strip())
+
+
+@dataclass(frozen=True)
+class _ChannelLayout:
+    """Field layout of one channel in a tagValueList."""
+
+    direction: str
+    width: int
+    lock: int
+    frequency: int
+    # Output key -> (field position, converter)
+    fields: dict[str, tuple[int, Callable[[str], Any]]]
+
+
+_DOWNSTREAM = _ChannelLayout(
+    direction="downstream",
+    width=9,
+    lock=1,
+    frequency=4,
+    fields={
+        "channel_id": (3, str),
+        "power": (5, float),
+        "snr": (6, float),
+        "modulation": (2, str),
+        "corrected": (7, int),
+        "uncorrected": (8, int),
+    },
+)
+_UPSTREAM = _ChannelLayout(
+    direction="upstream",
+    width=7,
+    lock=1,
+    frequency=5,
+    fields={
+        "channel_id": (3, str),
+        "power": (6, float),
+        "channel_type": (2, str),
+    },
+)
+_LAYOUTS = {"InitDsTableTagValue": _DOWNSTREAM, "InitUsTableTagValue": _UPSTREAM}
+
+
+@dataclass
+class NetgearPageData:
+    """Channel data and system info found in a page's scripts."""
+
+    downstream: list[dict] = field(default_factory=list)
+    upstream: list[dict] = field(default_factory=list)
+    system_info: dict = field(default_factory=dict)
+
+
+def html_scripts(html: str) -> Iterator[str]:
+    """Yield the source of every script block in raw HTML."""
+    for match in _SCRIPT.finditer(html):
+        yield match.group(1)
+
+
+def soup_scripts(soup: BeautifulSoup) -> list[str]:
+    """Return the source of every script block of an already parsed page."""
+    return [script.string for script in soup.find_all("script") if script.string]
+
+
+def scan_scripts(scripts: Iterable[str], model: str) -> NetgearPageData:
+    """Extract downstream, upstream and system info from script sources in one pass.
+
+    The first script holding a usable value list wins for each of the three,
+    matching how the pages themselves are rendered.
+
+    Args:
+        scripts: Script sources, in document order
+        model: Model name used in log messages
+
+    Returns:
+        NetgearPageData (empty lists/dict for anything not on the page)
+    """
+    channel_values: dict[str, list[str]] = {}
+    system_values: list[str] | None = None
+
+    for source in scripts:
+        if system_values is None:
+            system_values = _system_values(source)
+        if len(channel_values) < len(_LAYOUTS):
+            _collect_channel_values(source, channel_values, model)
+
+    data = NetgearPageData()
+    for name, layout in _LAYOUTS.items():
+        if name in channel_values:
+            setattr(data, layout.direction, _parse_channels(channel_values[name], layout, model))
+        else:
+            _LOGGER.debug("%s: No %s channel data (%s) on page", model, layout.direction, name)
+
+    if system_values is not None:
+        # values[2] is the serial number, which is not reported
+        if system_values[0]:
+            data.system_info["hardware_version"] = system_values[0]
+        if system_values[1]:
+            data.system_info["software_version"] = system_values[1]
+        _LOGGER.debug("Parsed %s system info: %s", model, data.system_info)
+
+    return data
+
+
+def _system_values(source: str) -> list[str] | None:
+    """Return the first tagValueList of a script if it looks like system info."""
+    match = _TAG_VALUE_LIST.search(source)
+    if match:
+        values = match.group(1).split("|")
+        if len(values) >= 3:
+            return values
+    return None
+
+
+def _collect_channel_values(source: str, channel_values: dict[str, list[str]], model: str) -> None:
+    """Add the tagValueLists of channel functions in a script that were not found in earlier scripts."""
+    for func_match in _CHANNEL_FUNCTION.finditer(source):
+        name = func_match.group(1)
+        if name in channel_values:
+            continue
+        # Remove block comments /* ... */ to avoid matching commented-out code
+        body = _BLOCK_COMMENT.sub("", func_match.group(2))
+        match = _FUNCTION_TAG_VALUE_LIST.search(body)
+        if match:
+            channel_values[name] = match.group(1).split("|")
+        else:
+            _LOGGER.debug("%s: No tagValueList found in %s", model, name)
+
+
+def _parse_channels(values: list[str], layout: _ChannelLayout, model: str) -> list[dict]:
+    """Convert a count-prefixed tagValueList into channel dicts, skipping unused channels."""
+    channels: list[dict] = []
+    if len(values) < 1 + layout.width:  # Need at least count + 1 channel
+        _LOGGER.warning("Insufficient %s data: %d values", layout.direction, len(values))
+        return channels
+
+    try:
+        channel_count = int(values[0])
+    except ValueError:
+        _LOGGER.error("Error parsing %s %s channel count: %r", model, layout.direction, values[0])
+        return channels
+    _LOGGER.debug("Found %d %s channels", channel_count, layout.direction)
+
+    for i in range(channel_count):
+        start = 1 + i * layout.width
+        if start + layout.width > len(values):
+            _LOGGER.warning("Incomplete data for %s channel %d", layout.direction, i + 1)
+            break
+        record = values[start : start + layout.width]
+
+        try:
+            freq = _hz(record[layout.frequency])
+            lock_status = record[layout.lock]  # "Locked" or "Not Locked"
+
+            # Skip unlocked channels with 0 frequency (placeholder entries)
+            # These are configured but not in use by the ISP
+            if freq == 0 or lock_status != "Locked":
+                _LOGGER.debug("Skipping %s channel %d: %s, freq=%d Hz", layout.direction, i + 1, lock_status, freq)
+                continue
+
+            channel: dict[str, Any] = {"frequency": freq}
+            for key, (position, convert) in layout.fields.items():
+                channel[key] = convert(record[position])
+        except ValueError as e:
+            _LOGGER.warning("Error parsing %s channel %d: %s", layout.direction, i + 1, e)
+            continue
+
+        channels.append(channel)
+
+    _LOGGER.info("Parsed %d %s channels", len(channels), layout.direction)
+    return channels
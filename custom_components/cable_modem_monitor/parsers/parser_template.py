@@ -18,6 +18,8 @@ STEP-BY-STEP GUIDE:
    - Add detection logic to identify your modem's HTML
    - Check for unique page title, CSS classes, or URL patterns
    - Return True if this is your modem, False otherwise
+   - Declare the same tell-tale strings in `fingerprints` so detection
+     tries your parser early (see base_parser.ModemParser.fingerprints)
 
 4. IMPLEMENT parse_downstream()
    - Extract downstream channel data from HTML
@@ -67,6 +69,7 @@ class YourModemParser(ModemParser):
     name = "Your Modem Model"  # e.g., "Netgear CM1000"
     manufacturer = "Your Manufacturer"  # e.g., "Netgear"
     models = ["MODEL1", "MODEL2"]  # e.g., ["CM1000", "CM1100"]
+    fingerprints = {"title": ["Your Modem Title"], "body": ["MODEL1"]}  # Strings that identify your modem's pages
 
     # =========================================================================
     # STEP 3: IMPLEMENT MODEM DETECTION
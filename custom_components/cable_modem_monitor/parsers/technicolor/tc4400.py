@@ -8,9 +8,10 @@ from bs4 import BeautifulSoup, Tag
 
 from custom_components.cable_modem_monitor.core.auth_config import BasicAuthConfig
 from custom_components.cable_modem_monitor.core.authentication import AuthStrategyType
+from custom_components.cable_modem_monitor.lib.table_extract import Column, TableSpec, table_rows
 from custom_components.cable_modem_monitor.lib.utils import extract_float, extract_number
 
-from ..base_parser import ModemParser
+from ..base_parser import ModemParser, ParseContext
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -19,6 +20,20 @@ _LOGGER = logging.getLogger(__name__)
 RESTART_WINDOW_SECONDS = 300
 
 
+def _parse_frequency(text: str) -> int | None:
+    """Parse frequency, handling both Hz and MHz formats."""
+    try:
+        freq = extract_float(text)
+        if freq is None:
+            return None
+        if "mhz" in text.lower() or (freq > 0 and freq < 2000):
+            return int(freq * 1_000_000)
+        else:
+            return int(freq)
+    except Exception:
+        return None
+
+
 class TechnicolorTC4400Parser(ModemParser):
     """Parser for Technicolor TC4400 cable modem."""
 
@@ -32,6 +47,42 @@ class TechnicolorTC4400Parser(ModemParser):
     url_patterns = [
         {"path": "/cmconnectionstatus.html", "auth_method": "basic", "auth_required": True},
     ]
+    fingerprints = {"url": ["cmconnectionstatus.html", "cmswinfo.html"], "body": ["Board ID:", "Build Timestamp:"]}
+    single_page = True
+
+    # Both channel tables start with a title row and a column header row
+    _DOWNSTREAM = TableSpec(
+        name="TC4400 downstream",
+        columns=(
+            Column("channel_id", 1, extract_number),
+            Column("lock_status", 2),
+            Column("channel_type", 3),
+            Column("bonding_status", 4),
+            Column("frequency", 5, _parse_frequency),
+            Column("width", 6, _parse_frequency),
+            Column("snr", 7, extract_float),
+            Column("power", 8, extract_float),
+            Column("modulation", 9),
+            Column("unerrored_codewords", 10, extract_number),
+            Column("corrected", 11, extract_number),
+            Column("uncorrected", 12, extract_number),
+        ),
+        header_rows=2,
+    )
+    _UPSTREAM = TableSpec(
+        name="TC4400 upstream",
+        columns=(
+            Column("channel_id", 1, extract_number),
+            Column("lock_status", 2),
+            Column("channel_type", 3),
+            Column("bonding_status", 4),
+            Column("frequency", 5, _parse_frequency),
+            Column("width", 6, _parse_frequency),
+            Column("power", 7, extract_float),
+            Column("modulation", 8),
+        ),
+        header_rows=2,
+    )
 
     @classmethod
     def can_parse(cls, soup: BeautifulSoup, url: str, html: str) -> bool:
@@ -58,13 +109,10 @@ class TechnicolorTC4400Parser(ModemParser):
         Note: This method now delegates to the new authentication system.
         It is maintained for backward compatibility.
         """
-        from custom_components.cable_modem_monitor.core.authentication import AuthFactory
-
-        auth_strategy = AuthFactory.get_strategy(self.auth_config.strategy)
-        success, _ = auth_strategy.login(session, base_url, username, password, self.auth_config)
+        success, _ = self.login_with_auth_config(session, base_url, username, password)
         return success
 
-    def parse(self, soup: BeautifulSoup, session=None, base_url=None) -> dict:
+    def parse(self, soup: BeautifulSoup, session=None, base_url=None, context: ParseContext | None = None) -> dict:
         """Parse all data from the modem."""
         # Parse system info first to get uptime for restart detection
         system_info = self._parse_system_info(soup)
@@ -104,34 +152,14 @@ class TechnicolorTC4400Parser(ModemParser):
                 _LOGGER.warning("TC4400: Downstream table parent not found")
                 return channels
 
-            for row in downstream_table.find_all("tr")[2:]:
-                cols = row.find_all("td")
-                if len(cols) == 13:
-                    snr = extract_float(cols[7].text)
-                    power = extract_float(cols[8].text)
-
-                    # During restart window, filter out zero values which are typically invalid
-                    if is_restarting:
-                        if power == 0:
-                            power = None
-                        if snr == 0:
-                            snr = None
-
-                    channel_data = {
-                        "channel_id": extract_number(cols[1].text),
-                        "lock_status": cols[2].text.strip(),
-                        "channel_type": cols[3].text.strip(),
-                        "bonding_status": cols[4].text.strip(),
-                        "frequency": self._parse_frequency(cols[5].text),
-                        "width": self._parse_frequency(cols[6].text),
-                        "snr": snr,
-                        "power": power,
-                        "modulation": cols[9].text.strip(),
-                        "unerrored_codewords": extract_number(cols[10].text),
-                        "corrected": extract_number(cols[11].text),
-                        "uncorrected": extract_number(cols[12].text),
-                    }
-                    channels.append(channel_data)
+            channels = self._DOWNSTREAM.extract(table_rows(downstream_table))
+            if is_restarting:
+                # During restart window, filter out zero values which are typically invalid
+                for channel in channels:
+                    if channel["power"] == 0:
+                        channel["power"] = None
+                    if channel["snr"] == 0:
+                        channel["snr"] = None
         except Exception as e:
             _LOGGER.error("Error parsing TC4400 downstream channels: %s", e)
 
@@ -164,26 +192,12 @@ class TechnicolorTC4400Parser(ModemParser):
                 _LOGGER.warning("TC4400: Upstream table parent not found")
                 return channels
 
-            for row in upstream_table.find_all("tr")[2:]:
-                cols = row.find_all("td")
-                if len(cols) == 9:
-                    power = extract_float(cols[7].text)
-
-                    # During restart window, filter out zero power which is typically invalid
-                    if is_restarting and power == 0:
-                        power = None
-
-                    channel_data = {
-                        "channel_id": extract_number(cols[1].text),
-                        "lock_status": cols[2].text.strip(),
-                        "channel_type": cols[3].text.strip(),
-                        "bonding_status": cols[4].text.strip(),
-                        "frequency": self._parse_frequency(cols[5].text),
-                        "width": self._parse_frequency(cols[6].text),
-                        "power": power,
-                        "modulation": cols[8].text.strip(),
-                    }
-                    channels.append(channel_data)
+            channels = self._UPSTREAM.extract(table_rows(upstream_table))
+            if is_restarting:
+                # During restart window, filter out zero power which is typically invalid
+                for channel in channels:
+                    if channel["power"] == 0:
+                        channel["power"] = None
         except Exception as e:
             _LOGGER.error("Error parsing TC4400 upstream channels: %s", e)
 
@@ -225,16 +239,3 @@ class TechnicolorTC4400Parser(ModemParser):
             _LOGGER.error("Error parsing TC4400 system info: %s", e)
 
         return info
-
-    def _parse_frequency(self, text: str) -> int | None:
-        """Parse frequency, handling both Hz and MHz formats."""
-        try:
-            freq = extract_float(text)
-            if freq is None:
-                return None
-            if "mhz" in text.lower() or (freq > 0 and freq < 2000):
-                return int(freq * 1_000_000)
-            else:
-                return int(freq)
-        except Exception:
-            return None
@@ -11,7 +11,7 @@ from custom_components.cable_modem_monitor.core.auth_config import RedirectFormA
 from custom_components.cable_modem_monitor.core.authentication import AuthStrategyType
 from custom_components.cable_modem_monitor.lib.utils import extract_float, extract_number
 
-from ..base_parser import ModemParser
+from ..base_parser import ModemParser, ParseContext
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -36,6 +36,8 @@ class TechnicolorXB7Parser(ModemParser):
     url_patterns = [
         {"path": "/network_setup.jst", "auth_method": "form", "auth_required": True},
     ]
+    fingerprints = {"url": ["network_setup.jst"], "body": ["Channel Bonding Value"]}
+    single_page = True
 
     def login(self, session, base_url, username, password) -> tuple[bool, str | None]:
         """
@@ -147,7 +149,7 @@ class TechnicolorXB7Parser(ModemParser):
 
         return False
 
-    def parse(self, soup: BeautifulSoup, session=None, base_url=None) -> dict:
+    def parse(self, soup: BeautifulSoup, session=None, base_url=None, context: ParseContext | None = None) -> dict:
         """Parse all data from the XB7 modem."""
         downstream_channels = self._parse_downstream(soup)
         upstream_channels = self._parse_upstream(soup)
@@ -17,7 +17,7 @@ from custom_components.cable_modem_monitor.core.auth_config import BasicAuthConf
 from custom_components.cable_modem_monitor.core.authentication import AuthStrategyType
 from custom_components.cable_modem_monitor.lib.html_crawler import generate_seed_urls
 
-from ..base_parser import ModemParser
+from ..base_parser import ModemParser, ParseContext
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -110,10 +110,7 @@ class UniversalFallbackParser(ModemParser):
         )
 
         try:
-            from custom_components.cable_modem_monitor.core.authentication import AuthFactory
-
-            auth_strategy = AuthFactory.get_strategy(self.auth_config.strategy)
-            success, html = auth_strategy.login(session, base_url, username, password, self.auth_config)
+            success, html = self.login_with_auth_config(session, base_url, username, password)
 
             if success:
                 _LOGGER.info("Fallback parser: HTTP Basic Auth succeeded")
@@ -138,7 +135,7 @@ class UniversalFallbackParser(ModemParser):
             # Return True anyway to allow installation
             return True, None
 
-    def parse(self, soup: BeautifulSoup, session=None, base_url=None) -> dict:
+    def parse(self, soup: BeautifulSoup, session=None, base_url=None, context: ParseContext | None = None) -> dict:
         """Return minimal placeholder data for unknown modems.
 
         This allows the integration to install and function minimally.
@@ -11,6 +11,7 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import PERCENTAGE
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import (
@@ -21,6 +22,7 @@ from homeassistant.util import dt as dt_util
 
 from .const import (
     CONF_HOST,
+    DATA_HEALTH_COORDINATORS,
     DOMAIN,
 )
 from .lib.utils import parse_uptime_to_seconds
@@ -43,12 +45,15 @@ async def async_setup_entry(
     # Add connection status sensor
     entities.append(ModemConnectionStatusSensor(coordinator, entry))
 
-    # Add health monitoring sensors
+    # Add health monitoring sensors, updated by the faster health coordinator when there is one
+    health_coordinator = hass.data.get(DATA_HEALTH_COORDINATORS, {}).get(entry.entry_id, coordinator)
     entities.extend(
         [
-            ModemHealthStatusSensor(coordinator, entry),
-            ModemPingLatencySensor(coordinator, entry),
-            ModemHttpLatencySensor(coordinator, entry),
+            ModemHealthStatusSensor(health_coordinator, entry),
+            ModemPingLatencySensor(health_coordinator, entry),
+            ModemPingJitterSensor(health_coordinator, entry),
+            ModemPingPacketLossSensor(health_coordinator, entry),
+            ModemHttpLatencySensor(health_coordinator, entry),
         ]
     )
 
@@ -562,7 +567,16 @@ class ModemLanTransmittedDropsSensor(ModemLanStatsSensor):
         super().__init__(coordinator, entry, interface, "transmitted_drops")
 
 
-class ModemHealthStatusSensor(ModemSensorBase):
+class ModemHealthSensorBase(ModemSensorBase):
+    """Base class for sensors fed by the health probes."""
+
+    @property
+    def available(self) -> bool:
+        """Health sensors stay available while the probes run, so they can report an unresponsive modem."""
+        return bool(self.coordinator.last_update_success)
+
+
+class ModemHealthStatusSensor(ModemHealthSensorBase):
     """Sensor for modem health status (healthy/degraded/icmp_blocked/unresponsive)."""
 
     def __init__(self, coordinator: DataUpdateCoordinator, entry: ConfigEntry) -> None:
@@ -588,7 +602,7 @@ class ModemHealthStatusSensor(ModemSensorBase):
         }
 
 
-class ModemPingLatencySensor(ModemSensorBase):
+class ModemPingLatencySensor(ModemHealthSensorBase):
     """Sensor for ICMP ping latency in milliseconds."""
 
     def __init__(self, coordinator: DataUpdateCoordinator, entry: ConfigEntry) -> None:
@@ -609,8 +623,58 @@ class ModemPingLatencySensor(ModemSensorBase):
             return None
         return int(round(ping_latency))
 
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Return the fastest and slowest round trip of the last probe burst."""
+        return {
+            "min_latency_ms": self.coordinator.data.get("ping_min_ms"),
+            "max_latency_ms": self.coordinator.data.get("ping_max_ms"),
+        }
+
+
+class ModemPingJitterSensor(ModemHealthSensorBase):
+    """Sensor for round-trip variation within a ping burst in milliseconds."""
+
+    def __init__(self, coordinator: DataUpdateCoordinator, entry: ConfigEntry) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry)
+        self._attr_name = "Ping Jitter"
+        self._attr_unique_id = f"{entry.entry_id}_cable_modem_ping_jitter"
+        self._attr_native_unit_of_measurement = "ms"
+        self._attr_icon = "mdi:chart-bell-curve"
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the ping jitter in milliseconds."""
+        jitter = self.coordinator.data.get("ping_jitter_ms")
+        if jitter is None:
+            return None
+        return round(jitter, 1)
+
+
+class ModemPingPacketLossSensor(ModemHealthSensorBase):
+    """Sensor for the share of unanswered pings in the last burst."""
+
+    def __init__(self, coordinator: DataUpdateCoordinator, entry: ConfigEntry) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry)
+        self._attr_name = "Ping Packet Loss"
+        self._attr_unique_id = f"{entry.entry_id}_cable_modem_ping_packet_loss"
+        self._attr_native_unit_of_measurement = PERCENTAGE
+        self._attr_icon = "mdi:lan-disconnect"
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the packet loss percentage."""
+        loss = self.coordinator.data.get("ping_packet_loss")
+        if loss is None:
+            return None
+        return round(loss, 1)
+
 
-class ModemHttpLatencySensor(ModemSensorBase):
+class ModemHttpLatencySensor(ModemHealthSensorBase):
     """Sensor for HTTP HEAD request latency in milliseconds."""
 
     def __init__(self, coordinator: DataUpdateCoordinator, entry: ConfigEntry) -> None:
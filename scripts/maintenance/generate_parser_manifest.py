@@ -0,0 +1,50 @@
+"""
+This script regenerates custom_components/cable_modem_monitor/parsers/manifest.py
+from the parser classes on disk.
+
+The integration loads parsers from the manifest instead of scanning the
+parsers package at runtime, so run this whenever a parser is added, renamed,
+or changes its name, models, priority, URL patterns, auth config or
+fingerprints. Pass --check to fail (exit code 1) when the manifest is stale.
+"""
+
+import os
+import sys
+
+
+def main() -> int:
+    """Write the manifest, or with --check verify that it is up to date."""
+    project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+    sys.path.insert(0, project_root)
+
+    from custom_components.cable_modem_monitor.parsers.manifest_builder import (
+        MANIFEST_FILE,
+        build_manifest,
+        render_manifest,
+    )
+
+    entries = build_manifest()
+    rendered = render_manifest(entries)
+
+    with open(MANIFEST_FILE, encoding="utf-8") as f:
+        current = f.read()
+
+    if "--check" in sys.argv[1:]:
+        if current != rendered:
+            print(f"{MANIFEST_FILE} is out of date. Run: python scripts/maintenance/generate_parser_manifest.py")
+            return 1
+        print("Parser manifest is up to date.")
+        return 0
+
+    if current == rendered:
+        print(f"Parser manifest already up to date ({len(entries)} parsers).")
+        return 0
+
+    with open(MANIFEST_FILE, "w", encoding="utf-8") as f:
+        f.write(rendered)
+    print(f"Wrote {len(entries)} parsers to {MANIFEST_FILE}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
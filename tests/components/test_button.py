@@ -15,6 +15,7 @@ from custom_components.cable_modem_monitor.button import (
     ModemRestartButton,
     ResetEntitiesButton,
     UpdateModemDataButton,
+    _check_restart_support,
     async_setup_entry,
 )
 from custom_components.cable_modem_monitor.const import DOMAIN
@@ -82,6 +83,21 @@ async def test_restart_button_initialization(mock_coordinator, mock_config_entry
     assert button.available is True
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("modem_choice", "expected"),
+    [("Motorola MB7621", True), ("ARRIS SB6141", False), ("auto", False), ("No Such Modem", False)],
+)
+async def test_check_restart_support_from_manifest(mock_config_entry, modem_choice, expected):
+    """Test that restart support is read from parser metadata without an executor job."""
+    hass = Mock(spec=HomeAssistant)
+    hass.async_add_executor_job = AsyncMock()
+    mock_config_entry.data = {**mock_config_entry.data, "modem_choice": modem_choice}
+
+    assert await _check_restart_support(hass, mock_config_entry) is expected
+    hass.async_add_executor_job.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_restart_button_success(mock_coordinator, mock_config_entry):
     """Test successful modem restart."""
@@ -99,10 +115,9 @@ async def test_restart_button_success(mock_coordinator, mock_config_entry):
         mock_scraper.restart_modem = Mock(return_value=True)
         mock_scraper_class.return_value = mock_scraper
 
-        # Mock get_parsers
-        with patch("custom_components.cable_modem_monitor.parsers.get_parsers", return_value=[]):
+        # Mock get_lazy_parsers
+        with patch("custom_components.cable_modem_monitor.parsers.get_lazy_parsers", return_value=[]):
             hass.async_add_executor_job.side_effect = [
-                [],  # get_parsers result
                 True,  # restart_modem result
             ]
 
@@ -136,9 +151,8 @@ async def test_restart_button_failure(mock_coordinator, mock_config_entry):
         mock_scraper.restart_modem = Mock(return_value=False)
         mock_scraper_class.return_value = mock_scraper
 
-        with patch("custom_components.cable_modem_monitor.parsers.get_parsers", return_value=[]):
+        with patch("custom_components.cable_modem_monitor.parsers.get_lazy_parsers", return_value=[]):
             hass.async_add_executor_job.side_effect = [
-                [],  # get_parsers result
                 False,  # restart_modem result (failed)
             ]
 
@@ -597,9 +611,8 @@ async def test_capture_html_button_success(mock_coordinator, mock_config_entry):
         },
     }
 
-    with patch("custom_components.cable_modem_monitor.parsers.get_parsers", return_value=[]):
+    with patch("custom_components.cable_modem_monitor.parsers.get_lazy_parsers", return_value=[]):
         hass.async_add_executor_job.side_effect = [
-            [],  # get_parsers result
             mock_capture_data,  # get_modem_data result
         ]
 
@@ -639,9 +652,8 @@ async def test_capture_html_button_failure(mock_coordinator, mock_config_entry):
         "cable_modem_connection_status": "online",
     }
 
-    with patch("custom_components.cable_modem_monitor.parsers.get_parsers", return_value=[]):
+    with patch("custom_components.cable_modem_monitor.parsers.get_lazy_parsers", return_value=[]):
         hass.async_add_executor_job.side_effect = [
-            [],  # get_parsers result
             mock_data,  # get_modem_data result without capture
         ]
 
@@ -674,9 +686,8 @@ async def test_capture_html_button_exception(mock_coordinator, mock_config_entry
         mock_scraper.get_modem_data.side_effect = Exception("Test error")
         mock_scraper_class.return_value = mock_scraper
 
-        with patch("custom_components.cable_modem_monitor.parsers.get_parsers", return_value=[]):
+        with patch("custom_components.cable_modem_monitor.parsers.get_lazy_parsers", return_value=[]):
             hass.async_add_executor_job.side_effect = [
-                [],  # get_parsers result
                 Exception("Test error"),  # get_modem_data result (will be caught by the mock)
             ]
         await button.async_press()
@@ -101,13 +101,13 @@ class TestValidateInput:
         assert result["title"] == "Cable Modem (192.168.100.1)"
 
     @pytest.mark.asyncio
-    @patch("custom_components.cable_modem_monitor.config_flow.get_parsers")
+    @patch("custom_components.cable_modem_monitor.config_flow.get_lazy_parsers")
     @patch("custom_components.cable_modem_monitor.config_flow.ModemScraper")
-    async def test_connection_failure(self, mock_scraper_class, mock_get_parsers, mock_hass, valid_input):
+    async def test_connection_failure(self, mock_scraper_class, mock_get_lazy_parsers, mock_hass, valid_input):
         """Test validation fails when cannot connect to modem."""
-        # Mock get_parsers to return a mock parser
+        # Mock get_lazy_parsers to return a mock parser
         mock_parser = Mock()
-        mock_get_parsers.return_value = [mock_parser]
+        mock_get_lazy_parsers.return_value = [mock_parser]
 
         # Mock scraper to raise exception
         mock_scraper = Mock()
@@ -142,7 +142,7 @@ class TestValidateInput:
 
         # We need to patch the rest of the validation to isolate the connectivity check
         with (
-            patch("custom_components.cable_modem_monitor.config_flow.get_parsers"),
+            patch("custom_components.cable_modem_monitor.config_flow.get_lazy_parsers"),
             patch("custom_components.cable_modem_monitor.config_flow.ModemScraper") as mock_scraper_class,
         ):
             mock_scraper = Mock()
@@ -187,7 +187,7 @@ class TestValidateInput:
 
         # We need to patch the rest of the validation to isolate the connectivity check
         with (
-            patch("custom_components.cable_modem_monitor.config_flow.get_parsers"),
+            patch("custom_components.cable_modem_monitor.config_flow.get_lazy_parsers"),
             patch("custom_components.cable_modem_monitor.config_flow.ModemScraper") as mock_scraper_class,
         ):
             mock_scraper = Mock()
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from datetime import timedelta
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 
@@ -227,3 +227,202 @@ class TestReloadFunctionality:
 
         # Config identical
         assert old_config == new_config
+
+
+class TestAdaptivePolling:
+    """Test adaptive polling driven by the signal analyzer."""
+
+    @staticmethod
+    def _setup(mocker, recommendation):
+        """Wire adaptive polling to a mock coordinator and return (coordinator, listener)."""
+        from custom_components.cable_modem_monitor import _setup_adaptive_polling
+
+        coordinator = Mock()
+        coordinator.update_interval = timedelta(seconds=600)
+        coordinator.last_update_success = True
+        coordinator.data = {
+            "cable_modem_connection_status": "online",
+            "cable_modem_downstream": [{"channel_id": 1, "snr": 38.0, "power": 2.0}],
+            "cable_modem_total_uncorrected": 0,
+        }
+        entry = Mock()
+        analyzer = mocker.patch("custom_components.cable_modem_monitor.core.signal_analyzer.SignalQualityAnalyzer")
+        analyzer.return_value.get_recommended_interval.return_value = recommendation
+
+        _setup_adaptive_polling(entry, coordinator)
+
+        listener = coordinator.async_add_listener.call_args.args[0]
+        entry.async_on_unload.assert_called_once_with(coordinator.async_add_listener.return_value)
+        return coordinator, listener, analyzer.return_value
+
+    def test_stable_signal_lengthens_interval(self, mocker):
+        """Test that a confident very_stable recommendation is applied."""
+        coordinator, listener, analyzer = self._setup(
+            mocker, {"recommended_seconds": 900, "confidence": "high", "signal_status": "very_stable"}
+        )
+
+        listener()
+
+        assert coordinator.update_interval == timedelta(seconds=900)
+        sample = analyzer.add_sample.call_args.args[0]
+        assert sample["downstream_channels"][0]["snr"] == 38.0
+        assert sample["total_uncorrected_errors"] == 0
+
+    def test_interval_clamped_to_bounds(self, mocker):
+        """Test that recommendations outside MIN/MAX are clamped."""
+        coordinator, listener, _ = self._setup(
+            mocker, {"recommended_seconds": 10, "confidence": "high", "signal_status": "problematic"}
+        )
+
+        listener()
+
+        assert coordinator.update_interval == timedelta(seconds=MIN_SCAN_INTERVAL)
+
+    def test_low_confidence_ignored(self, mocker):
+        """Test that low-confidence recommendations leave the interval alone."""
+        coordinator, listener, _ = self._setup(
+            mocker, {"recommended_seconds": 60, "confidence": "low", "signal_status": "unknown"}
+        )
+
+        listener()
+
+        assert coordinator.update_interval == timedelta(seconds=600)
+
+    def test_failed_poll_not_sampled(self, mocker):
+        """Test that unsuccessful polls are not fed into the analyzer."""
+        coordinator, listener, analyzer = self._setup(
+            mocker, {"recommended_seconds": 900, "confidence": "high", "signal_status": "very_stable"}
+        )
+        coordinator.last_update_success = False
+
+        listener()
+
+        analyzer.add_sample.assert_not_called()
+        assert coordinator.update_interval == timedelta(seconds=600)
+
+
+class TestHealthCoordinator:
+    """Test the health probe loop that runs separately from the scrape."""
+
+    @pytest.mark.asyncio
+    async def test_health_update_only_probes(self):
+        """Test that the health update reports the probe result without scraping."""
+        from custom_components.cable_modem_monitor import _create_health_update_function
+        from custom_components.cable_modem_monitor.core.health_monitor import HealthCheckResult
+
+        health_monitor = Mock()
+        health_monitor.check_health = AsyncMock(return_value=HealthCheckResult(1.0, False, None, True, 12.0))
+        health_monitor.consecutive_failures = 0
+
+        data = await _create_health_update_function(health_monitor, "192.168.100.1")()
+
+        health_monitor.check_health.assert_awaited_once_with("http://192.168.100.1")
+        assert data["health_status"] == "icmp_blocked"
+        assert data["http_latency_ms"] == 12.0
+        assert "cable_modem_connection_status" not in data
+
+    @pytest.mark.asyncio
+    async def test_health_sensors_use_health_coordinator(self):
+        """Test that health sensors follow the health coordinator and other sensors the scrape coordinator."""
+        from custom_components.cable_modem_monitor.const import DATA_HEALTH_COORDINATORS, DOMAIN
+        from custom_components.cable_modem_monitor.sensor import (
+            ModemConnectionStatusSensor,
+            ModemHealthSensorBase,
+            async_setup_entry,
+        )
+
+        coordinator = Mock()
+        coordinator.data = {"cable_modem_fallback_mode": True}
+        health_coordinator = Mock()
+        entry = Mock()
+        entry.entry_id = "test_entry"
+        entry.data = {"host": "192.168.100.1"}
+        hass = Mock()
+        hass.data = {DOMAIN: {"test_entry": coordinator}, DATA_HEALTH_COORDINATORS: {"test_entry": health_coordinator}}
+        added = []
+
+        await async_setup_entry(hass, entry, added.extend)
+
+        health_sensors = [entity for entity in added if isinstance(entity, ModemHealthSensorBase)]
+        assert len(health_sensors) == 5
+        assert all(entity.coordinator is health_coordinator for entity in health_sensors)
+        assert next(e for e in added if isinstance(e, ModemConnectionStatusSensor)).coordinator is coordinator
+
+
+class TestScrapeUpdate:
+    """Test that the scrape update relies on the health coordinator instead of probing itself."""
+
+    @staticmethod
+    def _update_function(mocker, scrape, health_data):
+        """Build the update function around the given scrape coroutine and latest health data."""
+        from custom_components.cable_modem_monitor import _create_update_function
+
+        mocker.patch("custom_components.cable_modem_monitor.async_get_clientsession")
+        scraper = Mock(async_get_modem_data=lambda _session, _executor: scrape())
+        return _create_update_function(Mock(), scraper, Mock(data=health_data))
+
+    @pytest.mark.asyncio
+    async def test_scrape_result_has_no_health_data(self, mocker):
+        """Test that a successful scrape returns only modem data."""
+
+        async def scrape():
+            return {"cable_modem_connection_status": "online", "cable_modem_downstream": [{"channel_id": 3}]}
+
+        update = self._update_function(mocker, scrape, {"ping_success": True, "ping_latency_ms": 3.0})
+
+        data = await update()
+
+        assert data["cable_modem_connection_status"] == "online"
+        assert data["_downstream_by_id"] == {3: {"channel_id": 3}}
+        assert "ping_latency_ms" not in data
+
+    @pytest.mark.asyncio
+    async def test_scrape_failure_reuses_health_result(self, mocker):
+        """Test that a failed scrape reports the modem offline while it answers health checks."""
+
+        async def scrape():
+            raise ConnectionError("login failed")
+
+        update = self._update_function(mocker, scrape, {"ping_success": False, "http_success": True})
+
+        data = await update()
+
+        assert data == {"cable_modem_connection_status": "offline"}
+
+    @pytest.mark.asyncio
+    async def test_scrape_failure_without_health_fails(self, mocker):
+        """Test that a failed scrape fails the update when the modem does not answer health checks either."""
+        from homeassistant.helpers.update_coordinator import UpdateFailed
+
+        async def scrape():
+            raise ConnectionError("timeout")
+
+        update = self._update_function(mocker, scrape, None)
+
+        with pytest.raises(UpdateFailed):
+            await update()
+
+
+class TestRequestedSections:
+    """Test deriving the parse result sections a poll needs from the enabled sensors."""
+
+    @staticmethod
+    def _sections(mocker, unique_ids, disabled=()):
+        from custom_components.cable_modem_monitor import _requested_sections
+
+        entries = [Mock(unique_id=f"entry1_cable_modem_{key}", disabled=key in disabled) for key in unique_ids]
+        mocker.patch("homeassistant.helpers.entity_registry.async_get")
+        mocker.patch("homeassistant.helpers.entity_registry.async_entries_for_config_entry", return_value=entries)
+        return _requested_sections(Mock(), Mock(entry_id="entry1"))
+
+    def test_everything_before_entities_exist(self, mocker):
+        """Test that the first poll asks for everything."""
+        assert self._sections(mocker, []) is None
+
+    def test_sections_of_enabled_sensors(self, mocker):
+        """Test that sections follow the enabled sensors, with downstream and system info always included."""
+        sections = self._sections(mocker, ["connection_status", "upstream_3_power"])
+        assert sections == frozenset({"downstream", "upstream", "system_info"})
+
+        sections = self._sections(mocker, ["connection_status", "upstream_3_power"], disabled={"upstream_3_power"})
+        assert sections == frozenset({"downstream", "system_info"})
@@ -116,6 +116,47 @@ class TestCoordinatorUnload:
         assert entry_id not in mock_hass.data["cable_modem_monitor"]
         assert result is True
 
+    @pytest.mark.asyncio
+    async def test_unload_last_entry_drops_poll_scheduler(self):
+        """Test that unloading the last entry releases the shared poll scheduler."""
+        from custom_components.cable_modem_monitor import async_unload_entry
+        from custom_components.cable_modem_monitor.const import DATA_POLL_SCHEDULER
+        from custom_components.cable_modem_monitor.core.poll_scheduler import PollScheduler
+
+        scheduler = PollScheduler()
+        scheduler.register("test_entry", 600)
+        mock_hass = Mock()
+        mock_hass.data = {"cable_modem_monitor": {"test_entry": Mock()}, DATA_POLL_SCHEDULER: scheduler}
+        mock_entry = Mock()
+        mock_entry.entry_id = "test_entry"
+        mock_hass.config_entries.async_unload_platforms = AsyncMock(return_value=True)
+        mock_hass.services.async_remove = Mock()
+
+        await async_unload_entry(mock_hass, mock_entry)
+
+        assert scheduler.entry_count == 0
+        assert DATA_POLL_SCHEDULER not in mock_hass.data
+
+    @pytest.mark.asyncio
+    async def test_unload_drops_health_coordinator(self):
+        """Test that unloading an entry forgets its health coordinator."""
+        from custom_components.cable_modem_monitor import async_unload_entry
+        from custom_components.cable_modem_monitor.const import DATA_HEALTH_COORDINATORS
+
+        health_coordinators = {"test_entry": Mock(), "other_entry": Mock()}
+        mock_hass = Mock()
+        mock_hass.data = {
+            "cable_modem_monitor": {"test_entry": Mock(), "other_entry": Mock()},
+            DATA_HEALTH_COORDINATORS: health_coordinators,
+        }
+        mock_entry = Mock()
+        mock_entry.entry_id = "test_entry"
+        mock_hass.config_entries.async_unload_platforms = AsyncMock(return_value=True)
+
+        await async_unload_entry(mock_hass, mock_entry)
+
+        assert list(health_coordinators) == ["other_entry"]
+
 
 class TestCoordinatorStateCheck:
     """Test coordinator handles different config entry states."""
@@ -296,6 +296,37 @@ async def test_diagnostics_basic_structure(mock_config_entry, mock_coordinator):
     assert diagnostics["modem_data"]["downstream_channel_count"] == 32
 
 
+@pytest.mark.asyncio
+async def test_diagnostics_do_not_poll_modem(mock_config_entry, mock_coordinator):
+    """Test that diagnostics report the last coordinator data without polling the modem."""
+    hass = Mock(spec=HomeAssistant)
+    hass.data = {DOMAIN: {mock_config_entry.entry_id: mock_coordinator}}
+
+    await async_get_config_entry_diagnostics(hass, mock_config_entry)
+
+    mock_coordinator.async_refresh.assert_not_called()
+    mock_coordinator.async_request_refresh.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_diagnostics_health_from_health_coordinator(mock_config_entry, mock_coordinator):
+    """Test that health data comes from the entry's health coordinator."""
+    from custom_components.cable_modem_monitor.const import DATA_HEALTH_COORDINATORS
+
+    health_coordinator = Mock(data={"health_status": "responsive", "ping_latency_ms": 3.0, "consecutive_failures": 0})
+    hass = Mock(spec=HomeAssistant)
+    hass.data = {
+        DOMAIN: {mock_config_entry.entry_id: mock_coordinator},
+        DATA_HEALTH_COORDINATORS: {mock_config_entry.entry_id: health_coordinator},
+    }
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, mock_config_entry)
+
+    assert diagnostics["modem_data"]["health_status"] == "responsive"
+    assert diagnostics["modem_data"]["ping_latency_ms"] == 3.0
+    assert diagnostics["modem_data"]["software_version"] == "3.0.1"
+
+
 @pytest.mark.asyncio
 async def test_diagnostics_includes_html_capture_not_expired(mock_config_entry, mock_coordinator):
     """Test diagnostics includes HTML capture when available and not expired."""
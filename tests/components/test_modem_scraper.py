@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
+
 import pytest
 
+from custom_components.cable_modem_monitor.core import document_cache
 from custom_components.cable_modem_monitor.core.modem_scraper import ModemScraper
 from custom_components.cable_modem_monitor.parsers.base_parser import ModemParser
 
@@ -424,7 +427,9 @@ class TestFallbackParserDetection:
 
         # Call _try_anonymous_probing
         attempted_parsers: list[type] = []
-        scraper._try_anonymous_probing(mock_circuit_breaker, attempted_parsers)
+        scraper._try_anonymous_probing(
+            "<html></html>", "http://192.168.100.1/", mock_circuit_breaker, attempted_parsers
+        )
 
         # Fallback parser should NOT have been tried
         assert mock_fallback_parser_class.can_parse.call_count == 0
@@ -538,3 +543,1089 @@ class TestFallbackParserDetection:
         # When both parsers are available, detection logic should try Motorola first
         # because it's excluded from phases 1-3 by manufacturer check
         # This test verifies the parsers themselves work correctly
+
+
+def _mock_aiohttp_session(responses):
+    """Create a mock aiohttp session whose get() returns responses keyed by URL.
+
+    Args:
+        responses: Mapping of URL -> (status, html) or (status, html, headers); URLs not listed raise ClientError
+    """
+    from unittest.mock import AsyncMock, MagicMock
+
+    import aiohttp
+
+    def get(url, **kwargs):
+        cm = MagicMock()
+        if url not in responses:
+            cm.__aenter__ = AsyncMock(side_effect=aiohttp.ClientConnectionError("refused"))
+        else:
+            status, html, *headers = responses[url]
+            response = MagicMock()
+            response.status = status
+            response.text = AsyncMock(return_value=html)
+            response.headers = headers[0] if headers else {}
+            response.cookies = {}
+            cm.__aenter__ = AsyncMock(return_value=response)
+        cm.__aexit__ = AsyncMock(return_value=None)
+        return cm
+
+    session = MagicMock()
+    session.get = MagicMock(side_effect=get)
+    return session
+
+
+class TestAsyncModemScraper:
+    """Test the event-loop fetch path of ModemScraper."""
+
+    @staticmethod
+    async def _run_inline(func, *args):
+        """Stand-in for hass.async_add_executor_job."""
+        return func(*args)
+
+    @pytest.mark.asyncio
+    async def test_async_fetch_falls_back_to_http(self):
+        """Test that the async fetch tries HTTPS first and falls back to HTTP."""
+        from custom_components.cable_modem_monitor.parsers.arris.sb6141 import ArrisSB6141Parser
+
+        scraper = ModemScraper("192.168.100.1", parser=ArrisSB6141Parser())
+        session = _mock_aiohttp_session({"http://192.168.100.1/cmSignalData.htm": (200, "<html>ok</html>")})
+
+        result = await scraper._async_fetch_data(session)
+
+        assert result is not None
+        html, url, parser_class = result
+        assert html == "<html>ok</html>"
+        assert url == "http://192.168.100.1/cmSignalData.htm"
+        assert parser_class is ArrisSB6141Parser
+        assert scraper.base_url == "http://192.168.100.1"
+        tried = [call.args[0] for call in session.get.call_args_list]
+        assert tried[0].startswith("https://")
+
+    @pytest.mark.asyncio
+    async def test_async_get_modem_data_offloads_parsing(self, mocker):
+        """Test that parsing runs through the supplied executor."""
+
+        class StatusParser(ModemParser):
+            name = "Status Parser"
+            manufacturer = "Test"
+            url_patterns = [{"path": "/status.html", "auth_method": "none"}]
+
+            @classmethod
+            def can_parse(cls, soup, url, html):
+                return True
+
+            def login(self, session, base_url, username, password):
+                return True
+
+            def parse(self, soup, session=None, base_url=None, context=None):
+                return {
+                    "downstream": [{"channel_id": 1, "corrected": 5, "uncorrected": 1}],
+                    "upstream": [],
+                    "system_info": {},
+                }
+
+        mock_parser = StatusParser()
+        mocker.spy(mock_parser, "parse")
+        scraper = ModemScraper("http://192.168.100.1", parser=mock_parser)
+        session = _mock_aiohttp_session({"http://192.168.100.1/status.html": (200, "<html></html>")})
+        executor = mocker.AsyncMock(side_effect=self._run_inline)
+
+        data = await scraper.async_get_modem_data(session, executor)
+
+        executor.assert_awaited_once()
+        mock_parser.parse.assert_called_once()
+        assert data["cable_modem_connection_status"] == "online"
+        assert data["cable_modem_total_corrected"] == 5
+
+    @pytest.mark.asyncio
+    async def test_async_get_modem_data_unreachable(self, mocker):
+        """Test that an unreachable modem never reaches the executor."""
+        from custom_components.cable_modem_monitor.parsers.arris.sb6141 import ArrisSB6141Parser
+
+        scraper = ModemScraper("192.168.100.1", parser=ArrisSB6141Parser())
+        executor = mocker.AsyncMock(side_effect=self._run_inline)
+
+        data = await scraper.async_get_modem_data(_mock_aiohttp_session({}), executor)
+
+        assert data["cable_modem_connection_status"] == "unreachable"
+        executor.assert_not_awaited()
+
+
+class TestConcurrentProbing:
+    """Test parallel URL/protocol probing."""
+
+    @pytest.fixture
+    def parser_class(self):
+        """Parser class with three candidate URLs."""
+
+        class ThreePageParser(ModemParser):
+            name = "Three Page Parser"
+            manufacturer = "Test"
+            url_patterns = [
+                {"path": "/a.html", "auth_method": "none"},
+                {"path": "/b.html", "auth_method": "none"},
+                {"path": "/c.html", "auth_method": "none"},
+            ]
+
+            @classmethod
+            def can_parse(cls, soup, url, html):
+                return True
+
+            def login(self, session, base_url, username, password):
+                return True
+
+            def parse(self, soup, session=None, base_url=None, context=None):
+                return {"downstream": [], "upstream": [], "system_info": {}}
+
+        return ThreePageParser
+
+    def test_protocols_interleaved(self, parser_class):
+        """Test that HTTPS and HTTP candidates race per URL in concurrent mode."""
+        scraper = ModemScraper("192.168.100.1", parser=parser_class(), probe_concurrency=4)
+
+        candidates = scraper._build_probe_candidates(scraper._get_url_patterns_to_try())
+
+        assert [c[0] for c in candidates[:3]] == [
+            "https://192.168.100.1/a.html",
+            "http://192.168.100.1/a.html",
+            "https://192.168.100.1/b.html",
+        ]
+
+    def test_serial_mode_keeps_protocol_order(self, parser_class):
+        """Test that serial mode still exhausts HTTPS before HTTP."""
+        scraper = ModemScraper("192.168.100.1", parser=parser_class())
+
+        candidates = scraper._build_probe_candidates(scraper._get_url_patterns_to_try())
+
+        assert [c[0].split("://")[0] for c in candidates] == ["https"] * 3 + ["http"] * 3
+
+    def test_first_success_in_priority_order(self, mocker, parser_class):
+        """Test that a faster lower-priority success does not beat a slower higher-priority one."""
+        import threading
+
+        scraper = ModemScraper("http://192.168.100.1", parser=parser_class(), probe_concurrency=4)
+        c_answered = threading.Event()
+
+        def fake_get(url, **kwargs):
+            response = mocker.Mock()
+            response.text = url
+            if url.endswith("/b.html"):
+                # Answer only after the lower-priority URL has already succeeded
+                c_answered.wait(timeout=5)
+                response.status_code = 200
+            elif url.endswith("/c.html"):
+                response.status_code = 200
+                c_answered.set()
+            else:
+                response.status_code = 404
+            return response
+
+        # Concurrent probes send their requests with sessions of their own
+        mocker.patch("requests.Session.get", side_effect=fake_get)
+
+        result = scraper._fetch_data()
+
+        assert result is not None
+        assert result[1] == "http://192.168.100.1/b.html"
+        assert scraper.last_successful_url == "http://192.168.100.1/b.html"
+
+    def test_known_good_url_probed_alone(self, mocker, parser_class):
+        """Test that a previously working URL is tried before fanning out."""
+        scraper = ModemScraper("http://192.168.100.1", parser=parser_class(), probe_concurrency=4)
+        scraper.last_successful_url = "http://192.168.100.1/c.html"
+
+        response = mocker.Mock(status_code=200, text="<html></html>")
+        mock_get = mocker.patch.object(scraper.session, "get", return_value=response)
+
+        result = scraper._fetch_data()
+
+        assert result is not None
+        assert result[1] == "http://192.168.100.1/c.html"
+        assert mock_get.call_count == 1
+
+    def test_all_candidates_fail(self, mocker, parser_class):
+        """Test that concurrent probing returns None when nothing answers 200."""
+        scraper = ModemScraper("192.168.100.1", parser=parser_class(), probe_concurrency=4)
+        mock_get = mocker.patch("requests.Session.get", return_value=mocker.Mock(status_code=404))
+
+        assert scraper._fetch_data() is None
+        assert mock_get.call_count == 6
+
+    def test_losing_candidate_does_not_touch_session_state(self, mocker, parser_class):
+        """Test that a lower-priority 401 does not clear the login the winning URL relies on."""
+        import threading
+
+        scraper = ModemScraper("http://192.168.100.1", parser=parser_class(), probe_concurrency=4)
+        scraper._authenticated = True
+        c_answered = threading.Event()
+
+        def fake_get(url, **kwargs):
+            if url.endswith("/c.html"):
+                c_answered.set()
+                return mocker.Mock(status_code=401, text="")
+            c_answered.wait(timeout=5)
+            return mocker.Mock(status_code=200 if url.endswith("/a.html") else 404, text=url, headers={})
+
+        mocker.patch("requests.Session.get", side_effect=fake_get)
+
+        result = scraper._fetch_data()
+
+        assert result is not None
+        assert result[1] == "http://192.168.100.1/a.html"
+        assert scraper._authenticated is True
+
+    def test_only_winner_cookies_reach_session(self, mocker, parser_class):
+        """Test that concurrent probes use their own sessions and only the winner's cookies are kept."""
+        import threading
+
+        scraper = ModemScraper("http://192.168.100.1", parser=parser_class(), probe_concurrency=4)
+        scraper.session.cookies.set("login", "kept")
+        c_answered = threading.Event()
+        probe_sessions = []
+
+        def fake_get(session, url, **kwargs):
+            probe_sessions.append(session)
+            assert session.cookies.get("login") == "kept"
+            if url.endswith("/c.html"):
+                session.cookies.set("login", "loser")
+                c_answered.set()
+                return mocker.Mock(status_code=404, text="")
+            c_answered.wait(timeout=5)
+            if url.endswith("/a.html"):
+                session.cookies.set("sid", "winner")
+                return mocker.Mock(status_code=200, text=url, headers={})
+            return mocker.Mock(status_code=404, text="")
+
+        mocker.patch("requests.Session.get", autospec=True, side_effect=fake_get)
+
+        result = scraper._fetch_data()
+
+        assert result is not None
+        assert result[1] == "http://192.168.100.1/a.html"
+        assert scraper.session not in probe_sessions
+        assert scraper.session.cookies.get("login") == "kept"
+        assert scraper.session.cookies.get("sid") == "winner"
+
+    @pytest.mark.asyncio
+    async def test_async_first_success_in_priority_order(self, parser_class):
+        """Test that the async prober also resolves in priority order."""
+        scraper = ModemScraper("192.168.100.1", parser=parser_class(), probe_concurrency=4)
+        session = _mock_aiohttp_session(
+            {
+                "http://192.168.100.1/b.html": (200, "b"),
+                "https://192.168.100.1/c.html": (200, "c"),
+            }
+        )
+
+        result = await scraper._async_fetch_data(session)
+
+        assert result is not None
+        assert result[0] == "b"
+        assert scraper.base_url == "http://192.168.100.1"
+
+    @pytest.mark.asyncio
+    async def test_async_losing_candidate_does_not_touch_session_state(self, parser_class):
+        """Test that a lower-priority 401 answered before the winner is not recorded."""
+        scraper = ModemScraper("192.168.100.1", parser=parser_class(), probe_concurrency=4)
+        scraper._authenticated = True
+        session = _mock_aiohttp_session(
+            {
+                "http://192.168.100.1/a.html": (200, "a"),
+                "https://192.168.100.1/c.html": (401, ""),
+            }
+        )
+
+        result = await scraper._async_fetch_data(session)
+
+        assert result is not None
+        assert result[0] == "a"
+        assert scraper._authenticated is True
+
+
+class TestSessionReuse:
+    """Test reuse of an authenticated session across polls."""
+
+    STATUS_HTML = "<html><table><tr><td>Downstream</td></tr></table></html>"
+    LOGIN_HTML = '<html><form><input type="password" name="loginPassword"></form></html>'
+
+    @pytest.fixture
+    def parser(self, mocker):
+        """Form-auth parser whose login and parse calls are recorded."""
+
+        class FormParser(ModemParser):
+            name = "Form Parser"
+            manufacturer = "Test"
+            url_patterns = [{"path": "/status.html", "auth_method": "form"}]
+
+            @classmethod
+            def can_parse(cls, soup, url, html):
+                return True
+
+            def login(self, session, base_url, username, password):
+                return True, None
+
+            def parse(self, soup, session=None, base_url=None, context=None):
+                return {"downstream": [{"channel_id": 1}], "upstream": [], "system_info": {}}
+
+        parser = FormParser()
+        mocker.spy(parser, "login")
+        mocker.spy(parser, "parse")
+        return parser
+
+    def test_login_skipped_on_second_poll(self, parser):
+        """Test that a still-valid session is not logged in again."""
+        scraper = ModemScraper("http://192.168.100.1", "admin", "pw", parser=parser)
+
+        scraper._process_fetched_data(self.STATUS_HTML, "http://192.168.100.1/status.html", None)
+        data = scraper._process_fetched_data(self.STATUS_HTML, "http://192.168.100.1/status.html", None)
+
+        assert parser.login.call_count == 1
+        assert data["cable_modem_connection_status"] == "online"
+
+    def test_login_page_triggers_relogin(self, parser):
+        """Test that being served the login form forces a new login."""
+        scraper = ModemScraper("http://192.168.100.1", "admin", "pw", parser=parser)
+
+        scraper._process_fetched_data(self.STATUS_HTML, "http://192.168.100.1/status.html", None)
+        scraper._process_fetched_data(self.LOGIN_HTML, "http://192.168.100.1/status.html", None)
+
+        assert parser.login.call_count == 2
+
+    def test_auth_failure_in_parse_triggers_relogin(self, mocker, parser):
+        """Test that a parse reporting an auth failure logs in again, refetches and re-parses once."""
+        scraper = ModemScraper("http://192.168.100.1", "admin", "pw", parser=parser)
+        scraper._process_fetched_data(self.STATUS_HTML, "http://192.168.100.1/status.html", None)
+
+        parser.parse.side_effect = [
+            {"downstream": [], "upstream": [], "system_info": {}, "_auth_failure": True},
+            {"downstream": [{"channel_id": 1}], "upstream": [], "system_info": {}},
+        ]
+        mock_get = mocker.patch.object(
+            scraper.session, "get", return_value=mocker.Mock(status_code=200, text=self.STATUS_HTML, headers={})
+        )
+        data = scraper._process_fetched_data(self.STATUS_HTML, "http://192.168.100.1/status.html", None)
+
+        assert parser.login.call_count == 2
+        assert mock_get.call_args.args[0] == "http://192.168.100.1/status.html"
+        assert data["cable_modem_downstream_channel_count"] == 1
+
+    def test_relogin_parses_refetched_page(self, mocker, parser):
+        """Test that after an expired session the data page is fetched again instead of re-parsing the login form."""
+        scraper = ModemScraper("http://192.168.100.1", "admin", "pw", parser=parser)
+        scraper._process_fetched_data(self.STATUS_HTML, "http://192.168.100.1/status.html", None)
+
+        def parse(soup, session=None, base_url=None, context=None):
+            if soup.find("input", {"type": "password"}):
+                return {"downstream": [], "upstream": [], "system_info": {}, "_login_page_detected": True}
+            return {"downstream": [{"channel_id": 1}], "upstream": [], "system_info": {}}
+
+        parser.parse.side_effect = parse
+        mocker.patch.object(
+            scraper.session, "get", return_value=mocker.Mock(status_code=200, text=self.STATUS_HTML, headers={})
+        )
+        # The session cookie expired between polls, but the page does not show a login form until parsed
+        scraper._authenticated = True
+        mocker.patch.object(scraper, "_can_reuse_session", return_value=True)
+
+        data = scraper._process_fetched_data(self.LOGIN_HTML, "http://192.168.100.1/status.html", None)
+
+        assert parser.login.call_count == 2
+        assert data["cable_modem_connection_status"] == "online"
+
+    def test_relogin_refetch_failure_is_unreachable(self, mocker, parser):
+        """Test that a failed refetch after logging in again reports the modem unreachable."""
+        scraper = ModemScraper("http://192.168.100.1", "admin", "pw", parser=parser)
+        scraper._process_fetched_data(self.STATUS_HTML, "http://192.168.100.1/status.html", None)
+
+        parser.parse.side_effect = [{"downstream": [], "upstream": [], "system_info": {}, "_auth_failure": True}]
+        mocker.patch.object(scraper.session, "get", return_value=mocker.Mock(status_code=500, text=""))
+
+        data = scraper._process_fetched_data(self.STATUS_HTML, "http://192.168.100.1/status.html", None)
+
+        assert data["cable_modem_connection_status"] == "unreachable"
+
+    def test_unauthorized_response_clears_session(self, mocker, parser):
+        """Test that a 401 during fetch marks the session as expired."""
+        scraper = ModemScraper("http://192.168.100.1", "admin", "pw", parser=parser)
+        scraper._authenticated = True
+        mocker.patch.object(scraper.session, "get", return_value=mocker.Mock(status_code=401))
+
+        scraper._fetch_data()
+
+        assert scraper._authenticated is False
+
+    def test_no_credentials_never_reuses(self, parser):
+        """Test that anonymous modems go through the login hook every poll."""
+        scraper = ModemScraper("http://192.168.100.1", parser=parser)
+
+        scraper._process_fetched_data(self.STATUS_HTML, "http://192.168.100.1/status.html", None)
+
+        assert scraper._authenticated is False
+
+
+class TestPasswordEncodingMemory:
+    """Test that the winning password encoding is carried across logins."""
+
+    def test_seeds_parser_and_reports_encoding(self, mocker):
+        """Test that the scraper seeds the parser and exposes the result in detection info."""
+        from custom_components.cable_modem_monitor.parsers.motorola.generic import MotorolaGenericParser
+
+        parser = MotorolaGenericParser()
+        seen = {}
+
+        def fake_login(session, base_url, username, password):
+            seen["encoding"] = parser.password_encoding
+            return True, None
+
+        mocker.patch.object(parser, "login", side_effect=fake_login)
+        scraper = ModemScraper("http://192.168.100.1", "admin", "pw", parser=parser, password_encoding="base64")
+
+        scraper._login()
+
+        assert seen["encoding"] == "base64"
+        assert scraper.get_detection_info()["password_encoding"] == "base64"
+
+
+class TestDocumentReuse:
+    """Test that each fetched page is requested and parsed once per poll."""
+
+    def test_detection_and_parse_share_root_page(self, mocker):
+        """Test that heuristics reuse the fetched root page and parse receives the detection soup."""
+        seen_soups = []
+
+        class SkippedParser(ModemParser):
+            name = "Skipped Parser"
+            manufacturer = "Other"
+            url_patterns = [{"path": "/", "auth_method": "none"}]
+
+            @classmethod
+            def can_parse(cls, soup, url, html):
+                seen_soups.append(soup)
+                return False
+
+            def login(self, session, base_url, username, password):
+                return True
+
+            def parse(self, soup, session=None, base_url=None, context=None):
+                return {}
+
+        class RootParser(SkippedParser):
+            name = "Root Parser"
+            manufacturer = "Test"
+
+            @classmethod
+            def can_parse(cls, soup, url, html):
+                seen_soups.append(soup)
+                return True
+
+            def parse(self, soup, session=None, base_url=None, context=None):
+                seen_soups.append(soup)
+                return {"downstream": [{"channel_id": 1}], "upstream": [], "system_info": {}}
+
+        # SkippedParser owns the first candidate URL, so detection falls through to the heuristics phase
+        scraper = ModemScraper("http://192.168.100.1", parser=[SkippedParser, RootParser])
+        response = mocker.Mock(status_code=200, text="<html><title>Test Modem</title></html>")
+        get = mocker.patch.object(scraper.session, "get", return_value=response)
+        make_soup = mocker.spy(document_cache, "make_soup")
+
+        data = scraper.get_modem_data()
+
+        assert data["cable_modem_connection_status"] == "online"
+        root_gets = [c for c in get.call_args_list if c.args[0] == "http://192.168.100.1/"]
+        assert len(root_gets) == 1
+        assert make_soup.call_count == 1
+        assert all(soup is seen_soups[0] for soup in seen_soups)
+
+
+class TestConditionalFetch:
+    """Test conditional requests and reuse of parsed data for unchanged pages."""
+
+    URL = "http://192.168.100.1/status.html"
+    STATUS_HTML = "<html><table><tr><td>Downstream</td></tr></table></html>"
+
+    @pytest.fixture
+    def parser(self, mocker):
+        """Single-page parser whose parse calls are recorded."""
+
+        class StatusParser(ModemParser):
+            name = "Status Parser"
+            manufacturer = "Test"
+            url_patterns = [{"path": "/status.html", "auth_method": "none"}]
+            single_page = True
+
+            @classmethod
+            def can_parse(cls, soup, url, html):
+                return True
+
+            def login(self, session, base_url, username, password):
+                return True
+
+            def parse(self, soup, session=None, base_url=None, context=None):
+                return {"downstream": [{"channel_id": 1, "power": 3.0}], "upstream": [], "system_info": {}}
+
+        parser = StatusParser()
+        mocker.spy(parser, "parse")
+        return parser
+
+    @staticmethod
+    def _response(mocker, status_code, text="", headers=None):
+        return mocker.Mock(status_code=status_code, text=text, headers=headers or {})
+
+    def test_conditional_request_after_etag(self, mocker, parser):
+        """Test that a remembered ETag is sent and a 304 reuses the previous page and data."""
+        scraper = ModemScraper("http://192.168.100.1", parser=parser)
+        get = mocker.patch.object(
+            scraper.session,
+            "get",
+            side_effect=[
+                self._response(mocker, 200, self.STATUS_HTML, {"ETag": '"abc"'}),
+                self._response(mocker, 304),
+            ],
+        )
+
+        first = scraper.get_modem_data()
+        second = scraper.get_modem_data()
+
+        assert get.call_args_list[0].kwargs["headers"] == {}
+        assert get.call_args_list[1].kwargs["headers"] == {"If-None-Match": '"abc"'}
+        assert second == first
+        assert parser.parse.call_count == 1
+
+    def test_no_validators_no_conditional_headers(self, mocker, parser):
+        """Test that servers without ETag/Last-Modified get plain requests."""
+        scraper = ModemScraper("http://192.168.100.1", parser=parser)
+        get = mocker.patch.object(scraper.session, "get", return_value=self._response(mocker, 200, self.STATUS_HTML))
+
+        scraper.get_modem_data()
+        scraper.get_modem_data()
+
+        assert get.call_args_list[1].kwargs["headers"] == {}
+
+    def test_unchanged_page_skips_parse(self, mocker, parser):
+        """Test that an identical page body reuses the previous result without parsing."""
+        scraper = ModemScraper("http://192.168.100.1", parser=parser)
+        mocker.patch.object(scraper.session, "get", return_value=self._response(mocker, 200, self.STATUS_HTML))
+
+        first = scraper.get_modem_data()
+        first["cable_modem_downstream"][0]["power"] = 99.0
+        second = scraper.get_modem_data()
+
+        assert parser.parse.call_count == 1
+        assert second["cable_modem_downstream"][0]["power"] == 3.0
+
+    def test_changed_page_is_parsed(self, mocker, parser):
+        """Test that a changed page body is parsed again."""
+        scraper = ModemScraper("http://192.168.100.1", parser=parser)
+        mocker.patch.object(
+            scraper.session,
+            "get",
+            side_effect=[
+                self._response(mocker, 200, self.STATUS_HTML),
+                self._response(mocker, 200, self.STATUS_HTML.replace("Downstream", "Downstream 2")),
+            ],
+        )
+
+        scraper.get_modem_data()
+        scraper.get_modem_data()
+
+        assert parser.parse.call_count == 2
+
+    def test_multi_page_parser_always_parses(self, mocker, parser):
+        """Test that parsers fetching extra pages are not short-circuited."""
+        parser.single_page = False
+        scraper = ModemScraper("http://192.168.100.1", parser=parser)
+        mocker.patch.object(scraper.session, "get", return_value=self._response(mocker, 200, self.STATUS_HTML))
+
+        scraper.get_modem_data()
+        scraper.get_modem_data()
+
+        assert parser.parse.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_async_not_modified(self, mocker, parser):
+        """Test that the async fetch sends validators and serves the remembered page on 304."""
+        scraper = ModemScraper("http://192.168.100.1", parser=parser)
+        scraper._remember_page(self.URL, {"Last-Modified": "Sat, 17 Oct 2026 10:00:00 GMT"}, self.STATUS_HTML)
+        session = _mock_aiohttp_session({self.URL: (304, "")})
+
+        result = await scraper._async_fetch_data(session)
+
+        assert result is not None
+        assert result[0] == self.STATUS_HTML
+        headers = session.get.call_args.kwargs["headers"]
+        assert headers == {"If-Modified-Since": "Sat, 17 Oct 2026 10:00:00 GMT"}
+
+
+class TestFingerprintRanking:
+    """Test that fingerprint candidates are tried before the remaining parsers."""
+
+    def test_fingerprint_candidate_tried_first(self, mocker):
+        """Test that the parser whose fingerprint hits the page is tested before earlier parsers."""
+        from custom_components.cable_modem_monitor.core.modem_scraper import ModemScraper
+
+        def parser_class(name, fingerprints, matches):
+            mock_class = mocker.Mock()
+            mock_class.name = name
+            mock_class.manufacturer = "TestBrand"
+            mock_class.priority = 50
+            mock_class.fingerprints = fingerprints
+            mock_class.can_parse.return_value = matches
+            return mock_class
+
+        unrelated = parser_class("Unrelated", {"body": ["ZZ-9"]}, False)
+        matching = parser_class("Matching", {"title": ["Acme X100"]}, True)
+        scraper = ModemScraper("192.168.100.1", parser=[unrelated, matching])
+        mocker.patch(
+            "custom_components.cable_modem_monitor.core.modem_scraper.ParserHeuristics.get_likely_parsers",
+            return_value=[unrelated, matching],
+        )
+        circuit_breaker = mocker.Mock()
+        circuit_breaker.should_continue.return_value = True
+        html = "<html><title>Acme X100</title></html>"
+
+        parser = scraper._try_prioritized_parsers(None, "http://192.168.100.1/", html, None, circuit_breaker, [])
+
+        assert parser is matching.return_value
+        unrelated.can_parse.assert_not_called()
+
+    def test_fingerprint_candidate_probed_first(self, mocker):
+        """Test that anonymous probing starts with the parser whose fingerprint hits the fetched page."""
+        from custom_components.cable_modem_monitor.core.modem_scraper import ModemScraper
+
+        def parser_class(name, fingerprints):
+            mock_class = mocker.Mock()
+            mock_class.name = name
+            mock_class.manufacturer = "TestBrand"
+            mock_class.priority = 50
+            mock_class.fingerprints = fingerprints
+            mock_class.can_parse.return_value = True
+            return mock_class
+
+        unrelated = parser_class("Unrelated", {"body": ["ZZ-9"]})
+        matching = parser_class("Matching", {"title": ["Acme X100"]})
+        scraper = ModemScraper("192.168.100.1", parser=[unrelated, matching])
+        probe = mocker.patch(
+            "custom_components.cable_modem_monitor.core.modem_scraper.ParserHeuristics.check_anonymous_access",
+            return_value=("<html></html>", "http://192.168.100.1/public.html"),
+        )
+        circuit_breaker = mocker.Mock()
+        circuit_breaker.should_continue.return_value = True
+        html = "<html><title>Acme X100</title></html>"
+
+        parser = scraper._try_anonymous_probing(html, "http://192.168.100.1/", circuit_breaker, [])
+
+        assert parser is matching.return_value
+        assert [call.args[1] for call in probe.call_args_list] == [matching]
+
+
+class TestStreamingPoll:
+    """Test polls that stream the known data page through a parser's declared targets."""
+
+    URL = "http://192.168.100.1/status.html"
+    STATUS_HTML = (
+        "<html><body><table><tr><th>Downstream</th></tr>"
+        "<tr><td>1</td><td>3.0</td></tr><tr><td>2</td><td>2.5</td></tr></table>"
+        "<table><tr><td>Event Log</td></tr></table></body></html>"
+    )
+
+    @pytest.fixture
+    def parser(self, mocker):
+        """Parser that reads the downstream table from streamed rows."""
+        from custom_components.cable_modem_monitor.core.auth_config import NoAuthConfig
+        from custom_components.cable_modem_monitor.lib.html_stream import StreamTarget
+
+        class StreamingParser(ModemParser):
+            name = "Streaming Parser"
+            manufacturer = "Test"
+            auth_config = NoAuthConfig()
+            url_patterns = [{"path": "/status.html", "auth_method": "none"}]
+            stream_targets = {"downstream": StreamTarget("table", "Downstream")}
+
+            @classmethod
+            def can_parse(cls, soup, url, html):
+                return True
+
+            def login(self, session, base_url, username, password):
+                return True
+
+            def parse(self, soup, session=None, base_url=None, context=None):
+                return {"downstream": [], "upstream": [], "system_info": {}}
+
+            def parse_rows(self, rows, context=None):
+                downstream = [
+                    {"channel_id": cells[0], "power": float(cells[1])} for _, cells in rows if len(cells) == 2
+                ]
+                return {"downstream": downstream, "upstream": [], "system_info": {}}
+
+        parser = StreamingParser()
+        mocker.spy(parser, "parse")
+        return parser
+
+    @staticmethod
+    def _response(mocker, html, status_code=200):
+        response = mocker.Mock(status_code=status_code, text=html, headers={}, encoding="utf-8")
+        response.iter_content.return_value = [html.encode()]
+        return response
+
+    def test_known_page_is_streamed(self, mocker, parser):
+        """Test that a poll after detection streams the page and skips the DOM parse."""
+        scraper = ModemScraper("http://192.168.100.1", parser=parser)
+        scraper.last_successful_url = self.URL
+        response = self._response(mocker, self.STATUS_HTML)
+        get = mocker.patch.object(scraper.session, "get", return_value=response)
+
+        data = scraper.get_modem_data()
+
+        get.assert_called_once_with(self.URL, timeout=10, verify=scraper.verify_ssl, stream=True)
+        response.close.assert_called_once()
+        parser.parse.assert_not_called()
+        assert data["cable_modem_connection_status"] == "online"
+        assert [ch["power"] for ch in data["cable_modem_downstream"]] == [3.0, 2.5]
+
+    def test_missing_target_falls_back_to_full_fetch(self, mocker, parser):
+        """Test that a page without the declared tables is fetched and parsed normally."""
+        scraper = ModemScraper("http://192.168.100.1", parser=parser)
+        scraper.last_successful_url = self.URL
+        other_page = "<html><body><form>Login</form></body></html>"
+        get = mocker.patch.object(scraper.session, "get", return_value=self._response(mocker, other_page))
+
+        scraper.get_modem_data()
+
+        assert get.call_args_list[0].kwargs.get("stream") is True
+        assert get.call_count >= 2
+        assert "stream" not in get.call_args_list[-1].kwargs
+        parser.parse.assert_called_once()
+
+    def test_capture_disables_streaming(self, mocker, parser):
+        """Test that diagnostics capture always fetches whole pages."""
+        scraper = ModemScraper("http://192.168.100.1", parser=parser)
+        scraper.last_successful_url = self.URL
+        # Capture mode swaps in a CapturingSession (a requests.Session) for the poll
+        get = mocker.patch("requests.Session.get", return_value=self._response(mocker, self.STATUS_HTML))
+
+        scraper.get_modem_data(capture_raw=True)
+
+        assert all("stream" not in call.kwargs for call in get.call_args_list)
+        parser.parse.assert_called_once()
+
+    def test_requires_login_session(self, parser):
+        """Test that pages behind a login are only streamed while a session is held."""
+        from custom_components.cable_modem_monitor.core.auth_config import BasicAuthConfig
+
+        parser.auth_config = BasicAuthConfig()
+        scraper = ModemScraper("http://192.168.100.1", "admin", "pw", parser=parser)
+        scraper.last_successful_url = self.URL
+
+        assert not scraper._can_stream_poll()
+        scraper._authenticated = True
+        assert scraper._can_stream_poll()
+
+    def test_streamed_poll_gets_static_info_and_sections(self, mocker, parser):
+        """Test that streamed results go through the same static info handling as full parses."""
+        from custom_components.cable_modem_monitor.parsers.base_parser import SECTION_DOWNSTREAM
+
+        seen = []
+
+        def parse_rows(rows, context=None):
+            seen.append((context.refresh_static_info, context.requested_sections))
+            list(rows)
+            system_info = {"system_uptime": "1 days 00h:00m:00s"}
+            if context.refresh_static_info:
+                system_info["software_version"] = "1.0"
+            return {"downstream": [{"channel_id": 1}], "upstream": [], "system_info": system_info}
+
+        parser.static_info_keys = frozenset({"software_version"})
+        parser.parse_rows = parse_rows
+        scraper = ModemScraper("http://192.168.100.1", parser=parser)
+        scraper.last_successful_url = self.URL
+        scraper.requested_sections = frozenset({SECTION_DOWNSTREAM})
+        mocker.patch.object(
+            scraper.session, "get", side_effect=lambda *a, **k: self._response(mocker, self.STATUS_HTML)
+        )
+
+        scraper.get_modem_data()
+        data = scraper.get_modem_data()
+
+        assert seen == [(True, frozenset({SECTION_DOWNSTREAM})), (False, frozenset({SECTION_DOWNSTREAM}))]
+        assert data["cable_modem_software_version"] == "1.0"
+
+    def test_parser_with_secondary_pages_is_not_streamed(self, parser):
+        """Test that parsers reading more than the data page always get a full parse."""
+        scraper = ModemScraper("http://192.168.100.1", parser=parser)
+        scraper.last_successful_url = self.URL
+        parser.secondary_pages = ("/other.html",)
+
+        assert not scraper._can_stream_poll()
+
+
+class TestSecondaryPagePrefetch:
+    """Test concurrent prefetching of the pages a parser declares in secondary_pages."""
+
+    URL = "http://192.168.100.1/index.htm"
+    DOCSIS_URL = "http://192.168.100.1/DocsisStatus.htm"
+    INDEX_HTML = "<html><body>Index</body></html>"
+    DOCSIS_HTML = "<html><body>Channels</body></html>"
+
+    @pytest.fixture
+    def parser(self):
+        """Parser that reads channel data from a secondary page."""
+        from custom_components.cable_modem_monitor.core.auth_config import NoAuthConfig
+
+        class MultiPageParser(ModemParser):
+            name = "Multi Page Parser"
+            manufacturer = "Test"
+            auth_config = NoAuthConfig()
+            url_patterns = [{"path": "/index.htm", "auth_method": "none"}]
+            secondary_pages = ("/DocsisStatus.htm",)
+
+            @classmethod
+            def can_parse(cls, soup, url, html):
+                return True
+
+            def login(self, session, base_url, username, password):
+                return True
+
+            def parse(self, soup, session=None, base_url=None, context=None):
+                self.seen_pages = dict(context.pages)
+                return {"downstream": [], "upstream": [], "system_info": {}}
+
+        return MultiPageParser()
+
+    @staticmethod
+    async def _run_inline(func, *args):
+        """Stand-in for hass.async_add_executor_job."""
+        return func(*args)
+
+    def _scraper(self, parser):
+        """Scraper for an already detected modem."""
+        scraper = ModemScraper("http://192.168.100.1", parser=parser)
+        scraper.last_successful_url = self.URL
+        return scraper
+
+    @pytest.mark.asyncio
+    async def test_secondary_page_fetched_alongside_data_page(self, mocker, parser):
+        """Test that the secondary page request is in flight while the data page is fetched."""
+        scraper = self._scraper(parser)
+        session = _mock_aiohttp_session({self.DOCSIS_URL: (200, self.DOCSIS_HTML)})
+        docsis_requested = asyncio.Event()
+        get = session.get.side_effect
+
+        def tracking_get(url, **kwargs):
+            docsis_requested.set()
+            return get(url, **kwargs)
+
+        session.get.side_effect = tracking_get
+
+        async def fetch_data(_session):
+            # Only returns promptly if the secondary page was requested concurrently
+            await asyncio.wait_for(docsis_requested.wait(), timeout=5)
+            return self.INDEX_HTML, self.URL, type(parser)
+
+        mocker.patch.object(scraper, "_async_fetch_data", side_effect=fetch_data)
+
+        await scraper.async_get_modem_data(session, self._run_inline)
+
+        session.get.assert_called_once()
+        assert session.get.call_args.args[0] == self.DOCSIS_URL
+        assert parser.seen_pages == {"/DocsisStatus.htm": self.DOCSIS_HTML}
+
+    def test_blocking_poll_does_not_prefetch(self, mocker, parser):
+        """Test that the blocking poll leaves secondary pages to the parser."""
+        scraper = self._scraper(parser)
+        get = mocker.patch.object(
+            scraper.session, "get", return_value=mocker.Mock(status_code=200, text=self.INDEX_HTML, headers={})
+        )
+
+        scraper.get_modem_data()
+
+        assert [call.args[0] for call in get.call_args_list] == [self.URL]
+        assert parser.seen_pages == {}
+
+    @pytest.mark.asyncio
+    async def test_login_form_not_passed_to_parser(self, parser):
+        """Test that a prefetched page that turned out to be a login form is left for the parser to fetch."""
+        login_form = '<html><form><input type="password" name="pw"></form></html>'
+        scraper = self._scraper(parser)
+        session = _mock_aiohttp_session({self.DOCSIS_URL: (200, login_form)})
+
+        assert await scraper._async_prefetch_pages(session) == {}
+
+    @pytest.mark.asyncio
+    async def test_failed_page_not_passed_to_parser(self, parser):
+        """Test that error responses and failed requests are left for the parser to fetch."""
+        scraper = self._scraper(parser)
+
+        assert await scraper._async_prefetch_pages(_mock_aiohttp_session({self.DOCSIS_URL: (404, "")})) == {}
+        assert await scraper._async_prefetch_pages(_mock_aiohttp_session({})) == {}
+
+    @pytest.mark.asyncio
+    async def test_requires_login_session(self, parser):
+        """Test that pages behind a login are not prefetched before the session holds one."""
+        from custom_components.cable_modem_monitor.core.auth_config import BasicAuthConfig
+
+        parser.auth_config = BasicAuthConfig()
+        scraper = ModemScraper("http://192.168.100.1", "admin", "pw", parser=parser)
+        scraper.session.auth = ("admin", "pw")
+        session = _mock_aiohttp_session({self.DOCSIS_URL: (200, self.DOCSIS_HTML)})
+
+        assert await scraper._async_prefetch_pages(session) == {}
+        session.get.assert_not_called()
+
+        scraper._authenticated = True
+        assert await scraper._async_prefetch_pages(session) == {"/DocsisStatus.htm": self.DOCSIS_HTML}
+        assert session.get.call_args.kwargs["auth"] is not None
+
+    def test_pages_only_used_by_first_parse(self, mocker, parser):
+        """Test that a parse after logging in again does not get the pages fetched before it."""
+        scraper = self._scraper(parser)
+        pages = {"/DocsisStatus.htm": self.DOCSIS_HTML}
+
+        scraper._process_fetched_data(self.INDEX_HTML, self.URL, None, False, pages)
+        assert parser.seen_pages == pages
+
+        scraper._parse_data(self.INDEX_HTML)
+        assert parser.seen_pages == {}
+
+
+class TestStaticInfo:
+    """Test caching of the system_info keys a parser declares static."""
+
+    HTML = "<html><body>Status</body></html>"
+
+    @pytest.fixture
+    def parser(self):
+        """Parser that reads its software version only when asked to."""
+
+        class StaticInfoParser(ModemParser):
+            name = "Static Info Parser"
+            manufacturer = "Test"
+            static_info_keys = frozenset({"software_version"})
+            static_info_ttl = 3600
+            uptime = "1 days 00h:00m:00s"
+
+            @classmethod
+            def can_parse(cls, soup, url, html):
+                return True
+
+            def login(self, session, base_url, username, password):
+                return True
+
+            def parse(self, soup, session=None, base_url=None, context=None):
+                self.refreshed = context.refresh_static_info
+                system_info = {"system_uptime": self.uptime}
+                if context.refresh_static_info:
+                    system_info["software_version"] = "1.0"
+                return {"downstream": [], "upstream": [], "system_info": system_info}
+
+        return StaticInfoParser()
+
+    @pytest.fixture
+    def clock(self, mocker):
+        """Controllable monotonic clock of the scraper module."""
+        return mocker.patch(
+            "custom_components.cable_modem_monitor.core.modem_scraper.time.monotonic", return_value=1000.0
+        )
+
+    def test_cached_until_ttl_expires(self, parser, clock):
+        """Test that static info is read on the first poll and again only after the TTL."""
+        scraper = ModemScraper("http://192.168.100.1", parser=parser)
+
+        assert scraper._parse_data(self.HTML)["system_info"]["software_version"] == "1.0"
+        assert parser.refreshed
+
+        clock.return_value = 1000.0 + 3599
+        data = scraper._parse_data(self.HTML)
+        assert not parser.refreshed
+        assert data["system_info"]["software_version"] == "1.0"
+
+        clock.return_value = 1000.0 + 3600
+        scraper._parse_data(self.HTML)
+        assert parser.refreshed
+
+    def test_reboot_refreshes_on_next_poll(self, parser, clock):
+        """Test that uptime going down expires the cached static info."""
+        scraper = ModemScraper("http://192.168.100.1", parser=parser)
+        scraper._parse_data(self.HTML)
+        scraper._parse_data(self.HTML)
+        assert not parser.refreshed
+
+        parser.uptime = "0 days 00h:02m:10s"
+        data = scraper._parse_data(self.HTML)
+        assert not parser.refreshed
+        assert data["system_info"]["software_version"] == "1.0"
+
+        scraper._parse_data(self.HTML)
+        assert parser.refreshed
+
+    def test_failed_refresh_retried(self, parser, clock, mocker):
+        """Test that a refresh that found no static info keeps the old values and is retried."""
+        scraper = ModemScraper("http://192.168.100.1", parser=parser)
+        mocker.patch.object(
+            parser,
+            "parse",
+            return_value={"downstream": [], "upstream": [], "system_info": {"system_uptime": parser.uptime}},
+        )
+
+        scraper._parse_data(self.HTML)
+        assert scraper._static_info_due(parser)
+
+    @pytest.mark.asyncio
+    async def test_static_pages_prefetched_only_when_due(self, parser, clock):
+        """Test that pages declared for static info are prefetched only on polls that refresh it."""
+        from custom_components.cable_modem_monitor.core.auth_config import NoAuthConfig
+
+        parser.auth_config = NoAuthConfig()
+        parser.static_pages = ("/home.asp",)
+        scraper = ModemScraper("http://192.168.100.1", parser=parser)
+        session = _mock_aiohttp_session({"http://192.168.100.1/home.asp": (200, self.HTML)})
+
+        assert await scraper._async_prefetch_pages(session) == {"/home.asp": self.HTML}
+        scraper._parse_data(self.HTML)
+
+        assert await scraper._async_prefetch_pages(session) == {}
+        session.get.assert_called_once()
+
+
+class TestRequestedSections:
+    """Test handing the requested sections to the parser."""
+
+    @pytest.fixture
+    def parser(self):
+        """Parser that records the sections it was asked for."""
+
+        class SectionParser(ModemParser):
+            name = "Section Parser"
+            manufacturer = "Test"
+
+            @classmethod
+            def can_parse(cls, soup, url, html):
+                return True
+
+            def login(self, session, base_url, username, password):
+                return True
+
+            def parse(self, soup, session=None, base_url=None, context=None):
+                self.seen_sections = context.requested_sections
+                return {"downstream": [], "upstream": [], "system_info": {}}
+
+        return SectionParser()
+
+    def test_sections_passed_to_parse(self, parser):
+        """Test that the parser is handed the scraper's sections."""
+        scraper = ModemScraper("http://192.168.100.1", parser=parser)
+        scraper.requested_sections = frozenset({"downstream"})
+
+        scraper._parse_data("<html></html>")
+
+        assert parser.seen_sections == frozenset({"downstream"})
+
+    def test_capture_requests_everything(self, parser):
+        """Test that a diagnostics capture asks the parser for every section."""
+        scraper = ModemScraper("http://192.168.100.1", parser=parser)
+        scraper.requested_sections = frozenset({"downstream"})
+        scraper._capture_enabled = True
+
+        scraper._parse_data("<html></html>")
+
+        assert parser.seen_sections is None
@@ -473,6 +473,57 @@ class TestLanStatsSensors:
         assert sensor.native_value == 395114324
 
 
+class TestPingBurstSensors:
+    """Test sensors fed by the ping probe burst."""
+
+    @pytest.fixture
+    def mock_coordinator(self):
+        """Create mock coordinator with ping burst data."""
+        coordinator = Mock()
+        coordinator.data = {
+            "ping_latency_ms": 5.4,
+            "ping_min_ms": 4.1,
+            "ping_max_ms": 7.2,
+            "ping_jitter_ms": 1.26,
+            "ping_packet_loss": 33.333,
+        }
+        coordinator.last_update_success = True
+        return coordinator
+
+    @pytest.fixture
+    def mock_entry(self):
+        """Create mock config entry."""
+        entry = Mock()
+        entry.entry_id = "test"
+        entry.data = {"host": "192.168.100.1"}
+        return entry
+
+    def test_ping_latency_min_max_attributes(self, mock_coordinator, mock_entry):
+        """Test that the latency sensor exposes the burst's min and max."""
+        from custom_components.cable_modem_monitor.sensor import ModemPingLatencySensor
+
+        sensor = ModemPingLatencySensor(mock_coordinator, mock_entry)
+        assert sensor.native_value == 5
+        assert sensor.extra_state_attributes == {"min_latency_ms": 4.1, "max_latency_ms": 7.2}
+
+    def test_ping_jitter_sensor(self, mock_coordinator, mock_entry):
+        """Test ping jitter sensor."""
+        from custom_components.cable_modem_monitor.sensor import ModemPingJitterSensor
+
+        sensor = ModemPingJitterSensor(mock_coordinator, mock_entry)
+        assert sensor.native_value == 1.3
+
+    def test_ping_packet_loss_sensor(self, mock_coordinator, mock_entry):
+        """Test ping packet loss sensor, and that it is empty without a burst."""
+        from custom_components.cable_modem_monitor.sensor import ModemPingPacketLossSensor
+
+        sensor = ModemPingPacketLossSensor(mock_coordinator, mock_entry)
+        assert sensor.native_value == 33.3
+
+        mock_coordinator.data = {}
+        assert sensor.native_value is None
+
+
 class TestFallbackModeSensorCreation:
     """Test that sensors are conditionally created based on fallback mode."""
 
@@ -597,6 +648,8 @@ class TestFallbackModeSensorCreation:
         assert "Connection Status" in sensor_names
         assert "Health Status" in sensor_names
         assert "Ping Latency" in sensor_names
+        assert "Ping Jitter" in sensor_names
+        assert "Ping Packet Loss" in sensor_names
         assert "HTTP Latency" in sensor_names
 
         # Should NOT include sensors that require channel/system data
@@ -607,8 +660,8 @@ class TestFallbackModeSensorCreation:
         assert "Software Version" not in sensor_names  # Skipped in fallback
         assert "System Uptime" not in sensor_names  # Skipped in fallback
 
-        # Should have exactly 4 sensors (Connection, Health, Ping, HTTP)
-        assert len(added_entities) == 4
+        # Should have exactly 6 sensors (Connection, Health, Ping latency/jitter/loss, HTTP)
+        assert len(added_entities) == 6
 
     @pytest.mark.asyncio
     async def test_no_channel_sensors(self, mock_hass, mock_entry, mock_coordinator_fallback_mode):
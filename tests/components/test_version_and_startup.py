@@ -136,7 +136,7 @@ class TestParserSelectionOptimization:
 
         with (
             patch("custom_components.cable_modem_monitor.parsers.get_parser_by_name") as mock_get_parser_by_name,
-            patch("custom_components.cable_modem_monitor.parsers.get_parsers") as mock_get_parsers,
+            patch("custom_components.cable_modem_monitor.parsers.get_lazy_parsers") as mock_get_lazy_parsers,
             patch("custom_components.cable_modem_monitor._create_health_monitor") as mock_health,
             patch("custom_components.cable_modem_monitor.DataUpdateCoordinator") as mock_coordinator,
             patch("custom_components.cable_modem_monitor._update_device_registry"),
@@ -161,12 +161,12 @@ class TestParserSelectionOptimization:
             # Verify get_parser_by_name was called (fast path)
             mock_get_parser_by_name.assert_called_once_with("Motorola MB7621")
 
-            # Verify get_parsers was NOT called (no full discovery)
-            mock_get_parsers.assert_not_called()
+            # Verify the lazy parser list was NOT requested (no full discovery)
+            mock_get_lazy_parsers.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_auto_mode_uses_get_parsers(self):
-        """Test that auto mode uses get_parsers for discovery."""
+    async def test_auto_mode_uses_lazy_parsers(self):
+        """Test that auto mode hands lazy parser proxies to discovery."""
         # Create a mock HomeAssistant instance
         hass = Mock(spec=HomeAssistant)
         hass.data = {}
@@ -196,14 +196,14 @@ class TestParserSelectionOptimization:
 
         with (
             patch("custom_components.cable_modem_monitor.parsers.get_parser_by_name") as mock_get_parser_by_name,
-            patch("custom_components.cable_modem_monitor.parsers.get_parsers") as mock_get_parsers,
+            patch("custom_components.cable_modem_monitor.parsers.get_lazy_parsers") as mock_get_lazy_parsers,
             patch("custom_components.cable_modem_monitor._create_health_monitor") as mock_health,
             patch("custom_components.cable_modem_monitor.DataUpdateCoordinator") as mock_coordinator,
             patch("custom_components.cable_modem_monitor._update_device_registry"),
             patch("homeassistant.config_entries.ConfigEntries.async_forward_entry_setups") as mock_forward,
         ):
             # Setup mocks
-            mock_get_parsers.return_value = []
+            mock_get_lazy_parsers.return_value = []
             mock_health.return_value = Mock()
 
             # Create coordinator mock with async method
@@ -215,8 +215,8 @@ class TestParserSelectionOptimization:
 
             await async_setup_entry(hass, mock_entry)
 
-            # Verify get_parsers was called (need all parsers for auto)
-            mock_get_parsers.assert_called_once()
+            # Verify all parsers were offered as lazy proxies (need all parsers for auto)
+            mock_get_lazy_parsers.assert_called_once()
 
             # Verify get_parser_by_name was NOT called
             mock_get_parser_by_name.assert_not_called()
@@ -253,7 +253,7 @@ class TestParserSelectionOptimization:
 
         with (
             patch("custom_components.cable_modem_monitor.parsers.get_parser_by_name") as mock_get_parser_by_name,
-            patch("custom_components.cable_modem_monitor.parsers.get_parsers") as mock_get_parsers,
+            patch("custom_components.cable_modem_monitor.parsers.get_lazy_parsers") as mock_get_lazy_parsers,
             patch("custom_components.cable_modem_monitor._create_health_monitor") as mock_health,
             patch("custom_components.cable_modem_monitor.DataUpdateCoordinator") as mock_coordinator,
             patch("custom_components.cable_modem_monitor._update_device_registry"),
@@ -262,7 +262,7 @@ class TestParserSelectionOptimization:
         ):
             # Setup mocks
             mock_get_parser_by_name.return_value = None  # Parser not found
-            mock_get_parsers.return_value = []
+            mock_get_lazy_parsers.return_value = []
             mock_health.return_value = Mock()
 
             # Create coordinator mock with async method
@@ -277,8 +277,8 @@ class TestParserSelectionOptimization:
             # Should log warning
             assert any("not found" in record.message for record in caplog.records)
 
-            # Should fall back to get_parsers
-            mock_get_parsers.assert_called_once()
+            # Should fall back to all (lazy) parsers
+            mock_get_lazy_parsers.assert_called_once()
 
 
 class TestProtocolOptimizationIntegration:
@@ -9,9 +9,12 @@ import requests
 
 from custom_components.cable_modem_monitor.core.auth_config import AuthStrategyType, FormAuthConfig
 from custom_components.cable_modem_monitor.core.authentication import (
+    AuthFactory,
     BasicHttpAuthStrategy,
+    FormPlainAndBase64AuthStrategy,
     FormPlainAuthStrategy,
     NoAuthStrategy,
+    get_password_candidates,
 )
 
 
@@ -175,6 +178,86 @@ class TestFormPlainAuthStrategy:
         assert success is True
 
 
+class TestFormPlainAndBase64AuthStrategy:
+    """Test FormPlainAndBase64AuthStrategy."""
+
+    @pytest.fixture
+    def config(self):
+        """Create a plain-and-Base64 form auth configuration."""
+        return FormAuthConfig(
+            strategy=AuthStrategyType.FORM_PLAIN_AND_BASE64,
+            login_url="/goform/login",
+            username_field="loginUsername",
+            password_field="loginPassword",
+            success_indicator="/status.asp",
+        )
+
+    @staticmethod
+    def _response(url):
+        response = MagicMock()
+        response.url = url
+        response.text = "<html></html>"
+        response.status_code = 200
+        return response
+
+    def test_falls_back_to_base64_and_records_it(self, mock_session, config):
+        """Test that Base64 is tried after plain fails and remembered on success."""
+        strategy = FormPlainAndBase64AuthStrategy()
+        mock_session.post.side_effect = [
+            self._response("http://192.168.1.1/login.asp"),
+            self._response("http://192.168.1.1/status.asp"),
+        ]
+
+        success, _ = strategy.login(mock_session, "http://192.168.1.1", "admin", "password", config)
+
+        assert success is True
+        assert mock_session.post.call_count == 2
+        assert strategy.successful_encoding == "base64"
+
+    def test_preferred_encoding_tried_first(self, mock_session, config):
+        """Test that a remembered Base64 encoding skips the plain attempt."""
+        strategy = FormPlainAndBase64AuthStrategy(preferred_encoding="base64")
+        mock_session.post.return_value = self._response("http://192.168.1.1/status.asp")
+
+        success, _ = strategy.login(mock_session, "http://192.168.1.1", "admin", "password", config)
+
+        assert success is True
+        mock_session.post.assert_called_once()
+        assert mock_session.post.call_args[1]["data"]["loginPassword"] == "cGFzc3dvcmQ="
+
+    def test_factory_passes_remembered_encoding(self):
+        """Test that the factory hands the remembered encoding to the strategy."""
+        strategy = AuthFactory.get_strategy(AuthStrategyType.FORM_PLAIN_AND_BASE64, password_encoding="base64")
+
+        assert isinstance(strategy, FormPlainAndBase64AuthStrategy)
+        assert strategy.preferred_encoding == "base64"
+
+    def test_parser_login_carries_encoding(self, mock_session, config):
+        """Test that a parser logging in through its auth_config keeps the encoding that worked."""
+        from custom_components.cable_modem_monitor.parsers.motorola.generic import MotorolaGenericParser
+
+        parser = MotorolaGenericParser()
+        parser.auth_config = config
+        parser.password_encoding = "base64"
+        mock_session.post.side_effect = [
+            self._response("http://192.168.1.1/login.asp"),
+            self._response("http://192.168.1.1/status.asp"),
+        ]
+
+        success, _ = parser.login_with_auth_config(mock_session, "http://192.168.1.1", "admin", "password")
+
+        assert success is True
+        # Base64 failed this time, so plain is remembered for the next login
+        assert mock_session.post.call_args_list[0][1]["data"]["loginPassword"] == "cGFzc3dvcmQ="
+        assert parser.password_encoding == "plain"
+
+    def test_password_candidates_order(self):
+        """Test candidate ordering with and without a preferred encoding."""
+        assert [e for e, _ in get_password_candidates("pw")] == ["plain", "base64"]
+        assert [e for e, _ in get_password_candidates("pw", "plain")] == ["plain", "base64"]
+        assert [e for e, _ in get_password_candidates("pw", "base64")] == ["base64", "plain"]
+
+
 class TestAuthStrategyFactoryPattern:
     """Test that auth strategies can be instantiated and used polymorphically."""
 
@@ -0,0 +1,139 @@
+"""Tests for the per-poll document cache."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import requests
+
+from custom_components.cable_modem_monitor.core.discovery_helpers import ParserHeuristics
+from custom_components.cable_modem_monitor.core.document_cache import DocumentCache
+from custom_components.cable_modem_monitor.parsers.base_parser import ModemParser
+
+
+def _response(text: str, status_code: int = 200) -> MagicMock:
+    response = MagicMock()
+    response.status_code = status_code
+    response.text = text
+    return response
+
+
+class _ArrisParser(ModemParser):
+    name = "Test Arris"
+    manufacturer = "Arris"
+    models = ["SB6141"]
+    url_patterns = [{"path": "/status.html", "auth_method": "none", "auth_required": False}]
+
+    def login(self, session, base_url, username, password):
+        return True
+
+    def parse(self, soup, session=None, base_url=None, context=None):
+        return {}
+
+
+class _OtherArrisParser(_ArrisParser):
+    name = "Test Arris Other"
+
+
+class TestDocumentCache:
+    """Test DocumentCache."""
+
+    def test_soup_parsed_once_per_content(self, mocker):
+        """Test that identical content is parsed once, whatever URL it came from."""
+        make_soup = mocker.patch(
+            "custom_components.cable_modem_monitor.core.document_cache.make_soup", return_value=MagicMock()
+        )
+        cache = DocumentCache("html.parser")
+
+        first = cache.soup("<html>same</html>", "http://192.168.100.1/")
+        second = cache.soup("<html>same</html>", "http://192.168.100.1/index.html")
+        third = cache.soup("<html>same</html>")
+
+        assert first is second is third
+        make_soup.assert_called_once_with("<html>same</html>", "html.parser")
+
+    def test_different_content_parsed_separately(self):
+        """Test that different pages get their own parse trees."""
+        cache = DocumentCache("html.parser")
+
+        first = cache.soup("<html><title>A</title></html>")
+        second = cache.soup("<html><title>B</title></html>")
+
+        assert first is not second
+        assert second.title.string == "B"
+
+    def test_fetch_requests_url_once(self):
+        """Test that a URL is requested at most once until the cache is cleared."""
+        session = MagicMock()
+        session.get.return_value = _response("<html>root</html>")
+        cache = DocumentCache()
+
+        first = cache.fetch(session, "http://192.168.100.1/")
+        second = cache.fetch(session, "http://192.168.100.1/")
+
+        assert first is second
+        assert first.html == "<html>root</html>"
+        session.get.assert_called_once()
+
+        cache.clear()
+        cache.fetch(session, "http://192.168.100.1/")
+        assert session.get.call_count == 2
+
+    def test_fetch_remembers_failures(self):
+        """Test that failed fetches are not retried within the same poll."""
+        session = MagicMock()
+        session.get.side_effect = requests.ConnectionError()
+        cache = DocumentCache()
+
+        assert cache.fetch(session, "http://192.168.100.1/") is None
+        assert cache.fetch(session, "http://192.168.100.1/") is None
+        session.get.assert_called_once()
+
+    def test_fetch_non_200_returns_none(self):
+        """Test that non-200 responses are not cached as documents."""
+        session = MagicMock()
+        session.get.return_value = _response("Unauthorized", status_code=401)
+        cache = DocumentCache()
+
+        assert cache.fetch(session, "http://192.168.100.1/") is None
+        assert cache.get("http://192.168.100.1/") is None
+
+    def test_added_page_served_without_fetch(self):
+        """Test that a page recorded by the scraper is not fetched again."""
+        session = MagicMock()
+        cache = DocumentCache()
+        cache.add("http://192.168.100.1/", "<html>fetched</html>")
+
+        document = cache.fetch(session, "http://192.168.100.1/")
+
+        assert document.html == "<html>fetched</html>"
+        session.get.assert_not_called()
+
+
+class TestHeuristicsWithDocumentCache:
+    """Test ParserHeuristics sharing pages through the document cache."""
+
+    def test_get_likely_parsers_reuses_fetched_root_page(self):
+        """Test that heuristics do not GET a root page the scraper already fetched."""
+        session = MagicMock()
+        cache = DocumentCache()
+        cache.add("http://192.168.100.1/", "<html><title>ARRIS Cable Modem</title></html>")
+
+        result = ParserHeuristics.get_likely_parsers("http://192.168.100.1", [_ArrisParser], session, documents=cache)
+
+        assert result == [_ArrisParser]
+        session.get.assert_not_called()
+
+    def test_check_anonymous_access_shares_public_page(self):
+        """Test that two parsers with the same public page cause a single GET."""
+        session = MagicMock()
+        session.get.return_value = _response("<html>status</html>")
+        cache = DocumentCache()
+
+        first = ParserHeuristics.check_anonymous_access("http://192.168.100.1", _ArrisParser, session, documents=cache)
+        second = ParserHeuristics.check_anonymous_access(
+            "http://192.168.100.1", _OtherArrisParser, session, documents=cache
+        )
+
+        assert first == second == ("<html>status</html>", "http://192.168.100.1/status.html")
+        session.get.assert_called_once()
@@ -0,0 +1,111 @@
+"""Tests for the parser fingerprint index."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from custom_components.cable_modem_monitor.core.fingerprint_index import FingerprintIndex
+from custom_components.cable_modem_monitor.lib.html_backend import make_soup
+from custom_components.cable_modem_monitor.parsers import get_parsers
+
+PARSER_TESTS = Path(__file__).parent.parent / "parsers"
+
+
+def _parser(name, fingerprints, priority=50):
+    """Create a minimal parser-like class with the given fingerprints."""
+    return type(name, (), {"name": name, "fingerprints": fingerprints, "priority": priority})
+
+
+class TestFingerprintIndex:
+    """Test scoring and ranking."""
+
+    def test_title_fingerprint_only_counts_in_title(self):
+        """Test that a title fingerprint is ignored when the text appears elsewhere."""
+        titled = _parser("Titled", {"title": ["Acme Modem"]})
+        index = FingerprintIndex([titled])
+
+        assert index.scores("<html><title>ACME MODEM</title></html>") == {titled: 4}
+        assert index.scores("<html><body>Acme Modem</body></html>") == {}
+
+    def test_body_fingerprint_counts_anywhere(self):
+        """Test that body fingerprints also match inside the title and meta tags."""
+        model = _parser("Model", {"body": ["X100"], "meta": ["X100"]})
+        index = FingerprintIndex([model])
+
+        html = '<title>X100</title><meta name="description" content="x100 gateway">'
+        assert index.scores(html) == {model: 1 + 3}
+
+    def test_url_fingerprint(self):
+        """Test that URL fingerprints match the page URL, not the HTML."""
+        by_url = _parser("ByUrl", {"url": ["status.jst"]})
+        index = FingerprintIndex([by_url])
+
+        assert index.scores("status.jst", "http://192.168.100.1/") == {}
+        assert index.scores("", "http://192.168.100.1/Status.jst") == {by_url: 4}
+
+    def test_rank_orders_by_priority_then_score(self):
+        """Test that a model-specific parser outranks a generic one with a stronger hit."""
+        generic = _parser("Generic", {"title": ["Acme"]}, priority=50)
+        specific = _parser("Specific", {"body": ["X100"]}, priority=100)
+        other = _parser("Other", {"body": ["Z9"]})
+        index = FingerprintIndex([generic, specific, other])
+
+        assert index.rank("<title>Acme</title> X100") == [specific, generic]
+
+    def test_parsers_without_fingerprints_are_skipped(self):
+        """Test that parsers with missing or invalid fingerprints never become candidates."""
+        bare = type("Bare", (), {"name": "Bare"})
+        odd = _parser("Odd", {"header": ["Server: acme"]})
+        index = FingerprintIndex([bare, odd])
+
+        assert index.rank("Server: acme") == []
+
+    def test_patterns_compiled_once_per_parser_set(self):
+        """Test that indexes of the same parser set share compiled patterns."""
+        parsers = get_parsers()
+
+        assert FingerprintIndex(parsers)._compiled is FingerprintIndex(list(parsers))._compiled
+
+    def test_cache_keeps_no_parsers_alive(self):
+        """Test that the compiled pattern cache does not hold on to parser classes."""
+        import gc
+        import weakref
+
+        parser = _parser("Transient", {"title": ["Transient Modem"]})
+        FingerprintIndex([parser])
+        ref = weakref.ref(parser)
+        del parser
+        gc.collect()
+
+        assert ref() is None
+
+
+class TestFingerprintsOfShippedParsers:
+    """Test that the first fingerprint candidate accepted by can_parse is the right parser."""
+
+    @pytest.mark.parametrize(
+        ("fixture", "path", "expected"),
+        [
+            ("arris/fixtures/sb6141/signal.html", "/cmSignalData.htm", "ARRIS SB6141"),
+            ("arris/fixtures/sb6190/arris_sb6190.html", "/cgi-bin/status", "ARRIS SB6190"),
+            ("motorola/fixtures/generic/MotoConnection.asp", "/MotoConnection.asp", "Motorola MB Series (Generic)"),
+            ("motorola/fixtures/mb7621/MotoSwInfo.asp", "/MotoSwInfo.asp", "Motorola MB7621"),
+            ("motorola/fixtures/mb8611_hnap/Login.html", "/Login.html", "Motorola MB8611 (HNAP)"),
+            ("netgear/fixtures/c3700/index.htm", "/", "Netgear C3700"),
+            ("netgear/fixtures/cm600/DocsisStatus.asp", "/DocsisStatus.asp", "Netgear CM600"),
+            ("technicolor/fixtures/tc4400/cmconnectionstatus.html", "/cmconnectionstatus.html", "Technicolor TC4400"),
+            ("technicolor/fixtures/xb7/network_setup.jst", "/network_setup.jst", "Technicolor XB7"),
+        ],
+    )
+    def test_first_accepted_candidate(self, fixture, path, expected):
+        """Test detection order on captured modem pages."""
+        html = (PARSER_TESTS / fixture).read_text(encoding="utf-8", errors="replace")
+        url = f"http://192.168.100.1{path}"
+        soup = make_soup(html)
+
+        candidates = FingerprintIndex(get_parsers()).rank(html, url)
+
+        accepted = next(parser for parser in candidates if parser.can_parse(soup, url, html))
+        assert accepted.name == expected
@@ -8,7 +8,17 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import aiohttp
 import pytest
 
-from custom_components.cable_modem_monitor.core.health_monitor import HealthCheckResult, ModemHealthMonitor
+from custom_components.cable_modem_monitor.core.health_monitor import (
+    HealthCheckResult,
+    HealthHistory,
+    ModemHealthMonitor,
+)
+from custom_components.cable_modem_monitor.core.network_probe import ProbeResult
+
+
+def _answered_probe(latency_ms):
+    """Create a ping burst whose probes were all answered in latency_ms."""
+    return ProbeResult("icmp", sent=3, rtts_ms=[latency_ms] * 3)
 
 
 class TestHealthCheckResult:
@@ -233,67 +243,54 @@ class TestHealthCheckPing:
     """Test ping check functionality."""
 
     async def test_ping_success(self):
-        """Test successful ping check."""
+        """Test successful ping check returns the burst."""
         monitor = ModemHealthMonitor()
+        probe = ProbeResult("icmp", sent=3, rtts_ms=[4.0, 6.0, 5.0])
 
-        with (
-            patch("asyncio.create_subprocess_exec", new_callable=AsyncMock) as mock_exec,
-            patch(
-                "custom_components.cable_modem_monitor.core.health_monitor.time.time",
-                side_effect=[1000.0, 1000.05],
-            ),
-        ):
-            # Mock successful ping
-            mock_proc = AsyncMock()
-            mock_proc.communicate.return_value = (b"", b"")
-            mock_proc.returncode = 0
-            mock_exec.return_value = mock_proc
-
-            success, latency = await monitor._check_ping("192.168.1.1")
+        with patch.object(monitor._prober, "probe", new=AsyncMock(return_value=probe)) as mock_probe:
+            result = await monitor._check_ping("192.168.1.1")
 
-            assert success is True
-            assert latency is not None
-            assert latency > 0
-
-            # Verify ping command
-            mock_exec.assert_called_once_with(
-                "ping", "-c", "1", "-W", "2", "192.168.1.1", stdout=-1, stderr=-1  # asyncio.subprocess.PIPE
-            )
+            assert result is probe
+            assert result.success is True
+            assert result.avg_ms == pytest.approx(5.0)
+            mock_probe.assert_awaited_once_with("192.168.1.1", 80)
 
     async def test_ping_failure(self):
         """Test failed ping check."""
         monitor = ModemHealthMonitor()
+        probe = ProbeResult("icmp", sent=3)
 
-        with patch("asyncio.create_subprocess_exec", new_callable=AsyncMock) as mock_exec:
-            # Mock failed ping
-            mock_proc = AsyncMock()
-            mock_proc.communicate.return_value = (b"", b"ping: unknown host")
-            mock_proc.returncode = 1
-            mock_exec.return_value = mock_proc
+        with patch.object(monitor._prober, "probe", new=AsyncMock(return_value=probe)):
+            result = await monitor._check_ping("192.168.1.1")
 
-            success, latency = await monitor._check_ping("192.168.1.1")
+            assert result.success is False
+            assert result.avg_ms is None
 
-            assert success is False
-            assert latency is None
+    async def test_ping_does_not_spawn_process(self):
+        """Test that the ping check never forks the ping binary."""
+        monitor = ModemHealthMonitor()
+        probe = ProbeResult("tcp", sent=3, rtts_ms=[1.0, 1.0, 1.0])
+
+        with (
+            patch("asyncio.create_subprocess_exec", new_callable=AsyncMock) as mock_exec,
+            patch.object(monitor._prober, "probe", new=AsyncMock(return_value=probe)),
+        ):
+            await monitor._check_ping("192.168.1.1")
+
+            mock_exec.assert_not_called()
 
     async def test_ping_invalid_host(self):
         """Test ping with invalid host."""
         monitor = ModemHealthMonitor()
 
-        success, latency = await monitor._check_ping("invalid; rm -rf /")
-
-        assert success is False
-        assert latency is None
+        assert await monitor._check_ping("invalid; rm -rf /") is None
 
     async def test_ping_exception_handling(self):
         """Test ping handles exceptions gracefully."""
         monitor = ModemHealthMonitor()
 
-        with patch("asyncio.create_subprocess_exec", side_effect=Exception("Network error")):
-            success, latency = await monitor._check_ping("192.168.1.1")
-
-            assert success is False
-            assert latency is None
+        with patch.object(monitor._prober, "probe", new=AsyncMock(side_effect=Exception("Network error"))):
+            assert await monitor._check_ping("192.168.1.1") is None
 
 
 @pytest.mark.asyncio
@@ -496,6 +493,60 @@ class TestHealthCheckHTTP:
             assert success is False
             assert latency is None
 
+    async def test_http_session_reused_across_checks(self):
+        """Test that consecutive checks share one session and connection pool."""
+        monitor = ModemHealthMonitor()
+
+        connector_patch = "custom_components.cable_modem_monitor.core.health_monitor.aiohttp.TCPConnector"
+        session_patch = "custom_components.cable_modem_monitor.core.health_monitor.aiohttp.ClientSession"
+
+        with patch(connector_patch) as mock_connector_class, patch(session_patch) as mock_session_class:
+            mock_response = MagicMock()
+            mock_response.status = 200
+            mock_response.headers = {}
+            mock_head_cm = MagicMock()
+            mock_head_cm.__aenter__ = AsyncMock(return_value=mock_response)
+            mock_head_cm.__aexit__ = AsyncMock(return_value=None)
+            mock_session = MagicMock()
+            mock_session.closed = False
+            mock_session.head = MagicMock(return_value=mock_head_cm)
+            mock_session_class.return_value = mock_session
+
+            await monitor._check_http("http://192.168.1.1")
+            await monitor._check_http("http://192.168.1.1")
+
+            mock_session_class.assert_called_once()
+            mock_connector_class.assert_called_once()
+            assert mock_session.head.call_count == 2
+
+    async def test_async_close_releases_session(self):
+        """Test that closing the monitor closes its session and a later check opens a new one."""
+        monitor = ModemHealthMonitor()
+
+        session_patch = "custom_components.cable_modem_monitor.core.health_monitor.aiohttp.ClientSession"
+
+        with (
+            patch("custom_components.cable_modem_monitor.core.health_monitor.aiohttp.TCPConnector"),
+            patch(session_patch) as mock_session_class,
+        ):
+            first, second = MagicMock(closed=False), MagicMock(closed=False)
+            first.close = AsyncMock()
+            mock_session_class.side_effect = [first, second]
+
+            assert monitor._get_session() is first
+            await monitor.async_close()
+
+            first.close.assert_awaited_once()
+            assert monitor._get_session() is second
+
+    async def test_async_close_without_session(self):
+        """Test that closing a monitor that never ran an HTTP check is a no-op."""
+        monitor = ModemHealthMonitor()
+
+        await monitor.async_close()
+
+        assert monitor._session is None
+
 
 @pytest.mark.asyncio
 class TestHealthCheckFullFlow:
@@ -506,7 +557,7 @@ class TestHealthCheckFullFlow:
         monitor = ModemHealthMonitor()
 
         with (
-            patch.object(monitor, "_check_ping", return_value=(True, 5.0)),
+            patch.object(monitor, "_check_ping", return_value=_answered_probe(5.0)),
             patch.object(monitor, "_check_http", return_value=(True, 10.0)),
         ):
             result = await monitor.check_health("http://192.168.1.1")
@@ -524,7 +575,7 @@ class TestHealthCheckFullFlow:
         monitor = ModemHealthMonitor()
 
         with (
-            patch.object(monitor, "_check_ping", return_value=(False, None)),
+            patch.object(monitor, "_check_ping", return_value=ProbeResult("icmp", sent=3)),
             patch.object(monitor, "_check_http", return_value=(False, None)),
         ):
             result = await monitor.check_health("http://192.168.1.1")
@@ -550,12 +601,63 @@ class TestHealthCheckFullFlow:
             assert result.http_success is False
             assert result.status == "unresponsive"
 
+    async def test_check_health_carries_burst_statistics(self):
+        """Test that jitter, loss and min/max of the ping burst end up in the result."""
+        monitor = ModemHealthMonitor()
+        probe = ProbeResult("icmp", sent=4, rtts_ms=[4.0, 8.0, 6.0])
+
+        with (
+            patch.object(monitor._prober, "probe", new=AsyncMock(return_value=probe)) as mock_probe,
+            patch.object(monitor, "_check_http", return_value=(True, 10.0)),
+        ):
+            result = await monitor.check_health("https://192.168.1.1:8443")
+
+            mock_probe.assert_awaited_once_with("192.168.1.1", 8443)
+            assert result.ping_latency_ms == pytest.approx(6.0)
+            assert result.ping_min_ms == 4.0
+            assert result.ping_max_ms == 8.0
+            assert result.ping_jitter_ms == pytest.approx(3.0)
+            assert result.ping_packet_loss == pytest.approx(25.0)
+
+    async def test_concurrent_checks_keep_their_own_burst(self):
+        """Test that overlapping checks each report the statistics of their own ping burst."""
+        import asyncio
+
+        monitor = ModemHealthMonitor()
+        slow = ProbeResult("icmp", sent=4, rtts_ms=[20.0, 30.0])
+        fast = ProbeResult("icmp", sent=3, rtts_ms=[1.0, 1.0, 1.0])
+
+        async def probe(host, port):
+            if port == 8080:
+                await asyncio.sleep(0.01)
+                return slow
+            return fast
+
+        async def check_http(base_url):
+            # The fast check finishes last, after the slow burst has completed
+            if not base_url.endswith(":8080"):
+                await asyncio.sleep(0.03)
+            return True, 10.0
+
+        with (
+            patch.object(monitor._prober, "probe", side_effect=probe),
+            patch.object(monitor, "_check_http", side_effect=check_http),
+        ):
+            slow_result, fast_result = await asyncio.gather(
+                monitor.check_health("http://192.168.1.1:8080"), monitor.check_health("http://192.168.1.1")
+            )
+
+        assert slow_result.ping_max_ms == 30.0
+        assert slow_result.ping_packet_loss == pytest.approx(50.0)
+        assert fast_result.ping_max_ms == 1.0
+        assert fast_result.ping_packet_loss == pytest.approx(0.0)
+
     async def test_history_limit(self):
         """Test that history is limited to max_history."""
         monitor = ModemHealthMonitor(max_history=5)
 
         with (
-            patch.object(monitor, "_check_ping", return_value=(True, 5.0)),
+            patch.object(monitor, "_check_ping", return_value=_answered_probe(5.0)),
             patch.object(monitor, "_check_http", return_value=(True, 10.0)),
         ):
             # Add 10 checks
@@ -571,7 +673,7 @@ class TestHealthCheckFullFlow:
 
         # Fail twice
         with (
-            patch.object(monitor, "_check_ping", return_value=(False, None)),
+            patch.object(monitor, "_check_ping", return_value=ProbeResult("icmp", sent=3)),
             patch.object(monitor, "_check_http", return_value=(False, None)),
         ):
             await monitor.check_health("http://192.168.1.1")
@@ -581,7 +683,7 @@ class TestHealthCheckFullFlow:
 
         # Succeed once
         with (
-            patch.object(monitor, "_check_ping", return_value=(True, 5.0)),
+            patch.object(monitor, "_check_ping", return_value=_answered_probe(5.0)),
             patch.object(monitor, "_check_http", return_value=(True, 10.0)),
         ):
             await monitor.check_health("http://192.168.1.1")
@@ -638,6 +740,45 @@ class TestAverageLatency:
         assert monitor.average_http_latency == pytest.approx(15.0)  # (10 + 20) / 2
 
 
+class TestHealthHistory:
+    """Test the rolling aggregates of the health history."""
+
+    def test_eviction_updates_aggregates(self):
+        """Test that evicted results leave the averages and success ratio."""
+        history = HealthHistory(2)
+
+        history.append(HealthCheckResult(1.0, True, 100.0, True, 100.0))
+        history.append(HealthCheckResult(2.0, True, 4.0, False, None))
+        history.append(HealthCheckResult(3.0, False, None, False, None))
+
+        assert len(history) == 2
+        assert history[0].timestamp == 2.0
+        assert history.ping.mean == pytest.approx(4.0)
+        assert history.http.mean is None
+        assert history.success_ratio == pytest.approx(0.5)
+
+    def test_longest_outage(self):
+        """Test that the longest run of failures is kept after recovery and eviction."""
+        history = HealthHistory(2)
+        up, down = (True, 5.0, True, 10.0), (False, None, False, None)
+
+        for timestamp, outcome in enumerate([up, down, down, down, up, down], start=100):
+            history.append(HealthCheckResult(float(timestamp), *outcome))
+
+        assert history.longest_outage_checks == 3
+        assert history.longest_outage_seconds == pytest.approx(3.0)
+
+    def test_clear(self):
+        """Test that clear resets the aggregates."""
+        history = HealthHistory(5)
+        history.append(HealthCheckResult(1.0, False, None, False, None))
+        history.clear()
+
+        assert len(history) == 0
+        assert history.success_ratio is None
+        assert history.longest_outage_checks == 0
+
+
 class TestStatusSummary:
     """Test status summary generation."""
 
@@ -662,6 +803,10 @@ class TestStatusSummary:
         assert summary["http_success"] is True
         assert "avg_ping_latency_ms" in summary
         assert "avg_http_latency_ms" in summary
+        assert summary["ping_latency_p50_ms"] == pytest.approx(5.0, rel=0.02)
+        assert summary["http_latency_p99_ms"] == pytest.approx(12.0, rel=0.02)
+        assert summary["success_ratio"] == 1.0
+        assert summary["longest_outage_checks"] == 0
 
     def test_no_history(self):
         """Test status summary with no history."""
@@ -8,7 +8,7 @@ from xml.etree.ElementTree import Element, fromstring
 import pytest
 import requests
 
-from custom_components.cable_modem_monitor.core.hnap_builder import HNAPRequestBuilder
+from custom_components.cable_modem_monitor.core.hnap_builder import HNAPRequestBuilder, HNAPResultPaths
 
 
 @pytest.fixture
@@ -246,6 +246,77 @@ class TestParseResponse:
 
         assert result is None
 
+    def test_stops_after_action_result(self):
+        """Test that the envelope is not read past the requested result."""
+        xml_response = (
+            '<soap:Envelope xmlns:soap="http://schemas.xmlsoap.org/soap/envelope/"><soap:Body>'
+            "<TestActionResponse><Result>OK</Result></TestActionResponse>"
+            "<Truncated"
+        )
+
+        result = HNAPRequestBuilder.parse_response(xml_response, "TestAction", "http://example.com/")
+
+        assert result is not None
+        assert HNAPRequestBuilder.get_text_value(result, "Result") == "OK"
+
+
+class TestExtractResults:
+    """Test streaming extraction of declared result fields."""
+
+    NAMESPACE = "http://purenetworks.com/HNAP1/"
+    PATHS = HNAPResultPaths.compile(
+        NAMESPACE,
+        {
+            "GetMotoStatusConnectionInfo": ("MotoConnSystemUpTime",),
+            "GetMotoStatusDownstreamChannelInfo": ("MotoConnDownstreamChannel",),
+        },
+    )
+    RESPONSE = f"""<?xml version="1.0" encoding="utf-8"?>
+    <soap:Envelope xmlns:soap="http://schemas.xmlsoap.org/soap/envelope/">
+      <soap:Body>
+        <GetMultipleHNAPsResponse xmlns="{NAMESPACE}">
+          <GetMotoStatusConnectionInfoResponse>
+            <MotoConnSystemUpTime> 1 days 02h:03m:04s </MotoConnSystemUpTime>
+            <MotoConnNetworkAccess>Allowed</MotoConnNetworkAccess>
+          </GetMotoStatusConnectionInfoResponse>
+          <GetMotoLagStatusResponse><MotoLagCurrentStatus>0</MotoLagCurrentStatus></GetMotoLagStatusResponse>
+          <GetMotoStatusDownstreamChannelInfoResponse>
+            <MotoConnDownstreamChannel>1^Locked^QAM256^20^543.0^1.4^45.1^41^0^</MotoConnDownstreamChannel>
+          </GetMotoStatusDownstreamChannelInfoResponse>
+        </GetMultipleHNAPsResponse>
+      </soap:Body>
+    </soap:Envelope>"""
+
+    def test_declared_fields_only(self):
+        """Test that only declared fields of declared results are returned, shaped like JSON HNAP."""
+        results = HNAPRequestBuilder.extract_results(self.RESPONSE, self.PATHS)
+
+        assert results == {
+            "GetMotoStatusConnectionInfoResponse": {"MotoConnSystemUpTime": "1 days 02h:03m:04s"},
+            "GetMotoStatusDownstreamChannelInfoResponse": {
+                "MotoConnDownstreamChannel": "1^Locked^QAM256^20^543.0^1.4^45.1^41^0^"
+            },
+        }
+
+    def test_results_without_namespace(self):
+        """Test that results and fields without the HNAP namespace are matched as well."""
+        xml_response = self.RESPONSE.replace(f' xmlns="{self.NAMESPACE}"', "")
+
+        results = HNAPRequestBuilder.extract_results(xml_response, self.PATHS)
+
+        assert set(results) == {"GetMotoStatusConnectionInfoResponse", "GetMotoStatusDownstreamChannelInfoResponse"}
+
+    def test_stops_after_last_requested_action(self):
+        """Test that parsing ends once the requested results are read."""
+        cut = self.RESPONSE.index("<GetMotoLagStatusResponse>")
+        truncated = self.RESPONSE[:cut] + "<Broken"
+
+        results = HNAPRequestBuilder.extract_results(truncated, self.PATHS, actions=["GetMotoStatusConnectionInfo"])
+
+        assert list(results) == ["GetMotoStatusConnectionInfoResponse"]
+        with pytest.raises(Exception):  # noqa: B017 - ParseError class depends on defusedxml availability
+            HNAPRequestBuilder.extract_results(truncated, self.PATHS)
+
 
 class TestGetTextValue:
     """Test text value extraction from XML elements."""
@@ -297,6 +368,13 @@ class TestGetTextValue:
 
         assert value == "default"  # Empty text returns default
 
+    def test_child_in_default_namespace(self):
+        """Test that children inheriting the result's default namespace are found by plain tag."""
+        xml = '<Result xmlns="http://purenetworks.com/HNAP1/"><Power> 5.0 </Power></Result>'
+        element = fromstring(xml)
+
+        assert HNAPRequestBuilder.get_text_value(element, "Power") == "5.0"
+
     def test_strips_whitespace(self):
         """Test that whitespace is stripped from values."""
         xml = "<root><Value>  text with spaces  </Value></root>"
@@ -0,0 +1,40 @@
+"""Tests for decoding HNAP channel table strings."""
+
+from __future__ import annotations
+
+from custom_components.cable_modem_monitor.core.hnap_records import decode_channels, split_channels
+from custom_components.cable_modem_monitor.lib.table_extract import Column
+
+COLUMNS = (
+    Column("channel_id", 0, int),
+    Column("lock_status", 1, str.strip),
+    Column("power", 2, float),
+)
+
+
+def test_decode_channels():
+    """Test that every channel becomes a dict with converted fields, in column order."""
+    data = "1^Locked^ 1.4^|+|2^ Locked ^-0.5^|+|"
+
+    channels = decode_channels(data, COLUMNS, "test")
+
+    assert channels == [
+        {"channel_id": 1, "lock_status": "Locked", "power": 1.4},
+        {"channel_id": 2, "lock_status": "Locked", "power": -0.5},
+    ]
+    assert list(channels[0]) == ["channel_id", "lock_status", "power"]
+
+
+def test_malformed_channels_dropped_individually():
+    """Test that a channel with an unconvertible or missing field does not take the others with it."""
+    data = "1^Locked^1.4^|+|2^Locked^n/a^|+|3^Locked|+|4^Locked^2.0^"
+
+    channels = decode_channels(data, COLUMNS, "test")
+
+    assert [channel["channel_id"] for channel in channels] == [1, 4]
+
+
+def test_split_channels_skips_blank_and_short_entries():
+    """Test that blank entries and entries with too few fields are not channels."""
+    assert split_channels("|+| |+|1^2^3^|+|1^2", 3, "test") == [["1", "2", "3", ""]]
+    assert decode_channels("", COLUMNS, "test") == []
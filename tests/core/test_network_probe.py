@@ -0,0 +1,172 @@
+"""Tests for the in-process ICMP/TCP network prober."""
+
+from __future__ import annotations
+
+import asyncio
+import socket
+import struct
+
+import pytest
+
+from custom_components.cable_modem_monitor.core import network_probe
+from custom_components.cable_modem_monitor.core.network_probe import (
+    NetworkProber,
+    ProbeResult,
+    _checksum,
+    build_echo_request,
+    parse_echo_reply,
+)
+
+
+class TestProbeResult:
+    """Test burst statistics."""
+
+    def test_statistics(self):
+        """Test min/avg/max/jitter/loss over a burst with one lost probe."""
+        result = ProbeResult("icmp", sent=4, rtts_ms=[2.0, 4.0, 3.0])
+
+        assert result.success is True
+        assert result.min_ms == 2.0
+        assert result.avg_ms == pytest.approx(3.0)
+        assert result.max_ms == 4.0
+        assert result.jitter_ms == pytest.approx(1.5)
+        assert result.packet_loss == pytest.approx(25.0)
+
+    def test_all_lost(self):
+        """Test that an unanswered burst reports full loss and no latency."""
+        result = ProbeResult("icmp", sent=3)
+
+        assert result.success is False
+        assert result.avg_ms is None
+        assert result.jitter_ms is None
+        assert result.packet_loss == 100.0
+
+    def test_nothing_sent(self):
+        """Test that loss is unknown when no probe was sent."""
+        assert ProbeResult("tcp").packet_loss is None
+
+
+class TestEchoPackets:
+    """Test ICMP echo encoding and decoding."""
+
+    def test_request_checksum_verifies(self):
+        """Test that a built request checksums to zero, as a receiver verifies it."""
+        packet = build_echo_request(0x1234, 7, b"payload!")
+
+        assert packet[0] == network_probe.ICMP_ECHO_REQUEST
+        assert _checksum(packet) == 0
+
+    def test_icmpv6_request_leaves_checksum_to_kernel(self):
+        """Test that ICMPv6 requests carry a zero checksum."""
+        packet = build_echo_request(0, 1, b"", ipv6=True)
+
+        assert packet[0] == network_probe.ICMPV6_ECHO_REQUEST
+        assert packet[2:4] == b"\x00\x00"
+
+    def test_parse_bare_reply(self):
+        """Test parsing a reply without IP header (Linux datagram sockets)."""
+        reply = struct.pack("!BBHHH", network_probe.ICMP_ECHO_REPLY, 0, 0, 99, 42)
+
+        assert parse_echo_reply(reply) == 42
+
+    def test_parse_reply_with_ip_header(self):
+        """Test parsing a reply prefixed with an IPv4 header (BSD/macOS)."""
+        ip_header = bytes([0x45]) + bytes(19)
+        reply = struct.pack("!BBHHH", network_probe.ICMP_ECHO_REPLY, 0, 0, 99, 42)
+
+        assert parse_echo_reply(ip_header + reply) == 42
+
+    def test_parse_ignores_other_messages(self):
+        """Test that non-reply and truncated packets are ignored."""
+        unreachable = struct.pack("!BBHHH", 3, 1, 0, 0, 0)
+
+        assert parse_echo_reply(unreachable) is None
+        assert parse_echo_reply(b"\x00\x00") is None
+
+
+@pytest.mark.asyncio
+class TestNetworkProber:
+    """Test probe method selection and the TCP fallback."""
+
+    async def test_falls_back_to_tcp_once(self, mocker):
+        """Test that a refused ICMP socket switches to TCP and is not retried."""
+        open_socket = mocker.patch.object(network_probe, "open_icmp_socket", side_effect=PermissionError("denied"))
+        prober = NetworkProber(count=2, interval=0)
+        tcp_burst = mocker.patch.object(prober, "_tcp_burst", return_value=ProbeResult("tcp", 2, [1.0, 1.0]))
+
+        await prober.probe("127.0.0.1", 8080)
+        result = await prober.probe("127.0.0.1", 8080)
+
+        assert result.method == "tcp"
+        assert prober.icmp_available is False
+        open_socket.assert_called_once()
+        tcp_burst.assert_awaited_with("127.0.0.1", 8080)
+
+    async def test_icmp_burst_matches_sequence(self, mocker):
+        """Test that replies are matched to requests by sequence number."""
+        prober = NetworkProber(count=2, interval=0)
+        sock = mocker.MagicMock()
+        sent: list[bytes] = []
+        stale = [struct.pack("!BBHHH", network_probe.ICMP_ECHO_REPLY, 0, 0, 0, 999)]
+
+        async def sendto(_sock, packet, _address):
+            sent.append(packet)
+
+        async def recv(_sock, _size):
+            # A stray reply for another sequence arrives first and must be skipped
+            if stale:
+                return stale.pop()
+            sequence = struct.unpack("!H", sent[-1][6:8])[0]
+            return struct.pack("!BBHHH", network_probe.ICMP_ECHO_REPLY, 0, 0, 0, sequence)
+
+        loop = asyncio.get_running_loop()
+        mocker.patch.object(loop, "sock_sendto", side_effect=sendto)
+        mocker.patch.object(loop, "sock_recv", side_effect=recv)
+
+        result = await prober._icmp_burst(sock, ("192.0.2.1", 0), ipv6=False)
+
+        assert result.method == "icmp"
+        assert result.sent == 2
+        assert result.received == 2
+        assert not stale
+
+    async def test_icmp_timeout_counts_as_loss(self, mocker):
+        """Test that an unanswered echo request counts as lost."""
+        prober = NetworkProber(count=1, timeout=0.01)
+
+        async def never(_sock, _size):
+            await asyncio.sleep(1)
+
+        loop = asyncio.get_running_loop()
+        mocker.patch.object(loop, "sock_sendto", new=mocker.AsyncMock())
+        mocker.patch.object(loop, "sock_recv", side_effect=never)
+
+        result = await prober._icmp_burst(mocker.MagicMock(), ("192.0.2.1", 0), ipv6=False)
+
+        assert result.sent == 1
+        assert result.packet_loss == 100.0
+
+    async def test_tcp_burst_against_local_server(self):
+        """Test TCP connect probes against a listening socket."""
+        server = await asyncio.start_server(lambda _r, w: w.close(), "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        try:
+            result = await NetworkProber(count=2, interval=0)._tcp_burst("127.0.0.1", port)
+        finally:
+            server.close()
+            await server.wait_closed()
+
+        assert result.method == "tcp"
+        assert result.received == 2
+        assert result.min_ms is not None
+
+    async def test_tcp_refused_counts_as_reply(self):
+        """Test that a refused connection still proves the host answered."""
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+
+        result = await NetworkProber(count=1)._tcp_burst("127.0.0.1", port)
+
+        assert result.success is True
+        assert result.packet_loss == 0.0
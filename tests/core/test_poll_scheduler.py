@@ -0,0 +1,103 @@
+"""Tests for the domain-wide poll scheduler."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from custom_components.cable_modem_monitor.core.poll_scheduler import PollScheduler
+
+
+class TestPhaseOffsets:
+    """Test phase offset assignment."""
+
+    def test_offsets_spaced_by_slot(self):
+        """Test that consecutive entries get evenly spaced offsets."""
+        scheduler = PollScheduler(phase_spacing=5)
+
+        offsets = [scheduler.register(f"entry_{i}", 600) for i in range(3)]
+
+        assert offsets == [0, 5, 10]
+        assert scheduler.entry_count == 3
+
+    def test_offsets_wrap_at_interval(self):
+        """Test that offsets never exceed the entry's interval."""
+        scheduler = PollScheduler(phase_spacing=25)
+
+        offsets = [scheduler.register(f"entry_{i}", 60) for i in range(4)]
+
+        assert offsets == [0, 25, 50, 15]
+
+    def test_freed_slot_is_reused(self):
+        """Test that a removed entry's slot goes to the next new entry."""
+        scheduler = PollScheduler(phase_spacing=5)
+        for i in range(3):
+            scheduler.register(f"entry_{i}", 600)
+
+        scheduler.unregister("entry_1")
+
+        assert scheduler.register("entry_new", 600) == 5
+
+    def test_reregister_keeps_slot(self):
+        """Test that reloading an entry keeps its slot."""
+        scheduler = PollScheduler(phase_spacing=5)
+        scheduler.register("entry_0", 600)
+        scheduler.register("entry_1", 600)
+
+        assert scheduler.register("entry_1", 600) == 5
+        assert scheduler.entry_count == 2
+
+
+class TestScheduledUpdate:
+    """Test the wrapped update function."""
+
+    @pytest.mark.asyncio
+    async def test_offset_applied_once(self, mocker):
+        """Test that the phase offset delays only the first scheduled poll."""
+        sleep = mocker.patch(
+            "custom_components.cable_modem_monitor.core.poll_scheduler.asyncio.sleep", new=mocker.AsyncMock()
+        )
+        scheduler = PollScheduler(phase_spacing=5)
+        update = scheduler.wrap("entry_1", mocker.AsyncMock(return_value={"ok": True}))
+        scheduler.register("entry_0", 600)
+        scheduler.register("entry_1", 600)
+
+        assert await update() == {"ok": True}
+        assert await update() == {"ok": True}
+
+        sleep.assert_awaited_once_with(5)
+
+    @pytest.mark.asyncio
+    async def test_concurrency_capped(self):
+        """Test that no more than max_concurrent_polls updates run at once."""
+        scheduler = PollScheduler(max_concurrent_polls=2)
+        running = 0
+        peak = 0
+
+        async def update():
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        await asyncio.gather(*(scheduler.wrap(f"entry_{i}", update)() for i in range(6)))
+
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_exception_releases_slot(self):
+        """Test that a failing update does not leak a concurrency slot."""
+        scheduler = PollScheduler(max_concurrent_polls=1)
+
+        async def failing():
+            raise RuntimeError("modem unreachable")
+
+        async def succeeding():
+            return "ok"
+
+        with pytest.raises(RuntimeError):
+            await scheduler.wrap("entry_0", failing)()
+
+        assert await asyncio.wait_for(scheduler.wrap("entry_1", succeeding)(), timeout=1) == "ok"
@@ -60,23 +60,26 @@ class TestSignalAnalyzerBasics:
 
     def test_initialization(self, analyzer):
         """Test analyzer initializes with empty history."""
-        assert len(analyzer._history) == 0
+        assert len(analyzer._samples) == 0
         assert analyzer._max_history_hours == 48
 
     def test_add_sample(self, analyzer, stable_sample):
         """Test adding a sample to history."""
         analyzer.add_sample(stable_sample)
 
-        assert len(analyzer._history) == 1
-        assert analyzer._history[0]["data"] == stable_sample
-        assert isinstance(analyzer._history[0]["timestamp"], datetime)
+        assert len(analyzer._samples) == 1
+        sample = analyzer._samples[0]
+        assert isinstance(sample.timestamp, datetime)
+        assert sample.snr.count == 3
+        assert sample.power.count == 3
+        assert sample.errors == 0
 
     def test_add_multiple_samples(self, analyzer, stable_sample):
         """Test adding multiple samples."""
         for _ in range(5):
             analyzer.add_sample(stable_sample)
 
-        assert len(analyzer._history) == 5
+        assert len(analyzer._samples) == 5
 
     @patch("custom_components.cable_modem_monitor.core.signal_analyzer.datetime")
     def test_old_samples_removed(self, mock_datetime, analyzer, stable_sample):
@@ -96,115 +99,137 @@ class TestSignalAnalyzerBasics:
         analyzer.add_sample(stable_sample)
 
         # First sample should be removed, only second remains
-        assert len(analyzer._history) == 1
-        assert analyzer._history[0]["timestamp"] == future_time
+        assert len(analyzer._samples) == 1
+        assert analyzer._samples[0].timestamp == future_time
+
+    def test_memory_bounded(self, analyzer, stable_sample, monkeypatch):
+        """Test that the number of retained samples never exceeds the buffer capacity."""
+        from custom_components.cable_modem_monitor.core import signal_analyzer
+
+        monkeypatch.setattr(signal_analyzer, "_MAX_SAMPLES", 10)
+        analyzer = SignalQualityAnalyzer()
+
+        for _ in range(25):
+            analyzer.add_sample(stable_sample)
+
+        assert len(analyzer._samples) == 10
+        assert analyzer._window_snr.count == 30  # 10 samples x 3 channels
 
 
 class TestSignalMetricExtraction:
-    """Test SNR, power, and error extraction."""
+    """Test per-sample SNR, power, and error reduction."""
 
-    def test_extract_snr_values(self, analyzer, stable_sample):
-        """Test SNR value extraction."""
-        sample = {"timestamp": datetime.now(), "data": stable_sample}
-        snr_values = analyzer._extract_snr_values([sample])
+    def test_snr_moments(self, analyzer, stable_sample):
+        """Test SNR values are reduced to count and mean."""
+        analyzer.add_sample(stable_sample)
 
-        assert len(snr_values) == 3
-        assert 39.8 in snr_values
-        assert 40.0 in snr_values
-        assert 40.5 in snr_values
+        snr = analyzer._samples[0].snr
+        assert snr.count == 3
+        assert snr.mean == pytest.approx((40.0 + 40.5 + 39.8) / 3)
 
-    def test_extract_power_values(self, analyzer, stable_sample):
-        """Test power value extraction."""
-        sample = {"timestamp": datetime.now(), "data": stable_sample}
-        power_values = analyzer._extract_power_values([sample])
+    def test_power_moments(self, analyzer, stable_sample):
+        """Test power values are reduced to count and mean."""
+        analyzer.add_sample(stable_sample)
 
-        assert len(power_values) == 3
-        assert 4.9 in power_values
-        assert 5.0 in power_values
-        assert 5.1 in power_values
+        power = analyzer._samples[0].power
+        assert power.count == 3
+        assert power.mean == pytest.approx(5.0)
 
-    def test_extract_snr_handles_none_values(self, analyzer):
+    def test_snr_handles_none_values(self, analyzer):
         """Test that None SNR values are filtered out."""
-        sample_with_none = {
-            "timestamp": datetime.now(),
-            "data": {
+        analyzer.add_sample(
+            {
                 "downstream_channels": [
                     {"channel_id": 1, "snr": 40.0, "power": 5.0},
                     {"channel_id": 2, "snr": None, "power": 5.1},  # None SNR
                     {"channel_id": 3, "snr": 39.8, "power": 4.9},
                 ]
-            },
-        }
-
-        snr_values = analyzer._extract_snr_values([sample_with_none])
+            }
+        )
 
-        assert len(snr_values) == 2  # Only 2 valid SNR values
-        assert None not in snr_values
+        assert analyzer._samples[0].snr.count == 2  # Only 2 valid SNR values
 
-    def test_extract_power_handles_none_values(self, analyzer):
+    def test_power_handles_none_values(self, analyzer):
         """Test that None power values are filtered out."""
-        sample_with_none = {
-            "timestamp": datetime.now(),
-            "data": {
+        analyzer.add_sample(
+            {
                 "downstream_channels": [
                     {"channel_id": 1, "snr": 40.0, "power": 5.0},
                     {"channel_id": 2, "snr": 40.5, "power": None},  # None power
                     {"channel_id": 3, "snr": 39.8, "power": 4.9},
                 ]
-            },
-        }
+            }
+        )
 
-        power_values = analyzer._extract_power_values([sample_with_none])
+        assert analyzer._samples[0].power.count == 2  # Only 2 valid power values
 
-        assert len(power_values) == 2  # Only 2 valid power values
-        assert None not in power_values
+    def test_cumulative_errors(self, analyzer):
+        """Test error totals are accumulated for window sums."""
+        for errors in (0, 10, 25):
+            analyzer.add_sample({"total_uncorrected_errors": errors})
 
-    def test_calculate_error_rates(self, analyzer):
-        """Test error rate calculation."""
-        samples = [
-            {"timestamp": datetime.now(), "data": {"total_uncorrected_errors": 0}},
-            {"timestamp": datetime.now(), "data": {"total_uncorrected_errors": 10}},
-            {"timestamp": datetime.now(), "data": {"total_uncorrected_errors": 25}},
-        ]
+        assert [s.errors for s in analyzer._samples] == [0, 10, 25]
+        assert analyzer._samples[-1].errors_cumulative == 35
 
-        error_rates = analyzer._calculate_error_rates(samples)
+    def test_pooled_stdev_matches_statistics(self, analyzer):
+        """Test that running moments give the same stdev as statistics.stdev over all values."""
+        import statistics
 
-        assert error_rates == [0, 10, 25]
+        values = [[40.0, 38.5, 41.2], [39.1, 37.0], [42.3, 40.0, 36.8, 39.9]]
+        for snrs in values:
+            analyzer.add_sample({"downstream_channels": [{"snr": v} for v in snrs]})
+
+        expected = statistics.stdev([v for snrs in values for v in snrs])
+        assert analyzer._window_snr.stdev == pytest.approx(expected)
 
 
 class TestErrorTrendAnalysis:
     """Test error trend calculation."""
 
+    @staticmethod
+    def _trend(analyzer, error_rates):
+        for errors in error_rates:
+            analyzer.add_sample({"total_uncorrected_errors": errors})
+        return analyzer._window_error_trend()
+
     def test_error_trend_increasing(self, analyzer):
         """Test detection of increasing error trend."""
         # Recent errors (50-100) are > 1.5x older errors (0-10)
-        error_rates = [0, 5, 10, 50, 75, 100]
-        trend = analyzer._calculate_error_trend(error_rates)
-
-        assert trend == "increasing"
+        assert self._trend(analyzer, [0, 5, 10, 50, 75, 100]) == "increasing"
 
     def test_error_trend_decreasing(self, analyzer):
         """Test detection of decreasing error trend."""
         # Recent errors (0-5) are < 0.5x older errors (100-150)
-        error_rates = [100, 125, 150, 0, 2, 5]
-        trend = analyzer._calculate_error_trend(error_rates)
-
-        assert trend == "decreasing"
+        assert self._trend(analyzer, [100, 125, 150, 0, 2, 5]) == "decreasing"
 
     def test_error_trend_stable(self, analyzer):
         """Test detection of stable error trend."""
         # Recent and older errors are similar
-        error_rates = [10, 12, 15, 11, 13, 14]
-        trend = analyzer._calculate_error_trend(error_rates)
+        assert self._trend(analyzer, [10, 12, 15, 11, 13, 14]) == "stable"
 
-        assert trend == "stable"
+    def test_error_trend_odd_sample_count(self, analyzer):
+        """Test that the newer half gets the extra sample, as with an index split."""
+        # Older half [0], newer half [10, 10]
+        assert self._trend(analyzer, [0, 10, 10]) == "increasing"
 
     def test_error_trend_insufficient_data(self, analyzer):
         """Test error trend with insufficient data."""
-        error_rates = [10]  # Only one sample
-        trend = analyzer._calculate_error_trend(error_rates)
+        assert self._trend(analyzer, [10]) == "stable"  # Default to stable
+
+    @patch("custom_components.cable_modem_monitor.core.signal_analyzer.datetime")
+    def test_error_trend_only_uses_window(self, mock_datetime, analyzer):
+        """Test that samples older than 24 hours do not count toward the trend."""
+        base_time = datetime(2025, 1, 1, 12, 0, 0)
+        mock_datetime.now.return_value = base_time
+        for errors in (1000, 1000, 1000):
+            analyzer.add_sample({"total_uncorrected_errors": errors})
+
+        mock_datetime.now.return_value = base_time + timedelta(hours=30)
+        for errors in (10, 10, 10, 10):
+            analyzer.add_sample({"total_uncorrected_errors": errors})
 
-        assert trend == "stable"  # Default to stable
+        assert analyzer._advance_window(mock_datetime.now.return_value) == 4
+        assert analyzer._window_error_trend() == "stable"
 
 
 class TestRecommendations:
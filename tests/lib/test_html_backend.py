@@ -0,0 +1,52 @@
+"""Tests for the selectable HTML parse backend in lib/html_backend.py."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from custom_components.cable_modem_monitor.lib import html_backend
+from custom_components.cable_modem_monitor.lib.html_backend import (
+    HTML_BACKEND_HTML_PARSER,
+    HTML_BACKEND_LXML,
+    make_soup,
+    resolve_backend,
+)
+
+
+class TestResolveBackend:
+    """Test backend selection."""
+
+    def test_default_prefers_lxml_when_installed(self):
+        """Test that lxml is chosen when it can be imported."""
+        with (
+            patch.object(html_backend, "_default_backend", None),
+            patch.object(html_backend, "_is_available", return_value=True),
+        ):
+            assert resolve_backend(None) == HTML_BACKEND_LXML
+
+    def test_default_falls_back_to_html_parser(self):
+        """Test that html.parser is used when lxml is missing."""
+        with (
+            patch.object(html_backend, "_default_backend", None),
+            patch.object(html_backend, "_is_available", side_effect=lambda b: b == HTML_BACKEND_HTML_PARSER),
+        ):
+            assert resolve_backend(None) == HTML_BACKEND_HTML_PARSER
+
+    def test_unknown_backend_uses_default(self):
+        """Test that an unsupported backend name falls back to the default."""
+        assert resolve_backend("no-such-parser") == html_backend.get_default_backend()
+
+    def test_explicit_html_parser(self):
+        """Test that html.parser can always be requested explicitly."""
+        assert resolve_backend(HTML_BACKEND_HTML_PARSER) == HTML_BACKEND_HTML_PARSER
+
+
+class TestMakeSoup:
+    """Test soup construction."""
+
+    def test_parses_with_requested_backend(self):
+        """Test that make_soup returns a usable document."""
+        soup = make_soup("<html><title>Modem</title></html>", HTML_BACKEND_HTML_PARSER)
+
+        assert soup.title is not None
+        assert soup.title.string == "Modem"
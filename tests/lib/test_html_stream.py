@@ -0,0 +1,103 @@
+"""Tests for incremental extraction of declared HTML targets."""
+
+from __future__ import annotations
+
+import pytest
+
+from custom_components.cable_modem_monitor.lib.html_stream import StreamTarget, TargetStream, iter_response_text
+
+PAGE = """<html><head><script>var config = 1;</script>
+<script>function InitDsTableTagValue() { var tagValueList = '1|2|3'; }</script></head>
+<body><table><tr><td>Layout</td></tr></table>
+<table class="simpleTable">
+<tr><th colspan="3"><strong>Downstream Bonded Channels</strong></th></tr>
+<tr><td>Channel</td><td>Frequency</td><td>Power &amp; Level</td></tr>
+<tr><td>1</td><td> 669.00 MHz </td><td>2.40 dBmV</td>
+<tr><td>2</td><td>675.00 MHz</td><td>2.10 dBmV</td></tr>
+</table>
+<table><tr><td>Upstream Bonded Channels</td></tr><tr><td>9</td></tr></table>
+</body></html>"""
+
+
+def _chunks(text, size):
+    """Split text into pieces of the given size."""
+    return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+class TestTargetStream:
+    """Test TargetStream."""
+
+    @pytest.mark.parametrize("size", [1, 5, 64, len(PAGE)])
+    def test_table_rows_independent_of_chunking(self, size):
+        """Test that markers and cells split across chunks are still recognized."""
+        stream = TargetStream(_chunks(PAGE, size), {"down": StreamTarget("table", "Downstream Bonded Channels")})
+
+        assert list(stream) == [
+            ("down", []),
+            ("down", ["Channel", "Frequency", "Power & Level"]),
+            ("down", ["1", "669.00 MHz", "2.40 dBmV"]),
+            ("down", ["2", "675.00 MHz", "2.10 dBmV"]),
+        ]
+        assert stream.complete
+
+    def test_stops_reading_once_targets_captured(self):
+        """Test that the chunk source is not consumed past the last target."""
+        consumed = []
+
+        def chunks():
+            for chunk in _chunks(PAGE, 16):
+                consumed.append(chunk)
+                yield chunk
+
+        stream = TargetStream(chunks(), {"down": StreamTarget("table", "Downstream Bonded Channels")})
+        rows = list(stream)
+
+        assert len(rows) == 4
+        assert stream.chars_read < len(PAGE)
+        assert "Upstream" not in "".join(consumed)
+
+    def test_script_target(self):
+        """Test that a script target yields the source of the first script containing its marker."""
+        stream = TargetStream(_chunks(PAGE, 7), {"ds": StreamTarget("script", "InitDsTableTagValue")})
+
+        ((name, (source,)),) = list(stream)
+
+        assert name == "ds"
+        assert "tagValueList = '1|2|3'" in source
+        assert stream.chars_read < PAGE.index("<body>") + 7
+
+    def test_missing_target(self):
+        """Test that a page without a target is read to the end and reported incomplete."""
+        targets = {
+            "down": StreamTarget("table", "Downstream Bonded Channels"),
+            "other": StreamTarget("table", "Not On This Page"),
+        }
+        stream = TargetStream([PAGE], targets)
+
+        assert len(list(stream)) == 4
+        assert not stream.complete
+        assert stream.missing == {"other"}
+
+    def test_invalid_tag(self):
+        """Test that only tables and scripts can be targeted."""
+        with pytest.raises(ValueError):
+            StreamTarget("div", "Status")
+
+
+class TestIterResponseText:
+    """Test incremental decoding of a streamed response."""
+
+    def test_multibyte_character_split_across_chunks(self, mocker):
+        """Test that a character split between chunks is decoded once it is complete."""
+        body = "Température 3.5 dBmV".encode()
+        response = mocker.Mock(encoding="utf-8")
+        response.iter_content.return_value = [body[:4], body[4:5], body[5:]]
+
+        assert "".join(iter_response_text(response)) == "Température 3.5 dBmV"
+
+    def test_missing_encoding_defaults_to_utf8(self, mocker):
+        """Test that a response without a declared charset is decoded as UTF-8."""
+        response = mocker.Mock(encoding=None)
+        response.iter_content.return_value = ["°C".encode()]
+
+        assert list(iter_response_text(response)) == ["°C"]
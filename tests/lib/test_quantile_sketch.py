@@ -0,0 +1,67 @@
+"""Tests for the relative-error quantile sketch."""
+
+from __future__ import annotations
+
+import math
+import random
+
+import pytest
+
+from custom_components.cable_modem_monitor.lib.quantile_sketch import QuantileSketch
+
+
+class TestQuantileSketch:
+    """Test QuantileSketch."""
+
+    def test_quantiles_within_relative_accuracy(self):
+        """Test that estimates stay within the configured relative error of the exact quantile."""
+        rng = random.Random(7)
+        values = [rng.lognormvariate(2, 1) for _ in range(5000)]
+        sketch = QuantileSketch(relative_accuracy=0.02)
+        for value in values:
+            sketch.add(value)
+
+        ordered = sorted(values)
+        for q in (0.5, 0.95, 0.99):
+            exact = ordered[math.ceil(q * len(ordered)) - 1]
+            assert sketch.quantile(q) == pytest.approx(exact, rel=0.02)
+
+    def test_remove_follows_window(self):
+        """Test that removed values no longer influence quantiles."""
+        sketch = QuantileSketch()
+        for value in (1.0, 2.0, 1000.0):
+            sketch.add(value)
+        sketch.remove(1000.0)
+
+        assert sketch.count == 2
+        assert sketch.quantile(1.0) == pytest.approx(2.0, rel=0.02)
+
+    def test_low_values_share_a_bucket(self):
+        """Test that values at or below min_value are reported as min_value."""
+        sketch = QuantileSketch(min_value=0.01)
+        sketch.add(0.0)
+        sketch.remove(0.0)
+        sketch.add(0.001)
+
+        assert sketch.quantile(0.5) == 0.01
+
+    def test_remove_unknown_value(self):
+        """Test that removing a value that was never added raises KeyError."""
+        sketch = QuantileSketch()
+        sketch.add(5.0)
+
+        with pytest.raises(KeyError):
+            sketch.remove(500.0)
+
+    def test_empty(self):
+        """Test that an empty sketch has no quantiles."""
+        sketch = QuantileSketch()
+        sketch.add(3.0)
+        sketch.clear()
+
+        assert sketch.quantile(0.5) is None
+
+    def test_invalid_accuracy(self):
+        """Test that an accuracy outside (0, 1) is rejected."""
+        with pytest.raises(ValueError):
+            QuantileSketch(relative_accuracy=1.0)
@@ -0,0 +1,65 @@
+"""Tests for the fixed-capacity ring buffer."""
+
+from __future__ import annotations
+
+import pytest
+
+from custom_components.cable_modem_monitor.lib.ring_buffer import RingBuffer
+
+
+class TestRingBuffer:
+    """Test RingBuffer."""
+
+    def test_append_and_index(self):
+        """Test items are indexed oldest first, with negative indexes from the newest."""
+        buffer: RingBuffer[int] = RingBuffer(3)
+        buffer.append(1)
+        buffer.append(2)
+
+        assert len(buffer) == 2
+        assert buffer[0] == 1
+        assert buffer[-1] == 2
+        assert list(buffer) == [1, 2]
+
+    def test_full_buffer_overwrites_oldest(self):
+        """Test that appending to a full buffer evicts and returns the oldest item."""
+        buffer: RingBuffer[int] = RingBuffer(3)
+        evicted = [buffer.append(i) for i in range(5)]
+
+        assert evicted == [None, None, None, 0, 1]
+        assert list(buffer) == [2, 3, 4]
+
+    def test_popleft(self):
+        """Test removing the oldest item across the wrap-around point."""
+        buffer: RingBuffer[int] = RingBuffer(2)
+        for i in range(3):
+            buffer.append(i)
+
+        assert buffer.popleft() == 1
+        assert buffer.popleft() == 2
+        with pytest.raises(IndexError):
+            buffer.popleft()
+
+    def test_index_out_of_range(self):
+        """Test that indexes beyond the stored items raise IndexError."""
+        buffer: RingBuffer[int] = RingBuffer(3)
+        buffer.append(1)
+
+        with pytest.raises(IndexError):
+            buffer[1]
+        with pytest.raises(IndexError):
+            buffer[-2]
+
+    def test_clear(self):
+        """Test that clear empties the buffer."""
+        buffer: RingBuffer[int] = RingBuffer(2)
+        buffer.append(1)
+        buffer.clear()
+
+        assert len(buffer) == 0
+        assert list(buffer) == []
+
+    def test_invalid_capacity(self):
+        """Test that a zero capacity is rejected."""
+        with pytest.raises(ValueError):
+            RingBuffer(0)
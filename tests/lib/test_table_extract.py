@@ -0,0 +1,125 @@
+"""Tests for declarative table extraction."""
+
+from __future__ import annotations
+
+import pytest
+from bs4 import BeautifulSoup
+
+from custom_components.cable_modem_monitor.lib.table_extract import (
+    TRANSPOSED,
+    Column,
+    TableSpec,
+    id_text,
+    table_rows,
+)
+from custom_components.cable_modem_monitor.lib.utils import extract_float, extract_number
+
+ROWS_SPEC = TableSpec(
+    name="test downstream",
+    columns=(
+        Column("channel_id", 0, id_text),
+        Column("modulation", 1),
+        Column("power", 2, extract_float),
+    ),
+    header_rows=1,
+    key="channel_id",
+)
+
+
+class TestRowsTable:
+    """Test tables with one channel per row."""
+
+    def test_extract(self):
+        """Test that each row after the header becomes a record with converted values."""
+        rows = [["ID", "Mod", "Power"], ["1", "QAM256", "2.4 dBmV"], ["2", "QAM256", "-1.5 dBmV"]]
+
+        assert ROWS_SPEC.extract(rows) == [
+            {"channel_id": "1", "modulation": "QAM256", "power": 2.4},
+            {"channel_id": "2", "modulation": "QAM256", "power": -1.5},
+        ]
+
+    def test_short_rows_and_missing_keys_dropped(self):
+        """Test that rows without enough cells or without a channel ID are not records."""
+        rows = [[], ["1", "QAM256"], ["----", "QAM256", "2.4"], ["3", "QAM256", "2.4", "extra"]]
+
+        assert ROWS_SPEC.extract(rows) == [{"channel_id": "3", "modulation": "QAM256", "power": 2.4}]
+
+    def test_min_cells_covers_every_column(self):
+        """Test that the required cell count is derived from the highest column index."""
+        assert ROWS_SPEC.min_cells == 3
+        assert TableSpec(name="t", columns=(Column("a", 0),), min_cells=5).min_cells == 5
+
+    def test_defaults_are_copied_into_each_record(self):
+        """Test that default keys are added to every record independently."""
+        spec = TableSpec(name="t", columns=(Column("channel_id", 0),), defaults={"corrected": None})
+
+        first, second = spec.extract([["1"], ["2"]])
+        first["corrected"] = 5
+
+        assert second == {"channel_id": "2", "corrected": None}
+
+    def test_invalid_declarations(self):
+        """Test that mismatched column sources and unknown orientations are rejected."""
+        with pytest.raises(ValueError):
+            TableSpec(name="t", columns=(Column("a", "Label"),))
+        with pytest.raises(ValueError):
+            TableSpec(name="t", columns=(Column("a", 0),), orientation=TRANSPOSED)
+        with pytest.raises(ValueError):
+            TableSpec(name="t", columns=(Column("a", 0),), orientation="diagonal")
+
+
+class TestTransposedTable:
+    """Test tables with one field per row and one channel per column."""
+
+    SPEC = TableSpec(
+        name="test transposed",
+        orientation=TRANSPOSED,
+        columns=(
+            Column("channel_id", "Channel ID", id_text),
+            Column("frequency", "Frequency", extract_number),
+            Column("power", "Power Level", extract_float),
+        ),
+        key="channel_id",
+    )
+
+    def test_extract(self):
+        """Test that columns become records and labels match by prefix."""
+        rows = [
+            [],
+            ["Channel ID", "10", "9"],
+            ["Frequency", "519000000 Hz", "513000000 Hz"],
+            ["Modulation", "QAM256", "QAM256"],
+            ["Power Level  (see note)", "5 dBmV", "4 dBmV"],
+        ]
+
+        assert self.SPEC.extract(rows) == [
+            {"channel_id": "10", "frequency": 519000000, "power": 5.0},
+            {"channel_id": "9", "frequency": 513000000, "power": 4.0},
+        ]
+
+    def test_ragged_rows(self):
+        """Test that fields missing for a column are left out and columns without an ID dropped."""
+        rows = [["Channel ID", "1"], ["Power Level", "3 dBmV", "4 dBmV"]]
+
+        assert self.SPEC.extract(rows) == [{"channel_id": "1", "power": 3.0}]
+
+
+class TestTableRows:
+    """Test reading cell texts from a BeautifulSoup table."""
+
+    @pytest.mark.parametrize("backend", ["html.parser", "lxml"])
+    def test_nested_table_stays_inside_its_cell(self, backend):
+        """Test that cells of a nested table are not counted as cells of the outer row."""
+        html = (
+            "<table><tr><th>Channel</th></tr>"
+            "<tr><td> Power Level <table><tr><td>note</td></tr></table></td><td>5 dBmV</td><td>4 dBmV</td></tr>"
+            "</table>"
+        )
+        table = BeautifulSoup(html, backend).find("table")
+
+        rows = table_rows(table)
+
+        assert rows[0] == []
+        assert rows[1][1:] == ["5 dBmV", "4 dBmV"]
+        assert rows[1][0].startswith("Power Level")
+        assert rows[2] == ["note"]
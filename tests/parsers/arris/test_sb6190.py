@@ -98,3 +98,20 @@ def test_transposed_table_parsing(arris_signal_html):
     assert "10" in channel_ids
     assert "9" in channel_ids
     assert "11" in channel_ids
+
+
+@pytest.mark.parametrize("chunk_size", [64, 4096])
+def test_streamed_rows_match_dom_parse(arris_signal_html, chunk_size):
+    """Test that parsing streamed table rows gives the same result as parsing the page."""
+    from custom_components.cable_modem_monitor.lib.html_stream import TargetStream
+
+    parser = ArrisSB6190Parser()
+    chunks = [arris_signal_html[i : i + chunk_size] for i in range(0, len(arris_signal_html), chunk_size)]
+    stream = TargetStream(chunks, parser.stream_targets)
+
+    streamed = parser.parse_rows(stream)
+
+    assert stream.complete
+    expected = parser.parse(BeautifulSoup(arris_signal_html, "html.parser"))
+    assert streamed["downstream"] == expected["downstream"]
+    assert streamed["upstream"] == expected["upstream"]
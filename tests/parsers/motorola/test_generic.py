@@ -5,6 +5,7 @@ import os
 import pytest
 from bs4 import BeautifulSoup
 
+from custom_components.cable_modem_monitor.parsers.base_parser import ParseContext
 from custom_components.cable_modem_monitor.parsers.motorola.generic import RESTART_WINDOW_SECONDS, MotorolaGenericParser
 
 "Tests for the generic Motorola MB series parser."
@@ -249,6 +250,65 @@ def test_software_version(moto_home_html):
     assert info["software_version"] == "7621-5.7.1.5", f"Expected '7621-5.7.1.5', got '{info['software_version']}'"
 
 
+def test_software_version_from_prefetched_home_page(mocker, moto_connection_html, moto_home_html):
+    """Test that a prefetched MotoHome.asp fills in the software version without another request."""
+    parser = MotorolaGenericParser()
+    context = ParseContext(pages={"/MotoHome.asp": moto_home_html})
+    session = mocker.Mock()
+
+    data = parser.parse(
+        BeautifulSoup(moto_connection_html, "html.parser"), session, "http://192.168.100.1", context=context
+    )
+
+    session.get.assert_not_called()
+    assert data["system_info"]["software_version"] == "7621-5.7.1.5"
+
+
+def test_home_page_fetched_when_not_prefetched(mocker, moto_connection_html, moto_home_html):
+    """Test that MotoHome.asp is requested when the connection page lacks the version and no copy was passed in."""
+    parser = MotorolaGenericParser()
+    session = mocker.Mock()
+    session.get.return_value = mocker.Mock(status_code=200, text=moto_home_html)
+
+    data = parser.parse(BeautifulSoup(moto_connection_html, "html.parser"), session, "http://192.168.100.1")
+
+    session.get.assert_called_once_with("http://192.168.100.1/MotoHome.asp", timeout=10)
+    assert data["system_info"]["software_version"] == "7621-5.7.1.5"
+
+
+def test_home_page_ignored_when_version_on_page(mocker, moto_home_html):
+    """Test that a prefetched MotoHome.asp is not parsed when the page already carries the version."""
+    parser = MotorolaGenericParser()
+    parse_system_info = mocker.spy(parser, "_parse_system_info")
+    session = mocker.Mock()
+    context = ParseContext(pages={"/MotoHome.asp": "<html><body>Other</body></html>"})
+
+    data = parser.parse(BeautifulSoup(moto_home_html, "html.parser"), session, "http://192.168.100.1", context=context)
+
+    session.get.assert_not_called()
+    assert parse_system_info.call_count == 1
+    assert data["system_info"]["software_version"] == "7621-5.7.1.5"
+    assert parser.static_pages == ("/MotoHome.asp",)
+
+
+def test_home_page_skipped_while_version_cached(mocker, moto_connection_html):
+    """Test that MotoHome.asp is not requested when the scraper does not need static info."""
+    parser = MotorolaGenericParser()
+    session = mocker.Mock()
+
+    data = parser.parse(
+        BeautifulSoup(moto_connection_html, "html.parser"),
+        session,
+        "http://192.168.100.1",
+        context=ParseContext(refresh_static_info=False),
+    )
+
+    session.get.assert_not_called()
+    assert "software_version" not in data["system_info"]
+    assert data["system_info"]["system_uptime"]
+    assert data["downstream"]
+
+
 def test_system_uptime(moto_connection_html):
     """Test parsing system uptime."""
     parser = MotorolaGenericParser()
@@ -292,3 +352,22 @@ def test_error_totals(moto_connection_html):
     assert isinstance(total_uncorrected, int), "Total uncorrected should be int"
     assert total_corrected >= 0, "Total corrected should be non-negative"
     assert total_uncorrected >= 0, "Total uncorrected should be non-negative"
+
+
+def test_login_tries_remembered_encoding_first(moto_connection_html):
+    """Test that a remembered Base64 encoding is posted before plain."""
+    from unittest.mock import MagicMock
+
+    parser = MotorolaGenericParser()
+    parser.password_encoding = "base64"
+
+    session = MagicMock()
+    session.post.return_value = MagicMock(status_code=200, url="http://192.168.100.1/goform/login")
+    session.get.return_value = MagicMock(status_code=200, text=moto_connection_html)
+
+    success, _ = parser.login(session, "http://192.168.100.1", "admin", "password")
+
+    assert success is True
+    session.post.assert_called_once()
+    assert session.post.call_args[1]["data"]["loginPassword"] == "cGFzc3dvcmQ="
+    assert parser.password_encoding == "base64"
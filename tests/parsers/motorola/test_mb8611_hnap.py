@@ -5,6 +5,7 @@ from __future__ import annotations
 import json
 import os
 from unittest.mock import Mock, patch
+from xml.sax.saxutils import escape
 
 import pytest
 from bs4 import BeautifulSoup
@@ -19,6 +20,7 @@ from custom_components.cable_modem_monitor.core.hnap_builder import HNAPRequestB
 from custom_components.cable_modem_monitor.core.hnap_json_builder import (
     HNAPJsonRequestBuilder,
 )
+from custom_components.cable_modem_monitor.parsers.base_parser import ParseContext
 from custom_components.cable_modem_monitor.parsers.motorola.mb8611_hnap import (
     MotorolaMB8611HnapParser,
 )
@@ -297,10 +299,89 @@ class TestHnapParsing:
             "GetMotoStatusConnectionInfo",
             "GetMotoStatusDownstreamChannelInfo",
             "GetMotoStatusUpstreamChannelInfo",
-            "GetMotoLagStatus",
         ]
         mock_builder.call_multiple.assert_called_once_with(mock_session, base_url, expected_actions)
 
+    @patch("custom_components.cable_modem_monitor" ".parsers.motorola.mb8611_hnap.HNAPRequestBuilder")
+    def test_startup_sequence_skipped_while_cached(self, mock_builder_class, hnap_full_status):
+        """Test that the startup sequence is left out of the batch when static info is not due."""
+        parser = MotorolaMB8611HnapParser()
+        mock_session = Mock()
+        mock_builder = Mock()
+        mock_builder.call_multiple.return_value = json.dumps(hnap_full_status)
+        mock_builder_class.return_value = mock_builder
+
+        parser.parse(
+            BeautifulSoup("<html></html>", "html.parser"),
+            session=mock_session,
+            base_url="http://x",
+            context=ParseContext(refresh_static_info=False),
+        )
+
+        actions = mock_builder.call_multiple.call_args.args[2]
+        assert "GetMotoStatusStartupSequence" not in actions
+        assert "GetMotoStatusDownstreamChannelInfo" in actions
+
+    @patch("custom_components.cable_modem_monitor" ".parsers.motorola.mb8611_hnap.HNAPRequestBuilder")
+    def test_batch_follows_requested_sections(self, mock_builder_class, hnap_full_status):
+        """Test that only actions for requested sections are sent and parsed."""
+        parser = MotorolaMB8611HnapParser()
+        context = ParseContext(requested_sections=frozenset({"downstream"}))
+        mock_builder = Mock()
+        mock_builder.call_multiple.return_value = json.dumps(hnap_full_status)
+        mock_builder_class.return_value = mock_builder
+
+        data = parser.parse(
+            BeautifulSoup("<html></html>", "html.parser"), session=Mock(), base_url="http://x", context=context
+        )
+
+        assert mock_builder.call_multiple.call_args.args[2] == ["GetMotoStatusDownstreamChannelInfo"]
+        assert data["downstream"]
+        assert data["upstream"] == []
+
+    def test_batch_only_sends_parsed_actions(self):
+        """Test that the batch for the sensor sections equals the full batch, with no unparsed actions."""
+        parser = MotorolaMB8611HnapParser()
+        sensor_sections = frozenset({"downstream", "upstream", "system_info"})
+
+        actions = parser._batch_actions(ParseContext(requested_sections=sensor_sections))
+
+        assert actions == parser._batch_actions(ParseContext())
+        assert "GetMotoLagStatus" not in actions
+        assert "GetMotoStatusConnectionInfo" in actions
+
+        assert parser._batch_actions(ParseContext(requested_sections=frozenset())) == [
+            "GetMotoStatusDownstreamChannelInfo"
+        ]
+
+    @patch("custom_components.cable_modem_monitor" ".parsers.motorola.mb8611_hnap.HNAPRequestBuilder.call_multiple")
+    @patch("custom_components.cable_modem_monitor" ".parsers.motorola.mb8611_hnap.HNAPJsonRequestBuilder.call_multiple")
+    def test_soap_xml_response(self, mock_json_call, mock_xml_call, hnap_full_status):
+        """Test that a SOAP envelope answer is parsed like the equivalent JSON answer."""
+        mock_json_call.side_effect = Exception("JSON not supported")
+        results = "".join(
+            f"<{action}>"
+            + "".join(f"<{field}>{escape(str(value))}</{field}>" for field, value in values.items())
+            + f"</{action}>"
+            for action, values in hnap_full_status["GetMultipleHNAPsResponse"].items()
+            if isinstance(values, dict)
+        )
+        mock_xml_call.return_value = (
+            '<?xml version="1.0" encoding="utf-8"?>'
+            '<soap:Envelope xmlns:soap="http://schemas.xmlsoap.org/soap/envelope/"><soap:Body>'
+            f'<GetMultipleHNAPsResponse xmlns="http://purenetworks.com/HNAP1/">{results}</GetMultipleHNAPsResponse>'
+            "</soap:Body></soap:Envelope>"
+        )
+        parser = MotorolaMB8611HnapParser()
+        soup = BeautifulSoup("<html></html>", "html.parser")
+
+        data = parser.parse(soup, session=Mock(), base_url="http://192.168.100.1")
+
+        mock_json_call.side_effect = None
+        mock_json_call.return_value = json.dumps(hnap_full_status)
+        assert data == parser.parse(soup, session=Mock(), base_url="http://192.168.100.1")
+        assert data["downstream"]
+
 
 class TestEdgeCases:
     """Test edge cases and error handling."""
@@ -28,6 +28,7 @@ import os
 import pytest
 from bs4 import BeautifulSoup
 
+from custom_components.cable_modem_monitor.parsers.base_parser import ParseContext
 from custom_components.cable_modem_monitor.parsers.netgear.c3700 import NetgearC3700Parser
 
 
@@ -221,6 +222,22 @@ def test_multi_page_parsing_fallback_on_error(c3700_index_html):
     assert data["upstream"] == []
 
 
+def test_prefetched_docsis_status_used(c3700_index_html, c3700_docsis_status_html):
+    """Test that a DocsisStatus.htm prefetched by the scraper is parsed without another request."""
+    from unittest.mock import Mock
+
+    parser = NetgearC3700Parser()
+    context = ParseContext(pages={"/DocsisStatus.htm": c3700_docsis_status_html})
+    mock_session = Mock()
+
+    index_soup = BeautifulSoup(c3700_index_html, "html.parser")
+    data = parser.parse(index_soup, session=mock_session, base_url="http://192.168.100.1", context=context)
+
+    mock_session.get.assert_not_called()
+    assert len(data["downstream"]) == 8
+    assert len(data["upstream"]) == 1
+
+
 def test_empty_data_when_offline():
     """Test that parser returns empty data structures when modem is offline."""
     parser = NetgearC3700Parser()
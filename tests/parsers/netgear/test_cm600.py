@@ -26,6 +26,7 @@ import os
 import pytest
 from bs4 import BeautifulSoup
 
+from custom_components.cable_modem_monitor.parsers.base_parser import ParseContext
 from custom_components.cable_modem_monitor.parsers.netgear.cm600 import NetgearCM600Parser
 
 
@@ -157,6 +158,49 @@ def test_parsing_upstream(cm600_docsis_status_html):
     assert second_us["power"] == 50.0
 
 
+def test_docsis_status_streamed(mocker, cm600_docsis_status_html, cm600_router_status_html):
+    """Test that DocsisStatus.asp is read only until the channel scripts are captured."""
+    body = cm600_docsis_status_html.encode()
+    chunks = [body[i : i + 1024] for i in range(0, len(body), 1024)]
+    served = []
+
+    def iter_content(chunk_size):
+        for chunk in chunks:
+            served.append(chunk)
+            yield chunk
+
+    response = mocker.Mock(status_code=200, encoding="utf-8")
+    response.iter_content.side_effect = iter_content
+    session = mocker.Mock()
+    session.get.return_value = response
+
+    parser = NetgearCM600Parser()
+    data = parser.parse(BeautifulSoup(cm600_router_status_html, "html.parser"), session, "http://192.168.100.1")
+
+    session.get.assert_called_once_with("http://192.168.100.1/DocsisStatus.asp", timeout=10, stream=True)
+    response.close.assert_called_once()
+    assert len(served) < len(chunks)
+    expected = parser.parse(BeautifulSoup(cm600_docsis_status_html, "html.parser"))
+    assert data["downstream"] == expected["downstream"]
+    assert data["upstream"] == expected["upstream"]
+
+
+def test_prefetched_docsis_status_used(mocker, cm600_docsis_status_html, cm600_router_status_html):
+    """Test that a DocsisStatus.asp prefetched by the scraper is parsed without another request."""
+    session = mocker.Mock()
+    parser = NetgearCM600Parser()
+    context = ParseContext(pages={"/DocsisStatus.asp": cm600_docsis_status_html})
+
+    data = parser.parse(
+        BeautifulSoup(cm600_router_status_html, "html.parser"), session, "http://192.168.100.1", context=context
+    )
+
+    session.get.assert_not_called()
+    assert len(data["downstream"]) == 8
+    assert len(data["upstream"]) == 4
+    assert data["system_info"] == parser.parse(BeautifulSoup(cm600_router_status_html, "html.parser"))["system_info"]
+
+
 class TestAuthentication:
     """Test HTTP Basic Authentication for CM600."""
 
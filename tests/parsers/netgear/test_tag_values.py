@@ -0,0 +1,88 @@
+"""Tests for the Netgear script data extractor."""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+from bs4 import BeautifulSoup
+
+from custom_components.cable_modem_monitor.parsers.netgear.tag_values import html_scripts, scan_scripts, soup_scripts
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+def _fixture(*parts):
+    with open(os.path.join(FIXTURES, *parts), encoding="utf-8", errors="replace") as f:
+        return f.read()
+
+
+@pytest.mark.parametrize(
+    ("page", "downstream", "upstream"),
+    [(("cm600", "DocsisStatus.asp"), 8, 4), (("c3700", "DocsisStatus.htm"), 8, 1)],
+)
+def test_raw_html_matches_parsed_page(page, downstream, upstream):
+    """Test that scanning the page source gives the same data as scanning a parsed document."""
+    html = _fixture(*page)
+
+    from_html = scan_scripts(html_scripts(html), "test")
+    from_soup = scan_scripts(soup_scripts(BeautifulSoup(html, "html.parser")), "test")
+
+    assert from_html == from_soup
+    assert len(from_html.downstream) == downstream
+    assert len(from_html.upstream) == upstream
+
+
+def test_system_info_from_first_value_list():
+    """Test that system info comes from the first tagValueList with at least three values."""
+    scripts = [
+        "var tagValueList = 'a|b';",
+        "var tagValueList = 'V2.02.18|V1.0.0.42|SERIAL|x';\nvar tagValueList = 'ignored|ignored|ignored';",
+    ]
+
+    data = scan_scripts(scripts, "test")
+
+    assert data.system_info == {"hardware_version": "V2.02.18", "software_version": "V1.0.0.42"}
+    assert data.downstream == []
+    assert data.upstream == []
+
+
+def test_channel_lists_skip_comments_and_placeholders():
+    """Test that commented-out lists are ignored and unlocked/zero-frequency channels skipped."""
+    downstream = "|".join(
+        [
+            "3",
+            "1|Locked|QAM256|5|507000000 Hz|2.4|40.1|10|2",
+            "2|Not Locked|QAM256|6|0 Hz|0|0|0|0",
+            "3|Locked|QAM256|7|bad|1|1|1|1",
+        ]
+    )
+    script = f"""
+function InitDsTableTagValue()
+{{
+    /* var tagValueList = '9|9|9|9|9|9|9|9|9|9'; */
+//  var tagValueList = '8|8|8|8|8|8|8|8|8|8';
+    var tagValueList = '{downstream}';
+    return tagValueList.split("|");
+}}
+function InitUsTableTagValue()
+{{
+    var tagValueList = '1|1|Locked|ATDMA|3|5120 Ksym/sec|35600000 Hz|45.5';
+    return tagValueList.split("|");
+}}
+"""
+
+    data = scan_scripts([script], "test")
+
+    assert data.downstream == [
+        {
+            "frequency": 507000000,
+            "channel_id": "5",
+            "power": 2.4,
+            "snr": 40.1,
+            "modulation": "QAM256",
+            "corrected": 10,
+            "uncorrected": 2,
+        }
+    ]
+    assert data.upstream == [{"frequency": 35600000, "channel_id": "3", "power": 45.5, "channel_type": "ATDMA"}]
@@ -0,0 +1,61 @@
+"""Parity tests: every parser must produce identical results with each HTML backend.
+
+Runs every fixture under tests/parsers/*/fixtures through each parser that claims
+it (can_parse) with html.parser and with lxml, and compares detection and parse
+results. Requires lxml; skipped when it is not installed.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from custom_components.cable_modem_monitor.lib.html_backend import (
+    HTML_BACKEND_HTML_PARSER,
+    HTML_BACKEND_LXML,
+    make_soup,
+)
+from custom_components.cable_modem_monitor.parsers import get_parsers
+
+pytest.importorskip("lxml")
+
+FIXTURES = sorted(
+    path
+    for path in Path(__file__).parent.glob("*/fixtures/*/*")
+    if path.is_file() and path.suffix not in (".md", ".json")
+)
+
+# Values derived from the current time rather than the page
+VOLATILE_SYSTEM_INFO_KEYS = {"last_boot_time"}
+
+
+def _normalize(result: dict) -> dict:
+    """Drop time-dependent fields from a parse result."""
+    system_info = {k: v for k, v in result.get("system_info", {}).items() if k not in VOLATILE_SYSTEM_INFO_KEYS}
+    return {**result, "system_info": system_info}
+
+
+@pytest.mark.parametrize("fixture_path", FIXTURES, ids=lambda p: f"{p.parent.name}/{p.name}")
+def test_backend_parity(fixture_path):
+    """Test that html.parser and lxml give the same detection and parse results."""
+    html = fixture_path.read_text(encoding="utf-8", errors="replace")
+    url = f"http://192.168.100.1/{fixture_path.name}"
+
+    for parser_class in get_parsers():
+        reference = make_soup(html, HTML_BACKEND_HTML_PARSER)
+        fast = make_soup(html, HTML_BACKEND_LXML)
+
+        detected = parser_class.can_parse(reference, url, html)
+        assert parser_class.can_parse(fast, url, html) == detected, parser_class.name
+
+        if not detected or parser_class.manufacturer == "Unknown":
+            continue
+
+        try:
+            expected = parser_class().parse(reference)
+        except ValueError:
+            # Parsers that only work against a live session (HNAP)
+            continue
+
+        assert _normalize(parser_class().parse(fast)) == _normalize(expected), parser_class.name
@@ -2,9 +2,18 @@
 
 from __future__ import annotations
 
+import pytest
+
 from custom_components.cable_modem_monitor.parsers import (
+    LazyParser,
+    ParserInfo,
+    get_lazy_parser,
+    get_lazy_parsers,
     get_parser_by_name,
+    get_parser_info,
+    get_parser_names,
     get_parsers,
+    load_parser,
 )
 from custom_components.cable_modem_monitor.parsers.base_parser import ModemParser
 
@@ -130,6 +139,108 @@ class TestGetParserByName:
         assert isinstance(parser_instance, ModemParser)
 
 
+class TestParserManifest:
+    """Test the generated parser manifest."""
+
+    def test_manifest_is_up_to_date(self):
+        """Test that manifest.py matches the parser classes on disk.
+
+        If this fails, run: python scripts/maintenance/generate_parser_manifest.py
+        """
+        from custom_components.cable_modem_monitor.parsers.manifest_builder import (
+            MANIFEST_FILE,
+            build_manifest,
+            render_manifest,
+        )
+
+        with open(MANIFEST_FILE, encoding="utf-8") as f:
+            assert f.read() == render_manifest(build_manifest())
+
+    def test_every_entry_loads_its_parser(self):
+        """Test that each manifest entry resolves to the parser class with that name."""
+        for info in get_parser_info():
+            parser_class = load_parser(info)
+            assert parser_class is not None, info.name
+            assert parser_class.name == info.name
+            assert parser_class.priority == info.priority
+
+    def test_sb6141_loads_by_name(self):
+        """Test loading ARRIS SB6141 parser by name."""
+        parser_class = get_parser_by_name("ARRIS SB6141")
+        assert parser_class is not None
+        assert parser_class.__name__ == "ArrisSB6141Parser"
+
+    def test_names_match_loaded_parsers(self):
+        """Test that the dropdown names come in the same order as get_parsers()."""
+        assert get_parser_names() == [p.name for p in get_parsers()]
+
+    def test_missing_class(self):
+        """Test that an entry pointing at a missing class is reported as None."""
+        info = ParserInfo(name="Ghost", manufacturer="Nobody", module="arris.sb6141", class_name="GhostParser")
+        assert load_parser(info) is None
+
+
+class TestLazyParser:
+    """Test lazy parser proxies."""
+
+    @staticmethod
+    def _fresh_proxy(name):
+        """Return a new, not yet loaded proxy for a manifest entry."""
+        return LazyParser(next(info for info in get_parser_info() if info.name == name))
+
+    def test_metadata_does_not_load(self):
+        """Test that manifest metadata is served without loading the parser class."""
+        proxy = self._fresh_proxy("Motorola MB7621")
+
+        assert proxy.manufacturer == "Motorola"
+        assert proxy.priority == 100
+        assert proxy.supports_restart is True
+        assert proxy.url_patterns[0]["path"] == "/MotoSwInfo.asp"
+        assert not proxy.loaded
+
+    def test_instantiating_loads_real_class(self):
+        """Test that calling the proxy creates an instance of the real parser class."""
+        proxy = self._fresh_proxy("ARRIS SB6141")
+
+        parser = proxy()
+
+        assert proxy.loaded
+        assert type(parser) is get_parser_by_name("ARRIS SB6141")
+
+    def test_class_attributes_delegate(self):
+        """Test that other class attributes, like can_parse, come from the real class."""
+        proxy = self._fresh_proxy("ARRIS SB6141")
+
+        assert proxy.can_parse == get_parser_by_name("ARRIS SB6141").can_parse
+        assert proxy.loaded
+
+    def test_unloadable_entry_raises(self):
+        """Test that a proxy for a missing class raises ImportError on use."""
+        proxy = LazyParser(ParserInfo(name="Ghost", manufacturer="Nobody", module="arris.sb6141", class_name="Ghost"))
+
+        with pytest.raises(ImportError):
+            proxy()
+
+    def test_registry(self):
+        """Test that the registry returns one shared proxy per parser, in dropdown order."""
+        proxies = get_lazy_parsers()
+
+        assert [proxy.name for proxy in proxies] == get_parser_names()
+        assert all(again is proxy for again, proxy in zip(get_lazy_parsers(), proxies, strict=True))
+        assert get_lazy_parser("Motorola MB7621") in proxies
+        assert get_lazy_parser("Invalid Parser Name") is None
+
+    def test_scraper_treats_single_proxy_as_class(self):
+        """Test that ModemScraper accepts a proxy where it accepts a parser class."""
+        from custom_components.cable_modem_monitor.core.modem_scraper import ModemScraper
+
+        proxy = self._fresh_proxy("ARRIS SB6141")
+        scraper = ModemScraper("192.168.100.1", parser=proxy)
+
+        assert scraper.parser is None
+        assert scraper.parsers == [proxy]
+
+
 class TestParserLoadingPerformance:
     """Test performance characteristics of parser loading."""
 